@@ -16,6 +16,7 @@
 )
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import CANCELABLE_RUN_STATUSES
+from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.error import serializable_error_info_from_exc_info
 from starlette.concurrency import (
@@ -223,6 +224,23 @@ def get_chunk_size() -> int:
     )
 
 
+def get_subscription_queue_size() -> int:
+    # the maximum number of live events buffered for a single run log subscription
+    return int(os.getenv("DAGSTER_UI_EVENT_SUBSCRIPTION_QUEUE_SIZE", "10000"))
+
+
+def _is_at_or_before(cursor: str, other_cursor: Optional[str]) -> bool:
+    if other_cursor is None:
+        return False
+    parsed_cursor = EventLogCursor.parse(cursor)
+    parsed_other_cursor = EventLogCursor.parse(other_cursor)
+    return (
+        parsed_cursor.is_id_cursor()
+        and parsed_other_cursor.is_id_cursor()
+        and parsed_cursor.storage_id() <= parsed_other_cursor.storage_id()
+    )
+
+
 async def gen_events_for_run(
     graphene_info: "ResolveInfo",
     run_id: str,
@@ -264,9 +282,7 @@ async def gen_events_for_run(
     # load the existing events in chunks
     has_more = True
     while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
+        connection = await instance.get_records_for_run_async(
             run_id=run_id,
             cursor=after_cursor,
             limit=chunk_size,
@@ -285,22 +301,64 @@ async def gen_events_for_run(
         after_cursor = connection.cursor
 
     loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[tuple[Any, Any]] = asyncio.Queue()
+    queue: asyncio.Queue[tuple[Any, Any]] = asyncio.Queue(maxsize=get_subscription_queue_size())
+    # Live events are delivered from a watcher thread that is shared with every other subscription,
+    # so rather than blocking it when this subscription falls behind, events are dropped once the
+    # queue is full. Once the queued events have been consumed, the dropped events are loaded from
+    # the event log instead.
+    overflowed = False
+
+    def _put(event, cursor):
+        nonlocal overflowed
+        if overflowed:
+            # keep dropping events until the queue is drained, so that events are not reordered
+            return
+        try:
+            queue.put_nowait((event, cursor))
+        except asyncio.QueueFull:
+            overflowed = True
 
     def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
+        loop.call_soon_threadsafe(_put, event, cursor)
 
     # watch for live events
     instance.watch_event_logs(run_id, after_cursor, _enqueue)
     try:
         while True:
+            if overflowed and queue.empty():
+                overflowed = False
+                has_more = True
+                while has_more:
+                    connection = await instance.get_records_for_run_async(
+                        run_id=run_id,
+                        cursor=after_cursor,
+                        limit=chunk_size,
+                    )
+                    if connection.records:
+                        yield GraphenePipelineRunLogsSubscriptionSuccess(
+                            run=GrapheneRun(record),
+                            messages=[
+                                from_event_record(record.event_log_entry, run.job_name)
+                                for record in connection.records
+                            ],
+                            hasMorePastEvents=False,
+                            cursor=connection.cursor,
+                        )
+                    has_more = connection.has_more
+                    after_cursor = connection.cursor
+
             event, cursor = await queue.get()
+            # skip events that were already loaded from the event log after an overflow
+            if _is_at_or_before(cursor, after_cursor):
+                continue
+
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
                 messages=[from_event_record(event, run.job_name)],
                 hasMorePastEvents=False,
                 cursor=cursor,
             )
+            after_cursor = cursor
     finally:
         instance.end_watch_event_logs(run_id, _enqueue)
 
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus
+from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.backfill import (
@@ -16,7 +16,7 @@ def get_backfill(graphene_info: "ResolveInfo", backfill_id: str) -> "GraphenePar
         GraphenePartitionBackfill,
     )
 
-    backfill_job = graphene_info.context.instance.get_backfill(backfill_id)
+    backfill_job = PartitionBackfill.blocking_get(graphene_info.context, backfill_id)
     if backfill_job is None:
         return GrapheneBackfillNotFoundError(backfill_id)
 
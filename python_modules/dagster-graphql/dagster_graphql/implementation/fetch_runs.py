@@ -225,7 +225,7 @@ def get_assets_latest_info(
         else []
     )
     if run_ids:
-        run_records = instance.get_run_records(RunsFilter(run_ids=run_ids))
+        run_records = RunRecord.blocking_get_many(graphene_info.context, run_ids)
         for run_record in run_records:
             run_records_by_run_id[run_record.dagster_run.run_id] = run_record
 
@@ -34,6 +34,7 @@
 )
 from dagster._core.snap.node import GraphDefSnap, OpDefSnap
 from dagster._core.storage.asset_check_execution_record import AssetCheckInstanceSupport
+from dagster._core.storage.dagster_run import RunRecord
 from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.tags import KIND_PREFIX
 from dagster._core.utils import is_valid_email
@@ -577,7 +578,7 @@ def resolve_assetMaterializationUsedData(
             if materialization_time
         ]
 
-    def resolve_assetMaterializations(
+    async def resolve_assetMaterializations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -592,9 +593,7 @@ def resolve_assetMaterializations(
             before_timestamp = None
 
         if limit == 1 and not partitions and not before_timestamp:
-            record = AssetRecord.blocking_get(
-                graphene_info.context, self._asset_node_snap.asset_key
-            )
+            record = await AssetRecord.gen(graphene_info.context, self._asset_node_snap.asset_key)
             latest_materialization_event = (
                 record.asset_entry.last_materialization if record else None
             )
@@ -615,7 +614,7 @@ def resolve_assetMaterializations(
             )
         ]
 
-    def resolve_assetObservations(
+    async def resolve_assetObservations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -635,9 +634,7 @@ def resolve_assetObservations(
             and not partitions
             and not before_timestamp
         ):
-            record = AssetRecord.blocking_get(
-                graphene_info.context, self._asset_node_snap.asset_key
-            )
+            record = await AssetRecord.gen(graphene_info.context, self._asset_node_snap.asset_key)
             latest_observation_event = record.asset_entry.last_observation if record else None
 
             if not latest_observation_event:
@@ -996,7 +993,7 @@ def resolve_latestMaterializationByPartition(
             for event in ordered_materializations
         ]
 
-    def resolve_latestRunForPartition(
+    async def resolve_latestRunForPartition(
         self,
         graphene_info: ResolveInfo,
         partition: str,
@@ -1006,7 +1003,7 @@ def resolve_latestRunForPartition(
         )
         if not planned_info:
             return None
-        run_record = graphene_info.context.instance.get_run_record_by_id(planned_info.run_id)
+        run_record = await RunRecord.gen(graphene_info.context, planned_info.run_id)
         return GrapheneRun(run_record) if run_record else None
 
     def resolve_assetPartitionStatuses(
@@ -20,6 +20,7 @@
     RunRecord,
     RunsFilter,
 )
+from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.tags import REPOSITORY_LABEL_TAG, RUN_METRIC_TAGS, TagType, get_tag_type
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.tags import get_boolean_tag_value
@@ -252,7 +253,7 @@ def resolve_id(self, _) -> str:
             return self._definition.id
         return get_unique_asset_id(self.key)
 
-    def resolve_assetMaterializations(
+    async def resolve_assetMaterializations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -268,6 +269,18 @@ def resolve_assetMaterializations(
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
+        if limit == 1 and not partitions and not before_timestamp and not after_timestamp:
+            # the latest materialization is stored on the asset record, which is batched across
+            # all of the assets resolved in the same request
+            record = await AssetRecord.gen(graphene_info.context, self.key)
+            latest_materialization_event = (
+                record.asset_entry.last_materialization if record else None
+            )
+            if not latest_materialization_event:
+                return []
+
+            return [GrapheneMaterializationEvent(event=latest_materialization_event)]
+
         events = get_asset_materializations(
             graphene_info,
             self.key,
@@ -340,7 +353,7 @@ def resolve_assetMaterializationHistory(
         ]
         return [event_tuple[1] for event_tuple in sorted_combined]
 
-    def resolve_assetObservations(
+    async def resolve_assetObservations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -356,6 +369,20 @@ def resolve_assetObservations(
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
+        if (
+            graphene_info.context.instance.event_log_storage.asset_records_have_last_observation
+            and limit == 1
+            and not partitions
+            and not before_timestamp
+            and not after_timestamp
+        ):
+            record = await AssetRecord.gen(graphene_info.context, self.key)
+            latest_observation_event = record.asset_entry.last_observation if record else None
+            if not latest_observation_event:
+                return []
+
+            return [GrapheneObservationEvent(event=latest_observation_event)]
+
         return [
             GrapheneObservationEvent(event=event)
             for event in get_asset_observations(
@@ -769,6 +769,29 @@
     }
 """
 
+BATCH_LOAD_ASSET_CATALOG = """
+    query AssetCatalogQuery {
+        assetsOrError {
+            ... on AssetConnection {
+                nodes {
+                    key {
+                        path
+                    }
+                    assetMaterializations(limit: 1) {
+                        timestamp
+                        runId
+                    }
+                    definition {
+                        assetMaterializations(limit: 1) {
+                            timestamp
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
 GET_ASSET_BACKFILL_POLICY = """
     query AssetNodeQuery($assetKey: AssetKeyInput!) {
         assetNodeOrError(assetKey: $assetKey) {
@@ -1429,7 +1452,7 @@ def test_latest_materialization_per_partition(self, graphql_context: WorkspaceRe
         )
 
         counts = counter.counts()
-        assert counts.get("DagsterInstance.get_run_records") == 1
+        assert counts.get("DagsterInstance.get_run_records_async") == 1
 
         assert result.data
         assert result.data["assetNodes"]
@@ -2290,7 +2313,28 @@ def test_batch_fetch_only_once(self, graphql_context: WorkspaceRequestContext):
         assert result.data
         counts = counter.counts()
         assert len(counts) == 1
-        assert counts.get("DagsterInstance.get_asset_records") == 1
+        assert counts.get("DagsterInstance.get_asset_records_async") == 1
+
+    def test_batch_fetch_asset_catalog(self, graphql_context: WorkspaceRequestContext):
+        _create_run(graphql_context, "multi_asset_job")
+        counter = Counter()
+        traced_counter.set(counter)
+        result = execute_dagster_graphql(graphql_context, BATCH_LOAD_ASSET_CATALOG)
+        assert result.data
+        nodes = result.data["assetsOrError"]["nodes"]
+        materialized = [node for node in nodes if node["assetMaterializations"]]
+        assert materialized
+
+        counts = counter.counts()
+        assert counts.get("DagsterInstance.get_asset_records_async") == 1
+        assert "DagsterInstance.fetch_materializations" not in counts
+
+        for node in materialized:
+            if node["definition"]:
+                assert (
+                    node["definition"]["assetMaterializations"][0]["timestamp"]
+                    == node["assetMaterializations"][0]["timestamp"]
+                )
 
     def test_batch_empty_list(self, graphql_context: WorkspaceRequestContext):
         traced_counter.set(Counter())
@@ -1,10 +1,15 @@
+import asyncio
 import json
 import time
 import uuid
 from typing import Any, Optional
+from unittest import mock
 
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import RunsFilter
-from dagster._core.test_utils import wait_for_runs_to_finish
+from dagster._core.test_utils import create_run_for_test, environ, wait_for_runs_to_finish
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.context import WorkspaceRequestContext
 from dagster._utils import file_relative_path
@@ -14,6 +19,7 @@
     RUN_EVENTS_QUERY,
     SUBSCRIPTION_QUERY,
 )
+from dagster_graphql.implementation.execution import gen_events_for_run
 from dagster_graphql.test.utils import (
     execute_dagster_graphql,
     execute_dagster_graphql_subscription,
@@ -769,3 +775,54 @@ def test_start_pipeline_execution_readonly_failure(
         assert result.data
 
         assert result.data["launchPipelineExecution"]["__typename"] == "UnauthorizedError"
+
+
+def test_run_logs_subscription_queue_overflow():
+    instance = DagsterInstance.ephemeral()
+    run_id = create_run_for_test(instance).run_id
+    graphene_info = mock.MagicMock()
+    graphene_info.context.instance = instance
+
+    def _store_event(count: int) -> None:
+        instance.handle_new_event(
+            EventLogEntry(
+                error_info=None,
+                user_message=str(count),
+                level="debug",
+                run_id=run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ENGINE_EVENT.value,
+                    "nonce",
+                    event_specific_data=EngineEventData.in_process(999),
+                ),
+            )
+        )
+
+    async def _process() -> list[list[str]]:
+        results = []
+        events = gen_events_for_run(graphene_info, run_id)
+        # past events
+        await events.__anext__()
+
+        next_result = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0.1)
+        # more events than fit in the queue of the subscription
+        for count in range(10):
+            _store_event(count)
+
+        while sum(len(messages) for messages in results) < 10:
+            result = await asyncio.wait_for(next_result, timeout=5)
+            results.append([message.message for message in result.messages])
+            next_result = asyncio.ensure_future(events.__anext__())
+
+        next_result.cancel()
+        await events.aclose()
+        return results
+
+    with environ({"DAGSTER_UI_EVENT_SUBSCRIPTION_QUEUE_SIZE": "3"}):
+        results = asyncio.run(_process())
+
+    # the queued events are delivered individually, after which the dropped events are loaded from
+    # the event log, in order and without duplicates
+    assert results == [["0"], ["1"], ["2"], [str(count) for count in range(3, 10)]]
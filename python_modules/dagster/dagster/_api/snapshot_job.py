@@ -5,10 +5,11 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.remote_representation.external_data import RemoteJobSubsetResult
-from dagster._core.remote_representation.origin import RemoteJobOrigin
+from dagster._core.remote_representation.external_data import JobDataSnap, RemoteJobSubsetResult
+from dagster._core.remote_representation.origin import RemoteJobOrigin, RemoteRepositoryOrigin
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
     from dagster._grpc.client import DagsterGrpcClient
@@ -48,3 +49,36 @@ def sync_get_external_job_subset_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_serialized_external_job_data_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: RemoteRepositoryOrigin,
+    job_name: str,
+) -> str:
+    from dagster._grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    repository_origin = check.inst_param(
+        repository_origin, "repository_origin", RemoteRepositoryOrigin
+    )
+    job_name = check.str_param(job_name, "job_name")
+
+    reply = api_client.external_job(repository_origin, job_name)
+    if reply.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_value(reply.serialized_error, SerializableErrorInfo)
+        )
+
+    return reply.serialized_job_data
+
+
+def sync_get_external_job_data_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: RemoteRepositoryOrigin,
+    job_name: str,
+) -> JobDataSnap:
+    return deserialize_value(
+        sync_get_serialized_external_job_data_grpc(api_client, repository_origin, job_name),
+        JobDataSnap,
+    )
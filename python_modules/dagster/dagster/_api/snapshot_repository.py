@@ -12,7 +12,7 @@
 
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient", code_location: "CodeLocation", defer_snapshots: bool = False
 ) -> Mapping[str, RepositorySnap]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
@@ -25,7 +25,8 @@ def sync_get_streaming_external_repositories_data_grpc(
                 remote_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                defer_snapshots=defer_snapshots,
             )
         )
 
@@ -47,7 +48,7 @@ def sync_get_streaming_external_repositories_data_grpc(
 
 
 async def gen_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient", code_location: "CodeLocation", defer_snapshots: bool = False
 ) -> Mapping[str, RepositorySnap]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
@@ -61,7 +62,8 @@ async def gen_streaming_external_repositories_data_grpc(
                 remote_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                defer_snapshots=defer_snapshots,
             )
         ]
 
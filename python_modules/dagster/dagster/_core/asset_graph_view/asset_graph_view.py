@@ -1,4 +1,5 @@
 import functools
+import threading
 from collections.abc import Awaitable, Iterable
 from datetime import datetime, timedelta
 from typing import (  # noqa: UP035
@@ -33,7 +34,7 @@
 )
 from dagster._core.loader import LoadingContext
 from dagster._time import get_current_datetime
-from dagster._utils.aiodataloader import DataLoader
+from dagster._utils.aiodataloader import BlockingDataLoader, DataLoader
 from dagster._utils.cached_method import cached_method
 
 if TYPE_CHECKING:
@@ -127,27 +128,36 @@ def __init__(
         instance: "DagsterInstance",
         asset_graph: "BaseAssetGraph",
     ):
-        from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
-
         self._temporal_context = temporal_context
         self._instance = instance
-        self._loaders = {}
+        # loaders are bound to the event loop that they are first used from, and the caches of the
+        # queryer are not thread-safe, so threads that evaluate in parallel each get a separate set
+        # of loaders and a separate queryer
+        self._thread_local = threading.local()
         self._asset_graph = asset_graph
 
-        self._queryer = CachingInstanceQueryer(
-            instance=instance,
-            asset_graph=asset_graph,
-            loading_context=self,
-            evaluation_time=temporal_context.effective_dt,
-        )
-
     @property
     def instance(self) -> "DagsterInstance":
         return self._instance
 
     @property
-    def loaders(self) -> dict[type, DataLoader]:
-        return self._loaders
+    def loaders(self) -> dict[type, tuple[DataLoader, BlockingDataLoader]]:
+        if not hasattr(self._thread_local, "loaders"):
+            self._thread_local.loaders = {}
+        return self._thread_local.loaders
+
+    @property
+    def _queryer(self) -> "CachingInstanceQueryer":
+        from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+        if not hasattr(self._thread_local, "queryer"):
+            self._thread_local.queryer = CachingInstanceQueryer(
+                instance=self._instance,
+                asset_graph=self._asset_graph,
+                loading_context=self,
+                evaluation_time=self.effective_dt,
+            )
+        return self._thread_local.queryer
 
     @property
     def effective_dt(self) -> datetime:
@@ -1,14 +1,16 @@
 import asyncio
 import datetime
 import logging
+import threading
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AbstractSet, NamedTuple, Optional  # noqa: UP035
 
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
-from dagster._core.definitions.asset_key import EntityKey
+from dagster._core.definitions.asset_key import AssetCheckKey, EntityKey
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
 from dagster._core.definitions.data_time import CachingDataTimeResolver
 from dagster._core.definitions.declarative_automation.automation_condition import (
@@ -16,14 +18,34 @@
     AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.operands import (
+    ExecutionFailedAutomationCondition,
+    LatestRunExecutedWithRootTargetCondition,
+    LatestRunExecutedWithTagsCondition,
+    MissingAutomationCondition,
+    RunInProgressAutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.operators import (
+    AnyDownstreamConditionsCondition,
+    ChecksAutomationCondition,
+    DepsAutomationCondition,
+    EntityMatchesCondition,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
+    from dagster._utils.aiodataloader import BlockingDataLoader, DataLoader
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+class _EvaluationResults(NamedTuple):
+    current_results_by_key: dict[EntityKey, AutomationResult]
+    request_subsets_by_key: dict[EntityKey, EntitySubset]
+    legacy_expected_data_time_by_key: dict[AssetKey, Optional[datetime.datetime]]
+
+
 class AutomationConditionEvaluator:
     def __init__(
         self,
@@ -36,6 +58,7 @@ def __init__(
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        num_evaluation_workers: Optional[int] = None,
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
@@ -50,7 +73,7 @@ def __init__(
         self.cursor = cursor
         self.default_condition = default_condition
 
-        self.current_results_by_key: dict[EntityKey, AutomationResult] = {}
+        self._evaluation_results = _EvaluationResults({}, {}, {})
         self.condition_cursors = []
         self.expected_data_time_mapping = defaultdict()
 
@@ -62,16 +85,44 @@ def __init__(
             _instance.auto_materialize_respect_materialization_data_versions
         )
         self.emit_backfills = emit_backfills or _instance.da_request_backfills()
+        self.num_evaluation_workers = (
+            num_evaluation_workers or _instance.auto_materialize_num_evaluation_workers
+        )
 
-        self.legacy_expected_data_time_by_key: dict[AssetKey, Optional[datetime.datetime]] = {}
-        self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
+        self._thread_local = threading.local()
 
-        self.request_subsets_by_key: dict[EntityKey, EntitySubset] = {}
+        self._num_evaluated = 0
+        self._num_evaluated_lock = threading.Lock()
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
         return self.asset_graph_view.get_inner_queryer_for_back_compat()
 
+    @property
+    def legacy_data_time_resolver(self) -> CachingDataTimeResolver:
+        # the instance queryer is separate for each thread, and so is the resolver that wraps it
+        if not hasattr(self._thread_local, "data_time_resolver"):
+            self._thread_local.data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
+        return self._thread_local.data_time_resolver
+
+    @property
+    def _results(self) -> _EvaluationResults:
+        # while a group of entities is evaluated on a worker thread, its results are tracked
+        # separately, and merged into the results of the evaluator by the calling thread
+        return getattr(self._thread_local, "results", self._evaluation_results)
+
+    @property
+    def current_results_by_key(self) -> dict[EntityKey, AutomationResult]:
+        return self._results.current_results_by_key
+
+    @property
+    def request_subsets_by_key(self) -> dict[EntityKey, EntitySubset]:
+        return self._results.request_subsets_by_key
+
+    @property
+    def legacy_expected_data_time_by_key(self) -> dict[AssetKey, Optional[datetime.datetime]]:
+        return self._results.legacy_expected_data_time_by_key
+
     @property
     def evaluation_time(self) -> datetime.datetime:
         return self.asset_graph_view.effective_dt
@@ -82,26 +133,144 @@ def asset_graph(self) -> "BaseAssetGraph[BaseAssetNode]":
 
     @property
     def evaluated_asset_keys_and_parents(self) -> AbstractSet[AssetKey]:
-        asset_keys = {ek for ek in self.entity_keys if isinstance(ek, AssetKey)}
+        return self._get_asset_keys_and_parents(self.entity_keys)
+
+    @property
+    def asset_records_to_prefetch(self) -> Sequence[AssetKey]:
+        return self._get_asset_records_to_prefetch(self.entity_keys)
+
+    def _get_asset_keys_and_parents(
+        self, entity_keys: Iterable[EntityKey]
+    ) -> AbstractSet[AssetKey]:
+        asset_keys = {ek for ek in entity_keys if isinstance(ek, AssetKey)}
         return {
             parent for ek in asset_keys for parent in self.asset_graph.get(ek).parent_keys
         } | asset_keys
 
-    @property
-    def asset_records_to_prefetch(self) -> Sequence[AssetKey]:
-        return [key for key in self.evaluated_asset_keys_and_parents if self.asset_graph.has(key)]
+    def _get_asset_records_to_prefetch(
+        self, entity_keys: Iterable[EntityKey]
+    ) -> Sequence[AssetKey]:
+        return [
+            key
+            for key in self._get_asset_keys_and_parents(entity_keys)
+            if self.asset_graph.has(key)
+        ]
 
-    def prefetch(self) -> None:
+    def prefetch(self, entity_keys: Optional[Iterable[EntityKey]] = None) -> None:
         """Pre-populate the cached values here to avoid situations in which the new latest_storage_id
         value is calculated using information that comes in after the set of asset partitions with
         new parent materializations is calculated, as this can result in materializations being
         ignored if they happen between the two calculations.
+
+        The condition trees of the provided entities are walked up front to determine which other
+        data they will query, so that it can be fetched in a handful of batched queries rather than
+        one query per entity during evaluation.
         """
+        entity_keys = list(self.entity_keys if entity_keys is None else entity_keys)
+        asset_records_to_prefetch = self._get_asset_records_to_prefetch(entity_keys)
+
+        queried_keys: set[EntityKey] = set()
+        status_cache_asset_keys: set[AssetKey] = set()
+        latest_run_entity_keys: set[EntityKey] = set()
+        visited: set[tuple[int, EntityKey]] = set()
+
+        def _visit(condition: AutomationCondition, key: EntityKey) -> None:
+            if (id(condition), key) in visited or not self.asset_graph.has(key):
+                return
+            visited.add((id(condition), key))
+            queried_keys.add(key)
+
+            if isinstance(
+                condition,
+                (
+                    MissingAutomationCondition,
+                    RunInProgressAutomationCondition,
+                    ExecutionFailedAutomationCondition,
+                ),
+            ):
+                if isinstance(key, AssetKey):
+                    status_cache_asset_keys.add(key)
+                latest_run_entity_keys.add(key)
+            elif isinstance(
+                condition,
+                (LatestRunExecutedWithRootTargetCondition, LatestRunExecutedWithTagsCondition),
+            ):
+                latest_run_entity_keys.add(key)
+
+            # operators which evaluate their operand against other entities
+            if isinstance(condition, DepsAutomationCondition):
+                for dep_key in condition.get_dep_keys(key, self.asset_graph):
+                    _visit(condition.operand, dep_key)
+            elif isinstance(condition, ChecksAutomationCondition) and isinstance(key, AssetKey):
+                for check_key in condition.get_check_keys(key, self.asset_graph):
+                    _visit(condition.operand, check_key)
+            elif isinstance(condition, EntityMatchesCondition):
+                _visit(condition.operand, condition.key)
+            elif isinstance(condition, AnyDownstreamConditionsCondition) and isinstance(
+                key, AssetKey
+            ):
+                for downstream_condition in self.asset_graph.get_downstream_automation_conditions(
+                    asset_key=key
+                ):
+                    if not downstream_condition.has_rule_condition:
+                        _visit(downstream_condition, key)
+            else:
+                for child in condition.children:
+                    _visit(child, key)
+
+        for entity_key in entity_keys:
+            condition = (
+                self.asset_graph.get(entity_key).automation_condition or self.default_condition
+            )
+            if condition is not None:
+                _visit(condition, entity_key)
+
         self.logger.info(
-            f"Prefetching asset records for {len(self.asset_records_to_prefetch)} records."
+            f"Prefetching data for {len(queried_keys)} entities referenced by "
+            f"{len(entity_keys)} automation conditions."
         )
-        self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
-        self.logger.info("Done prefetching asset records.")
+        self.instance_queryer.prefetch(
+            asset_keys={
+                *asset_records_to_prefetch,
+                *(key for key in queried_keys if isinstance(key, AssetKey)),
+            },
+            asset_check_keys={key for key in queried_keys if isinstance(key, AssetCheckKey)},
+            status_cache_asset_keys=status_cache_asset_keys,
+            latest_run_entity_keys=latest_run_entity_keys,
+        )
+        self.logger.info("Done prefetching data.")
+
+    def _get_evaluation_groups(self) -> Sequence[Sequence[Sequence[EntityKey]]]:
+        """Splits the entity keys to evaluate into groups that can be evaluated independently of each
+        other, as no entity in a group depends on, or shares an execution set with, an entity in
+        another group. Each group is returned as a list of topological levels, and groups are
+        ordered by their first entity in the topological sort of the asset graph.
+        """
+        root_by_key: dict[EntityKey, EntityKey] = {}
+
+        def _find(key: EntityKey) -> EntityKey:
+            root = root_by_key.setdefault(key, key)
+            while root != root_by_key[root]:
+                root = root_by_key[root]
+            while key != root:
+                root_by_key[key], key = root, root_by_key[key]
+            return root
+
+        for key in self.entity_keys:
+            node = self.asset_graph.get(key)
+            for neighbor_key in (
+                node.parent_entity_keys | node.child_entity_keys | node.execution_set_entity_keys
+            ):
+                root_by_key[_find(neighbor_key)] = _find(key)
+
+        levels_by_root: dict[EntityKey, dict[int, list[EntityKey]]] = {}
+        for level_idx, topo_level in enumerate(self.asset_graph.toposorted_entity_keys_by_level):
+            for entity_key in topo_level:
+                if entity_key in self.entity_keys:
+                    levels = levels_by_root.setdefault(_find(entity_key), {})
+                    levels.setdefault(level_idx, []).append(entity_key)
+
+        return [list(levels.values()) for levels in levels_by_root.values()]
 
     def evaluate(self) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         return asyncio.run(self.async_evaluate())
@@ -109,48 +278,117 @@ def evaluate(self) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[En
     async def async_evaluate(
         self,
     ) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        # the data required for evaluation is fetched once up front, for all groups
         self.prefetch()
-        num_conditions = len(self.entity_keys)
-        num_evaluated = 0
+        prefetched_loaders = self.asset_graph_view.loaders
 
-        async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
-            self.logger.debug(
-                f"Evaluating {entity_key.to_user_string()} ({num_evaluated+offset}/{num_conditions})"
+        groups = self._get_evaluation_groups() if self.num_evaluation_workers > 1 else []
+        if len(groups) > 1:
+            self.logger.info(
+                f"Evaluating {len(groups)} independent groups of entities using "
+                f"{self.num_evaluation_workers} threads."
             )
-
-            try:
-                await self.evaluate_entity(entity_key)
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for {entity_key.to_user_string()}"
-                ) from e
-
-            result = self.current_results_by_key[entity_key]
-            num_requested = result.true_subset.size
-            if result.true_subset.is_partitioned:
-                requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
-            else:
-                requested_str = "(no partition)"
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-            log_fn(
-                f"{entity_key.to_user_string()} evaluation result: {num_requested} "
-                f"requested ({requested_str}) "
-                f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=self.num_evaluation_workers,
+                thread_name_prefix="automation_condition_evaluator",
+            ) as executor:
+                group_results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor, self._evaluate_group_in_thread, levels, prefetched_loaders
+                        )
+                        for levels in groups
+                    )
+                )
+            for results in group_results:
+                self.current_results_by_key.update(results.current_results_by_key)
+                self.legacy_expected_data_time_by_key.update(
+                    results.legacy_expected_data_time_by_key
+                )
+                for subset in results.request_subsets_by_key.values():
+                    self._add_request_subset(subset)
+        else:
+            await self._evaluate_levels(
+                [
+                    [entity_key for entity_key in topo_level if entity_key in self.entity_keys]
+                    for topo_level in self.asset_graph.toposorted_entity_keys_by_level
+                ]
             )
 
-        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
-            coroutines = [
-                _evaluate_entity_async(entity_key, offset)
-                for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
-            ]
-            await asyncio.gather(*coroutines)
-            num_evaluated += len(coroutines)
-
-        return list(self.current_results_by_key.values()), [
-            v for v in self.request_subsets_by_key.values() if not v.is_empty
+        # results are returned in topological order regardless of the order in which they were
+        # evaluated, so that the output of a tick does not depend on thread scheduling
+        toposorted_keys = [
+            entity_key
+            for topo_level in self.asset_graph.toposorted_entity_keys_by_level
+            for entity_key in topo_level
+        ]
+        return [
+            self.current_results_by_key[key]
+            for key in toposorted_keys
+            if key in self.current_results_by_key
+        ], [
+            self.request_subsets_by_key[key]
+            for key in toposorted_keys
+            if key in self.request_subsets_by_key and not self.request_subsets_by_key[key].is_empty
         ]
 
+    def _evaluate_group_in_thread(
+        self,
+        levels: Sequence[Sequence[EntityKey]],
+        prefetched_loaders: Mapping[type, tuple["DataLoader", "BlockingDataLoader"]],
+    ) -> _EvaluationResults:
+        self._thread_local.results = _EvaluationResults({}, {}, {})
+        try:
+            asyncio.run(self._evaluate_group(levels, prefetched_loaders))
+            return self._thread_local.results
+        finally:
+            del self._thread_local.results
+
+    async def _evaluate_group(
+        self,
+        levels: Sequence[Sequence[EntityKey]],
+        prefetched_loaders: Mapping[type, tuple["DataLoader", "BlockingDataLoader"]],
+    ) -> None:
+        # each thread runs its own event loop, and the AssetGraphView provides separate loaders for
+        # each thread, so the prefetched data is added to the loaders of this thread
+        self.asset_graph_view.prime_loaders_from(prefetched_loaders)
+        await self._evaluate_levels(levels)
+
+    async def _evaluate_levels(self, levels: Sequence[Sequence[EntityKey]]) -> None:
+        for topo_level in levels:
+            await asyncio.gather(
+                *(self._evaluate_entity_and_log(entity_key) for entity_key in topo_level)
+            )
+
+    async def _evaluate_entity_and_log(self, entity_key: EntityKey) -> None:
+        with self._num_evaluated_lock:
+            self._num_evaluated += 1
+            num_evaluated = self._num_evaluated
+        self.logger.debug(
+            f"Evaluating {entity_key.to_user_string()} ({num_evaluated}/{len(self.entity_keys)})"
+        )
+
+        try:
+            await self.evaluate_entity(entity_key)
+        except Exception as e:
+            raise Exception(
+                f"Error while evaluating conditions for {entity_key.to_user_string()}"
+            ) from e
+
+        result = self.current_results_by_key[entity_key]
+        num_requested = result.true_subset.size
+        if result.true_subset.is_partitioned:
+            requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
+        else:
+            requested_str = "(no partition)"
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
+        log_fn(
+            f"{entity_key.to_user_string()} evaluation result: {num_requested} "
+            f"requested ({requested_str}) "
+            f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+        )
+
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
@@ -78,9 +78,12 @@ def ignore(self, selection: "AssetSelection") -> "ChecksAutomationCondition":
         )
         return copy(self, ignore_selection=ignore_selection)
 
-    def _get_check_keys(
+    def get_check_keys(
         self, key: AssetKey, asset_graph: BaseAssetGraph[BaseAssetNode]
     ) -> AbstractSet[AssetCheckKey]:
+        """Returns the keys of the checks of the given asset that this condition evaluates its
+        operand against.
+        """
         check_keys = asset_graph.get(key).check_keys
         if self.blocking_only:
             check_keys = {ck for ck in check_keys if asset_graph.get(ck).blocking}
@@ -109,7 +112,7 @@ async def evaluate(self, context: AutomationContext[AssetKey]) -> AutomationResu
                 candidate_subset=context.candidate_subset,
             ).evaluate_async()
             for i, check_key in enumerate(
-                sorted(self._get_check_keys(context.key, context.asset_graph))
+                sorted(self.get_check_keys(context.key, context.asset_graph))
             )
         ]
 
@@ -133,7 +136,7 @@ async def evaluate(self, context: AutomationContext[AssetKey]) -> AutomationResu
         true_subset = context.candidate_subset
 
         for i, check_key in enumerate(
-            sorted(self._get_check_keys(context.key, context.asset_graph))
+            sorted(self.get_check_keys(context.key, context.asset_graph))
         ):
             check_result = await context.for_child_condition(
                 child_condition=EntityMatchesCondition(key=check_key, operand=self.operand),
@@ -134,9 +134,12 @@ def ignore(self, selection: "AssetSelection") -> "DepsAutomationCondition":
         )
         return copy(self, ignore_selection=ignore_selection)
 
-    def _get_dep_keys(
+    def get_dep_keys(
         self, key: T_EntityKey, asset_graph: BaseAssetGraph[BaseAssetNode]
     ) -> AbstractSet[AssetKey]:
+        """Returns the keys of the dependencies of the given entity that this condition evaluates
+        its operand against.
+        """
         dep_keys = asset_graph.get(key).parent_entity_keys
         if self.allow_selection is not None:
             dep_keys &= self.allow_selection.resolve(asset_graph)
@@ -176,7 +179,7 @@ async def evaluate(
         dep_results = []
         true_subset = context.get_empty_subset()
 
-        for i, dep_key in enumerate(sorted(self._get_dep_keys(context.key, context.asset_graph))):
+        for i, dep_key in enumerate(sorted(self.get_dep_keys(context.key, context.asset_graph))):
             dep_result = await context.for_child_condition(
                 child_condition=EntityMatchesCondition(key=dep_key, operand=self.operand),
                 child_index=i,
@@ -201,7 +204,7 @@ async def evaluate(
         dep_results = []
         true_subset = context.candidate_subset
 
-        for i, dep_key in enumerate(sorted(self._get_dep_keys(context.key, context.asset_graph))):
+        for i, dep_key in enumerate(sorted(self.get_dep_keys(context.key, context.asset_graph))):
             dep_result = await context.for_child_condition(
                 child_condition=EntityMatchesCondition(key=dep_key, operand=self.operand),
                 child_index=i,
@@ -7,7 +7,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Noneable, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -332,12 +332,19 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=check.opt_int_elem(worker_pool_cfg or {}, "max_steps_per_worker"),
+        recycle_workers_on_failure=(
+            check.bool_elem(worker_pool_cfg, "recycle_on_failure") if worker_pool_cfg else True
+        ),
     )
 
 
@@ -391,6 +398,34 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps that a worker process executes before it is replaced"
+                        " by a new process. By default, workers are reused for the whole run."
+                    ),
+                ),
+                "recycle_on_failure": Field(
+                    Bool,
+                    default_value=True,
+                    description=(
+                        "Whether to replace a worker process after it executes a step that fails,"
+                        " so that state left behind by the failure cannot affect later steps."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes rather than starting a"
+                " new process for each step. Each worker imports and loads the job once, and then"
+                " executes successive steps, which avoids paying process start up costs for every"
+                " step of jobs with many small steps. Module-level state in user code is shared"
+                " between the steps that execute in the same worker."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -419,6 +454,18 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default, each step is executed in a new process. For jobs with many short steps, the
+    ``worker_pool`` option instead executes steps in long-lived worker processes, which only import
+    and load the job once:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
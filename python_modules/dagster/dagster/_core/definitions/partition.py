@@ -1,6 +1,9 @@
+import base64
 import copy
 import hashlib
 import json
+import os
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
@@ -329,9 +332,19 @@ class StaticPartitionsDefinition(PartitionsDefinition[str]):
             @asset(partitions_def=oceans_partitions_defs)
             def ml_model_for_each_ocean():
                 ...
+
+    Args:
+        partition_keys (Sequence[str]): The keys of the partitions, in order.
+        use_bitmap_subset (bool): If True, subsets of this partitions definition are represented
+            as bitmaps over the partition key indexes, which makes set operations on large subsets
+            significantly cheaper. Subsets are still stored as lists of partition keys, unless the
+            ``DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS`` environment variable is set, in which
+            case they are stored as compressed bitmaps. Stored bitmaps cannot be read by versions
+            of Dagster that predate this option, so only set the environment variable once every
+            process that reads the instance's storage has been upgraded. Defaults to False.
     """
 
-    def __init__(self, partition_keys: Sequence[str]):
+    def __init__(self, partition_keys: Sequence[str], use_bitmap_subset: bool = False):
         # for back compat reasons we allow str as a Sequence[str] here
         if not isinstance(partition_keys, str):
             check.sequence_param(
@@ -344,6 +357,20 @@ def __init__(self, partition_keys: Sequence[str]):
         raise_error_on_duplicate_partition_keys(partition_keys)
 
         self._partition_keys = partition_keys
+        self._use_bitmap_subset = check.bool_param(use_bitmap_subset, "use_bitmap_subset")
+        self._hash: Optional[int] = None
+
+    @property
+    def use_bitmap_subset(self) -> bool:
+        return self._use_bitmap_subset
+
+    @property
+    def partitions_subset_class(self) -> type["PartitionsSubset"]:
+        return BitmapPartitionsSubset if self._use_bitmap_subset else DefaultPartitionsSubset
+
+    @cached_method
+    def get_partition_key_indexes(self) -> Mapping[str, int]:
+        return {key: idx for idx, key in enumerate(self._partition_keys)}
 
     @public
     def get_partition_keys(
@@ -367,11 +394,21 @@ def get_partition_keys(
         return self._partition_keys
 
     def __hash__(self):
-        return hash(self.__repr__())
+        # cached, since subsets of the definition are hashed by their definition. Derived from a
+        # digest of the partition keys rather than the keys themselves, so that the cached value
+        # remains valid if the definition is pickled into another process.
+        if self._hash is None:
+            unique_id = self.get_serializable_unique_identifier()
+            self._hash = hash((int(unique_id[:16], 16), self._use_bitmap_subset))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         return isinstance(other, StaticPartitionsDefinition) and (
-            self is other or self._partition_keys == other.get_partition_keys()
+            self is other
+            or (
+                self._use_bitmap_subset == other.use_bitmap_subset
+                and self._partition_keys == other.get_partition_keys()
+            )
         )
 
     def __repr__(self) -> str:
@@ -1103,6 +1140,42 @@ def deserialize(self, partitions_def: PartitionsDefinition) -> PartitionsSubset:
         return partitions_def.deserialize_subset(self.serialized_subset)
 
 
+def _should_serialize_partitions_subset_bitmaps() -> bool:
+    # bitmaps cannot be read by older versions of dagster, so they are only written once every
+    # process sharing the storage has been upgraded
+    return bool(os.getenv("DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS"))
+
+
+def _encode_bitmap(bitmap: int) -> str:
+    return base64.b64encode(
+        zlib.compress(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little"))
+    ).decode("ascii")
+
+
+def _decode_bitmap(encoded: str) -> int:
+    return int.from_bytes(zlib.decompress(base64.b64decode(encoded)), "little")
+
+
+def _iter_bitmap_indexes(bitmap: int) -> Iterable[int]:
+    # bin() runs in C, so scanning its output is much faster than shifting the int bit by bit
+    bits = bin(bitmap)[:1:-1]
+    idx = bits.find("1")
+    while idx != -1:
+        yield idx
+        idx = bits.find("1", idx + 1)
+
+
+def _is_serialized_bitmap_valid_for_partitions_def(
+    data: Mapping[str, Any], partitions_def: PartitionsDefinition
+) -> bool:
+    # bitmaps reference partitions by index, so they can only be deserialized against the exact
+    # set of partition keys they were created with
+    return (
+        isinstance(partitions_def, StaticPartitionsDefinition)
+        and data.get("partitions_def_id") == partitions_def.get_serializable_unique_identifier()
+    )
+
+
 @whitelist_for_serdes
 class DefaultPartitionsSubset(
     PartitionsSubset,
@@ -1242,6 +1315,15 @@ def from_serialized(
                     f"Attempted to deserialize partition subset with version {data.get('version')},"
                     f" but only version {cls.SERIALIZATION_VERSION} is supported."
                 )
+            if "bitmap" in data:
+                # written by a BitmapPartitionsSubset
+                return cls(
+                    subset=set(
+                        BitmapPartitionsSubset.from_serialized(
+                            partitions_def, serialized
+                        ).get_partition_keys()
+                    )
+                )
             return cls(subset=set(data.get("subset")))
 
     @classmethod
@@ -1253,9 +1335,24 @@ def can_deserialize(
         serialized_partitions_def_class_name: Optional[str],
     ) -> bool:
         if serialized_partitions_def_class_name is not None:
-            return serialized_partitions_def_class_name == partitions_def.__class__.__name__
+            if serialized_partitions_def_class_name != partitions_def.__class__.__name__:
+                return False
+            # only subsets written by a BitmapPartitionsSubset need to be parsed to check that they
+            # match the partitions definition, so avoid parsing the usually much larger key lists
+            if '"bitmap"' not in serialized:
+                return True
 
         data = json.loads(serialized)
+        if isinstance(data, dict) and "bitmap" in data:
+            return data.get(
+                "version"
+            ) == cls.SERIALIZATION_VERSION and _is_serialized_bitmap_valid_for_partitions_def(
+                data, partitions_def
+            )
+
+        if serialized_partitions_def_class_name is not None:
+            return True
+
         return isinstance(data, list) or (
             data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
         )
@@ -1283,6 +1380,239 @@ def empty_subset(
     ) -> "DefaultPartitionsSubset":
         return DefaultPartitionsSubset()
 
+    def to_bitmap_subset(self, partitions_def: StaticPartitionsDefinition) -> PartitionsSubset:
+        return BitmapPartitionsSubset.create_empty_subset(partitions_def).with_partition_keys(
+            self.subset
+        )
+
+
+class BitmapPartitionsSubset(
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [("partitions_def", StaticPartitionsDefinition), ("bitmap", int)],
+    ),
+    PartitionsSubset,
+):
+    """A subset of the partitions of a StaticPartitionsDefinition, stored as an integer bitmap in
+    which bit i is set if the i-th partition key of the definition is in the subset.
+
+    Union, intersection, and difference between subsets of the same partitions definition are
+    single big-integer operations, and the subset serializes to a compressed form of the bitmap
+    rather than a list of keys.
+
+    This class is not itself serdes-serializable: `to_serializable_subset` converts it to a
+    DefaultPartitionsSubset, and `serialize` produces a string that DefaultPartitionsSubset is
+    also able to deserialize. `serialize` only writes the bitmap if the
+    DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS environment variable is set, and otherwise writes
+    the same list of keys as a DefaultPartitionsSubset, which every version of dagster can read.
+
+    Like TimeWindowPartitionsSubset, subsets are only equal to subsets of an equal partitions
+    definition, and are hashed by their definition and bitmap. Since a DefaultPartitionsSubset has
+    no partitions definition, they are never equal to one, even if it has the same partition keys.
+    """
+
+    def __new__(cls, partitions_def: StaticPartitionsDefinition, bitmap: int = 0):
+        return super().__new__(
+            cls,
+            partitions_def=check.inst_param(
+                partitions_def, "partitions_def", StaticPartitionsDefinition
+            ),
+            bitmap=check.int_param(bitmap, "bitmap"),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self.bitmap == 0
+
+    def _all_partitions_bitmap(self) -> int:
+        return (1 << len(self.partitions_def.get_partition_keys())) - 1
+
+    def _keys_for_bitmap(self, bitmap: int) -> Sequence[str]:
+        partition_keys = self.partitions_def.get_partition_keys()
+        return [partition_keys[idx] for idx in _iter_bitmap_indexes(bitmap)]
+
+    def _is_compatible(self, other: PartitionsSubset) -> bool:
+        # definitions are almost always the same object, and the cached hash rules out most
+        # definitions that are not equal without comparing their partition keys
+        return isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self.partitions_def
+            or (
+                hash(other.partitions_def) == hash(self.partitions_def)
+                and other.partitions_def == self.partitions_def
+            )
+        )
+
+    def get_partition_keys(self) -> Sequence[str]:
+        return self._keys_for_bitmap(self.bitmap)
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return self._keys_for_bitmap(self._all_partitions_bitmap() & ~self.bitmap)
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self.partitions_def.get_partition_keys()
+        result = []
+        range_start = range_end = None
+        for idx in _iter_bitmap_indexes(self.bitmap):
+            if range_end is not None and idx == range_end + 1:
+                range_end = idx
+                continue
+            if range_start is not None and range_end is not None:
+                result.append(
+                    PartitionKeyRange(partition_keys[range_start], partition_keys[range_end])
+                )
+            range_start = range_end = idx
+
+        if range_start is not None and range_end is not None:
+            result.append(PartitionKeyRange(partition_keys[range_start], partition_keys[range_end]))
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_key_indexes = self.partitions_def.get_partition_key_indexes()
+        bitmap = self.bitmap
+        unknown_keys = set()
+        for partition_key in partition_keys:
+            idx = partition_key_indexes.get(partition_key)
+            if idx is None:
+                unknown_keys.add(partition_key)
+            else:
+                bitmap |= 1 << idx
+
+        if unknown_keys:
+            # keys that do not belong to the partitions definition cannot be represented in the
+            # bitmap, so fall back to a set of keys
+            return DefaultPartitionsSubset(set(self._keys_for_bitmap(bitmap)) | unknown_keys)
+        return BitmapPartitionsSubset(self.partitions_def, bitmap)
+
+    def with_partition_key_range(
+        self,
+        partitions_def: PartitionsDefinition,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> PartitionsSubset:
+        partition_key_indexes = self.partitions_def.get_partition_key_indexes()
+        start_idx = partition_key_indexes.get(partition_key_range.start)
+        end_idx = partition_key_indexes.get(partition_key_range.end)
+        if start_idx is None or end_idx is None:
+            # defer to the base implementation, which raises an informative error
+            return super().with_partition_key_range(
+                partitions_def, partition_key_range, dynamic_partitions_store
+            )
+        range_bitmap = ((1 << (end_idx - start_idx + 1)) - 1) << start_idx
+        return BitmapPartitionsSubset(self.partitions_def, self.bitmap | range_bitmap)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return BitmapPartitionsSubset(
+                self.partitions_def, self.bitmap | cast(BitmapPartitionsSubset, other).bitmap
+            )
+        return super().__or__(other)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return BitmapPartitionsSubset(
+                self.partitions_def, self.bitmap & cast(BitmapPartitionsSubset, other).bitmap
+            )
+        return super().__and__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return BitmapPartitionsSubset(
+                self.partitions_def, self.bitmap & ~cast(BitmapPartitionsSubset, other).bitmap
+            )
+        return super().__sub__(other)
+
+    def serialize(self) -> str:
+        if not _should_serialize_partitions_subset_bitmaps():
+            return self.to_serializable_subset().serialize()
+
+        return json.dumps(
+            {
+                "version": DefaultPartitionsSubset.SERIALIZATION_VERSION,
+                "partitions_def_id": self.partitions_def.get_serializable_unique_identifier(),
+                "bitmap": _encode_bitmap(self.bitmap),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        data = json.loads(serialized)
+        if not isinstance(data, dict) or "bitmap" not in data:
+            # subsets serialized as a set of keys
+            return DefaultPartitionsSubset.from_serialized(
+                partitions_def, serialized
+            ).to_bitmap_subset(check.inst(partitions_def, StaticPartitionsDefinition))
+
+        if data.get("version") != DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {DefaultPartitionsSubset.SERIALIZATION_VERSION} is supported."
+            )
+        if not _is_serialized_bitmap_valid_for_partitions_def(data, partitions_def):
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset bitmap against a partitions definition"
+                " with different partition keys than the one it was created with."
+            )
+        return cls(cast(StaticPartitionsDefinition, partitions_def), _decode_bitmap(data["bitmap"]))
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, BitmapPartitionsSubset)
+            and self._is_compatible(other)
+            and self.bitmap == other.bitmap
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.partitions_def, self.bitmap))
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1")
+
+    def __contains__(self, value) -> bool:
+        idx = self.partitions_def.get_partition_key_indexes().get(value)
+        return idx is not None and bool(self.bitmap >> idx & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={set(self.get_partition_keys())})"
+
+    @classmethod
+    def create_empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        return cls(check.inst(partitions_def, StaticPartitionsDefinition))
+
+    def empty_subset(self) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(self.partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
 
 class AllPartitionsSubset(
     NamedTuple(
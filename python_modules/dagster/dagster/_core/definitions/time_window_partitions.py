@@ -1,8 +1,13 @@
+import bisect
 import functools
 import hashlib
+import itertools
 import json
+import math
 import re
-from collections.abc import Iterable, Mapping, Sequence
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import cached_property
@@ -39,6 +44,7 @@
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
@@ -217,6 +223,280 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+# Upper bound on the number of cron ticks that are compiled into a _CompiledTimeWindowIndex when
+# looking up an arbitrary timestamp, so that lookups of keys far in the future fall back to
+# iterating the cron schedule rather than materializing an enormous table
+MAX_COMPILED_TIME_WINDOW_TICKS = 100_000
+
+# The number of compiled tick tables that are kept in memory. Tables are shared by every definition
+# with the same cron schedule, timezone and start.
+_COMPILED_TIME_WINDOW_INDEX_CACHE_SIZE = 16
+
+_FIXED_INTERVAL_SECONDS_BY_SCHEDULE_TYPE = {
+    ScheduleType.HOURLY: 60 * 60,
+    ScheduleType.DAILY: 24 * 60 * 60,
+    ScheduleType.WEEKLY: 7 * 24 * 60 * 60,
+}
+
+
+class _TimeWindowIndex(ABC):
+    """Maps between partition indexes and the cron ticks of a TimeWindowPartitionsDefinition.
+
+    Tick i is the start of the i-th time window of the definition, so tick 0 is the first cron tick
+    at or after the definition's start, and window i spans [tick(i), tick(i + 1)).
+    """
+
+    @abstractmethod
+    def tick(self, idx: int) -> datetime: ...
+
+    @abstractmethod
+    def first_index_at_or_after(self, timestamp: float) -> int:
+        """The index of the first tick with a timestamp >= the given timestamp."""
+
+    @abstractmethod
+    def first_index_after(self, timestamp: float) -> int:
+        """The index of the first tick with a timestamp > the given timestamp."""
+
+    @abstractmethod
+    def is_indexable(self, timestamp: float) -> bool:
+        """Whether index lookups for the given timestamp are supported."""
+
+    def ticks(self, start_idx: int, end_idx: int) -> Sequence[datetime]:
+        """The ticks with indexes in [start_idx, end_idx)."""
+        return [self.tick(idx) for idx in range(start_idx, end_idx)]
+
+    def time_window(self, idx: int) -> TimeWindow:
+        return TimeWindow(self.tick(idx), self.tick(idx + 1))
+
+
+class _FixedIntervalTimeWindowIndex(_TimeWindowIndex):
+    """Index for schedules whose ticks are a fixed number of seconds apart, where ticks can be
+    computed directly from their index.
+    """
+
+    def __init__(self, first_tick: datetime, interval_seconds: int):
+        self._first_tick = first_tick
+        self._first_timestamp = first_tick.timestamp()
+        self._interval_seconds = interval_seconds
+
+    def tick(self, idx: int) -> datetime:
+        return self._first_tick + timedelta(seconds=idx * self._interval_seconds)
+
+    def first_index_at_or_after(self, timestamp: float) -> int:
+        return max(math.ceil((timestamp - self._first_timestamp) / self._interval_seconds), 0)
+
+    def first_index_after(self, timestamp: float) -> int:
+        return max(math.floor((timestamp - self._first_timestamp) / self._interval_seconds) + 1, 0)
+
+    def is_indexable(self, timestamp: float) -> bool:
+        return timestamp >= self._first_timestamp
+
+
+class _CalendarTimeWindowIndex(_TimeWindowIndex):
+    """Index for daily, weekly and monthly schedules in any timezone, which tick exactly once per
+    local calendar day, week or month. DST transitions can shift individual ticks, or change the
+    number of seconds between them, but not the calendar period that each tick falls in, so the
+    index of a tick can be computed from its local date. Each tick is found by running the cron
+    iterator from the start of its local day, so DST transitions are handled identically to
+    iterating time windows.
+    """
+
+    def __init__(
+        self,
+        cron_schedule: str,
+        timezone: str,
+        schedule_type: ScheduleType,
+        first_tick: datetime,
+    ):
+        check.invariant(
+            schedule_type in (ScheduleType.DAILY, ScheduleType.WEEKLY, ScheduleType.MONTHLY)
+        )
+        self._cron_schedule = cron_schedule
+        self._timezone = timezone
+        self._tzinfo = get_timezone(timezone)
+        self._schedule_type = schedule_type
+        self._first_tick = first_tick
+        self._first_timestamp = first_tick.timestamp()
+        self._first_date = first_tick.astimezone(self._tzinfo).date()
+
+    def _period_start_date(self, idx: int) -> date:
+        if self._schedule_type == ScheduleType.MONTHLY:
+            month_idx = self._first_date.month - 1 + idx
+            return date(self._first_date.year + month_idx // 12, month_idx % 12 + 1, 1)
+        days = 7 if self._schedule_type == ScheduleType.WEEKLY else 1
+        return self._first_date + timedelta(days=idx * days)
+
+    def _period_index(self, local_date: date) -> int:
+        if self._schedule_type == ScheduleType.MONTHLY:
+            return (local_date.year - self._first_date.year) * 12 + (
+                local_date.month - self._first_date.month
+            )
+        days = 7 if self._schedule_type == ScheduleType.WEEKLY else 1
+        return (local_date - self._first_date).days // days
+
+    def _iterate_ticks_from(self, idx: int) -> Iterator[datetime]:
+        period_start = self._period_start_date(idx)
+        start_of_day = datetime(period_start.year, period_start.month, period_start.day)
+        # if midnight is skipped or repeated by a DST transition, start from the later of its
+        # interpretations, which is always on the period's first day
+        start_timestamp = max(
+            start_of_day.replace(tzinfo=self._tzinfo, fold=fold).timestamp() for fold in (0, 1)
+        )
+        return cron_string_iterator(
+            start_timestamp=start_timestamp,
+            cron_string=self._cron_schedule,
+            execution_timezone=self._timezone,
+        )
+
+    def tick(self, idx: int) -> datetime:
+        if idx == 0:
+            return self._first_tick
+        return next(self._iterate_ticks_from(idx))
+
+    def ticks(self, start_idx: int, end_idx: int) -> Sequence[datetime]:
+        if start_idx >= end_idx:
+            return []
+        iterator = self._iterate_ticks_from(start_idx)
+        return [next(iterator) for _ in range(end_idx - start_idx)]
+
+    def _first_index_at_or_after(self, timestamp: float, inclusive: bool) -> int:
+        if timestamp < self._first_timestamp:
+            return 0
+        # ticks of earlier periods are before the timestamp, and ticks of later periods after it
+        idx = self._period_index(datetime.fromtimestamp(timestamp, self._tzinfo).date())
+        tick_timestamp = self.tick(idx).timestamp()
+        if tick_timestamp > timestamp or (inclusive and tick_timestamp == timestamp):
+            return idx
+        return idx + 1
+
+    def first_index_at_or_after(self, timestamp: float) -> int:
+        return self._first_index_at_or_after(timestamp, inclusive=True)
+
+    def first_index_after(self, timestamp: float) -> int:
+        return self._first_index_at_or_after(timestamp, inclusive=False)
+
+    def is_indexable(self, timestamp: float) -> bool:
+        return timestamp >= self._first_timestamp
+
+
+class _CompiledTimeWindowIndex(_TimeWindowIndex):
+    """Index for arbitrary schedules, which lazily compiles the ticks produced by the cron iterator
+    into a table that is then searched by bisection. The ticks come from a single cron iterator
+    started at the partitions definition's start, exactly as in _iterate_time_windows, so the
+    table always agrees with iterating time windows. Restarting the cron iterator from an
+    intermediate tick is not equivalent: in timezones with a non-whole-hour UTC offset, hourly
+    iterators started between ticks can be out of phase with the original ones.
+
+    The table holds at most MAX_COMPILED_TIME_WINDOW_TICKS ticks. Ticks past the end of a full table
+    are found by iterating the cron schedule from the start again and skipping the ticks in the
+    table, without storing them.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _ticks, _timestamps and _iterator
+    """
+
+    def __init__(self, iterate_ticks: Callable[[], Iterator[datetime]]):
+        self._iterate_ticks = iterate_ticks
+        self._iterator = iterate_ticks()
+        first_tick = next(self._iterator)
+        self._ticks: list[datetime] = [first_tick]
+        self._timestamps: list[float] = [first_tick.timestamp()]
+        self._lock = threading.Lock()
+
+    def _extend(self) -> bool:
+        if len(self._ticks) >= MAX_COMPILED_TIME_WINDOW_TICKS:
+            return False
+        next_tick = next(self._iterator)
+        self._ticks.append(next_tick)
+        self._timestamps.append(next_tick.timestamp())
+        return True
+
+    def _extend_past(self, timestamp: float) -> bool:
+        """Extends the table until its last tick is after the given timestamp. Returns False if the
+        table is full before that point.
+        """
+        while self._timestamps[-1] <= timestamp:
+            if not self._extend():
+                return False
+        return True
+
+    def _iterate_ticks_past_table(self) -> Iterator[tuple[int, datetime]]:
+        num_ticks = len(self._ticks)
+        return enumerate(itertools.islice(self._iterate_ticks(), num_ticks, None), start=num_ticks)
+
+    def tick(self, idx: int) -> datetime:
+        with self._lock:
+            while len(self._ticks) <= idx:
+                if not self._extend():
+                    break
+            else:
+                return self._ticks[idx]
+            ticks_past_table = self._iterate_ticks_past_table()
+
+        for tick_idx, tick in ticks_past_table:
+            if tick_idx == idx:
+                return tick
+        check.failed("Cron schedule iterator ended unexpectedly")
+
+    def ticks(self, start_idx: int, end_idx: int) -> Sequence[datetime]:
+        with self._lock:
+            while len(self._ticks) < end_idx:
+                if not self._extend():
+                    break
+            result = self._ticks[start_idx:end_idx]
+            if len(self._ticks) >= end_idx:
+                return result
+            ticks_past_table = self._iterate_ticks_past_table()
+
+        for tick_idx, tick in ticks_past_table:
+            if tick_idx >= end_idx:
+                break
+            if tick_idx >= start_idx:
+                result.append(tick)
+        return result
+
+    def first_index_at_or_after(self, timestamp: float) -> int:
+        with self._lock:
+            if self._extend_past(timestamp):
+                return bisect.bisect_left(self._timestamps, timestamp)
+            ticks_past_table = self._iterate_ticks_past_table()
+
+        for tick_idx, tick in ticks_past_table:
+            if tick.timestamp() >= timestamp:
+                return tick_idx
+        check.failed("Cron schedule iterator ended unexpectedly")
+
+    def first_index_after(self, timestamp: float) -> int:
+        with self._lock:
+            if self._extend_past(timestamp):
+                return bisect.bisect_right(self._timestamps, timestamp)
+            ticks_past_table = self._iterate_ticks_past_table()
+
+        for tick_idx, tick in ticks_past_table:
+            if tick.timestamp() > timestamp:
+                return tick_idx
+        check.failed("Cron schedule iterator ended unexpectedly")
+
+    def is_indexable(self, timestamp: float) -> bool:
+        with self._lock:
+            return timestamp >= self._timestamps[0] and self._extend_past(timestamp)
+
+
+@functools.lru_cache(maxsize=_COMPILED_TIME_WINDOW_INDEX_CACHE_SIZE)
+def _get_compiled_time_window_index(
+    cron_schedule: str, timezone: str, start_timestamp: float
+) -> _CompiledTimeWindowIndex:
+    def _iterate_ticks() -> Iterator[datetime]:
+        iterator = cron_string_iterator(
+            start_timestamp=start_timestamp,
+            cron_string=cron_schedule,
+            execution_timezone=timezone,
+        )
+        return itertools.dropwhile(lambda tick: tick.timestamp() < start_timestamp, iterator)
+
+    return _CompiledTimeWindowIndex(_iterate_ticks)
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -354,6 +634,62 @@ def end(self) -> Optional[datetime]:
             get_timezone(end_timestamp_with_timezone.timezone),
         )
 
+    @cached_property
+    def _time_window_index(self) -> _TimeWindowIndex:
+        iterator = iter(self._iterate_time_windows(self.start.timestamp()))
+        first_tick = next(iterator).start
+
+        # in UTC, schedules with a fixed cadence have a constant number of seconds between ticks, so
+        # ticks can be computed directly
+        schedule_type = self.schedule_type
+        if self.timezone.upper() == "UTC":
+            fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+            interval_seconds = (
+                fixed_minute_interval * 60
+                if fixed_minute_interval
+                else _FIXED_INTERVAL_SECONDS_BY_SCHEDULE_TYPE.get(schedule_type)  # type: ignore
+            )
+            if interval_seconds:
+                return _FixedIntervalTimeWindowIndex(first_tick, interval_seconds)
+
+        # in other timezones, DST transitions can shift individual ticks, but schedules that tick
+        # once per calendar period can still be indexed by their local date. Monthly schedules on
+        # days that not every month has are skipped in some months, so they can't.
+        if schedule_type in (ScheduleType.DAILY, ScheduleType.WEEKLY) or (
+            schedule_type == ScheduleType.MONTHLY
+            and self.day_offset <= MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL
+        ):
+            return _CalendarTimeWindowIndex(
+                self.cron_schedule, self.timezone, check.not_none(schedule_type), first_tick
+            )
+
+        # otherwise, e.g. for hourly schedules outside of UTC, which tick a varying number of times
+        # per day, we compile the ticks produced by the cron iterator
+        return _get_compiled_time_window_index(
+            self.cron_schedule, self.timezone, self.start.timestamp()
+        )
+
+    def _get_num_partitions_at(self, current_timestamp: float) -> int:
+        index = self._time_window_index
+        # windows that end at or before the current time
+        num_partitions = max(index.first_index_after(current_timestamp) - 1, 0)
+        if self.end_offset > 0:
+            num_partitions += self.end_offset
+        # only look up the end of the definition if the last window ends after it, since the end
+        # may be far in the future
+        if self.end and index.tick(num_partitions).timestamp() > self.end.timestamp():
+            num_partitions = max(index.first_index_after(self.end.timestamp()) - 1, 0)
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+        return num_partitions
+
+    def _time_window_for_timestamp(self, timestamp: float) -> TimeWindow:
+        """Returns the first time window that starts at or after the given timestamp."""
+        index = self._time_window_index
+        if index.is_indexable(timestamp):
+            return index.time_window(index.first_index_at_or_after(timestamp))
+        return next(iter(self._iterate_time_windows(timestamp)))
+
     def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         if not current_time:
             return get_current_timestamp()
@@ -386,6 +722,14 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
             minutes_in_window = (time_window.end.timestamp() - time_window.start.timestamp()) / 60
             return int(minutes_in_window // fixed_minute_interval)
 
+        index = self._time_window_index
+        if index.is_indexable(time_window.start.timestamp()) and index.is_indexable(
+            time_window.end.timestamp()
+        ):
+            return index.first_index_at_or_after(
+                time_window.end.timestamp()
+            ) - index.first_index_at_or_after(time_window.start.timestamp())
+
         return len(self.get_partition_keys_in_time_window(time_window))
 
     def get_num_partitions(
@@ -393,15 +737,7 @@ def get_num_partitions(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> int:
-        last_partition_window = self.get_last_partition_window(current_time)
-        first_partition_window = self.get_first_partition_window(current_time)
-
-        if not last_partition_window or not first_partition_window:
-            return 0
-
-        return self.get_num_partitions_in_window(
-            TimeWindow(start=first_partition_window.start, end=last_partition_window.end)
-        )
+        return self._get_num_partitions_at(self._get_current_timestamp(current_time=current_time))
 
     def get_partition_keys_between_indexes(
         self, start_idx: int, end_idx: int, current_time: Optional[datetime] = None
@@ -410,70 +746,24 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
-        current_timestamp = self._get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys = []
-        reached_end = False
-
-        for idx, time_window in enumerate(self._iterate_time_windows(self.start.timestamp())):
-            if time_window.end.timestamp() >= current_timestamp:
-                reached_end = True
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                reached_end = True
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                if idx >= start_idx and idx < end_idx:
-                    partition_keys.append(
-                        dst_safe_strftime(
-                            time_window.start, self.timezone, self.fmt, self.cron_schedule
-                        )
-                    )
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-            if len(partition_keys) >= end_idx - start_idx:
-                break
-
-        if reached_end and self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
-
-        return partition_keys
+        num_partitions = self._get_num_partitions_at(
+            self._get_current_timestamp(current_time=current_time)
+        )
+        return [
+            dst_safe_strftime(tick, self.timezone, self.fmt, self.cron_schedule)
+            for tick in self._time_window_index.ticks(
+                max(start_idx, 0), min(end_idx, num_partitions)
+            )
+        ]
 
     def get_partition_keys(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
-        current_timestamp = self._get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys: list[str] = []
-        for time_window in self._iterate_time_windows(self.start.timestamp()):
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                break
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                partition_keys.append(
-                    dst_safe_strftime(
-                        time_window.start, self.timezone, self.fmt, self.cron_schedule
-                    )
-                )
-
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-
-        if self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
-
-        return partition_keys
+        return self.get_partition_keys_between_indexes(
+            0, self.get_num_partitions(current_time), current_time=current_time
+        )
 
     def __str__(self) -> str:
         schedule_str = (
@@ -504,7 +794,7 @@ def __hash__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
+        return self._time_window_for_timestamp(partition_key_dt.timestamp())
 
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
@@ -515,30 +805,12 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
-        sorted_pks = sorted(
-            partition_keys,
-            key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
-        )
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
-            )
+        partition_key_timestamps = sorted(
+            dst_safe_strptime(pk, self.timezone, self.fmt).timestamp() for pk in partition_keys
         )
-        partition_key_time_windows: list[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if (
-                dst_safe_strftime(next_window.start, self.timezone, self.fmt, self.cron_schedule)
-                == partition_key
-            ):
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
-                    )
-                )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+        partition_key_time_windows = [
+            self._time_window_for_timestamp(timestamp) for timestamp in partition_key_timestamps
+        ]
 
         if validate:
             start_time_window = self.get_first_partition_window()
@@ -564,7 +836,7 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
+        return self._time_window_for_timestamp(partition_key_dt.timestamp()).start
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
@@ -661,13 +933,10 @@ def _get_last_partition_window(self, *, current_timestamp: float) -> Optional[Ti
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
         else:
-            # TODO: make this efficient
-            last_partition_key = super().get_last_partition_key(
-                datetime.fromtimestamp(current_timestamp, tz=get_timezone(self.timezone))
-            )
+            num_partitions = self._get_num_partitions_at(current_timestamp)
             return (
-                self.time_window_for_partition_key(last_partition_key)
-                if last_partition_key
+                self._time_window_index.time_window(num_partitions - 1)
+                if num_partitions > 0
                 else None
             )
 
@@ -704,6 +973,18 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        index = self._time_window_index
+        if index.is_indexable(time_window.start.timestamp()) and index.is_indexable(
+            time_window.end.timestamp()
+        ):
+            return [
+                dst_safe_strftime(tick, self.timezone, self.fmt, self.cron_schedule)
+                for tick in index.ticks(
+                    index.first_index_at_or_after(time_window.start.timestamp()),
+                    index.first_index_at_or_after(time_window.end.timestamp()),
+                )
+            ]
+
         result: list[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
@@ -255,6 +255,19 @@ class DagsterEventType(str, Enum):
     DagsterEventType.ASSET_FAILED_TO_MATERIALIZE,
 }
 
+# When buffered event writing is enabled, these events (along with all run events) cause the event
+# buffer to be flushed immediately, since they mark step boundaries or failures that consumers of the
+# event log (the UI, run monitoring, retries) need to observe promptly.
+EVENT_BUFFER_FLUSH_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_FAILED_TO_MATERIALIZE,
+}
+
 ASSET_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
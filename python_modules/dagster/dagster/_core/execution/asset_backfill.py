@@ -1345,6 +1345,37 @@ def _get_subset_in_target_subset(
     return AssetGraphSubset.from_entity_subsets([subset_in_target_subset])
 
 
+def _get_children_in_target_subset(
+    asset_graph_view: AssetGraphView,
+    parent_asset_graph_subset: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+) -> AssetGraphSubset:
+    """Returns the targeted children of the provided subset. Since the children of an asset
+    partition can only be requested once all of their targeted parents have been materialized by
+    the backfill, these are the only asset partitions that can have become eligible to be requested
+    after the provided subset was materialized.
+    """
+    asset_graph = asset_graph_view.asset_graph
+    child_subsets_by_key: dict[AssetKey, EntitySubset[AssetKey]] = {}
+    for parent_entity_subset in asset_graph_view.iterate_asset_subsets(parent_asset_graph_subset):
+        for child_key in asset_graph.get(parent_entity_subset.key).child_keys:
+            if child_key not in target_subset.asset_keys:
+                continue
+            child_subset = asset_graph_view.compute_child_subset(child_key, parent_entity_subset)
+            if child_key in child_subsets_by_key:
+                child_subset = child_subset.compute_union(child_subsets_by_key[child_key])
+            child_subsets_by_key[child_key] = child_subset
+
+    return AssetGraphSubset.from_entity_subsets(
+        [
+            child_subset.compute_intersection(
+                asset_graph_view.get_entity_subset_from_asset_graph_subset(target_subset, child_key)
+            )
+            for child_key, child_subset in child_subsets_by_key.items()
+        ]
+    )
+
+
 def _get_failed_and_downstream_asset_graph_subset(
     backfill_id: str,
     asset_backfill_data: AssetBackfillData,
@@ -1454,6 +1485,21 @@ def execute_asset_backfill_iteration_inner(
         RemoteWorkspaceAssetGraph, asset_graph_view.asset_graph
     )
 
+    # fetch the asset records of all targeted assets and their parents in a single batch, rather
+    # than one query per asset as they are needed
+    target_asset_keys = {
+        key for key in asset_backfill_data.target_subset.asset_keys if asset_graph.has(key)
+    }
+    instance_queryer.prefetch_asset_records(
+        target_asset_keys
+        | {
+            parent
+            for key in target_asset_keys
+            for parent in asset_graph.get(key).parent_keys
+            if asset_graph.has(parent)
+        }
+    )
+
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
     if request_roots:
         logger.info(
@@ -1500,17 +1546,13 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
-        parent_materialized_asset_partitions = set().union(
-            *(
-                instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
-                    latest_storage_id=asset_backfill_data.latest_storage_id,
-                    child_asset_key=asset_key,
-                )[0]
-                for asset_key in asset_backfill_data.target_subset.asset_keys
-            )
-        )
-        candidate_asset_graph_subset = AssetGraphSubset.from_asset_partition_set(
-            parent_materialized_asset_partitions, asset_graph
+        # Only the children of partitions that the backfill materialized since the last tick can
+        # have become eligible to be requested, so rather than re-evaluating every targeted asset
+        # against all of its parents, only this frontier is evaluated.
+        candidate_asset_graph_subset = _get_children_in_target_subset(
+            asset_graph_view,
+            materialized_since_last_tick,
+            asset_backfill_data.target_subset,
         )
 
         yield None
@@ -1,4 +1,4 @@
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, NamedTuple, Optional, Union
@@ -19,6 +19,7 @@
 )
 from dagster._core.execution.bulk_actions import BulkActionType
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._core.loader import LoadableBy, LoadingContext
 from dagster._core.remote_representation.external_data import job_name_for_partition_set_snap_name
 from dagster._core.remote_representation.origin import RemotePartitionSetOrigin
 from dagster._core.storage.dagster_run import (
@@ -120,6 +121,7 @@ class PartitionBackfill(
             ("backfill_end_timestamp", Optional[float]),
         ],
     ),
+    LoadableBy[str],
 ):
     def __new__(
         cls,
@@ -197,6 +199,23 @@ def __new__(
             ),
         )
 
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], context: LoadingContext
+    ) -> Iterable[Optional["PartitionBackfill"]]:
+        result_map: dict[str, Optional[PartitionBackfill]] = {
+            backfill_id: None for backfill_id in keys
+        }
+        backfills = context.instance.get_backfills(
+            filters=BulkActionsFilter(backfill_ids=list(result_map.keys()))
+        )
+
+        for backfill in backfills:
+            if backfill.backfill_id in result_map:
+                result_map[backfill.backfill_id] = backfill
+
+        return result_map.values()
+
     @property
     def selector_id(self):
         return self.partition_set_origin.get_selector_id() if self.partition_set_origin else None
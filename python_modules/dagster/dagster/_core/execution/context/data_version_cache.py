@@ -7,7 +7,7 @@
 in the user_context module.
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from hashlib import sha256
 from typing import Optional
@@ -71,10 +71,17 @@ def get_data_version(self, asset_key: AssetKey) -> "DataVersion":
     def maybe_fetch_and_get_input_asset_version_info(
         self, key: AssetKey
     ) -> Optional["InputAssetVersionInfo"]:
-        if key not in self.input_asset_version_info:
-            self._fetch_input_asset_version_info([key])
+        self.maybe_fetch_input_asset_version_info([key])
         return self.input_asset_version_info[key]
 
+    # Fetches the records of all of the provided keys that are not yet cached in a single batch, so
+    # that intra-step deps wiped from the cache can be refreshed with one query per downstream asset
+    # rather than one query per dep.
+    def maybe_fetch_input_asset_version_info(self, keys: Iterable[AssetKey]) -> None:
+        to_fetch = [key for key in keys if key not in self.input_asset_version_info]
+        if to_fetch:
+            self._fetch_input_asset_version_info(to_fetch)
+
     # "external" refers to records for inputs generated outside of this step
     def fetch_external_input_asset_version_info(self) -> None:
         output_keys = self._context.get_output_asset_keys()
@@ -910,6 +910,9 @@ def maybe_fetch_and_get_input_asset_version_info(
     ) -> Optional["InputAssetVersionInfo"]:
         return self._data_version_cache.maybe_fetch_and_get_input_asset_version_info(key)
 
+    def maybe_fetch_input_asset_version_info(self, keys: Iterable[AssetKey]) -> None:
+        return self._data_version_cache.maybe_fetch_input_asset_version_info(keys)
+
     # "external" refers to records for inputs generated outside of this step
     def fetch_external_input_asset_version_info(self) -> None:
         return self._data_version_cache.fetch_external_input_asset_version_info()
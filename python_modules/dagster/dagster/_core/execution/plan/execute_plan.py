@@ -52,53 +52,57 @@ def inner_plan_execution_iterator(
             except Exception:
                 yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
-            while not active_execution.is_complete:
-                step = active_execution.get_next_step()
-
-                yield from active_execution.concurrency_event_iterator(job_context)
-
-                if not step:
-                    active_execution.sleep_til_ready()
-                    continue
-
-                step_context = cast(
-                    StepExecutionContext,
-                    job_context.for_step(step, active_execution.get_known_state()),
-                )
-                step_event_list = []
-
-                missing_resources = [
-                    resource_key
-                    for resource_key in step_context.required_resource_keys
-                    if not hasattr(step_context.resources, resource_key)
-                ]
-                check.invariant(
-                    len(missing_resources) == 0,
-                    (
-                        f"Expected step context for solid {step_context.op.name} to have all required"
-                        f" resources, but missing {missing_resources}."
-                    ),
-                )
-
-                # we have already set up the log capture at the process level, just handle the step events
-                for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
-                    dagster_event = check.inst(step_event, DagsterEvent)
-                    step_event_list.append(dagster_event)
-                    yield dagster_event
-                    active_execution.handle_event(dagster_event)
-
-                active_execution.verify_complete(job_context, step.key)
-
-                # process skips from failures or uncovered inputs
-                for event in active_execution.plan_events_iterator(job_context):
-                    step_event_list.append(event)
-                    yield event
-
-                # pass a list of step events to hooks
-                yield from _trigger_hook(step_context, step_event_list)
+            # events handled while executing steps are buffered, if enabled on the instance
+            with job_context.instance.buffered_event_writes():
+                # It would be good to implement a reference tracking algorithm here to
+                # garbage collect results that are no longer needed by any steps
+                # https://github.com/dagster-io/dagster/issues/811
+                while not active_execution.is_complete:
+                    step = active_execution.get_next_step()
+
+                    yield from active_execution.concurrency_event_iterator(job_context)
+
+                    if not step:
+                        active_execution.sleep_til_ready()
+                        continue
+
+                    step_context = cast(
+                        StepExecutionContext,
+                        job_context.for_step(step, active_execution.get_known_state()),
+                    )
+                    step_event_list = []
+
+                    missing_resources = [
+                        resource_key
+                        for resource_key in step_context.required_resource_keys
+                        if not hasattr(step_context.resources, resource_key)
+                    ]
+                    check.invariant(
+                        len(missing_resources) == 0,
+                        (
+                            f"Expected step context for solid {step_context.op.name} to have all required"
+                            f" resources, but missing {missing_resources}."
+                        ),
+                    )
+
+                    # we have already set up the log capture at the process level, just handle the step events
+                    for step_event in check.generator(
+                        dagster_event_sequence_for_step(step_context)
+                    ):
+                        dagster_event = check.inst(step_event, DagsterEvent)
+                        step_event_list.append(dagster_event)
+                        yield dagster_event
+                        active_execution.handle_event(dagster_event)
+
+                    active_execution.verify_complete(job_context, step.key)
+
+                    # process skips from failures or uncovered inputs
+                    for event in active_execution.plan_events_iterator(job_context):
+                        step_event_list.append(event)
+                        yield event
+
+                    # pass a list of step events to hooks
+                    yield from _trigger_hook(step_context, step_event_list)
 
             try:
                 capture_stack.close()
@@ -678,12 +678,12 @@ def _get_input_provenance_data(
 ) -> Mapping[AssetKey, _InputProvenanceData]:
     input_provenance: dict[AssetKey, _InputProvenanceData] = {}
     deps = step_context.job_def.asset_layer.get(asset_key).parent_keys
+    # Records for deps external to this step were cached prior to step execution. Records for deps
+    # internal to this step are wiped from the cache when they are materialized, so any that are
+    # missing are refetched here in a single batch. For this to be correct, the output
+    # materializations for the step must be generated in topological order -- we assume this.
+    step_context.maybe_fetch_input_asset_version_info(deps)
     for key in deps:
-        # For deps external to this step, this will retrieve the cached record that was stored prior
-        # to step execution. For inputs internal to this step, it may trigger a query to retrieve
-        # the most recent materialization record (it will retrieve a cached record if it's already
-        # been asked for). For this to be correct, the output materializations for the step must be
-        # generated in topological order -- we assume this.
         version_info = step_context.maybe_fetch_and_get_input_asset_version_info(key)
 
         # This can only happen for source assets that have never been observed.
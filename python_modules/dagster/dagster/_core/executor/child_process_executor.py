@@ -5,10 +5,11 @@
 import sys
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from contextlib import AbstractContextManager
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
@@ -57,6 +58,14 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         Yields a sequence of events to be handled by _execute_command_in_child_process.
         """
 
+    def with_term_event(self, term_event: Any) -> "ChildProcessCommand":
+        """Invoked in a ChildProcessWorker before the command is executed, with the event that the
+        parent process sets to terminate the command. Multiprocessing events can only be shared
+        with a process when it is started, so commands sent to a long-lived worker cannot carry
+        their own.
+        """
+        return self
+
 
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
@@ -176,3 +185,194 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+def _execute_commands_in_child_worker(
+    command_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    initializer: Optional[Callable[[], None]],
+):
+    """Executes ChildProcessCommands received on the command queue until a None sentinel is
+    received, communicating the events of each command back to the parent process.
+
+    If the initializer fails, each command received is failed with the initializer's error
+    instead of being executed.
+    """
+    initializer_error: Optional[SerializableErrorInfo] = None
+    if initializer is not None:
+        try:
+            initializer()
+        except Exception:
+            initializer_error = serializable_error_info_from_exc_info(sys.exc_info())
+
+    while True:
+        command = command_queue.get()
+        if command is None:
+            return
+        if initializer_error is not None:
+            pid = os.getpid()
+            event_queue.put(ChildProcessStartEvent(pid=pid))
+            event_queue.put(ChildProcessSystemErrorEvent(pid=pid, error_info=initializer_error))
+            continue
+        term_event.clear()
+        _execute_command_in_child_process(event_queue, command.with_term_event(term_event))
+
+
+class ChildProcessWorker:
+    """A long-lived child process which executes successive ChildProcessCommands, so that process
+    start up costs (e.g. importing and loading user code) are only paid once for all of the
+    commands that it executes.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        self.command_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.num_commands = 0
+        self.process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_child_worker,
+            args=(self.command_queue, self.event_queue, self.term_event, initializer),
+        )
+        self.process.start()
+
+    def execute_command(
+        self, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in this worker, yielding the same sequence of objects as
+        execute_child_process_command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        self.num_commands += 1
+        self.command_queue.put(command)
+        yield self.process
+
+        while True:
+            event = _poll_for_event(self.process, self.event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                raise ChildProcessCrashException(
+                    pid=self.process.pid, exit_code=self.process.exitcode
+                )
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                return
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        if self.process.is_alive():
+            self.command_queue.put(None)
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.command_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool(AbstractContextManager):
+    """A pool of ChildProcessWorkers that commands are dispatched to, in place of starting a new
+    process for each command.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to start workers in (spawn, forkserver).
+        initializer (Optional[Callable[[], None]]): A picklable function invoked in each worker when
+            it starts, before any commands are executed.
+        max_commands_per_worker (Optional[int]): The number of commands that a worker executes
+            before it is replaced by a new worker. By default, workers are never replaced.
+        recycle_on_failure (Callable[[object], bool]): Invoked with each object yielded by a
+            command. If it returns True, the worker is replaced once the command completes.
+    """
+
+    # how long to wait for a worker to exit after asking it to before terminating it
+    SHUTDOWN_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        initializer: Optional[Callable[[], None]] = None,
+        max_commands_per_worker: Optional[int] = None,
+        recycle_on_failure: Optional[Callable[[object], bool]] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._initializer = initializer
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._recycle_on_failure = recycle_on_failure
+        self._idle_workers: list[ChildProcessWorker] = []
+        self._busy_workers: list[ChildProcessWorker] = []
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def start_workers(self, num_workers: int) -> None:
+        """Starts workers ahead of time, so that they can load code while the first commands are
+        being prepared.
+        """
+        while len(self._idle_workers) + len(self._busy_workers) < num_workers:
+            self._idle_workers.append(self._start_worker())
+
+    def _start_worker(self) -> ChildProcessWorker:
+        return ChildProcessWorker(self._multiprocessing_ctx, self._initializer)
+
+    def acquire_worker(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                break
+            worker.shutdown()
+        else:
+            worker = self._start_worker()
+        self._busy_workers.append(worker)
+        return worker
+
+    def _release_worker(self, worker: ChildProcessWorker, reusable: bool) -> None:
+        self._busy_workers.remove(worker)
+        if (
+            reusable
+            and worker.process.is_alive()
+            and (
+                self._max_commands_per_worker is None
+                or worker.num_commands < self._max_commands_per_worker
+            )
+        ):
+            self._idle_workers.append(worker)
+        else:
+            worker.shutdown(self.SHUTDOWN_TIMEOUT)
+
+    def execute_command(
+        self, worker: ChildProcessWorker, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in a worker acquired from this pool, yielding the same
+        sequence of objects as execute_child_process_command. The worker is returned to the pool
+        once the command completes.
+        """
+        reusable = False
+        try:
+            recycle = False
+            for ret in worker.execute_command(command):
+                if isinstance(ret, ChildProcessSystemErrorEvent) or (
+                    self._recycle_on_failure is not None and self._recycle_on_failure(ret)
+                ):
+                    recycle = True
+                yield ret
+            reusable = not recycle
+        finally:
+            self._release_worker(worker, reusable)
+
+    def shutdown(self) -> None:
+        for worker in self._idle_workers:
+            worker.shutdown(self.SHUTDOWN_TIMEOUT)
+        # workers with commands in flight are only left behind if execution was aborted
+        for worker in self._busy_workers:
+            worker.process.terminate()
+            worker.shutdown()
+        self._idle_workers = []
+        self._busy_workers = []
@@ -4,6 +4,7 @@
 import threading
 from collections.abc import Iterator, Mapping, Sequence
 from contextlib import ExitStack
+from functools import partial
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
 from typing import TYPE_CHECKING, Any, Optional
@@ -33,6 +34,7 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -70,6 +72,10 @@ def __init__(
         self.known_state = known_state
         self.repository_load_data = repository_load_data
 
+    def with_term_event(self, term_event: Any) -> "MultiprocessExecutorChildProcessCommand":
+        self.term_event = term_event
+        return self
+
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
@@ -108,6 +114,18 @@ def execute(self) -> Iterator[DagsterEvent]:
                 self.term_event.set()
 
 
+def _load_job_in_worker(
+    recon_job: ReconstructableJob, repository_load_data: Optional[RepositoryLoadData]
+) -> None:
+    # the loaded definition is cached on the reconstructable job, so steps executed by the worker
+    # do not need to load it again
+    recon_job.with_repository_load_data(repository_load_data).get_definition()
+
+
+def _is_step_failure(ret: object) -> bool:
+    return isinstance(ret, DagsterEvent) and ret.is_step_failure
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -116,6 +134,9 @@ def __init__(
         tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        recycle_workers_on_failure: bool = True,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -141,6 +162,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._recycle_workers_on_failure = check.bool_param(
+            recycle_workers_on_failure, "recycle_workers_on_failure"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -203,6 +231,23 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool: Optional[ChildProcessWorkerPool] = None
+            if self._use_worker_pool:
+                worker_pool = stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        initializer=partial(
+                            _load_job_in_worker, job, execution_plan.repository_load_data
+                        ),
+                        max_commands_per_worker=self._max_steps_per_worker,
+                        recycle_on_failure=(
+                            _is_step_failure if self._recycle_workers_on_failure else None
+                        ),
+                    )
+                )
+                # start loading code in workers while the first steps are being prepared
+                worker_pool.start_workers(min(limit, len(execution_plan.step_keys_to_execute)))
+
             active_iters: dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: dict[int, SerializableErrorInfo] = {}
             processes: dict[str, BaseProcess] = {}
@@ -250,6 +295,7 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                worker_pool,
                             )
 
                     # process active iterators
@@ -373,26 +419,43 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker_pool: Optional[ChildProcessWorkerPool] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
+    worker = None
+    if worker_pool is not None:
+        worker = worker_pool.acquire_worker()
+        # workers listen to their own termination event, which is bound to each command that they
+        # execute, since events cannot be sent to a process after it has started
+        term_events[step.key] = worker.term_event
+
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        term_event=term_events[step.key] if worker is None else None,
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        f'Launching subprocess for "{step.key}".',
-        metadata={},
-    )
+    if worker_pool is not None and worker is not None:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Executing "{step.key}" in worker process (pid: {worker.process.pid}).',
+            metadata={},
+        )
+        child_process_iter = worker_pool.execute_command(worker, command)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Launching subprocess for "{step.key}".',
+            metadata={},
+        )
+        child_process_iter = execute_child_process_command(multiproc_ctx, command)
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in child_process_iter:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -1,12 +1,16 @@
+import asyncio
 import logging
 import logging.config
 import os
 import sys
+import threading
+import time
 import warnings
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from enum import Enum
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -80,6 +84,7 @@
     TAGS_TO_MAYBE_OMIT_ON_RETRY,
     WILL_RETRY_TAG,
 )
+from dagster._core.utils import coerce_valid_log_level
 from dagster._serdes import ConfigurableClass
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import PrintFn, is_uuid, traced
@@ -204,6 +209,39 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the number of events of any kind that will be buffered before being written to the event log
+# with a single `store_buffered_events` call. Unlike DAGSTER_EVENT_BATCH_SIZE, this applies to every
+# event handled by the instance while steps are being executed (log lines, step events, asset
+# events). The buffer is also flushed once its oldest event has become older than
+# DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS (checked by a background thread while buffering, so that
+# events are written even while a step is blocked in user code), whenever a run event, step
+# boundary, or failure is handled, before events are read back through the instance, and when step
+# execution ends. Defaults to 0, which turns off buffering.
+def _get_event_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_BUFFER_SIZE", "0"))
+
+
+def _get_event_buffer_max_age_seconds() -> float:
+    return float(os.getenv("DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS", "1.0"))
+
+
+def _is_buffered_writing_enabled() -> bool:
+    return _get_event_buffer_size() > 0
+
+
+def _should_flush_event_buffer(event: "EventLogEntry") -> bool:
+    from dagster._core.events import EVENT_BUFFER_FLUSH_EVENTS
+
+    if coerce_valid_log_level(event.level) >= logging.ERROR:
+        return True
+
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    return dagster_event.is_job_event or dagster_event.event_type in EVENT_BUFFER_FLUSH_EVENTS
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, tuple[Any, Any]]:
@@ -286,6 +324,7 @@ class InstanceType(Enum):
 
 
 T_DagsterInstance = TypeVar("T_DagsterInstance", bound="DagsterInstance", default="DagsterInstance")
+T_Read = TypeVar("T_Read")
 
 
 class MayHaveInstanceWeakref(Generic[T_DagsterInstance]):
@@ -423,6 +462,16 @@ def __init__(
         from dagster._core.storage.schedules import ScheduleStorage
 
         self._instance_type = check.inst_param(instance_type, "instance_type", InstanceType)
+
+        # Used for buffered event handling. Set up before the storages are registered, since they
+        # may access the event log storage through the instance, which flushes the buffer.
+        self._buffered_events: list[EventLogEntry] = []
+        self._buffered_events_start: Optional[float] = None
+        self._buffered_events_lock = threading.RLock()
+        self._event_buffering_depth = 0
+        self._event_buffer_flusher_stop: Optional[threading.Event] = None
+        self._event_buffer_flusher: Optional[threading.Thread] = None
+
         self._local_artifact_storage = check.inst_param(
             local_artifact_storage, "local_artifact_storage", LocalArtifactStorage
         )
@@ -747,6 +796,8 @@ def run_storage(self) -> "RunStorage":
 
     @property
     def event_log_storage(self) -> "EventLogStorage":
+        # callers may read from the storage directly, so they should see any buffered events
+        self.flush_event_buffer()
         return self._event_storage
 
     @property
@@ -875,6 +926,25 @@ def nux_enabled(self) -> bool:
         else:
             return nux_enabled_by_default
 
+    # event log retention
+
+    @property
+    def event_log_retention_days(self) -> Optional[int]:
+        """The number of days after which run events are purged from the event log, or None if
+        they are kept indefinitely.
+        """
+        purge_after_days = (
+            self.get_settings("retention").get("event_logs", {}).get("purge_after_days")
+        )
+        return purge_after_days if purge_after_days and purge_after_days > 0 else None
+
+    @property
+    def event_log_retention_enabled(self) -> bool:
+        return (
+            self.event_log_retention_days is not None
+            and self._event_storage.supports_event_log_retention
+        )
+
     # run monitoring
 
     @property
@@ -917,6 +987,14 @@ def code_server_reload_timeout(self) -> int:
     def wait_for_local_code_server_processes_on_shutdown(self) -> bool:
         return self.code_server_settings.get("wait_for_local_processes_on_shutdown", False)
 
+    @property
+    def defer_code_server_job_snapshots(self) -> bool:
+        return self.code_server_settings.get("defer_job_snapshots", False)
+
+    @property
+    def code_server_job_snapshot_cache_dir(self) -> Optional[str]:
+        return self.code_server_settings.get("job_snapshot_cache_dir")
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         return self.run_monitoring_settings.get("max_resume_run_attempts", 0)
@@ -943,6 +1021,10 @@ def run_retries_max_retries(self) -> int:
     def run_retries_retry_on_asset_or_op_failure(self) -> bool:
         return self.get_settings("run_retries").get("retry_on_asset_or_op_failure", True)
 
+    @property
+    def binary_snapshot_serialization_enabled(self) -> bool:
+        return self.get_settings("snapshots").get("binary_serialization", False)
+
     @property
     def auto_materialize_enabled(self) -> bool:
         return self.get_settings("auto_materialize").get("enabled", True)
@@ -969,6 +1051,10 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> bool:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> int:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers", 1)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_concurrency_config().pool_config.default_pool_limit
@@ -1034,6 +1120,7 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_event_buffer()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1120,12 +1207,14 @@ def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapsho
 
     @traced
     def get_run_stats(self, run_id: str) -> DagsterRunStatsSnapshot:
+        self.flush_event_buffer()
         return self._event_storage.get_stats_for_run(run_id)
 
     @traced
     def get_run_step_stats(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
+        self.flush_event_buffer()
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
     @traced
@@ -1909,6 +1998,26 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    async def get_run_records_async(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
+    ) -> Sequence[RunRecord]:
+        return await asyncio.to_thread(
+            self._run_storage.get_run_records,
+            filters,
+            limit,
+            order_by,
+            ascending,
+            cursor,
+            bucket_by,
+        )
+
     @traced
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
@@ -1929,6 +2038,14 @@ def delete_run(self, run_id: str) -> None:
         self._run_storage.delete_run(run_id)
         self._event_storage.delete_events(run_id)
 
+    def purge_run_events(self, before: float) -> None:
+        """Delete the events stored before the given timestamp, except for asset events.
+
+        Args:
+            before (float): The timestamp before which events are deleted.
+        """
+        self._event_storage.purge_run_events(before)
+
     # event storage
     @traced
     def logs_after(
@@ -1938,6 +2055,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ) -> Sequence["EventLogEntry"]:
+        self.flush_event_buffer()
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1951,6 +2069,7 @@ def all_logs(
         run_id: str,
         of_type: Optional[Union["DagsterEventType", set["DagsterEventType"]]] = None,
     ) -> Sequence["EventLogEntry"]:
+        self.flush_event_buffer()
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1962,8 +2081,31 @@ def get_records_for_run(
         limit: Optional[int] = None,
         ascending: bool = True,
     ) -> "EventLogConnection":
+        self.flush_event_buffer()
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    @traced
+    async def get_records_for_run_async(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> "EventLogConnection":
+        return await self._read_event_log_async(
+            self._event_storage.get_records_for_run, run_id, cursor, of_type, limit, ascending
+        )
+
+    async def _read_event_log_async(self, read_fn: Callable[..., T_Read], *args: Any) -> T_Read:
+        # flushing takes the buffer lock and may write to storage, so it happens on the worker
+        # thread along with the read rather than on the event loop
+        def _read() -> T_Read:
+            self.flush_event_buffer()
+            return read_fn(*args)
+
+        return await asyncio.to_thread(_read)
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -1990,6 +2132,7 @@ def wipe_asset_cached_status(self, asset_keys: Sequence[AssetKey]) -> None:
 
     @traced
     def all_asset_keys(self) -> Sequence[AssetKey]:
+        self.flush_event_buffer()
         return self._event_storage.all_asset_keys()
 
     @public
@@ -2010,6 +2153,7 @@ def get_asset_keys(
         Returns:
             Sequence[AssetKey]: List of asset keys.
         """
+        self.flush_event_buffer()
         return self._event_storage.get_asset_keys(prefix=prefix, limit=limit, cursor=cursor)
 
     @public
@@ -2020,12 +2164,14 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
         Args:
             asset_key (AssetKey): Asset key to check.
         """
+        self.flush_event_buffer()
         return self._event_storage.has_asset_key(asset_key)
 
     @traced
     def get_latest_materialization_events(
         self, asset_keys: Iterable[AssetKey]
     ) -> Mapping[AssetKey, Optional["EventLogEntry"]]:
+        self.flush_event_buffer()
         return self._event_storage.get_latest_materialization_events(asset_keys)
 
     @public
@@ -2040,12 +2186,14 @@ def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional["Eve
             Optional[EventLogEntry]: The latest materialization event for the given asset
                 key, or `None` if the asset has not been materialized.
         """
+        self.flush_event_buffer()
         return self._event_storage.get_latest_materialization_events([asset_key]).get(asset_key)
 
     @traced
     def get_latest_asset_check_evaluation_record(
         self, asset_check_key: "AssetCheckKey"
     ) -> Optional["AssetCheckExecutionRecord"]:
+        self.flush_event_buffer()
         return self._event_storage.get_latest_asset_check_execution_by_key([asset_check_key]).get(
             asset_check_key
         )
@@ -2093,6 +2241,7 @@ def get_event_records(
                 "Use fetch_run_status_changes instead of get_event_records to fetch run status change events."
             )
 
+        self.flush_event_buffer()
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
     @public
@@ -2117,6 +2266,7 @@ def fetch_materializations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_event_buffer()
         return self._event_storage.fetch_materializations(records_filter, limit, cursor, ascending)
 
     @traced
@@ -2140,6 +2290,7 @@ def fetch_failed_materializations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_event_buffer()
         return self._event_storage.fetch_failed_materializations(
             records_filter, limit, cursor, ascending
         )
@@ -2177,6 +2328,7 @@ def fetch_planned_materializations(
                 DagsterEventType.ASSET_MATERIALIZATION_PLANNED, cursor=cursor, ascending=ascending
             )
         )
+        self.flush_event_buffer()
         records = self._event_storage.get_event_records(
             event_records_filter, limit=limit, ascending=ascending
         )
@@ -2211,6 +2363,7 @@ def fetch_observations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_event_buffer()
         return self._event_storage.fetch_observations(records_filter, limit, cursor, ascending)
 
     @public
@@ -2235,6 +2388,7 @@ def fetch_run_status_changes(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self.flush_event_buffer()
         return self._event_storage.fetch_run_status_changes(
             records_filter, limit, cursor, ascending
         )
@@ -2303,8 +2457,15 @@ def get_asset_records(
         Returns:
             Sequence[AssetRecord]: List of asset records.
         """
+        self.flush_event_buffer()
         return self._event_storage.get_asset_records(asset_keys)
 
+    @traced
+    async def get_asset_records_async(
+        self, asset_keys: Optional[Sequence[AssetKey]] = None
+    ) -> Sequence["AssetRecord"]:
+        return await self._read_event_log_async(self._event_storage.get_asset_records, asset_keys)
+
     @traced
     def get_event_tags_for_asset(
         self,
@@ -2324,6 +2485,7 @@ def get_event_tags_for_asset(
         Returns a list of dicts, where each dict is a mapping of tag key to tag value for a
         single event.
         """
+        self.flush_event_buffer()
         return self._event_storage.get_event_tags_for_asset(asset_key, filter_tags, filter_event_id)
 
     @public
@@ -2358,6 +2520,7 @@ def get_materialized_partitions(
         before_cursor: Optional[int] = None,
         after_cursor: Optional[int] = None,
     ) -> set[str]:
+        self.flush_event_buffer()
         return self._event_storage.get_materialized_partitions(
             asset_key, before_cursor=before_cursor, after_cursor=after_cursor
         )
@@ -2373,6 +2536,7 @@ def get_latest_storage_id_by_partition(
 
         Returns a mapping of partition to storage id.
         """
+        self.flush_event_buffer()
         return self._event_storage.get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
@@ -2383,6 +2547,7 @@ def get_latest_planned_materialization_info(
         asset_key: AssetKey,
         partition: Optional[str] = None,
     ) -> Optional["PlannedMaterializationInfo"]:
+        self.flush_event_buffer()
         return self._event_storage.get_latest_planned_materialization_info(asset_key, partition)
 
     @public
@@ -2505,11 +2670,19 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If buffered writing is enabled (via DAGSTER_EVENT_BUFFER_SIZE), events handled within
+        `buffered_event_writes` are instead kept in a single instance-wide buffer regardless of
+        `batch_metadata`, and written in one batch when the buffer fills up, when its oldest event
+        has aged out, or when a run event, step boundary, or failure event is handled. See
+        `flush_event_buffer`.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
-        from dagster._core.events import RunFailureReason
+        if self._event_buffering_depth > 0 and _is_buffered_writing_enabled():
+            self._buffer_new_event(event)
+            return
 
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
@@ -2522,11 +2695,119 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_notify_events(events)
+
+    def _buffer_new_event(self, event: "EventLogEntry") -> None:
+        with self._buffered_events_lock:
+            if not self._buffered_events:
+                self._buffered_events_start = time.monotonic()
+            self._buffered_events.append(event)
+
+            if (
+                len(self._buffered_events) >= _get_event_buffer_size()
+                or _should_flush_event_buffer(event)
+                or time.monotonic() - check.not_none(self._buffered_events_start)
+                >= _get_event_buffer_max_age_seconds()
+            ):
+                self.flush_event_buffer()
+
+    @contextmanager
+    def buffered_event_writes(self) -> Iterator[None]:
+        """Context manager within which handled events are buffered, if buffered writing is enabled
+        via DAGSTER_EVENT_BUFFER_SIZE. Used while executing steps, where most events are written.
+        While events are buffered, a background thread flushes the buffer once its oldest event is
+        older than DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS. Any buffered events are flushed on exit.
+        """
+        with self._buffered_events_lock:
+            self._event_buffering_depth += 1
+            if self._event_buffering_depth == 1 and _is_buffered_writing_enabled():
+                self._start_event_buffer_flusher()
+        try:
+            yield
+        finally:
+            with self._buffered_events_lock:
+                self._event_buffering_depth -= 1
+                stop_flusher = self._event_buffering_depth == 0
+                if stop_flusher:
+                    self.flush_event_buffer()
+            if stop_flusher:
+                self._stop_event_buffer_flusher()
+
+    def _start_event_buffer_flusher(self) -> None:
+        if self._event_buffer_flusher is not None:
+            # still running from a previous buffering scope that is being exited concurrently
+            return
+
+        stop_event = threading.Event()
+        self._event_buffer_flusher_stop = stop_event
+        self._event_buffer_flusher = threading.Thread(
+            target=self._flush_aged_event_buffer,
+            args=(stop_event,),
+            name="event-buffer-flusher",
+            daemon=True,
+        )
+        self._event_buffer_flusher.start()
+
+    def _stop_event_buffer_flusher(self) -> None:
+        with self._buffered_events_lock:
+            stop_event, flusher = self._event_buffer_flusher_stop, self._event_buffer_flusher
+            if self._event_buffering_depth > 0 or not stop_event or not flusher:
+                return
+            self._event_buffer_flusher_stop = None
+            self._event_buffer_flusher = None
+
+        stop_event.set()
+        flusher.join()
+
+    def _flush_aged_event_buffer(self, stop_event: threading.Event) -> None:
+        # Flushes events that have been buffered for longer than the max age, even if no further
+        # events are handled, e.g. while a step is blocked in user code. Subscribers of these
+        # events are notified on this thread.
+        max_age_seconds = _get_event_buffer_max_age_seconds()
+        while not stop_event.wait(max(max_age_seconds / 2, 0.01)):
+            try:
+                with self._buffered_events_lock:
+                    if (
+                        self._buffered_events_start is not None
+                        and time.monotonic() - self._buffered_events_start >= max_age_seconds
+                    ):
+                        self.flush_event_buffer()
+            except Exception:
+                logging.getLogger("dagster").exception("Error while flushing buffered events")
+
+    def flush_event_buffer(self) -> None:
+        """Write any events held in the event buffer to storage and notify subscribers.
+
+        Only has an effect when buffered event writing is enabled via DAGSTER_EVENT_BUFFER_SIZE.
+        Events are written on the calling thread. The instance flushes before reading from the
+        event log, and when the event log storage is accessed through `event_log_storage`.
+        """
+        if not self._buffered_events:
+            # avoid taking the lock when nothing is buffered, which is the case unless steps are
+            # being executed with buffering enabled
+            return
+
+        with self._buffered_events_lock:
+            events = self._buffered_events
+            self._buffered_events = []
+            self._buffered_events_start = None
+
+            if events:
+                self._store_and_notify_events(events, buffered=True)
+
+    def _store_and_notify_events(
+        self, events: Sequence["EventLogEntry"], buffered: bool = False
+    ) -> None:
+        from dagster._core.events import RunFailureReason
+
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
             try:
-                self._event_storage.store_event_batch(events)
+                if buffered:
+                    self._event_storage.store_buffered_events(events)
+                else:
+                    self._event_storage.store_event_batch(events)
 
             # Fall back to storing events one by one if writing a batch fails. We catch a generic
             # Exception because that is the parent class of the actually received error,
@@ -3162,6 +3443,7 @@ def get_required_daemon_types(self) -> Sequence[str]:
         from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
         from dagster._daemon.daemon import (
             BackfillDaemon,
+            EventLogRetentionDaemon,
             MonitoringDaemon,
             SchedulerDaemon,
             SensorDaemon,
@@ -3184,6 +3466,8 @@ def get_required_daemon_types(self) -> Sequence[str]:
             daemons.append(EventLogConsumerDaemon.daemon_type())
         if self.auto_materialize_enabled or self.auto_materialize_use_sensors:
             daemons.append(AssetDaemon.daemon_type())
+        if self.event_log_retention_enabled or self._event_storage.requires_event_log_maintenance:
+            daemons.append(EventLogRetentionDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
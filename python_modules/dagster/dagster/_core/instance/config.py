@@ -332,6 +332,10 @@ def retention_config_schema() -> Field:
             "schedule": _tick_retention_config_schema(),
             "sensor": _tick_retention_config_schema(),
             "auto_materialize": _tick_retention_config_schema(),
+            "event_logs": Field(
+                {"purge_after_days": Field(int, is_required=False)},
+                is_required=False,
+            ),
         },
         is_required=False,
     )
@@ -373,6 +377,35 @@ def backfills_daemon_config() -> Field:
     )
 
 
+DEFAULT_DAEMON_SHARD_LEASE_DURATION_SECONDS = 60
+
+
+def daemon_sharding_config(instigator_type_name: str) -> Field:
+    return Field(
+        {
+            "enabled": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    f"Whether multiple replicas of the daemon can run at once, each evaluating a"
+                    f" disjoint subset of the {instigator_type_name}s of the instance."
+                ),
+            ),
+            "lease_duration_seconds": Field(
+                int,
+                is_required=False,
+                default_value=DEFAULT_DAEMON_SHARD_LEASE_DURATION_SECONDS,
+                description=(
+                    f"How long a replica holds its {instigator_type_name}s without renewing its"
+                    f" leases, after which they are reassigned to the remaining replicas."
+                ),
+            ),
+        },
+        is_required=False,
+    )
+
+
 def sensors_daemon_config() -> Field:
     return Field(
         {
@@ -393,6 +426,7 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "sharding": daemon_sharding_config("sensor"),
         },
         is_required=False,
     )
@@ -418,6 +452,7 @@ def schedules_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "sharding": daemon_sharding_config("schedule"),
         },
         is_required=False,
     )
@@ -569,6 +604,42 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "local_startup_timeout": Field(int, is_required=False),
                 "reload_timeout": Field(int, is_required=False),
                 "wait_for_local_processes_on_shutdown": Field(bool, is_required=False),
+                "defer_job_snapshots": Field(
+                    bool,
+                    is_required=False,
+                    description=(
+                        "Whether to only load the snapshot of each job from a code server the"
+                        " first time that it is used, rather than loading the snapshots of all jobs"
+                        " whenever the code location is loaded."
+                    ),
+                ),
+                "job_snapshot_cache_dir": Field(
+                    str,
+                    is_required=False,
+                    description=(
+                        "Directory in which job snapshots loaded from code servers are cached by"
+                        " snapshot id when defer_job_snapshots is set, so that unchanged job"
+                        " snapshots are not fetched again after code locations are reloaded or the"
+                        " process is restarted."
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
+        "snapshots": Field(
+            {
+                "binary_serialization": Field(
+                    bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to store job and execution plan snapshots in the binary"
+                        " serialization format instead of JSON. Snapshots stored in either format"
+                        " can be read, but processes running versions of dagster that predate the"
+                        " binary format can't read snapshots stored in it, so this should only be"
+                        " enabled once every process that uses the run storage has been upgraded."
+                    ),
+                ),
             },
             is_required=False,
         ),
@@ -600,6 +671,13 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate independent components of the asset graph in parallel within a single tick"
+                    ),
+                ),
             }
         ),
         "concurrency": get_concurrency_config(),
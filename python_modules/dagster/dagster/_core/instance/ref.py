@@ -453,6 +453,7 @@ def from_dir(
             "run_monitoring",
             "run_retries",
             "code_servers",
+            "snapshots",
             "retention",
             "backfills",
             "sensors",
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from functools import partial
 from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 
@@ -74,6 +74,20 @@ def get_loaders_for(self, ttype: type["LoadableBy"]) -> tuple[DataLoader, Blocki
 
         return self.loaders[ttype]
 
+    def prime_loaders_from(
+        self, loaders: Mapping[type, tuple[DataLoader, BlockingDataLoader]]
+    ) -> None:
+        """Prime both the blocking and the non-blocking loaders of this context with the values
+        cached by the provided blocking loaders, e.g. those of the same context on a thread that
+        prefetched data. Must be called from within the event loop that the non-blocking loaders
+        will be used from.
+        """
+        for ttype, (_, source_blocking_loader) in list(loaders.items()):
+            loader, blocking_loader = self.get_loaders_for(ttype)
+            for key, value in source_blocking_loader.cached_items():
+                blocking_loader.prime(key, value)
+                loader.prime(key, value)
+
     def clear_loaders(self) -> None:
         for ttype in self.loaders:
             del self.loaders[ttype]
@@ -132,6 +146,17 @@ def blocking_get_many(cls, context: LoadingContext, ids: Iterable[TKey]) -> Iter
         _, blocking_loader = context.get_loaders_for(cls)
         return list(filter(None, blocking_loader.blocking_load_many(ids)))
 
+    @classmethod
+    def blocking_prefetch(cls, context: LoadingContext, ids: Iterable[TKey]) -> None:
+        """Fetch N objects by their id in a single batch, priming both the blocking and the
+        non-blocking loader with the results. Must be called from within the event loop that the
+        non-blocking loader will be used from.
+        """
+        ids = list(ids)
+        loader, blocking_loader = context.get_loaders_for(cls)
+        for key, value in zip(ids, blocking_loader.blocking_load_many(ids)):
+            loader.prime(key, value)
+
     @classmethod
     def prepare(cls, context: LoadingContext, ids: Iterable[TKey]) -> None:
         """Ensure the provided ids will be fetched on the next blocking query."""
@@ -3,7 +3,7 @@
 from abc import abstractmethod
 from collections.abc import Mapping, Sequence
 from contextlib import AbstractContextManager
-from functools import cached_property
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, AbstractSet, Any, Optional, Union, cast  # noqa: UP035
 
 import dagster._check as check
@@ -11,7 +11,10 @@
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.notebook_data import sync_get_streaming_external_notebook_data_grpc
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_subset_grpc,
+    sync_get_serialized_external_job_data_grpc,
+)
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
@@ -44,6 +47,8 @@
     RemoteRepository,
 )
 from dagster._core.remote_representation.external_data import (
+    JobDataSnap,
+    JobRefSnap,
     PartitionNamesSnap,
     RepositorySnap,
     ScheduleExecutionErrorSnap,
@@ -52,10 +57,12 @@
 )
 from dagster._core.remote_representation.grpc_server_registry import GrpcServerRegistry
 from dagster._core.remote_representation.handle import JobHandle, RepositoryHandle
+from dagster._core.remote_representation.job_snapshot_cache import get_process_job_snapshot_cache
 from dagster._core.remote_representation.origin import (
     CodeLocationOrigin,
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
+    RemoteRepositoryOrigin,
 )
 from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster._grpc.impl import (
@@ -728,9 +735,14 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
+            # When job snapshots are deferred, only the repository and its asset graph are loaded
+            # up front, and the snapshot of each job is fetched from the server the first time
+            # that it is used, unless a snapshot with the same id has already been fetched by this
+            # process.
             self._repository_snaps = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                defer_snapshots=instance.defer_code_server_job_snapshots,
             )
 
             self.remote_repositories = {
@@ -741,6 +753,7 @@ def __init__(
                         code_location=self,
                     ),
                     auto_materialize_use_sensors=instance.auto_materialize_use_sensors,
+                    ref_to_data_fn=partial(self._get_job_data_snap, repo_name),
                 )
                 for repo_name, repo_data in self._repository_snaps.items()
             }
@@ -792,6 +805,23 @@ def host(self) -> str:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
+    def _get_job_data_snap(self, repository_name: str, job_ref_snap: JobRefSnap) -> JobDataSnap:
+        job_snapshot_cache = get_process_job_snapshot_cache(
+            self._instance.code_server_job_snapshot_cache_dir
+        )
+        job_data_snap = job_snapshot_cache.get(job_ref_snap)
+        if job_data_snap is None:
+            serialized_job_data = sync_get_serialized_external_job_data_grpc(
+                self.client,
+                RemoteRepositoryOrigin(self.origin, repository_name),
+                job_ref_snap.name,
+            )
+            job_data_snap = deserialize_value(serialized_job_data, JobDataSnap)
+            job_snapshot_cache.set(
+                job_ref_snap, job_data_snap, serialized_size=len(serialized_job_data)
+            )
+        return job_data_snap
+
     def _reload_current_image(self) -> Optional[str]:
         return deserialize_value(
             self.client.get_current_image(),
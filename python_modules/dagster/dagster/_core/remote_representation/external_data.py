@@ -866,12 +866,16 @@ def _dedup_partition_keys(keys: Sequence[str]) -> Sequence[str]:
     return new_keys
 
 
-@whitelist_for_serdes(storage_name="ExternalStaticPartitionsDefinitionData")
+@whitelist_for_serdes(
+    storage_name="ExternalStaticPartitionsDefinitionData",
+    skip_when_none_fields={"use_bitmap_subset"},
+)
 @record_custom(checked=False)
 class StaticPartitionsSnap(PartitionsSnap, IHaveNew):
     partition_keys: Sequence[str]
+    use_bitmap_subset: Optional[bool]
 
-    def __new__(cls, partition_keys: Sequence[str]):
+    def __new__(cls, partition_keys: Sequence[str], use_bitmap_subset: Optional[bool] = None):
         # for back compat reasons we allow str as a Sequence[str] here
         if not isinstance(partition_keys, str):
             check.sequence_param(
@@ -883,19 +887,24 @@ def __new__(cls, partition_keys: Sequence[str]):
         return super().__new__(
             cls,
             partition_keys=partition_keys,
+            use_bitmap_subset=check.opt_bool_param(use_bitmap_subset, "use_bitmap_subset"),
         )
 
     @classmethod
     def from_def(cls, partitions_def: StaticPartitionsDefinition) -> Self:
         check.inst_param(partitions_def, "partitions_def", StaticPartitionsDefinition)
-        return cls(partition_keys=partitions_def.get_partition_keys())
+        return cls(
+            partition_keys=partitions_def.get_partition_keys(),
+            # only set when enabled so that the snapshot is unchanged for existing definitions
+            use_bitmap_subset=True if partitions_def.use_bitmap_subset else None,
+        )
 
     def get_partitions_definition(self):
         # v1.4 made `StaticPartitionsDefinition` error if given duplicate keys. This caused
         # host process errors for users who had not upgraded their user code to 1.4 and had dup
         # keys, since the host process `StaticPartitionsDefinition` would throw an error.
         keys = _dedup_partition_keys(self.partition_keys)
-        return StaticPartitionsDefinition(keys)
+        return StaticPartitionsDefinition(keys, use_bitmap_subset=bool(self.use_bitmap_subset))
 
 
 @whitelist_for_serdes(
@@ -0,0 +1,213 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+import dagster._check as check
+from dagster._core.remote_representation.external_data import JobDataSnap, JobRefSnap
+from dagster._serdes import deserialize_value, serialize_value_to_bytes
+from dagster._utils import mkdir_p
+
+# Entries are bounded by the size of the serialized snapshot that they were loaded from, which is
+# cheap to measure, since each entry is deserialized when it is added to the cache anyway
+DEFAULT_JOB_SNAPSHOT_CACHE_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_JOB_SNAPSHOT_CACHE_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+_TMP_SUFFIX = ".tmp"
+
+
+class _CacheEntry(NamedTuple):
+    job_data_snap: JobDataSnap
+    size: int
+
+
+class JobSnapshotCache:
+    """Cache of the job snapshots loaded from code servers, keyed by snapshot id.
+
+    Since snapshot ids are a hash of the contents of the job snapshot (including the id of the
+    parent snapshot for subset jobs), entries remain valid across code location reloads and can be
+    shared between code locations. Entries are kept in memory up to a maximum total serialized size,
+    and are additionally written to cache_dir if it is provided, so that they survive restarts of
+    the host process. Once the files in cache_dir exceed a maximum total size, the least recently
+    used ones are removed until they fit within it again.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_JOB_SNAPSHOT_CACHE_MAX_MEMORY_BYTES,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_JOB_SNAPSHOT_CACHE_MAX_DISK_BYTES,
+    ):
+        self._max_memory_bytes = check.int_param(max_memory_bytes, "max_memory_bytes")
+        self._cache_dir = check.opt_str_param(cache_dir, "cache_dir")
+        self._max_disk_bytes = check.int_param(max_disk_bytes, "max_disk_bytes")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
+        # total size of the files in cache_dir, measured when the first file is written and then
+        # tracked as files are written by this process. Files written by other processes sharing
+        # the directory are accounted for whenever it is scanned to evict files.
+        self._disk_bytes: Optional[int] = None
+
+    def get(self, job_ref_snap: JobRefSnap) -> Optional[JobDataSnap]:
+        snapshot_id = job_ref_snap.snapshot_id
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is not None:
+                self._entries.move_to_end(snapshot_id)
+
+        if entry is None:
+            entry = self._read_from_disk(snapshot_id)
+            if entry is None:
+                return None
+            self._add(snapshot_id, entry)
+
+        # presets are not part of the job snapshot, so they are always taken from the ref
+        return JobDataSnap(
+            name=job_ref_snap.name,
+            job=entry.job_data_snap.job,
+            active_presets=job_ref_snap.active_presets,
+            parent_job=entry.job_data_snap.parent_job,
+        )
+
+    def set(
+        self,
+        job_ref_snap: JobRefSnap,
+        job_data_snap: JobDataSnap,
+        serialized_size: Optional[int] = None,
+    ) -> None:
+        """Adds a snapshot to the cache. serialized_size is the size of the serialized snapshot that
+        job_data_snap was loaded from, if any, which avoids serializing it again when entries are
+        only cached in memory.
+        """
+        check.inst_param(job_data_snap, "job_data_snap", JobDataSnap)
+        check.opt_int_param(serialized_size, "serialized_size")
+        serialized = (
+            serialize_value_to_bytes(job_data_snap)
+            if self._cache_dir or serialized_size is None
+            else None
+        )
+        size = serialized_size if serialized_size is not None else len(check.not_none(serialized))
+        self._add(job_ref_snap.snapshot_id, _CacheEntry(job_data_snap, size))
+        if serialized is not None:
+            self._write_to_disk(job_ref_snap.snapshot_id, serialized)
+
+    def _add(self, snapshot_id: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            previous_entry = self._entries.pop(snapshot_id, None)
+            if previous_entry is not None:
+                self._memory_bytes -= previous_entry.size
+            self._entries[snapshot_id] = entry
+            self._memory_bytes += entry.size
+            # the most recently added entry is always kept, even if it exceeds the limit by itself
+            while self._memory_bytes > self._max_memory_bytes and len(self._entries) > 1:
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_entry.size
+
+    def _get_path(self, snapshot_id: str) -> str:
+        return os.path.join(check.not_none(self._cache_dir), snapshot_id)
+
+    def _read_from_disk(self, snapshot_id: str) -> Optional[_CacheEntry]:
+        if not self._cache_dir:
+            return None
+
+        path = self._get_path(snapshot_id)
+        try:
+            with open(path, "rb") as f:
+                serialized = f.read()
+            entry = _CacheEntry(deserialize_value(serialized, JobDataSnap), len(serialized))
+        except Exception:
+            # entries that are missing or can't be read (e.g. written by an incompatible version)
+            # are treated as misses, and are replaced once the snapshot is fetched again
+            return None
+
+        try:
+            # the modification time of each file tracks when it was last used, for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _write_to_disk(self, snapshot_id: str, serialized: bytes) -> None:
+        if not self._cache_dir:
+            return
+
+        path = self._get_path(snapshot_id)
+        # write to a temporary file and move it into place so that readers never observe partial
+        # writes
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}{_TMP_SUFFIX}"
+        try:
+            mkdir_p(self._cache_dir)
+            try:
+                replaced_size = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            with open(tmp_path, "wb") as f:
+                f.write(serialized)
+            os.replace(tmp_path, path)
+        except OSError:
+            # the cache on disk is an optimization, so failing to write to it (e.g. because the disk
+            # is full) does not fail loading the snapshot
+            logging.getLogger("dagster").warning(
+                f"Could not write job snapshot {snapshot_id} to the cache in {self._cache_dir}.",
+                exc_info=True,
+            )
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                # the first write scans the directory, which also evicts files left by earlier
+                # processes if they exceed the limit
+                should_evict = True
+            else:
+                self._disk_bytes += len(serialized) - replaced_size
+                should_evict = self._disk_bytes > self._max_disk_bytes
+        if should_evict:
+            self._evict_from_disk()
+
+    def _evict_from_disk(self) -> None:
+        cache_dir = check.not_none(self._cache_dir)
+        try:
+            files = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(cache_dir)
+                if entry.is_file() and not entry.name.endswith(_TMP_SUFFIX)
+            ]
+        except OSError:
+            return
+
+        disk_bytes = sum(size for _, size, _ in files)
+        if disk_bytes > self._max_disk_bytes:
+            # least recently used first
+            for _, size, path in sorted(files):
+                if disk_bytes <= self._max_disk_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    # e.g. removed concurrently by another process sharing the cache directory
+                    pass
+                disk_bytes -= size
+
+        with self._lock:
+            self._disk_bytes = disk_bytes
+
+
+_process_job_snapshot_caches: dict[Optional[str], JobSnapshotCache] = {}
+_process_job_snapshot_caches_lock = threading.Lock()
+
+
+def get_process_job_snapshot_cache(cache_dir: Optional[str] = None) -> JobSnapshotCache:
+    """Returns the job snapshot cache shared by all code locations in the current process that use
+    the given cache directory. Sharing a single cache is what allows snapshots to be reused when a
+    code location is reloaded, since each reload creates a new code location.
+    """
+    with _process_job_snapshot_caches_lock:
+        if cache_dir not in _process_job_snapshot_caches:
+            _process_job_snapshot_caches[cache_dir] = JobSnapshotCache(cache_dir=cache_dir)
+        return _process_job_snapshot_caches[cache_dir]
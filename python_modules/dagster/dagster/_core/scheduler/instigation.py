@@ -841,3 +841,22 @@ def get_evaluation_with_run_ids(self) -> AutomationConditionEvaluationWithRunIds
         return deserialize_value(
             self.serialized_evaluation_body, AutomationConditionEvaluationWithRunIds
         )
+
+
+@dataclass(frozen=True)
+class DaemonLease:
+    """A lease on a key held by a replica of a daemon until its expiry timestamp, used to
+    coordinate which replica processes each instigator when a daemon is sharded.
+    """
+
+    key: str
+    owner_id: str
+    expiry_timestamp: float
+
+    @classmethod
+    def from_db_row(cls, row) -> "DaemonLease":
+        return DaemonLease(
+            key=row["lease_key"],
+            owner_id=row["owner_id"],
+            expiry_timestamp=utc_datetime_from_naive(row["expiry_timestamp"]).timestamp(),
+        )
@@ -0,0 +1,42 @@
+"""add daemon leases table
+
+Revision ID: a6b3d2f1c9e4
+Revises: 7e2f3204cf8e
+Create Date: 2025-02-10 10:41:12.529384
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+from dagster._core.storage.sql import get_sql_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "a6b3d2f1c9e4"
+down_revision = "7e2f3204cf8e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("daemon_leases"):
+        op.create_table(
+            "daemon_leases",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("lease_key", db.String(255), unique=True),
+            db.Column("owner_id", db.String(255)),
+            db.Column("expiry_timestamp", db.types.TIMESTAMP),
+            db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+            db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+
+def downgrade():
+    if has_table("daemon_leases"):
+        op.drop_table("daemon_leases")
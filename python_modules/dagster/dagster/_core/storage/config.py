@@ -63,4 +63,14 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "event_log_partition_size": Field(
+            IntSource,
+            is_required=False,
+            description=(
+                "If set, the event log table is created with a partitioned schema, where events"
+                " that are not asset events are range partitioned by id into partitions of this"
+                " many events, so that event log retention can drop whole partitions. Partitions"
+                " for upcoming events are created by the event log retention daemon."
+            ),
+        ),
     }
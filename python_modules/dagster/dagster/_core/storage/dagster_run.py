@@ -722,12 +722,24 @@ def __new__(
         )
 
     @classmethod
-    def _blocking_batch_load(
+    async def _batch_load(
         cls, keys: Iterable[str], context: LoadingContext
     ) -> Iterable[Optional["RunRecord"]]:
         result_map: dict[str, Optional[RunRecord]] = {run_id: None for run_id in keys}
+        records = await context.instance.get_run_records_async(
+            RunsFilter(run_ids=list(result_map.keys()))
+        )
+
+        for record in records:
+            result_map[record.dagster_run.run_id] = record
+
+        return result_map.values()
 
-        # this should be replaced with an async DB call
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], context: LoadingContext
+    ) -> Iterable[Optional["RunRecord"]]:
+        result_map: dict[str, Optional[RunRecord]] = {run_id: None for run_id in keys}
         records = context.instance.get_run_records(RunsFilter(run_ids=list(result_map.keys())))
 
         for record in records:
@@ -1,9 +1,13 @@
+import math
 from abc import ABC, abstractmethod
 from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
 import dagster._check as check
+from dagster._annotations import beta
 from dagster._check import CheckError
 from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.definitions.metadata.metadata_set import TableMetadataSet
@@ -28,12 +32,56 @@ class TablePartitionDimension(NamedTuple):
     partitions: Union[TimeWindow, Sequence[str]]
 
 
+TABLE_FILTER_OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "in", "not in", "is null", "is not null")
+
+
+@beta
+class TableFilter(NamedTuple("_TableFilter", [("column", str), ("operator", str), ("value", Any)])):
+    """A filter on the rows of a table, which is pushed down into the query that loads the table.
+
+    Like the ``partition_expr`` metadata, the column is inserted into the query as is, so it may be
+    any SQL expression that the database supports.
+
+    Args:
+        column (str): The column, or SQL expression, to filter on.
+        operator (str): One of ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in``, ``not in``,
+            ``is null`` or ``is not null``.
+        value (Any): The value to compare the column to. A sequence of values for ``in`` and
+            ``not in``, and no value for ``is null`` and ``is not null``.
+    """
+
+    def __new__(cls, column: str, operator: str, value: Any = None):
+        check.str_param(column, "column")
+        operator = check.str_param(operator, "operator").lower()
+        check.param_invariant(
+            operator in TABLE_FILTER_OPERATORS,
+            "operator",
+            f"Expected one of {', '.join(TABLE_FILTER_OPERATORS)}, got '{operator}'.",
+        )
+        if operator in ("in", "not in"):
+            value = tuple(check.sequence_param(value, "value"))
+            check.param_invariant(
+                len(value) > 0, "value", f"'{operator}' requires at least one value."
+            )
+        elif operator in ("is null", "is not null"):
+            check.param_invariant(value is None, "value", f"'{operator}' does not take a value.")
+        else:
+            check.param_invariant(
+                value is not None,
+                "value",
+                f"'{operator}' requires a value. Use 'is null' to filter on null values.",
+            )
+
+        return super().__new__(cls, column, operator, value)
+
+
 class TableSlice(NamedTuple):
     table: str
     schema: str
     database: Optional[str] = None
     columns: Optional[Sequence[str]] = None
     partition_dimensions: Optional[Sequence[TablePartitionDimension]] = None
+    filters: Optional[Sequence[TableFilter]] = None
 
 
 class DbTypeHandler(ABC, Generic[T]):
@@ -172,6 +220,11 @@ def load_input(self, context: InputContext) -> object:
         self._check_supported_type(load_type)
 
         table_slice = self._get_table_slice(context, cast(OutputContext, context.upstream_output))
+        # filters only apply to the rows loaded by a downstream input, not to the rows stored by
+        # the output, so they are read from the input metadata alone
+        filters = _get_table_filters(context)
+        if filters:
+            table_slice = table_slice._replace(filters=filters)
 
         with self._db_client.connect(context, table_slice) as conn:
             return self._resolve_handler(load_type).load_input(context, table_slice, conn)  # type: ignore  # (pyright bug)
@@ -297,3 +350,70 @@ def _check_supported_type(self, obj_type):
                 )
 
             raise CheckError(msg)
+
+
+def _get_table_filters(context: InputContext) -> Optional[Sequence[TableFilter]]:
+    filters = (context.definition_metadata or {}).get("filters")
+    if not filters:
+        return None
+
+    check.sequence_param(filters, "filters")
+    return [
+        table_filter if isinstance(table_filter, TableFilter) else TableFilter(*table_filter)
+        for table_filter in filters
+    ]
+
+
+def _format_sql_literal(value: Any, datetime_format: str, backslash_escapes: bool) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float, Decimal)):
+        # str() renders nan and infinity as identifiers rather than numeric literals
+        if isinstance(value, float) and not math.isfinite(value):
+            check.failed(f"Cannot filter a table on a non-finite number: {value!r}")
+        if isinstance(value, Decimal) and not value.is_finite():
+            check.failed(f"Cannot filter a table on a non-finite number: {value!r}")
+        return str(value)
+    elif isinstance(value, datetime):
+        return f"'{value.strftime(datetime_format)}'"
+    elif isinstance(value, date):
+        return f"'{value.isoformat()}'"
+    elif isinstance(value, str):
+        if backslash_escapes:
+            value = value.replace("\\", "\\\\").replace("'", "\\'")
+        else:
+            value = value.replace("'", "''")
+        return f"'{value}'"
+
+    check.failed(f"Cannot filter a table on a value of type {type(value)}: {value!r}")
+
+
+def get_table_filters_where_clause(
+    filters: Sequence[TableFilter], datetime_format: str, backslash_escapes: bool = False
+) -> str:
+    """Returns a SQL expression which is true for the rows of a table that match all of the given
+    filters.
+
+    Args:
+        filters (Sequence[TableFilter]): The filters to apply to the table.
+        datetime_format (str): The format of datetime values in the database.
+        backslash_escapes (bool): Whether the database uses backslashes to escape quotes in string
+            literals, rather than doubling them.
+    """
+
+    def _literal(value: Any) -> str:
+        return _format_sql_literal(value, datetime_format, backslash_escapes)
+
+    clauses = []
+    for table_filter in filters:
+        if table_filter.operator in ("is null", "is not null"):
+            clauses.append(f"{table_filter.column} {table_filter.operator}")
+        elif table_filter.operator in ("in", "not in"):
+            values = ", ".join(_literal(value) for value in table_filter.value)
+            clauses.append(f"{table_filter.column} {table_filter.operator} ({values})")
+        else:
+            clauses.append(
+                f"{table_filter.column} {table_filter.operator} {_literal(table_filter.value)}"
+            )
+
+    return " AND\n".join(clauses)
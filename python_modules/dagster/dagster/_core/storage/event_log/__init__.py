@@ -8,6 +8,7 @@
 )
 from dagster._core.storage.event_log.polling_event_watcher import (
     SqlPollingEventWatcher as SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher as SqlPollingMultiRunEventWatcher,
 )
 from dagster._core.storage.event_log.schema import (
     AssetKeyTable as AssetKeyTable,
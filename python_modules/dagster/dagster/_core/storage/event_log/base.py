@@ -155,6 +155,17 @@ class AssetRecord(
     Users should not invoke this class directly.
     """
 
+    @classmethod
+    async def _batch_load(
+        cls, keys: Iterable[AssetKey], context: LoadingContext
+    ) -> Iterable[Optional["AssetRecord"]]:
+        keys = list(keys)
+        records_by_key = {
+            record.asset_entry.asset_key: record
+            for record in await context.instance.get_asset_records_async(keys)
+        }
+        return [records_by_key.get(key) for key in keys]
+
     @classmethod
     def _blocking_batch_load(
         cls, keys: Iterable[AssetKey], context: LoadingContext
@@ -304,10 +315,56 @@ def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             self.store_event(event)
 
+    def store_buffered_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store the events flushed from the event buffer of the instance, in order. Unlike the
+        events passed to `store_event_batch`, these may be events of any type, including log
+        messages.
+
+        Implementations that write the events in a single request should do so atomically: if the
+        write fails, the instance falls back to storing each of the events with `store_event`.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        """Indicates that the EventLogStorage supports purging old run events via
+        purge_run_events.
+        """
+        return False
+
+    @property
+    def requires_event_log_maintenance(self) -> bool:
+        """Indicates that maintain_event_log should be called periodically, which the event log
+        retention daemon does.
+        """
+        return False
+
+    def maintain_event_log(self) -> None:
+        """Performs periodic upkeep of the event log, e.g. creating partitions for upcoming events.
+
+        Called by the event log retention daemon rather than when the storage is initialized, since
+        it may need locks that are shared by every process using the storage.
+        """
+
+    def purge_run_events(self, before: float) -> None:
+        """Remove the events stored before the given timestamp that are not indexed by asset key.
+
+        Asset events (e.g. materializations and observations) are kept, so that the history of
+        each asset is preserved while the logs of old runs are removed.
+
+        Args:
+            before (float): The timestamp before which events are removed.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -1,5 +1,8 @@
+import logging
 import os
 import threading
+import time
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
 
 import dagster._check as check
@@ -9,9 +12,17 @@
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
+# How long the multi-run watcher waits for a missing storage id to be committed before treating it
+# as a gap left by a rolled back or deleted write
+MAX_STORAGE_ID_GAP_WAIT = 5.0  # 5s
+# The maximum number of missing storage ids that the multi-run watcher waits for at once
+MAX_MISSING_STORAGE_IDS = 1000
+
 
 class CallbackAfterCursor(NamedTuple):
     """Callback passed from Observer class in event polling.
@@ -188,3 +199,278 @@ def run(self) -> None:
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
             wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+
+class SqlPollingMultiRunEventWatcher:
+    """Event log watcher that tails the event log of all runs from a single thread, rather than
+    polling each watched run separately as SqlPollingEventWatcher does. Each poll reads the storage
+    ids stored after a global storage id cursor, and the events of the watched runs among them,
+    whose results are fanned out to the callbacks of the watched runs. So the number of queries
+    does not grow with the number of watched runs, and events of runs that are not watched are
+    never read.
+
+    Runs are only queried individually when they are first watched, to deliver the events written
+    between the cursor of the new callback and the global cursor. Requires storage that assigns
+    increasing storage ids across all runs, i.e. storage that is not sharded by run.
+
+    Since ids are allocated before writes are committed, concurrent writes can become visible out
+    of order. The global cursor moves past storage ids that are missing from the results, but each
+    missing id is retried on every poll for up to MAX_STORAGE_ID_GAP_WAIT, so that an event which is
+    committed late is still delivered, and an id that is never committed does not hold back the
+    events after it.
+
+    LOCKING INFO:
+        ORDER: _lock
+        INVARIANTS: _lock protects _callbacks_by_run_id and _new_callbacks. All other state is only
+            accessed by the watcher thread.
+    """
+
+    def __init__(self, event_log_storage: "SqlEventLogStorage"):
+        from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", SqlEventLogStorage
+        )
+        self._lock = threading.Lock()
+        self._callbacks_by_run_id: MutableMapping[str, list[CallbackAfterCursor]] = {}
+        # callbacks that have been added but have not yet been caught up to the global cursor
+        self._new_callbacks: list[tuple[str, CallbackAfterCursor]] = []
+
+        # all events with a storage id up to the cursor have been delivered, except for those in
+        # _missing_storage_ids
+        self._cursor: Optional[int] = None
+        # storage ids up to the cursor that had not been committed when they were polled, mapped to
+        # the time at which they were first found to be missing
+        self._missing_storage_ids: dict[int, float] = {}
+
+        self._wake = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._callbacks_by_run_id or any(
+                new_run_id == run_id for new_run_id, _ in self._new_callbacks
+            )
+
+    def watch_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        check.invariant(not self._disposed, "Attempted to watch_run after close")
+
+        with self._lock:
+            self._new_callbacks.append((run_id, CallbackAfterCursor(cursor, callback)))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch-all-runs", daemon=True
+                )
+                self._thread.start()
+
+        # catch up the new callback without waiting for the current poll period to elapse
+        self._wake.set()
+
+    def unwatch_run(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            self._new_callbacks = [
+                (new_run_id, callback_with_cursor)
+                for new_run_id, callback_with_cursor in self._new_callbacks
+                if new_run_id != run_id or callback_with_cursor.callback != handler
+            ]
+            if run_id in self._callbacks_by_run_id:
+                self._callbacks_by_run_id[run_id] = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                    if callback_with_cursor.callback != handler
+                ]
+                if not self._callbacks_by_run_id[run_id]:
+                    del self._callbacks_by_run_id[run_id]
+
+    def close(self) -> None:
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            self._wake.set()
+            if self._thread:
+                self._thread.join()
+            with self._lock:
+                self._callbacks_by_run_id = {}
+                self._new_callbacks = []
+
+    def _run(self) -> None:
+        wait_time = INIT_POLL_PERIOD
+        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
+        while not self._should_thread_exit.is_set():
+            has_more, num_delivered = False, 0
+            try:
+                self._catch_up_new_callbacks(chunk_limit)
+                has_more, num_delivered = self._poll(chunk_limit)
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+
+            if has_more:
+                continue
+
+            wait_time = INIT_POLL_PERIOD if num_delivered else min(wait_time * 2, MAX_POLL_PERIOD)
+            self._wake.wait(wait_time)
+            self._wake.clear()
+
+    def _catch_up_new_callbacks(self, chunk_limit: int) -> None:
+        with self._lock:
+            new_callbacks = list(self._new_callbacks)
+            if new_callbacks and not self._callbacks_by_run_id:
+                # nothing has been tailed since the last callback was removed, so start from the
+                # current end of the event log rather than reading everything written since then
+                self._cursor = None
+
+        if not new_callbacks:
+            return
+
+        if self._cursor is None:
+            self._cursor = self._event_log_storage.get_maximum_record_id() or 0
+            self._missing_storage_ids = {}
+        global_cursor = self._cursor
+
+        for run_id, callback_with_cursor in new_callbacks:
+            # deliver the events up to the global cursor, after which the callback is served by
+            # polling
+            cursor = callback_with_cursor.cursor
+            has_more = True
+            while has_more:
+                conn = self._event_log_storage.get_records_for_run(
+                    run_id, cursor=cursor, limit=chunk_limit
+                )
+                has_more = conn.has_more
+                cursor = conn.cursor
+                for event_record in conn.records:
+                    if event_record.storage_id > global_cursor:
+                        has_more = False
+                        break
+                    if event_record.storage_id in self._missing_storage_ids:
+                        # the event was committed late, so it has not been delivered to the other
+                        # callbacks of the run either
+                        del self._missing_storage_ids[event_record.storage_id]
+                        self._deliver_to_run_callbacks(
+                            {event_record.storage_id: event_record.event_log_entry}
+                        )
+                    self._deliver(
+                        callback_with_cursor, event_record.storage_id, event_record.event_log_entry
+                    )
+
+            with self._lock:
+                # the callback may have been removed while it was being caught up
+                if (run_id, callback_with_cursor) in self._new_callbacks:
+                    self._new_callbacks.remove((run_id, callback_with_cursor))
+                    self._callbacks_by_run_id.setdefault(run_id, []).append(callback_with_cursor)
+
+    def _poll(self, chunk_limit: int) -> tuple[bool, int]:
+        """Delivers the events of the watched runs that were stored after the global cursor to
+        their callbacks, returning whether there are more events to fetch and the number of events
+        delivered.
+        """
+        with self._lock:
+            run_ids = list(self._callbacks_by_run_id.keys())
+        if not run_ids:
+            return False, 0
+
+        num_delivered = self._poll_missing_storage_ids(run_ids)
+
+        previous_cursor = check.not_none(self._cursor)
+        storage_ids = self._event_log_storage.get_storage_ids(
+            after_cursor=previous_cursor, limit=chunk_limit
+        )
+        if not storage_ids:
+            return False, num_delivered
+
+        events_by_storage_id = self._event_log_storage.get_logs_for_runs_by_log_id(
+            run_ids, after_cursor=previous_cursor, up_to_cursor=storage_ids[-1]
+        )
+        num_delivered += self._deliver_to_run_callbacks(events_by_storage_id)
+
+        # ids may have been committed between the two queries, in which case their events have
+        # already been delivered
+        stored_ids = set(storage_ids).union(events_by_storage_id.keys())
+        now = time.monotonic()
+        for storage_id in range(previous_cursor + 1, storage_ids[-1]):
+            if len(self._missing_storage_ids) >= MAX_MISSING_STORAGE_IDS:
+                break
+            if storage_id not in stored_ids:
+                self._missing_storage_ids[storage_id] = now
+
+        self._cursor = storage_ids[-1]
+        return len(storage_ids) == chunk_limit, num_delivered
+
+    def _poll_missing_storage_ids(self, run_ids: Sequence[str]) -> int:
+        """Delivers the events of the watched runs whose storage ids were missing when they were
+        polled and have since been committed, returning the number of events delivered.
+        """
+        if not self._missing_storage_ids:
+            return 0
+
+        missing_storage_ids = list(self._missing_storage_ids.keys())
+        committed_storage_ids = self._event_log_storage.get_storage_ids(
+            storage_ids=missing_storage_ids
+        )
+        num_delivered = 0
+        if committed_storage_ids:
+            num_delivered = self._deliver_to_run_callbacks(
+                self._event_log_storage.get_logs_for_runs_by_log_id(
+                    run_ids, storage_ids=committed_storage_ids
+                )
+            )
+            for storage_id in committed_storage_ids:
+                del self._missing_storage_ids[storage_id]
+
+        # ids that are still missing are gaps left by rolled back or deleted writes
+        now = time.monotonic()
+        self._missing_storage_ids = {
+            storage_id: missing_since
+            for storage_id, missing_since in self._missing_storage_ids.items()
+            if now - missing_since < MAX_STORAGE_ID_GAP_WAIT
+        }
+        return num_delivered
+
+    def _deliver_to_run_callbacks(self, events_by_storage_id: Mapping[int, EventLogEntry]) -> int:
+        num_delivered = 0
+        for storage_id, event_log_entry in events_by_storage_id.items():
+            with self._lock:
+                callbacks = list(self._callbacks_by_run_id.get(event_log_entry.run_id, []))
+            for callback_with_cursor in callbacks:
+                self._deliver(callback_with_cursor, storage_id, event_log_entry)
+                num_delivered += 1
+        return num_delivered
+
+    def _deliver(
+        self,
+        callback_with_cursor: CallbackAfterCursor,
+        storage_id: int,
+        event_log_entry: EventLogEntry,
+    ) -> None:
+        if (
+            callback_with_cursor.cursor is not None
+            and EventLogCursor.parse(callback_with_cursor.cursor).storage_id() >= storage_id
+        ):
+            return
+
+        try:
+            callback_with_cursor.callback(
+                event_log_entry, str(EventLogCursor.from_storage_id(storage_id))
+            )
+        except Exception:
+            logging.exception(
+                "Exception in callback for event watch on run %s.", event_log_entry.run_id
+            )
@@ -117,6 +117,12 @@
 
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+RUN_EVENT_PURGE_BATCH_SIZE = 10000
+
+# Only asset events are stored with an asset key. Queries for asset events include this clause
+# explicitly so that storages which partition the event log by whether rows have an asset key (see
+# PostgresEventLogStorage) can prune the partitions of run events.
+HAS_ASSET_KEY = SqlEventLogStorageTable.c.asset_key != None  # noqa: E711
 
 
 def get_max_event_records_limit() -> int:
@@ -680,6 +686,81 @@ def delete_events(self, run_id: str) -> None:
         if self.supports_global_concurrency_limits:
             self.free_concurrency_slots_for_run(run_id)
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        return True
+
+    def purge_run_events(self, before: float) -> None:
+        check.float_param(before, "before")
+        max_purged_id = self._get_max_event_id_before(before)
+        if max_purged_id is None:
+            return
+
+        # delete in batches, so that each statement only holds locks on a bounded number of rows
+        while True:
+            with self.index_connection() as conn:
+                event_ids = [
+                    row[0]
+                    for row in conn.execute(
+                        db_select([SqlEventLogStorageTable.c.id])
+                        .where(
+                            db.and_(
+                                SqlEventLogStorageTable.c.asset_key == None,  # noqa: E711
+                                SqlEventLogStorageTable.c.id <= max_purged_id,
+                            )
+                        )
+                        .order_by(SqlEventLogStorageTable.c.id.asc())
+                        .limit(RUN_EVENT_PURGE_BATCH_SIZE)
+                    ).fetchall()
+                ]
+                if not event_ids:
+                    return
+                conn.execute(
+                    SqlEventLogStorageTable.delete().where(
+                        SqlEventLogStorageTable.c.id.in_(event_ids)
+                    )
+                )
+
+    def _get_max_event_id_before(self, before: float) -> Optional[int]:
+        """Returns the largest storage id of the events stored before the given timestamp.
+
+        Storage ids are assigned in insertion order, so this binary searches the id index for the
+        last event with an earlier timestamp instead of scanning the (unindexed) timestamp column.
+        """
+        before_datetime = datetime.fromtimestamp(before, timezone.utc).replace(tzinfo=None)
+        with self.index_connection() as conn:
+            min_id, max_id = conn.execute(
+                db_select(
+                    [
+                        db.func.min(SqlEventLogStorageTable.c.id),
+                        db.func.max(SqlEventLogStorageTable.c.id),
+                    ]
+                )
+            ).fetchone()  # type: ignore
+            if min_id is None:
+                return None
+
+            # invariant: events with ids < low are before the cutoff and events with ids > high are not
+            result = None
+            low, high = min_id, max_id
+            while low <= high:
+                mid = (low + high) // 2
+                row = conn.execute(
+                    db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.timestamp])
+                    .where(SqlEventLogStorageTable.c.id >= mid)
+                    .order_by(SqlEventLogStorageTable.c.id.asc())
+                    .limit(1)
+                ).fetchone()
+                if row is None or row[0] > high:
+                    high = mid - 1
+                elif row[1] is not None and row[1] < before_datetime:
+                    result = row[0]
+                    low = row[0] + 1
+                else:
+                    high = mid - 1
+
+        return result
+
     def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         records = conn.execute(
@@ -795,7 +876,11 @@ def _apply_filter_to_query(
 
         if event_records_filter.asset_key:
             query = query.where(
-                SqlEventLogStorageTable.c.asset_key == event_records_filter.asset_key.to_string(),
+                db.and_(
+                    HAS_ASSET_KEY,
+                    SqlEventLogStorageTable.c.asset_key
+                    == event_records_filter.asset_key.to_string(),
+                )
             )
 
         if event_records_filter.asset_partitions:
@@ -1119,6 +1204,72 @@ def get_logs_for_all_runs_by_log_id(
 
         return events
 
+    def get_storage_ids(
+        self,
+        after_cursor: int = -1,
+        limit: Optional[int] = None,
+        storage_ids: Optional[Sequence[int]] = None,
+    ) -> Sequence[int]:
+        """Returns the storage ids of the events stored after the cursor, in ascending order,
+        without reading the events themselves. If storage_ids is given, only returns those of the
+        given storage ids which are stored.
+        """
+        check.int_param(after_cursor, "after_cursor")
+        check.opt_int_param(limit, "limit")
+        check.opt_sequence_param(storage_ids, "storage_ids", of_type=int)
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id])
+            .where(SqlEventLogStorageTable.c.id > after_cursor)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if storage_ids is not None:
+            query = query.where(SqlEventLogStorageTable.c.id.in_(storage_ids))
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            return [row[0] for row in conn.execute(query).fetchall()]
+
+    def get_logs_for_runs_by_log_id(
+        self,
+        run_ids: Sequence[str],
+        after_cursor: int = -1,
+        up_to_cursor: Optional[int] = None,
+        storage_ids: Optional[Sequence[int]] = None,
+    ) -> Mapping[int, EventLogEntry]:
+        """Returns the events of the given runs which were stored after after_cursor, up to and
+        including up_to_cursor, keyed by storage id. If storage_ids is given, only returns events
+        with those storage ids.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_cursor, "after_cursor")
+        check.opt_int_param(up_to_cursor, "up_to_cursor")
+        check.opt_sequence_param(storage_ids, "storage_ids", of_type=int)
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.id > after_cursor)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if up_to_cursor is not None:
+            query = query.where(SqlEventLogStorageTable.c.id <= up_to_cursor)
+        if storage_ids is not None:
+            query = query.where(SqlEventLogStorageTable.c.id.in_(storage_ids))
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        events = {}
+        for record_id, json_str in results:
+            try:
+                events[record_id] = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+
+        return events
+
     def get_maximum_record_id(self) -> Optional[int]:
         with self.index_connection() as conn:
             result = conn.execute(db_select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
@@ -1183,6 +1334,7 @@ def _get_latest_materialization_records(
             )
             .where(
                 db.and_(
+                    HAS_ASSET_KEY,
                     SqlEventLogStorageTable.c.asset_key.in_(
                         [asset_key.to_string() for asset_key in to_backcompat_fetch]
                     ),
@@ -1492,8 +1644,11 @@ def _fetch_backcompat_materialization_times(
                 ]
             )
             .where(
-                SqlEventLogStorageTable.c.asset_key.in_(
-                    [asset_key.to_string() for asset_key in asset_keys]
+                db.and_(
+                    HAS_ASSET_KEY,
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
                 )
             )
             .group_by(SqlEventLogStorageTable.c.asset_key)
@@ -1764,6 +1919,7 @@ def get_materialized_partitions(
             )
             .where(
                 db.and_(
+                    HAS_ASSET_KEY,
                     SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
                     SqlEventLogStorageTable.c.partition != None,  # noqa: E711
                     SqlEventLogStorageTable.c.dagster_event_type
@@ -1805,6 +1961,7 @@ def _latest_event_ids_by_partition_subquery(
             ]
         ).where(
             db.and_(
+                HAS_ASSET_KEY,
                 SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
                 SqlEventLogStorageTable.c.partition != None,  # noqa: E711
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
@@ -3154,6 +3311,7 @@ def _get_partition_data_versions(
                     SqlEventLogStorageTable.c.dagster_event_type
                     == DagsterEventType.ASSET_OBSERVATION.value,
                 ),
+                HAS_ASSET_KEY,
                 SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
                 SqlEventLogStorageTable.c.partition.in_(partitions),
             )
@@ -453,6 +453,11 @@ def wipe(self) -> None:
         self._initialized_dbs = set()
         self._wipe_index()
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        # run events are stored in a separate shard for each run, rather than in the index shard
+        return False
+
     def _delete_mirrored_events_for_asset_key(self, asset_key: AssetKey) -> None:
         with self.index_connection() as conn:
             conn.execute(
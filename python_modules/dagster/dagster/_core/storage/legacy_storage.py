@@ -49,6 +49,7 @@
     from dagster._core.remote_representation.origin import RemoteJobOrigin
     from dagster._core.scheduler.instigation import (
         AutoMaterializeAssetEvaluationRecord,
+        DaemonLease,
         InstigatorState,
         InstigatorStatus,
         InstigatorTick,
@@ -431,9 +432,26 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_buffered_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_buffered_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        return self._storage.event_log_storage.supports_event_log_retention
+
+    @property
+    def requires_event_log_maintenance(self) -> bool:
+        return self._storage.event_log_storage.requires_event_log_maintenance
+
+    def maintain_event_log(self) -> None:
+        return self._storage.event_log_storage.maintain_event_log()
+
+    def purge_run_events(self, before: float) -> None:
+        return self._storage.event_log_storage.purge_run_events(before)
+
     def upgrade(self) -> None:
         return self._storage.event_log_storage.upgrade()
 
@@ -872,6 +890,23 @@ def get_auto_materialize_evaluations_for_evaluation_id(
     def purge_asset_evaluations(self, before: float):
         return self._storage.schedule_storage.purge_asset_evaluations(before)
 
+    @property
+    def supports_daemon_leases(self) -> bool:
+        return self._storage.schedule_storage.supports_daemon_leases
+
+    def acquire_daemon_leases(
+        self, lease_keys: Sequence[str], owner_id: str, lease_duration_seconds: float
+    ) -> Sequence[str]:
+        return self._storage.schedule_storage.acquire_daemon_leases(
+            lease_keys, owner_id, lease_duration_seconds
+        )
+
+    def release_daemon_leases(self, lease_keys: Sequence[str], owner_id: str) -> None:
+        return self._storage.schedule_storage.release_daemon_leases(lease_keys, owner_id)
+
+    def get_daemon_leases(self, key_prefix: str) -> Sequence["DaemonLease"]:
+        return self._storage.schedule_storage.get_daemon_leases(key_prefix)
+
     def upgrade(self) -> None:
         return self._storage.schedule_storage.upgrade()
 
@@ -313,62 +313,25 @@ def _build_status_cache(
     if not partitions_def or not is_cacheable_partition_type(partitions_def):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
-    failed_subset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
-        if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
-        else None
-    )
-
-    cached_in_progress_cursor = (
-        (
-            stored_cache_value.earliest_in_progress_materialization_event_id - 1
-            if stored_cache_value.earliest_in_progress_materialization_event_id
-            else stored_cache_value.latest_storage_id
-        )
-        if stored_cache_value
-        else None
-    )
-
     if stored_cache_value:
-        # fetch the incremental new materialized partitions, and update the cached materialized
-        # subset
-        new_partitions = set()
-        if (
-            last_materialization_storage_id
-            and last_materialization_storage_id > stored_cache_value.latest_storage_id
-        ):
-            new_partitions = get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(
-                    asset_key, after_cursor=stored_cache_value.latest_storage_id
-                ),
-            )
-
-        materialized_subset: PartitionsSubset = (
-            partitions_def.deserialize_subset(
-                stored_cache_value.serialized_materialized_partition_subset
-            )
-            if stored_cache_value.serialized_materialized_partition_subset
-            else partitions_def.empty_subset()
+        return _apply_status_cache_delta(
+            instance,
+            asset_key,
+            partitions_def,
+            dynamic_partitions_store,
+            stored_cache_value,
+            latest_storage_id=latest_storage_id,
+            last_materialization_storage_id=last_materialization_storage_id,
+            last_planned_materialization_storage_id=last_planned_materialization_storage_id,
         )
 
-        if new_partitions:
-            materialized_subset = materialized_subset.with_partition_keys(new_partitions)
-
-        if failed_subset and new_partitions:
-            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
-                new_partitions
-            )
-
-    else:
-        materialized_subset = partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(asset_key),
-            )
+    materialized_subset = partitions_def.empty_subset().with_partition_keys(
+        get_validated_partition_keys(
+            dynamic_partitions_store,
+            partitions_def,
+            instance.get_materialized_partitions(asset_key),
         )
+    )
 
     (
         failed_subset,
@@ -380,8 +343,6 @@ def _build_status_cache(
         partitions_def,
         dynamic_partitions_store,
         last_planned_materialization_storage_id=last_planned_materialization_storage_id,
-        failed_subset=failed_subset,
-        after_storage_id=cached_in_progress_cursor,
     )
 
     return AssetStatusCacheValue(
@@ -396,6 +357,92 @@ def _build_status_cache(
     )
 
 
+def _apply_status_cache_delta(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    stored_cache_value: AssetStatusCacheValue,
+    latest_storage_id: int,
+    last_materialization_storage_id: Optional[int],
+    last_planned_materialization_storage_id: int,
+) -> AssetStatusCacheValue:
+    """Applies the materialization, planned, and failure events that occurred after the stored
+    cache value's latest storage id. Serialized subsets that are unaffected by the new events are
+    carried over as-is, so the cost of an update is proportional to the number of new events rather
+    than the total number of partitions of the asset.
+    """
+    if (
+        latest_storage_id == stored_cache_value.latest_storage_id
+        and stored_cache_value.earliest_in_progress_materialization_event_id is None
+    ):
+        # no new events, and no in-progress runs whose status may have changed
+        return stored_cache_value
+
+    new_partitions: set[str] = set()
+    if (
+        last_materialization_storage_id
+        and last_materialization_storage_id > stored_cache_value.latest_storage_id
+    ):
+        new_partitions = get_validated_partition_keys(
+            dynamic_partitions_store,
+            partitions_def,
+            instance.get_materialized_partitions(
+                asset_key, after_cursor=stored_cache_value.latest_storage_id
+            ),
+        )
+
+    serialized_materialized_partition_subset = (
+        stored_cache_value.serialized_materialized_partition_subset
+    )
+    if new_partitions:
+        serialized_materialized_partition_subset = (
+            stored_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+            .with_partition_keys(new_partitions)
+            .serialize()
+        )
+
+    in_progress_cursor = (
+        stored_cache_value.earliest_in_progress_materialization_event_id - 1
+        if stored_cache_value.earliest_in_progress_materialization_event_id
+        else stored_cache_value.latest_storage_id
+    )
+    (
+        failed_partitions,
+        in_progress_partitions,
+        earliest_in_progress_materialization_event_id,
+    ) = get_failed_and_in_progress_partitions(
+        instance,
+        asset_key,
+        partitions_def,
+        dynamic_partitions_store,
+        last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+        after_storage_id=in_progress_cursor,
+    )
+
+    serialized_failed_partition_subset = stored_cache_value.serialized_failed_partition_subset
+    if failed_partitions or (new_partitions and serialized_failed_partition_subset):
+        failed_subset = stored_cache_value.deserialize_failed_partition_subsets(partitions_def)
+        if new_partitions:
+            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
+                new_partitions
+            )
+        if failed_partitions:
+            failed_subset = failed_subset.with_partition_keys(failed_partitions)
+        serialized_failed_partition_subset = failed_subset.serialize()
+
+    return AssetStatusCacheValue(
+        latest_storage_id=latest_storage_id,
+        partitions_def_id=stored_cache_value.partitions_def_id,
+        serialized_materialized_partition_subset=serialized_materialized_partition_subset,
+        serialized_failed_partition_subset=serialized_failed_partition_subset,
+        serialized_in_progress_partition_subset=partitions_def.empty_subset()
+        .with_partition_keys(in_progress_partitions)
+        .serialize(),
+        earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+    )
+
+
 def build_failed_and_in_progress_partition_subset(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -405,12 +452,50 @@ def build_failed_and_in_progress_partition_subset(
     failed_subset: Optional[PartitionsSubset[str]] = None,
     after_storage_id: Optional[int] = None,
 ) -> tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
+    (
+        failed_partitions,
+        in_progress_partitions,
+        cursor,
+    ) = get_failed_and_in_progress_partitions(
+        instance,
+        asset_key,
+        partitions_def,
+        dynamic_partitions_store,
+        last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+        after_storage_id=after_storage_id,
+    )
+
+    failed_subset = failed_subset or partitions_def.empty_subset()
+    if failed_partitions:
+        failed_subset = failed_subset.with_partition_keys(failed_partitions)
+
+    return (
+        failed_subset,
+        (
+            partitions_def.empty_subset().with_partition_keys(in_progress_partitions)
+            if in_progress_partitions
+            else partitions_def.empty_subset()
+        ),
+        cursor,
+    )
+
+
+def get_failed_and_in_progress_partitions(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    last_planned_materialization_storage_id: int,
+    after_storage_id: Optional[int] = None,
+) -> tuple[set[str], set[str], Optional[int]]:
+    """Returns the validated partition keys that failed and that are in progress among the
+    materialization attempts planned after the given storage id, along with the event id of the
+    earliest attempt that is still in progress.
+    """
     in_progress_partitions: set[str] = set()
 
     incomplete_materializations = {}
 
-    failed_subset = failed_subset or partitions_def.empty_subset()
-
     # Fetch incomplete materializations if there have been any planned materializations since the
     # cursor
     if last_planned_materialization_storage_id and (
@@ -452,22 +537,13 @@ def build_failed_and_in_progress_partition_subset(
                 # considered neither in-progress nor failed
                 pass
 
-    if failed_partitions:
-        failed_subset = failed_subset.with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store, partitions_def, failed_partitions
-            )
-        )
-
     return (
-        failed_subset,
-        (
-            partitions_def.empty_subset().with_partition_keys(
-                get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
-            )
-            if in_progress_partitions
-            else partitions_def.empty_subset()
-        ),
+        get_validated_partition_keys(dynamic_partitions_store, partitions_def, failed_partitions)
+        if failed_partitions
+        else set(),
+        get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
+        if in_progress_partitions
+        else set(),
         cursor,
     )
 
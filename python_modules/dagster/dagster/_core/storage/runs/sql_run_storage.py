@@ -75,7 +75,12 @@
     RUN_FAILURE_REASON_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import (
+    deserialize_value,
+    is_binary_serialized_value,
+    serialize_value,
+    serialize_value_to_bytes,
+)
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.merger import merge_dicts
@@ -594,6 +599,13 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def _serialize_snapshot_body(self, snapshot_obj) -> bytes:
+        # snapshots are only written in the binary format when the instance opts in, since
+        # processes running older versions of dagster against the same database can't read them
+        if self.has_instance and self._instance.binary_snapshot_serialization_enabled:
+            return zlib.compress(serialize_value_to_bytes(snapshot_obj))
+        return zlib.compress(serialize_value(snapshot_obj).encode("utf-8"))
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -602,7 +614,7 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=self._serialize_snapshot_body(snapshot_obj),
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -1136,6 +1148,9 @@ def _warn(msg: str) -> None:
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
+    if is_binary_serialized_value(uncompressed_bytes):
+        return deserialize_value(uncompressed_bytes, (ExecutionPlanSnapshot, JobSnap))
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
@@ -10,6 +10,7 @@
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.scheduler.instigation import (
     AutoMaterializeAssetEvaluationRecord,
+    DaemonLease,
     InstigatorState,
     InstigatorStatus,
     InstigatorTick,
@@ -193,6 +194,35 @@ def purge_asset_evaluations(self, before: float) -> None:
             before (datetime): All evaluations before this datetime will get purged
         """
 
+    @property
+    def supports_daemon_leases(self) -> bool:
+        return False
+
+    def acquire_daemon_leases(
+        self, lease_keys: Sequence[str], owner_id: str, lease_duration_seconds: float
+    ) -> Sequence[str]:
+        """Acquire the leases with the given keys for the given owner, or renew them if they are
+        already held by that owner. Leases held by other owners are only acquired once they have
+        expired.
+
+        Args:
+            lease_keys (Sequence[str]): The keys of the leases to acquire.
+            owner_id (str): The id of the owner acquiring the leases.
+            lease_duration_seconds (float): How long the leases are held for, unless renewed.
+
+        Returns:
+            Sequence[str]: The keys of the leases that are held by the owner.
+        """
+        raise NotImplementedError()
+
+    def release_daemon_leases(self, lease_keys: Sequence[str], owner_id: str) -> None:
+        """Release the leases with the given keys that are held by the given owner."""
+        raise NotImplementedError()
+
+    def get_daemon_leases(self, key_prefix: str) -> Sequence[DaemonLease]:
+        """Get the unexpired leases whose keys start with the given prefix."""
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def upgrade(self) -> None:
         """Perform any needed migrations."""
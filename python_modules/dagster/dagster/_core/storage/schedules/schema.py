@@ -81,6 +81,22 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
 )
 
+DaemonLeasesTable = db.Table(
+    "daemon_leases",
+    ScheduleStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("lease_key", db.String(255), unique=True),
+    db.Column("owner_id", db.String(255)),
+    db.Column("expiry_timestamp", db.types.TIMESTAMP),
+    db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+    db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
 
 # Secondary Index migration table, used to track data migrations, event_logs and runs.
 # This schema should match the schema in the event_log storage, run schema
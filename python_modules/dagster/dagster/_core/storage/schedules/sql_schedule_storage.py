@@ -18,6 +18,7 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.scheduler.instigation import (
     AutoMaterializeAssetEvaluationRecord,
+    DaemonLease,
     InstigatorState,
     InstigatorStatus,
     InstigatorTick,
@@ -33,6 +34,7 @@
 )
 from dagster._core.storage.schedules.schema import (
     AssetDaemonAssetEvaluationsTable,
+    DaemonLeasesTable,
     InstigatorsTable,
     JobTable,
     JobTickTable,
@@ -46,6 +48,9 @@
 
 T_NamedTuple = TypeVar("T_NamedTuple", bound=NamedTuple)
 
+# bounds the number of parameters bound to each lease query
+DAEMON_LEASE_BATCH_SIZE = 500
+
 
 class SqlScheduleStorage(ScheduleStorage):
     """Base class for SQL backed schedule storage."""
@@ -278,6 +283,10 @@ def _has_asset_daemon_asset_evaluations_table(self, conn: Connection) -> bool:
         table_names = db.inspect(conn).get_table_names()
         return "asset_daemon_asset_evaluations" in table_names
 
+    def _has_daemon_leases_table(self, conn: Connection) -> bool:
+        table_names = db.inspect(conn).get_table_names()
+        return "daemon_leases" in table_names
+
     def get_batch_ticks(
         self,
         selector_ids: Sequence[str],
@@ -560,6 +569,106 @@ def purge_asset_evaluations(self, before: float):
         with self.connect() as conn:
             conn.execute(query)
 
+    @property
+    def supports_daemon_leases(self) -> bool:
+        with self.connect() as conn:
+            return self._has_daemon_leases_table(conn)
+
+    def acquire_daemon_leases(
+        self, lease_keys: Sequence[str], owner_id: str, lease_duration_seconds: float
+    ) -> Sequence[str]:
+        check.sequence_param(lease_keys, "lease_keys", of_type=str)
+        check.str_param(owner_id, "owner_id")
+        check.numeric_param(lease_duration_seconds, "lease_duration_seconds")
+
+        now = get_current_datetime()
+        expiry = datetime_from_timestamp(now.timestamp() + lease_duration_seconds)
+        held_keys = []
+        with self.connect() as conn:
+            for i in range(0, len(lease_keys), DAEMON_LEASE_BATCH_SIZE):
+                batch_keys = lease_keys[i : i + DAEMON_LEASE_BATCH_SIZE]
+
+                # renew the leases held by this owner and take over expired leases. The conditions
+                # are evaluated atomically for each row, so only one owner can take over a lease
+                conn.execute(
+                    DaemonLeasesTable.update()
+                    .where(
+                        db.and_(
+                            DaemonLeasesTable.c.lease_key.in_(batch_keys),
+                            db.or_(
+                                DaemonLeasesTable.c.owner_id == owner_id,
+                                DaemonLeasesTable.c.expiry_timestamp < now,
+                            ),
+                        )
+                    )
+                    .values(owner_id=owner_id, expiry_timestamp=expiry, update_timestamp=now)
+                )
+                owners = {
+                    row[0]: row[1]
+                    for row in conn.execute(
+                        db_select(
+                            [DaemonLeasesTable.c.lease_key, DaemonLeasesTable.c.owner_id]
+                        ).where(DaemonLeasesTable.c.lease_key.in_(batch_keys))
+                    ).fetchall()
+                }
+
+                for lease_key in batch_keys:
+                    if lease_key in owners:
+                        if owners[lease_key] == owner_id:
+                            held_keys.append(lease_key)
+                        continue
+
+                    try:
+                        conn.execute(
+                            DaemonLeasesTable.insert().values(
+                                lease_key=lease_key,
+                                owner_id=owner_id,
+                                expiry_timestamp=expiry,
+                            )
+                        )
+                        held_keys.append(lease_key)
+                    except db_exc.IntegrityError:
+                        # acquired by another owner since the leases were read
+                        pass
+
+        return held_keys
+
+    def release_daemon_leases(self, lease_keys: Sequence[str], owner_id: str) -> None:
+        check.sequence_param(lease_keys, "lease_keys", of_type=str)
+        check.str_param(owner_id, "owner_id")
+
+        with self.connect() as conn:
+            for i in range(0, len(lease_keys), DAEMON_LEASE_BATCH_SIZE):
+                conn.execute(
+                    DaemonLeasesTable.delete().where(
+                        db.and_(
+                            DaemonLeasesTable.c.lease_key.in_(
+                                lease_keys[i : i + DAEMON_LEASE_BATCH_SIZE]
+                            ),
+                            DaemonLeasesTable.c.owner_id == owner_id,
+                        )
+                    )
+                )
+
+    def get_daemon_leases(self, key_prefix: str) -> Sequence[DaemonLease]:
+        check.str_param(key_prefix, "key_prefix")
+
+        query = db_select(
+            [
+                DaemonLeasesTable.c.lease_key,
+                DaemonLeasesTable.c.owner_id,
+                DaemonLeasesTable.c.expiry_timestamp,
+            ]
+        ).where(
+            db.and_(
+                DaemonLeasesTable.c.lease_key.startswith(key_prefix, autoescape=True),
+                DaemonLeasesTable.c.expiry_timestamp >= get_current_datetime(),
+            )
+        )
+        with self.connect() as conn:
+            rows = db_fetch_mappings(conn, query)
+        return [DaemonLease.from_db_row(row) for row in rows]
+
     def wipe(self) -> None:
         """Clears the schedule storage."""
         with self.connect() as conn:
@@ -570,6 +679,8 @@ def wipe(self) -> None:
                 conn.execute(InstigatorsTable.delete())
             if self._has_asset_daemon_asset_evaluations_table(conn):
                 conn.execute(AssetDaemonAssetEvaluationsTable.delete())
+            if self._has_daemon_leases_table(conn):
+                conn.execute(DaemonLeasesTable.delete())
 
     # MIGRATIONS
 
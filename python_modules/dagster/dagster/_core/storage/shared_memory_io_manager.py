@@ -0,0 +1,326 @@
+import errno
+import mmap
+import os
+import pickle
+import shutil
+import stat
+import struct
+import tempfile
+from collections.abc import Sequence
+from typing import Optional
+
+from pydantic import Field
+
+import dagster._check as check
+from dagster._annotations import beta
+from dagster._config.pythonic_config import ConfigurableIOManagerFactory
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.events import DagsterEventType
+from dagster._core.execution.context.init import InitResourceContext
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.execution.plan.step import StepKind
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import FINISHED_STATUSES, DagsterRun, RunsFilter
+from dagster._core.storage.io_manager import IOManager
+from dagster._utils import mkdir_p
+
+# out-of-band buffers require pickle protocol 5
+SHARED_MEMORY_PICKLE_PROTOCOL = 5
+
+RUN_DIRECTORY_PREFIX = "dagster-run-"
+
+# magic, length of the pickle stream, number of out-of-band buffers
+_HEADER = struct.Struct("<8sQQ")
+_HEADER_MAGIC = b"DAGSHM01"
+# offset and length of each out-of-band buffer
+_BUFFER_ENTRY = struct.Struct("<QQ")
+# buffers are aligned so that they can be used directly by vectorized code
+_BUFFER_ALIGNMENT = 64
+
+
+def _get_default_base_dir() -> str:
+    # /dev/shm is a memory-backed filesystem on most linux hosts, so mapped files never touch disk.
+    # Both it and the temporary directory are shared by all users, so each user gets a private
+    # directory within them.
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return os.path.join(root, f"dagster-{user}")
+
+
+def _check_private(path: str, st: os.stat_result) -> None:
+    # Values are unpickled when they are loaded, so anyone who can write to the storage can run
+    # code in the process that loads it
+    if not hasattr(os, "getuid"):
+        return
+    if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise DagsterInvariantViolationError(
+            f"Refusing to use {path} for shared memory storage, as it is not owned by the current"
+            " user or can be written to by other users."
+        )
+
+
+def ensure_private_directory(path: str) -> None:
+    """Creates the directory at path, readable only by the current user, if it does not exist, and
+    raises if an existing directory is not owned by the current user or is writable by others.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise DagsterInvariantViolationError(
+            f"Refusing to use {path} for shared memory storage, as it is not a directory."
+        )
+    _check_private(path, st)
+
+
+def _align(offset: int) -> int:
+    return (offset + _BUFFER_ALIGNMENT - 1) // _BUFFER_ALIGNMENT * _BUFFER_ALIGNMENT
+
+
+def write_shared_memory_file(path: str, obj: object) -> None:
+    """Pickles obj to the file at path, writing any buffers that the object exposes via pickle
+    protocol 5 (e.g. NumPy arrays, Arrow buffers, and the DataFrames built on them) out of band
+    after the pickle stream so that they can be mapped directly into memory when read.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=SHARED_MEMORY_PICKLE_PROTOCOL, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    offset = _HEADER.size + _BUFFER_ENTRY.size * len(raw_buffers) + len(data)
+    entries = []
+    for raw_buffer in raw_buffers:
+        offset = _align(offset)
+        entries.append((offset, raw_buffer.nbytes))
+        offset += raw_buffer.nbytes
+
+    # write to a temporary file and move it into place so that readers never observe partial writes
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            f.write(_HEADER.pack(_HEADER_MAGIC, len(data), len(raw_buffers)))
+            for entry in entries:
+                f.write(_BUFFER_ENTRY.pack(*entry))
+            f.write(data)
+            for (buffer_offset, _), raw_buffer in zip(entries, raw_buffers):
+                f.write(b"\0" * (buffer_offset - f.tell()))
+                f.write(raw_buffer)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # partially written files would otherwise keep holding memory
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    for buffer in buffers:
+        buffer.release()
+
+
+def read_shared_memory_file(path: str) -> object:
+    """Loads an object written by write_shared_memory_file. Out-of-band buffers are not copied, but
+    are instead views onto a copy-on-write memory map of the file, so objects built on them are
+    backed by the same physical pages as the file until they are modified.
+    """
+    with open(path, "rb") as f:
+        _check_private(path, os.fstat(f.fileno()))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    view = memoryview(mapped)
+    magic, data_length, num_buffers = _HEADER.unpack_from(view, 0)
+    check.invariant(magic == _HEADER_MAGIC, f"File at {path} was not written by this IO manager")
+
+    offset = _HEADER.size
+    buffers = []
+    for _ in range(num_buffers):
+        buffer_offset, buffer_length = _BUFFER_ENTRY.unpack_from(view, offset)
+        buffers.append(view[buffer_offset : buffer_offset + buffer_length])
+        offset += _BUFFER_ENTRY.size
+
+    return pickle.loads(view[offset : offset + data_length], buffers=buffers)
+
+
+def get_run_directory(base_dir: str, run_id: str) -> str:
+    return os.path.join(base_dir, f"{RUN_DIRECTORY_PREFIX}{run_id}")
+
+
+_STEP_FINISHED_EVENTS = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+}
+
+
+def have_all_steps_finished(instance: DagsterInstance, dagster_run: DagsterRun) -> bool:
+    """Whether every step that the run was planned to execute has finished, so that no step of the
+    run will load the outputs stored for it. Returns False if this cannot be determined up front,
+    e.g. for runs with dynamic steps, whose keys are only known once their upstream outputs are.
+    """
+    if dagster_run.execution_plan_snapshot_id is None:
+        return False
+
+    plan_snapshot = instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id)
+    step_kinds = {step.key: step.kind for step in plan_snapshot.steps}
+    step_keys = plan_snapshot.step_keys_to_execute
+    if any(step_kinds.get(step_key) != StepKind.COMPUTE for step_key in step_keys):
+        return False
+
+    finished_step_keys = {
+        record.event_log_entry.step_key
+        for record in instance.get_records_for_run(
+            dagster_run.run_id, of_type=_STEP_FINISHED_EVENTS
+        ).records
+    }
+    return all(step_key in finished_step_keys for step_key in step_keys)
+
+
+def remove_finished_run_directories(
+    base_dir: str, instance: DagsterInstance, dagster_run: DagsterRun
+) -> Sequence[str]:
+    """Removes the storage of dagster_run if all of its steps have finished, along with the storage
+    of any other run in base_dir that has finished. Other runs are only removed once the instance
+    has recorded that they finished, which covers runs whose steps did not all execute, e.g.
+    because an upstream step failed. Returns the ids of the runs whose storage was removed.
+    """
+    try:
+        run_ids = [
+            name[len(RUN_DIRECTORY_PREFIX) :]
+            for name in os.listdir(base_dir)
+            if name.startswith(RUN_DIRECTORY_PREFIX)
+        ]
+    except FileNotFoundError:
+        return []
+
+    other_run_ids = [run_id for run_id in run_ids if run_id != dagster_run.run_id]
+    removed_run_ids = []
+    if other_run_ids:
+        removed_run_ids.extend(
+            record.dagster_run.run_id
+            for record in instance.get_run_records(RunsFilter(run_ids=other_run_ids))
+            if record.dagster_run.status in FINISHED_STATUSES
+        )
+    if dagster_run.run_id in run_ids and have_all_steps_finished(instance, dagster_run):
+        removed_run_ids.append(dagster_run.run_id)
+
+    for run_id in removed_run_ids:
+        shutil.rmtree(get_run_directory(base_dir, run_id), ignore_errors=True)
+    return removed_run_ids
+
+
+class PickledObjectSharedMemoryIOManager(IOManager):
+    """IO manager that passes values between processes on the same host through memory-mapped
+    files. Values are pickled using protocol 5, and any out-of-band buffers are loaded without
+    copying.
+
+    Args:
+        base_dir (str): Directory in which the storage of each run is created.
+    """
+
+    def __init__(self, base_dir: str):
+        self.base_dir = check.str_param(base_dir, "base_dir")
+
+    def _get_path(self, context: OutputContext) -> str:
+        return os.path.join(
+            get_run_directory(self.base_dir, context.run_id),
+            context.step_key,
+            context.name,
+            *([context.mapping_key] if context.mapping_key else []),
+        )
+
+    def handle_output(self, context: OutputContext, obj: object) -> None:
+        path = self._get_path(context)
+        mkdir_p(os.path.dirname(path))
+        context.log.debug(f"Writing shared memory file at: {path}")
+
+        try:
+            write_shared_memory_file(path, obj)
+        except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
+            raise DagsterInvariantViolationError(
+                f"Object of type {type(obj)} returned by output '{context.name}' is not picklable,"
+                " so it cannot be passed between processes using the shared memory IO manager."
+            ) from e
+        except OSError as e:
+            if e.errno != errno.ENOSPC:
+                raise
+            raise DagsterInvariantViolationError(
+                f"Ran out of space in {self.base_dir} while writing output '{context.name}' of"
+                f" type {type(obj)}. Containers often limit the size of /dev/shm to 64MB, which can"
+                " be increased (e.g. with the --shm-size option of docker run, or with a"
+                " memory-backed emptyDir volume on Kubernetes), or base_dir can be set to a"
+                " directory on a larger filesystem."
+            ) from e
+
+    def load_input(self, context: InputContext) -> object:
+        path = self._get_path(check.not_none(context.upstream_output))
+        context.log.debug(f"Loading shared memory file from: {path}")
+        return read_shared_memory_file(path)
+
+
+@beta
+class SharedMemoryIOManager(ConfigurableIOManagerFactory[PickledObjectSharedMemoryIOManager]):
+    """IO manager that passes step outputs between processes on the same host, such as the step
+    processes of the :py:func:`multiprocess_executor`, without copying the underlying data.
+
+    Outputs are pickled using protocol 5 into memory-mapped files. Large buffers exposed through
+    that protocol, such as those backing NumPy arrays, Arrow tables and pandas DataFrames, are
+    stored out of band and are mapped directly into the memory of the process that loads them,
+    rather than being copied while unpickling.
+
+    Files are stored in a directory per run under ``base_dir``, which defaults to a directory that
+    is private to the current user within ``/dev/shm`` when it exists, so that values never touch
+    disk. Since values are unpickled when they are loaded, ``base_dir`` must be owned by the
+    current user and must not be writable by other users.
+
+    Values only live for as long as their run: when the IO manager is torn down at the end of a
+    step, the storage of its run is removed once all steps of the run have finished, along with
+    the storage of any other run that the instance has recorded as finished. This means that, as with the :py:func:`mem_io_manager`, values are not available
+    after the run, e.g. through the result of :py:func:`execute_job`, or to later runs, so this IO
+    manager should not be used for assets which are loaded by other runs, or for runs which are
+    re-executed from failure. Since ``/dev/shm`` is often small within containers, writing an
+    output that does not fit raises an error that explains how to make more space available.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import SharedMemoryIOManager, job, multiprocess_executor, op
+
+        @op
+        def make_frame():
+            return build_large_dataframe()
+
+        @op
+        def summarize(frame):
+            return frame.describe()
+
+        @job(
+            executor_def=multiprocess_executor,
+            resource_defs={"io_manager": SharedMemoryIOManager()},
+        )
+        def my_job():
+            summarize(make_frame())
+    """
+
+    base_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory in which the storage of each run is created. Must be owned by the current"
+            " user and not writable by other users. Defaults to a directory private to the current"
+            " user within /dev/shm if it exists, and within the system temporary directory"
+            " otherwise."
+        ),
+    )
+
+    @classmethod
+    def _is_dagster_maintained(cls) -> bool:
+        return True
+
+    def create_io_manager(self, context: InitResourceContext) -> PickledObjectSharedMemoryIOManager:
+        base_dir = self.base_dir or _get_default_base_dir()
+        ensure_private_directory(base_dir)
+        return PickledObjectSharedMemoryIOManager(base_dir=base_dir)
+
+    def teardown_after_execution(self, context: InitResourceContext) -> None:
+        if context.instance is None or context.dagster_run is None:
+            return
+        remove_finished_run_directories(
+            self.base_dir or _get_default_base_dir(), context.instance, context.dagster_run
+        )
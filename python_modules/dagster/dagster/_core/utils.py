@@ -1,12 +1,15 @@
 import os
+import queue
 import random
 import re
 import string
+import threading
+import time
 import uuid
 import warnings
 from collections import OrderedDict, deque
 from collections.abc import Iterable, Iterator, Mapping, Sequence
-from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait
 from contextvars import copy_context
 from typing import (  # noqa: UP035
     AbstractSet,
@@ -257,6 +260,116 @@ def _apply_func_to_iterator_results(iterable: Iterator) -> None:
         raise exc
 
 
+_END_OF_ITERATOR = object()
+
+
+def imap_batched(
+    executor: ThreadPoolExecutor,
+    iterable: Iterator[T],
+    func: Callable[[Sequence[T]], Sequence[P]],
+    batch_size: int,
+    batch_window_seconds: float,
+) -> Iterator[P]:
+    """A version of `imap` which applies the function to batches of elements of the iterator,
+    yielding the results for each element in the order of the input iterator.
+
+    Elements are grouped into a batch until either the batch contains `batch_size` elements, or
+    `batch_window_seconds` have elapsed since the first element of the batch was received. At most
+    `batch_size` elements are read ahead of the batch being filled, and the iterator is no longer
+    read once the returned generator is closed.
+
+    Args:
+        executor: The ThreadPoolExecutor to use for parallel execution.
+        iterable: The iterator to apply the function to.
+        func: The function to apply to each batch of elements of the iterator, which returns a
+            result for each element of the batch.
+        batch_size: The maximum number of elements in a batch.
+        batch_window_seconds: The maximum time to wait for a batch to fill up before it is
+            submitted.
+    """
+    check.invariant(batch_size > 0, "batch_size must be positive")
+
+    # tail the iterator in a separate thread, so that partial batches can be submitted once their
+    # window has elapsed while waiting on the next element of the iterator
+    input_queue: queue.Queue[tuple[Any, Optional[Exception]]] = queue.Queue(maxsize=batch_size)
+    stop_event = threading.Event()
+
+    def _put(item: tuple[Any, Optional[Exception]]) -> bool:
+        # the queue is bounded, so stop waiting for room in it once the consumer has gone away
+        while not stop_event.is_set():
+            try:
+                input_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _enqueue_iterator_results(iterable: Iterator) -> None:
+        try:
+            for arg in iterable:
+                if not _put((arg, None)):
+                    return
+        except Exception as e:
+            _put((_END_OF_ITERATOR, e))
+        else:
+            _put((_END_OF_ITERATOR, None))
+
+    threading.Thread(
+        target=_enqueue_iterator_results, args=(iterable,), name="imap_batched", daemon=True
+    ).start()
+
+    def _apply_func_to_batch(batch: Sequence[T]) -> Sequence[P]:
+        results = func(batch)
+        check.invariant(
+            len(results) == len(batch), "Expected a result for each element of the batch"
+        )
+        return results
+
+    work_queue: deque[Future] = deque([])
+    batch: list[T] = []
+    batch_deadline = 0.0
+    is_exhausted = False
+    exc = None
+
+    try:
+        while not is_exhausted or batch or work_queue:
+            # yield the results of the batches that have completed, in the order they were submitted
+            while work_queue and work_queue[0].done():
+                yield from work_queue.popleft().result()
+
+            if not is_exhausted:
+                timeout = 0.1 if not batch else min(0.1, max(batch_deadline - time.monotonic(), 0))
+                try:
+                    arg, exc = input_queue.get(timeout=timeout)
+                    if arg is _END_OF_ITERATOR:
+                        is_exhausted = True
+                    else:
+                        if not batch:
+                            batch_deadline = time.monotonic() + batch_window_seconds
+                        batch.append(arg)
+                except queue.Empty:
+                    pass
+
+            if batch and (
+                is_exhausted or len(batch) >= batch_size or time.monotonic() >= batch_deadline
+            ):
+                work_queue.append(executor.submit(_apply_func_to_batch, batch))
+                batch = []
+            elif is_exhausted and work_queue:
+                wait([work_queue[0]], timeout=0.1)
+    finally:
+        # stop reading the iterator, and skip the batches that have not started, if the generator
+        # is closed before it is exhausted
+        stop_event.set()
+        for future in work_queue:
+            future.cancel()
+
+    # Ensure any exceptions from the iterator are raised, after all batches have been processed.
+    if exc:
+        raise exc
+
+
 def exhaust_iterator_and_yield_results_with_exception(iterable: Iterator[T]) -> Iterator[T]:
     """Fully exhausts an iterator and then yield its results. If the iterator raises an exception,
     raise that exception at the position in the iterator where it was originally raised.
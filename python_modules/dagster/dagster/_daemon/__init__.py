@@ -16,6 +16,7 @@
 from dagster._daemon.daemon import (
     BackfillDaemon as BackfillDaemon,
     DagsterDaemon as DagsterDaemon,
+    EventLogRetentionDaemon as EventLogRetentionDaemon,
     IntervalDaemon as IntervalDaemon,
     MonitoringDaemon as MonitoringDaemon,
     SchedulerDaemon as SchedulerDaemon,
@@ -1,5 +1,6 @@
 import os
 import sys
+from collections.abc import Sequence
 from contextlib import ExitStack
 from typing import Optional
 
@@ -15,11 +16,13 @@
     DEFAULT_DAEMON_HEARTBEAT_TOLERANCE_SECONDS,
     DagsterDaemonController as DagsterDaemonController,
     all_daemons_live,
+    create_daemon_of_type,
+    create_daemons_from_instance,
     daemon_controller_from_instance,
     debug_daemon_heartbeats,
     get_daemon_statuses,
 )
-from dagster._daemon.daemon import get_telemetry_daemon_session_id
+from dagster._daemon.daemon import DagsterDaemon, get_telemetry_daemon_session_id
 from dagster._serdes import deserialize_value
 from dagster._utils.interrupts import capture_interrupts, setup_interrupt_handlers
 
@@ -58,6 +61,16 @@ def _get_heartbeat_tolerance():
     default="colored",
     help="Format of the log output from the webserver",
 )
+@click.option(
+    "--daemon-type",
+    "daemon_types",
+    type=click.STRING,
+    multiple=True,
+    help=(
+        "Only run the daemons of the given types, e.g. SENSOR. Can be used to run additional"
+        " replicas of the sensor and scheduler daemons when their evaluations are sharded."
+    ),
+)
 @click.option(
     "--instance-ref",
     type=click.STRING,
@@ -76,6 +89,7 @@ def run_command(
     code_server_log_level: str,
     log_level: str,
     log_format: str,
+    daemon_types: Sequence[str],
     instance_ref: Optional[str],
     shutdown_pipe: Optional[int],
     **other_opts: object,
@@ -95,7 +109,12 @@ def run_command(
                 instance_ref=deserialize_value(instance_ref, InstanceRef) if instance_ref else None
             ) as instance:
                 _daemon_run_command(
-                    instance, log_level, code_server_log_level, log_format, workspace_opts
+                    instance,
+                    log_level,
+                    code_server_log_level,
+                    log_format,
+                    workspace_opts,
+                    daemon_types,
                 )
     except KeyboardInterrupt:
         return  # Exit cleanly on interrupt
@@ -108,11 +127,27 @@ def _daemon_run_command(
     code_server_log_level: str,
     log_format: str,
     workspace_opts: WorkspaceOpts,
+    daemon_types: Sequence[str] = (),
 ) -> None:
+    if daemon_types:
+        required_daemon_types = instance.get_required_daemon_types()
+        for daemon_type in daemon_types:
+            if daemon_type not in required_daemon_types:
+                raise click.UsageError(
+                    f"Daemon type {daemon_type} is not configured on the instance. Configured"
+                    f" daemon types: {', '.join(required_daemon_types)}"
+                )
+
+    def _gen_daemons(instance: DagsterInstance) -> Sequence[DagsterDaemon]:
+        if not daemon_types:
+            return create_daemons_from_instance(instance)
+        return [create_daemon_of_type(daemon_type, instance) for daemon_type in daemon_types]
+
     with daemon_controller_from_instance(
         instance,
         workspace_load_target=workspace_opts.to_load_target(),
         heartbeat_tolerance_seconds=_get_heartbeat_tolerance(),
+        gen_daemons=_gen_daemons,
         log_level=log_level,
         code_server_log_level=code_server_log_level,
         log_format=log_format,
@@ -21,6 +21,7 @@
 from dagster._daemon.daemon import (
     BackfillDaemon,
     DagsterDaemon,
+    EventLogRetentionDaemon,
     MonitoringDaemon,
     SchedulerDaemon,
     SensorDaemon,
@@ -369,6 +370,8 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
     elif daemon_type == EventLogConsumerDaemon.daemon_type():
         return EventLogConsumerDaemon()
+    elif daemon_type == EventLogRetentionDaemon.daemon_type():
+        return EventLogRetentionDaemon()
     elif daemon_type == AssetDaemon.daemon_type():
         return AssetDaemon(
             settings=instance.get_auto_materialize_settings(),
@@ -25,11 +25,16 @@
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.backfill import execute_backfill_iteration_loop
+from dagster._daemon.event_log_retention import (
+    EVENT_LOG_RETENTION_INTERVAL_SECONDS,
+    execute_event_log_retention_iteration,
+)
 from dagster._daemon.monitoring import (
     execute_concurrency_slots_iteration,
     execute_run_monitoring_iteration,
 )
 from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sharding import is_daemon_sharding_enabled
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
@@ -87,6 +92,12 @@ def daemon_type(cls) -> str:
     def __exit__(self, _exception_type, _exception_value, _traceback):
         pass
 
+    def is_sharded(self, instance: DagsterInstance) -> bool:
+        """Whether multiple replicas of this daemon can run at once, each processing a disjoint
+        subset of its work.
+        """
+        return False
+
     def run_daemon_loop(
         self,
         workspace_process_context: TContext,
@@ -180,6 +191,7 @@ def _check_add_heartbeat(
             self._last_heartbeat_time
             and last_stored_heartbeat
             and last_stored_heartbeat.daemon_id != daemon_uuid
+            and not self.is_sharded(instance)
         ):
             self._logger.error(
                 "Another %s daemon is still sending heartbeats. You likely have multiple "
@@ -272,6 +284,9 @@ class SchedulerDaemon(DagsterDaemon):
     def daemon_type(cls) -> str:
         return "SCHEDULER"
 
+    def is_sharded(self, instance: DagsterInstance) -> bool:
+        return is_daemon_sharding_enabled(instance.get_scheduler_settings())
+
     def scheduler_delay_instrumentation(
         self, scheduler_id: str, next_iteration_timestamp: float, now_timestamp: float
     ) -> None:
@@ -328,6 +343,9 @@ def instrument_elapsed(
     def daemon_type(cls) -> str:
         return "SENSOR"
 
+    def is_sharded(self, instance: DagsterInstance) -> bool:
+        return is_daemon_sharding_enabled(instance.get_sensor_settings())
+
     def __exit__(self, _exception_type, _exception_value, _traceback):
         self._exit_stack.close()
         super().__exit__(_exception_type, _exception_value, _traceback)
@@ -393,3 +411,18 @@ def run_iteration(
     ) -> DaemonIterator:
         yield from execute_run_monitoring_iteration(workspace_process_context, self._logger)
         yield from execute_concurrency_slots_iteration(workspace_process_context, self._logger)
+
+
+class EventLogRetentionDaemon(IntervalDaemon):
+    def __init__(self, interval_seconds: float = EVENT_LOG_RETENTION_INTERVAL_SECONDS):
+        super().__init__(interval_seconds=interval_seconds)
+
+    @classmethod
+    def daemon_type(cls) -> str:
+        return "EVENT_LOG_RETENTION"
+
+    def run_iteration(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+    ) -> DaemonIterator:
+        yield from execute_event_log_retention_iteration(workspace_process_context, self._logger)
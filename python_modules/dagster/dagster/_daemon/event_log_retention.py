@@ -0,0 +1,29 @@
+import datetime
+import logging
+from collections.abc import Iterator
+from typing import Optional
+
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._time import get_current_datetime
+from dagster._utils.error import SerializableErrorInfo
+
+EVENT_LOG_RETENTION_INTERVAL_SECONDS = 3600
+
+
+def execute_event_log_retention_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+) -> Iterator[Optional[SerializableErrorInfo]]:
+    instance = workspace_process_context.instance
+    if instance.event_log_storage.requires_event_log_maintenance:
+        instance.event_log_storage.maintain_event_log()
+
+    retention_days = instance.event_log_retention_days
+    if not retention_days or not instance.event_log_storage.supports_event_log_retention:
+        yield
+        return
+
+    before = get_current_datetime() - datetime.timedelta(days=retention_days)
+    logger.info(f"Purging run events stored before {before.isoformat()}")
+    instance.purge_run_events(before.timestamp())
+    yield
@@ -1,8 +1,10 @@
+import datetime
+import heapq
 import json
 import sys
 import threading
 import time
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
 from typing import Optional
@@ -35,6 +37,142 @@
 
 PAGE_SIZE = 100
 
+# How often the queued runs are reloaded in full. In between, only the runs that were updated since
+# the previous iteration are read.
+QUEUED_RUNS_FULL_REFRESH_INTERVAL_SECONDS = 300
+# Runs updated shortly before the most recent update that was observed are read again on the next
+# iteration, so that updates which are committed out of order are not missed.
+QUEUED_RUNS_UPDATE_OVERLAP_SECONDS = 10
+# The statuses of the runs that are read on the iterations in between full reloads: queued runs, and
+# every status that a queued run can reach by the time that its update is read. Filtering on status
+# lets the query use the index on (status, update_timestamp) rather than scanning every run.
+QUEUED_RUN_UPDATE_STATUSES = [
+    status
+    for status in DagsterRunStatus
+    if status not in (DagsterRunStatus.NOT_STARTED, DagsterRunStatus.MANAGED)
+]
+
+
+def _get_run_priority(run: DagsterRun) -> int:
+    priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
+class _QueuedRuns:
+    """The queued runs, ordered by priority and then by the order in which they were created.
+
+    Maintained across daemon iterations by applying the changes to runs which were updated since
+    the previous iteration, so that the cost of an iteration does not grow with the number of queued
+    runs. The queued runs are reloaded in full periodically, and on every iteration where the queue
+    is empty, which is cheap since only queued runs are read.
+    """
+
+    def __init__(self, page_size: int):
+        self._page_size = page_size
+        self._runs: dict[str, DagsterRun] = {}
+        self._sort_keys: dict[str, tuple[int, int]] = {}
+        # entries are (-priority, storage id, run id). Entries whose sort key no longer matches the
+        # run's are stale, and are discarded when they reach the top of the heap.
+        self._heap: list[tuple[int, int, str]] = []
+        self._max_update_timestamp: Optional[datetime.datetime] = None
+        self._last_full_refresh_time: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    @property
+    def runs(self) -> Sequence[DagsterRun]:
+        return list(self._runs.values())
+
+    def refresh(self, instance: DagsterInstance) -> None:
+        now = time.monotonic()
+        if (
+            self._last_full_refresh_time is None
+            or self._max_update_timestamp is None
+            or not self._runs
+            or now - self._last_full_refresh_time > QUEUED_RUNS_FULL_REFRESH_INTERVAL_SECONDS
+        ):
+            self._runs = {}
+            self._sort_keys = {}
+            self._heap = []
+            self._max_update_timestamp = None
+            for record in self._iter_run_records(
+                instance, RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+            ):
+                self._add(record)
+            self._last_full_refresh_time = now
+        else:
+            updated_after = self._max_update_timestamp - datetime.timedelta(
+                seconds=QUEUED_RUNS_UPDATE_OVERLAP_SECONDS
+            )
+            for record in self._iter_run_records(
+                instance,
+                RunsFilter(statuses=QUEUED_RUN_UPDATE_STATUSES, updated_after=updated_after),
+            ):
+                if record.dagster_run.status == DagsterRunStatus.QUEUED:
+                    self._add(record)
+                else:
+                    self.remove(record.dagster_run.run_id)
+                self._observe_update(record)
+
+        if len(self._heap) > 2 * len(self._sort_keys) + self._page_size:
+            self._heap = [(*sort_key, run_id) for run_id, sort_key in self._sort_keys.items()]
+            heapq.heapify(self._heap)
+
+    def _iter_run_records(
+        self, instance: DagsterInstance, filters: RunsFilter
+    ) -> Iterator[RunRecord]:
+        # Paginate through the runs so that we don't need to hold every record in memory at once
+        cursor = None
+        while True:
+            records = instance.get_run_records(
+                filters, limit=self._page_size, cursor=cursor, ascending=True
+            )
+            yield from records
+            if len(records) < self._page_size:
+                return
+            cursor = records[-1].dagster_run.run_id
+
+    def _add(self, record: RunRecord) -> None:
+        run = record.dagster_run
+        sort_key = (-_get_run_priority(run), record.storage_id)
+        self._runs[run.run_id] = run
+        if self._sort_keys.get(run.run_id) != sort_key:
+            self._sort_keys[run.run_id] = sort_key
+            heapq.heappush(self._heap, (*sort_key, run.run_id))
+        self._observe_update(record)
+
+    def _observe_update(self, record: RunRecord) -> None:
+        if (
+            self._max_update_timestamp is None
+            or record.update_timestamp > self._max_update_timestamp
+        ):
+            self._max_update_timestamp = record.update_timestamp
+
+    def remove(self, run_id: str) -> None:
+        self._runs.pop(run_id, None)
+        self._sort_keys.pop(run_id, None)
+
+    def iter_by_priority(self) -> Iterator[DagsterRun]:
+        """Yields the queued runs from highest to lowest priority. Only the runs that are consumed
+        are ordered, so consuming the first N runs costs O(N log(number of queued runs)).
+        """
+        popped = []
+        try:
+            while self._heap:
+                entry = heapq.heappop(self._heap)
+                priority, storage_id, run_id = entry
+                if self._sort_keys.get(run_id) != (priority, storage_id):
+                    continue
+                popped.append(entry)
+                yield self._runs[run_id]
+        finally:
+            for entry in popped:
+                heapq.heappush(self._heap, entry)
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -49,6 +187,7 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._page_size = page_size
         self._global_concurrency_blocked_runs_lock = threading.Lock()
         self._global_concurrency_blocked_runs = set()
+        self._queued_runs = _QueuedRuns(page_size)
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -201,10 +340,8 @@ def _get_runs_to_dequeue(
         run_queue_config = concurrency_config.run_queue_config
         assert run_queue_config
         max_concurrent_runs = run_queue_config.max_concurrent_runs
-        tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
         in_progress_run_records = self._get_in_progress_run_records(instance)
-        in_progress_runs = [record.dagster_run for record in in_progress_run_records]
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         max_runs_to_launch = max_concurrent_runs - len(in_progress_run_records)
@@ -216,10 +353,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: list[DagsterRun] = []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -229,66 +362,80 @@ def _get_runs_to_dequeue(
                 if self._location_timeouts[location_name] > now
             }
 
+        self._queued_runs.refresh(instance)
+        if not self._queued_runs:
+            return []
+
         locations_clause = ""
         if paused_location_names:
             locations_clause = (
                 " Temporarily skipping runs from the following locations due to a user code error: "
                 + ",".join(list(paused_location_names))
             )
+        self._logger.info(
+            "Priority sorting and checking tag concurrency limits for queued runs."
+            + locations_clause
+        )
 
-        logged_this_iteration = False
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
+        while True:
+            batch = self._select_runs_to_dequeue(
+                instance,
+                concurrency_config,
+                in_progress_run_records,
+                max_runs_to_launch if max_concurrent_runs_enabled else None,
+                paused_location_names,
             )
-            has_more = len(queued_runs) >= self._page_size
 
-            if not queued_runs:
-                has_more = False
+            # Runs that were cancelled or deleted may not have been observed when refreshing the
+            # queued runs, so check that the selected runs are still queued before returning them
+            stale_run_ids = self._get_stale_run_ids(instance, batch)
+            if not stale_run_ids:
                 return batch
 
-            if not logged_this_iteration:
-                logged_this_iteration = True
-                self._logger.info(
-                    "Priority sorting and checking tag concurrency limits for queued runs."
-                    + locations_clause
-                )
+            for run_id in stale_run_ids:
+                self._queued_runs.remove(run_id)
 
-            cursor = queued_runs[-1].run_id
+    def _select_runs_to_dequeue(
+        self,
+        instance: DagsterInstance,
+        concurrency_config: ConcurrencyConfig,
+        in_progress_run_records: Sequence[RunRecord],
+        max_runs_to_launch: Optional[int],
+        paused_location_names: set[str],
+    ) -> list[DagsterRun]:
+        run_queue_config = concurrency_config.run_queue_config
+        assert run_queue_config
 
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
-            batch += queued_runs
-            batch = self._priority_sort(batch)
-
-            if run_queue_config.should_block_op_concurrency_limited_runs:
-                try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                        concurrency_config.pool_config.pool_granularity,
-                    )
-                except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
-                    global_concurrency_limits_counter = None
-            else:
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            run_queue_config.tag_concurrency_limits,
+            [record.dagster_run for record in in_progress_run_records],
+        )
+
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            try:
+                global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
+                    instance,
+                    self._queued_runs.runs,
+                    in_progress_run_records,
+                    run_queue_config.op_concurrency_slot_buffer,
+                    concurrency_config.pool_config.pool_granularity,
+                )
+            except:
+                self._logger.exception("Failed to initialize op concurrency counter")
+                # when we cannot initialize the global concurrency counter, we should fall back
+                # to not blocking any runs based on op concurrency limits
                 global_concurrency_limits_counter = None
+        else:
+            global_concurrency_limits_counter = None
+
+        batch: list[DagsterRun] = []
+        queued_runs_iter = self._queued_runs.iter_by_priority()
+        try:
+            for run in queued_runs_iter:
+                if max_runs_to_launch is not None and len(batch) >= max_runs_to_launch:
+                    break
 
-            to_remove = []
-            for run in batch:
                 if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
                     continue
                 else:
                     tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -297,7 +444,6 @@ def _get_runs_to_dequeue(
                     global_concurrency_limits_counter
                     and global_concurrency_limits_counter.is_blocked(run)
                 ):
-                    to_remove.append(run)
                     if run.run_id not in self._global_concurrency_blocked_runs:
                         with self._global_concurrency_blocked_runs_lock:
                             self._global_concurrency_blocked_runs.add(run.run_id)
@@ -315,31 +461,29 @@ def _get_runs_to_dequeue(
                     run.remote_job_origin.location_name if run.remote_job_origin else None
                 )
                 if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
                     continue
 
-            for run in to_remove:
-                batch.remove(run)
-
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+                batch.append(run)
+        finally:
+            queued_runs_iter.close()
 
         return batch
 
+    def _get_stale_run_ids(self, instance: DagsterInstance, runs: Sequence[DagsterRun]) -> set[str]:
+        stale_run_ids = set()
+        for i in range(0, len(runs), self._page_size):
+            run_ids = [run.run_id for run in runs[i : i + self._page_size]]
+            statuses = {
+                run.run_id: run.status for run in instance.get_runs(RunsFilter(run_ids=run_ids))
+            }
+            stale_run_ids.update(
+                run_id for run_id in run_ids if statuses.get(run_id) != DagsterRunStatus.QUEUED
+            )
+        return stale_run_ids
+
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> list[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
-
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
             return (
@@ -52,6 +52,7 @@
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import make_new_backfill_id, make_new_run_id
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.sharding import DaemonShard, daemon_shard_from_settings
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._time import get_current_datetime, get_current_timestamp
@@ -355,43 +356,48 @@ def execute_sensor_iteration_loop(
     iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
     each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
     """
-    from dagster._daemon.daemon import SpanMarker
+    from dagster._daemon.daemon import SensorDaemon, SpanMarker
 
     sensor_tick_futures: dict[str, Future] = {}
-    while True:
-        start_time = get_current_timestamp()
-        if until and start_time >= until:
-            # provide a way of organically ending the loop to support test environment
-            break
+    instance = workspace_process_context.instance
+    with daemon_shard_from_settings(
+        instance, SensorDaemon.daemon_type(), instance.get_sensor_settings(), logger
+    ) as shard:
+        while True:
+            start_time = get_current_timestamp()
+            if until and start_time >= until:
+                # provide a way of organically ending the loop to support test environment
+                break
 
-        yield SpanMarker.START_SPAN
+            yield SpanMarker.START_SPAN
 
-        try:
-            yield from execute_sensor_iteration(
-                workspace_process_context,
-                logger,
-                threadpool_executor=threadpool_executor,
-                submit_threadpool_executor=submit_threadpool_executor,
-                sensor_tick_futures=sensor_tick_futures,
-                instrument_elapsed=instrument_elapsed,
-            )
-        except Exception:
-            error_info = DaemonErrorCapture.process_exception(
-                exc_info=sys.exc_info(),
-                logger=logger,
-                log_message="SensorDaemon caught an error",
-            )
-            yield error_info
-        # Yield to check for heartbeats in case there were no yields within
-        # execute_sensor_iteration
-        yield SpanMarker.END_SPAN
+            try:
+                yield from execute_sensor_iteration(
+                    workspace_process_context,
+                    logger,
+                    threadpool_executor=threadpool_executor,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                    sensor_tick_futures=sensor_tick_futures,
+                    instrument_elapsed=instrument_elapsed,
+                    shard=shard,
+                )
+            except Exception:
+                error_info = DaemonErrorCapture.process_exception(
+                    exc_info=sys.exc_info(),
+                    logger=logger,
+                    log_message="SensorDaemon caught an error",
+                )
+                yield error_info
+            # Yield to check for heartbeats in case there were no yields within
+            # execute_sensor_iteration
+            yield SpanMarker.END_SPAN
 
-        end_time = get_current_timestamp()
-        loop_duration = end_time - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-        shutdown_event.wait(sleep_time)
+            end_time = get_current_timestamp()
+            loop_duration = end_time - start_time
+            sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+            shutdown_event.wait(sleep_time)
 
-        yield None
+            yield None
 
 
 def execute_sensor_iteration(
@@ -402,6 +408,7 @@ def execute_sensor_iteration(
     sensor_tick_futures: Optional[dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     instrument_elapsed: ElapsedInstrumentation = default_elapsed_instrumentation,
+    shard: Optional[DaemonShard] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -434,6 +441,22 @@ def execute_sensor_iteration(
                     ).is_running:
                         sensors[selector_id] = sensor
 
+    if shard:
+        # only evaluate the sensors claimed by this replica of the daemon
+        claimed_selector_ids = shard.claim(
+            sensors.keys(),
+            in_progress_selector_ids={
+                selector_id
+                for selector_id, future in (sensor_tick_futures or {}).items()
+                if not future.done()
+            },
+        )
+        sensors = {
+            selector_id: sensor
+            for selector_id, sensor in sensors.items()
+            if selector_id in claimed_selector_ids
+        }
+
     if not sensors:
         yield
         return
@@ -458,6 +481,10 @@ def execute_sensor_iteration(
         elif is_under_min_interval(sensor_state, sensor):
             continue
 
+        if shard and not shard.renew(sensor.selector_id):
+            # the lease on the sensor was lost to another replica since it was claimed
+            continue
+
         elapsed = get_elapsed(sensor_state)
         instrument_elapsed(sensor, elapsed, sensor.min_interval_seconds)
 
@@ -0,0 +1,276 @@
+import hashlib
+import logging
+import sys
+import threading
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import AbstractSet, Any, Optional  # noqa: UP035
+
+import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance.config import DEFAULT_DAEMON_SHARD_LEASE_DURATION_SECONDS
+from dagster._utils.error import serializable_error_info_from_exc_info
+
+
+def _get_shard_owner(selector_id: str, replica_ids: Sequence[str]) -> str:
+    # rendezvous hashing: when a replica joins or leaves, only the instigators assigned to that
+    # replica move, rather than reshuffling the assignments of every replica
+    return max(
+        replica_ids,
+        key=lambda replica_id: hashlib.sha256(f"{replica_id}/{selector_id}".encode()).digest(),
+    )
+
+
+class DaemonShard:
+    """Claims the subset of instigators that a replica of a sharded daemon should evaluate.
+
+    Each replica holds a lease on a key identifying the replica, which it renews whenever it claims
+    instigators. Instigators are assigned to the replicas with unexpired leases, and a replica only
+    evaluates the instigators that are assigned to it and whose lease it holds, so that at most one
+    replica evaluates each instigator. When a replica stops renewing its leases, its instigators are
+    reassigned to the remaining replicas once its leases expire.
+
+    An iteration of the daemon may take longer than the lease duration, so the leases held by a
+    replica are also renewed by a heartbeat thread, and the lease on each instigator is renewed
+    again right before it is evaluated.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        daemon_type: str,
+        lease_duration_seconds: float = DEFAULT_DAEMON_SHARD_LEASE_DURATION_SECONDS,
+        replica_id: Optional[str] = None,
+    ):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._daemon_type = check.str_param(daemon_type, "daemon_type")
+        self._lease_duration_seconds = check.numeric_param(
+            lease_duration_seconds, "lease_duration_seconds"
+        )
+        self._replica_id = check.opt_str_param(replica_id, "replica_id") or str(uuid.uuid4())
+        # guards _held_selector_ids, which is also updated by the heartbeat thread and by the
+        # threads that evaluate instigators
+        self._lock = threading.Lock()
+        self._held_selector_ids: set[str] = set()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stop_heartbeat = threading.Event()
+
+        if not self._instance.schedule_storage or not (
+            self._instance.schedule_storage.supports_daemon_leases
+        ):
+            raise DagsterInvariantViolationError(
+                f"Sharding the {daemon_type} daemon requires a schedule storage that supports"
+                " daemon leases. You may need to run `dagster instance migrate`."
+            )
+
+    @property
+    def replica_id(self) -> str:
+        return self._replica_id
+
+    @property
+    def _replica_key_prefix(self) -> str:
+        return f"{self._daemon_type}/replicas/"
+
+    @property
+    def _replica_key(self) -> str:
+        return f"{self._replica_key_prefix}{self._replica_id}"
+
+    def _instigator_key(self, selector_id: str) -> str:
+        return f"{self._daemon_type}/instigators/{selector_id}"
+
+    def get_replica_ids(self) -> Sequence[str]:
+        schedule_storage = check.not_none(self._instance.schedule_storage)
+        return sorted(
+            {
+                lease.owner_id
+                for lease in schedule_storage.get_daemon_leases(self._replica_key_prefix)
+            }
+        )
+
+    def claim(
+        self,
+        selector_ids: Iterable[str],
+        in_progress_selector_ids: AbstractSet[str] = frozenset(),
+    ) -> AbstractSet[str]:
+        """Renews the lease of this replica and returns the selector ids of the instigators that
+        this replica should evaluate.
+
+        The leases on instigators that are in progress are kept even if they have been reassigned
+        to another replica, so that the new owner does not evaluate them until they finish.
+        """
+        schedule_storage = check.not_none(self._instance.schedule_storage)
+        schedule_storage.acquire_daemon_leases(
+            [self._replica_key], self._replica_id, self._lease_duration_seconds
+        )
+
+        replica_ids = self.get_replica_ids()
+        if self._replica_id not in replica_ids:
+            # our own lease expired between acquiring and reading it back
+            replica_ids = sorted([*replica_ids, self._replica_id])
+
+        selector_ids = set(selector_ids)
+        assigned = {
+            selector_id
+            for selector_id in selector_ids
+            if _get_shard_owner(selector_id, replica_ids) == self._replica_id
+        }
+        with self._lock:
+            held_selector_ids = set(self._held_selector_ids)
+        retained = held_selector_ids & set(in_progress_selector_ids) & selector_ids
+
+        # release the leases on instigators that are no longer assigned to this replica, so that
+        # their new owner can claim them without waiting for the leases to expire
+        released = held_selector_ids - assigned - retained
+        if released:
+            schedule_storage.release_daemon_leases(
+                [self._instigator_key(selector_id) for selector_id in released], self._replica_id
+            )
+
+        keys_to_selector_ids = {
+            self._instigator_key(selector_id): selector_id for selector_id in assigned | retained
+        }
+        held_keys = schedule_storage.acquire_daemon_leases(
+            list(keys_to_selector_ids.keys()), self._replica_id, self._lease_duration_seconds
+        )
+        held_selector_ids = {keys_to_selector_ids[key] for key in held_keys}
+        with self._lock:
+            self._held_selector_ids = held_selector_ids
+        return held_selector_ids & assigned
+
+    def renew(self, selector_id: str) -> bool:
+        """Renews the lease on a claimed instigator right before it is evaluated, returning whether
+        this replica still holds it. An instigator whose lease was lost, e.g. because its lease
+        expired while the heartbeat could not reach the storage and another replica took it over,
+        must not be evaluated.
+        """
+        with self._lock:
+            if selector_id not in self._held_selector_ids:
+                return False
+
+        schedule_storage = check.not_none(self._instance.schedule_storage)
+        if schedule_storage.acquire_daemon_leases(
+            [self._instigator_key(selector_id)], self._replica_id, self._lease_duration_seconds
+        ):
+            return True
+
+        with self._lock:
+            self._held_selector_ids.discard(selector_id)
+        return False
+
+    def heartbeat(self) -> None:
+        """Renews the leases on this replica and the instigators that it holds, forgetting any
+        instigators whose leases were lost to another replica.
+        """
+        with self._lock:
+            selector_ids = set(self._held_selector_ids)
+        keys_to_selector_ids = {
+            self._instigator_key(selector_id): selector_id for selector_id in selector_ids
+        }
+
+        schedule_storage = check.not_none(self._instance.schedule_storage)
+        held_keys = schedule_storage.acquire_daemon_leases(
+            [self._replica_key, *keys_to_selector_ids.keys()],
+            self._replica_id,
+            self._lease_duration_seconds,
+        )
+
+        lost_selector_ids = selector_ids - {
+            keys_to_selector_ids[key] for key in held_keys if key in keys_to_selector_ids
+        }
+        if lost_selector_ids:
+            with self._lock:
+                self._held_selector_ids -= lost_selector_ids
+
+    def start_heartbeat(self, logger: logging.Logger) -> None:
+        """Starts a thread that calls heartbeat several times per lease duration, so that the leases
+        of this replica do not expire during an iteration that outlasts them.
+        """
+        if self._heartbeat_thread is not None:
+            return
+
+        interval = self._lease_duration_seconds / 3
+
+        def _heartbeat_loop() -> None:
+            while not self._stop_heartbeat.wait(interval):
+                try:
+                    self.heartbeat()
+                except Exception:
+                    logger.warning(
+                        f"Failed to renew the leases of replica {self._replica_id}:\n"
+                        f"{serializable_error_info_from_exc_info(sys.exc_info())}"
+                    )
+
+        self._stop_heartbeat.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=_heartbeat_loop,
+            name=f"{self._daemon_type.lower()}-shard-heartbeat",
+            daemon=True,
+        )
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self) -> None:
+        if self._heartbeat_thread is None:
+            return
+        self._stop_heartbeat.set()
+        self._heartbeat_thread.join()
+        self._heartbeat_thread = None
+
+    def release(self) -> None:
+        """Releases all of the leases held by this replica, so that its instigators are reassigned
+        to the remaining replicas without waiting for the leases to expire.
+        """
+        self.stop_heartbeat()
+        with self._lock:
+            held_selector_ids = self._held_selector_ids
+            self._held_selector_ids = set()
+
+        schedule_storage = check.not_none(self._instance.schedule_storage)
+        schedule_storage.release_daemon_leases(
+            [
+                *(self._instigator_key(selector_id) for selector_id in held_selector_ids),
+                self._replica_key,
+            ],
+            self._replica_id,
+        )
+
+
+def is_daemon_sharding_enabled(settings: Mapping[str, Any]) -> bool:
+    return bool((settings.get("sharding") or {}).get("enabled"))
+
+
+@contextmanager
+def daemon_shard_from_settings(
+    instance: DagsterInstance,
+    daemon_type: str,
+    settings: Mapping[str, Any],
+    logger: logging.Logger,
+) -> Iterator[Optional[DaemonShard]]:
+    """Yields the shard of a daemon replica if sharding is enabled in the given daemon settings,
+    and releases its leases on exit.
+    """
+    if not is_daemon_sharding_enabled(settings):
+        yield None
+        return
+
+    sharding_settings = settings["sharding"]
+    shard = DaemonShard(
+        instance,
+        daemon_type,
+        lease_duration_seconds=sharding_settings.get(
+            "lease_duration_seconds", DEFAULT_DAEMON_SHARD_LEASE_DURATION_SECONDS
+        ),
+    )
+    logger.info(f"Sharding {daemon_type} daemon evaluations as replica {shard.replica_id}")
+    shard.start_heartbeat(logger)
+    try:
+        yield shard
+    finally:
+        try:
+            shard.release()
+        except Exception:
+            logger.warning(
+                f"Failed to release the leases of replica {shard.replica_id}, they will be"
+                f" reassigned once they expire:\n{serializable_error_info_from_exc_info(sys.exc_info())}"
+            )
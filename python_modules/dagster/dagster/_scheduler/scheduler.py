@@ -37,6 +37,7 @@
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.sharding import DaemonShard, daemon_shard_from_settings
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._time import get_current_datetime, get_current_timestamp
@@ -201,7 +202,7 @@ def execute_scheduler_iteration_loop(
     shutdown_event: threading.Event,
     scheduler_delay_instrumentation: SchedulerDelayInstrumentation = default_scheduler_delay_instrumentation,
 ) -> "DaemonIterator":
-    from dagster._daemon.daemon import SpanMarker
+    from dagster._daemon.daemon import SchedulerDaemon, SpanMarker
 
     scheduler_run_futures: dict[str, Future] = {}
     iteration_times: dict[str, ScheduleIterationTimes] = {}
@@ -227,6 +228,15 @@ def execute_scheduler_iteration_loop(
                     )
                 )
 
+        shard = stack.enter_context(
+            daemon_shard_from_settings(
+                workspace_process_context.instance,
+                SchedulerDaemon.daemon_type(),
+                settings,
+                logger,
+            )
+        )
+
         while True:
             start_time = get_current_timestamp()
             end_datetime_utc = get_current_datetime()
@@ -247,6 +257,7 @@ def execute_scheduler_iteration_loop(
                     max_catchup_runs=max_catchup_runs,
                     max_tick_retries=max_tick_retries,
                     scheduler_delay_instrumentation=scheduler_delay_instrumentation,
+                    shard=shard,
                 )
             except Exception:
                 error_info = DaemonErrorCapture.process_exception(
@@ -280,6 +291,7 @@ def launch_scheduled_runs(
     max_tick_retries: int = 0,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     scheduler_delay_instrumentation: SchedulerDelayInstrumentation = default_scheduler_delay_instrumentation,
+    shard: Optional[DaemonShard] = None,
 ) -> "DaemonIterator":
     instance = workspace_process_context.instance
 
@@ -366,6 +378,22 @@ def launch_scheduled_runs(
             )
             instance.delete_instigator_state(state.instigator_origin_id, state.selector_id)
 
+    if shard:
+        # only launch runs for the schedules claimed by this replica of the daemon
+        claimed_selector_ids = shard.claim(
+            running_schedules.keys(),
+            in_progress_selector_ids={
+                selector_id
+                for selector_id, future in (scheduler_run_futures or {}).items()
+                if not future.done()
+            },
+        )
+        running_schedules = {
+            selector_id: schedule
+            for selector_id, schedule in running_schedules.items()
+            if selector_id in claimed_selector_ids
+        }
+
     if not running_schedules:
         yield
         return
@@ -391,6 +419,10 @@ def launch_scheduled_runs(
                 debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
             )
 
+            if shard and not shard.renew(schedule.selector_id):
+                # the lease on the schedule was lost to another replica since it was claimed
+                continue
+
             if threadpool_executor:
                 if scheduler_run_futures is None:
                     check.failed(
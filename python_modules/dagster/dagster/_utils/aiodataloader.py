@@ -11,7 +11,7 @@
     iscoroutinefunction,
 )
 from collections import namedtuple
-from collections.abc import Coroutine, Iterable, Iterator, MutableMapping
+from collections.abc import Coroutine, Iterable, Iterator, MutableMapping, Sequence
 from functools import partial
 from typing import Any, Callable, Generic, Optional, TypeVar, Union
 
@@ -94,6 +94,16 @@ def blocking_load_many(self, keys: Iterable[KeyT]) -> Iterable[ReturnT]:
         self.prepare(keys)
         return [self.blocking_load(key) for key in keys]
 
+    def prime(self, key: KeyT, value: ReturnT) -> None:
+        """Adds the provided key and value to the cache. If the key already exists, no change is
+        made.
+        """
+        self._cache.setdefault(self.get_cache_key(key), value)
+
+    def cached_items(self) -> Sequence[tuple[Union[CacheKeyT, KeyT], ReturnT]]:
+        """Returns the cached values, along with their cache keys."""
+        return list(self._cache.items())
+
 
 class DataLoader(_BaseDataLoader[KeyT, ReturnT]):
     batch: bool = True
@@ -7,6 +7,7 @@
 import dagster._check as check
 from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.asset_key import AssetCheckKey
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.data_version import DataVersion, extract_data_version_from_entry
 from dagster._core.definitions.declarative_automation.legacy.valid_asset_subset import (
@@ -106,6 +107,71 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
 
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
 
+    def prefetch(
+        self,
+        *,
+        asset_keys: Iterable[AssetKey] = (),
+        asset_check_keys: Iterable[AssetCheckKey] = (),
+        status_cache_asset_keys: Iterable[AssetKey] = (),
+        latest_run_entity_keys: Iterable[Union[AssetKey, AssetCheckKey]] = (),
+    ) -> None:
+        """For performance, fetches all of the data that will be required for the provided entities
+        with a small number of batched queries, rather than one query per entity as the data is
+        needed. Values are cached on both the blocking and non-blocking loaders of the loading
+        context.
+
+        Args:
+            asset_keys (Iterable[AssetKey]): Assets to fetch the AssetRecord of.
+            asset_check_keys (Iterable[AssetCheckKey]): Asset checks to fetch the
+                AssetCheckSummaryRecord of.
+            status_cache_asset_keys (Iterable[AssetKey]): Assets to fetch the
+                AssetStatusCacheValue of. Unpartitioned assets are ignored.
+            latest_run_entity_keys (Iterable[Union[AssetKey, AssetCheckKey]]): Entities to fetch
+                the RunRecords of the latest and latest planned runs of.
+        """
+        from dagster._core.storage.event_log.base import AssetCheckSummaryRecord, AssetRecord
+        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
+        latest_run_entity_keys = set(latest_run_entity_keys)
+        asset_keys = {
+            key
+            for key in {*asset_keys, *status_cache_asset_keys, *latest_run_entity_keys}
+            if isinstance(key, AssetKey)
+        }
+        asset_check_keys = {
+            *asset_check_keys,
+            *(key for key in latest_run_entity_keys if isinstance(key, AssetCheckKey)),
+        }
+
+        AssetRecord.blocking_prefetch(self._loading_context, asset_keys)
+        AssetCheckSummaryRecord.blocking_prefetch(self._loading_context, asset_check_keys)
+
+        # status cache values are derived from the (already fetched) asset records
+        AssetStatusCacheValue.blocking_prefetch(
+            self._loading_context,
+            [
+                (key, partitions_def)
+                for key in status_cache_asset_keys
+                if (partitions_def := self.asset_graph.get(key).partitions_def) is not None
+            ],
+        )
+
+        run_ids = set()
+        for key in latest_run_entity_keys:
+            if isinstance(key, AssetKey):
+                asset_record = AssetRecord.blocking_get(self._loading_context, key)
+                if asset_record is None:
+                    continue
+                if asset_record.asset_entry.last_materialization:
+                    run_ids.add(asset_record.asset_entry.last_materialization.run_id)
+                if asset_record.asset_entry.last_planned_materialization_run_id:
+                    run_ids.add(asset_record.asset_entry.last_planned_materialization_run_id)
+            else:
+                summary = AssetCheckSummaryRecord.blocking_get(self._loading_context, key)
+                if summary and summary.last_check_execution_record:
+                    run_ids.add(summary.last_check_execution_record.run_id)
+        RunRecord.blocking_prefetch(self._loading_context, run_ids)
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -206,7 +272,7 @@ def get_in_progress_asset_subset(
             ):
                 value = False
             else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_run_id)
+                dagster_run = self._get_run_by_id(planned_materialization_run_id)
                 value = dagster_run is not None and dagster_run.status in [
                     *IN_PROGRESS_RUN_STATUSES,
                     # an asset is considered to be "in progress" if there is planned work for it that has not
@@ -236,7 +302,7 @@ def get_failed_asset_subset(self, *, asset_key: AssetKey) -> SerializableEntityS
             if not planned_materialization_info:
                 value = False
             else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_info.run_id)
+                dagster_run = self._get_run_by_id(planned_materialization_info.run_id)
 
                 value = dagster_run is not None and dagster_run.status == DagsterRunStatus.FAILURE
 
@@ -456,9 +522,8 @@ def next_version_record(
     # RUNS
     ####################
 
-    @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        return RunRecord.blocking_get(self._loading_context, run_id)
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -997,3 +997,42 @@ def test_purge_asset_evaluations(self, storage) -> None:
 
         res = storage.get_auto_materialize_asset_evaluations(key=AssetKey("asset_one"), limit=100)
         assert len(res) == 0
+
+    def test_daemon_leases(self, storage) -> None:
+        if not storage.supports_daemon_leases:
+            pytest.skip("Storage does not support daemon leases")
+
+        freeze_datetime = get_current_datetime()
+        with freeze_time(freeze_datetime):
+            assert storage.acquire_daemon_leases(["test/a", "test/b"], "owner_1", 60) == [
+                "test/a",
+                "test/b",
+            ]
+            # leases held by another owner can't be acquired until they expire
+            assert storage.acquire_daemon_leases(["test/b", "test/c"], "owner_2", 60) == ["test/c"]
+            # leases held by the same owner are renewed
+            assert storage.acquire_daemon_leases(["test/a"], "owner_1", 120) == ["test/a"]
+
+            leases = {lease.key: lease for lease in storage.get_daemon_leases("test/")}
+            assert {key: lease.owner_id for key, lease in leases.items()} == {
+                "test/a": "owner_1",
+                "test/b": "owner_1",
+                "test/c": "owner_2",
+            }
+            assert leases["test/a"].expiry_timestamp == pytest.approx(
+                freeze_datetime.timestamp() + 120, abs=1
+            )
+            assert storage.get_daemon_leases("other/") == []
+
+            # only leases held by the owner are released
+            storage.release_daemon_leases(["test/a", "test/c"], "owner_1")
+            assert {lease.key for lease in storage.get_daemon_leases("test/")} == {
+                "test/b",
+                "test/c",
+            }
+
+        with freeze_time(freeze_datetime + relativedelta(seconds=90)):
+            # expired leases are no longer returned, and can be acquired by other owners
+            assert {lease.key for lease in storage.get_daemon_leases("test/")} == set()
+            assert storage.acquire_daemon_leases(["test/b"], "owner_2", 60) == ["test/b"]
+            assert [lease.owner_id for lease in storage.get_daemon_leases("test/")] == ["owner_2"]
@@ -1,9 +1,14 @@
 import asyncio
+import os
 import sys
+import tempfile
 from contextlib import contextmanager
+from unittest import mock
 
+import dagster._check as check
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster._api.snapshot_job import sync_get_serialized_external_job_data_grpc
 from dagster._api.snapshot_repository import (
     gen_streaming_external_repositories_data_grpc,
     sync_get_streaming_external_repositories_data_grpc,
@@ -22,11 +27,16 @@
     extract_serialized_job_snap_from_serialized_job_data_snap,
 )
 from dagster._core.remote_representation.handle import RepositoryHandle
+from dagster._core.remote_representation.job_snapshot_cache import JobSnapshotCache
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._utils.env import environ
-from dagster_shared.serdes.serdes import deserialize_value, get_storage_fields
+from dagster_shared.serdes.serdes import (
+    deserialize_value,
+    get_storage_fields,
+    serialize_value_to_bytes,
+)
 from dagster_shared.serdes.utils import hash_str
 
 from dagster_tests.api_tests.utils import get_bar_repo_code_location
@@ -208,3 +218,155 @@ def test_job_data_snap_layout():
 
     # must remain last position
     assert get_storage_fields(JobDataSnap)[-1] == "pipeline_snapshot"
+
+
+def test_code_location_defer_job_snapshots():
+    with (
+        instance_for_test(overrides={"code_servers": {"defer_job_snapshots": True}}) as instance,
+        get_bar_repo_code_location(instance) as code_location,
+    ):
+        repo = code_location.get_repository("bar_repo")
+        assert repo.repository_snap.job_datas is None
+        assert repo.repository_snap.job_refs
+
+        with mock.patch(
+            "dagster._core.remote_representation.code_location.sync_get_serialized_external_job_data_grpc",
+            wraps=sync_get_serialized_external_job_data_grpc,
+        ) as fetch_job_data_mock:
+            jobs = repo.get_all_jobs()
+            assert fetch_job_data_mock.call_count == 0
+
+            job = repo.get_full_job("foo")
+            assert job.job_snapshot.name == "foo"
+            assert job.computed_job_snapshot_id == job.job_snapshot.snapshot_id
+            assert fetch_job_data_mock.call_count == 1
+
+            # job snapshots are only fetched once
+            assert repo.get_full_job("foo").job_snapshot.name == "foo"
+            assert fetch_job_data_mock.call_count == 1
+
+            assert {job.name for job in jobs} == {
+                job_ref.name for job_ref in repo.repository_snap.job_refs
+            }
+
+
+def test_job_snapshot_cache_across_reloads():
+    with (
+        tempfile.TemporaryDirectory() as cache_dir,
+        instance_for_test(
+            overrides={
+                "code_servers": {"defer_job_snapshots": True, "job_snapshot_cache_dir": cache_dir}
+            }
+        ) as instance,
+    ):
+        with mock.patch(
+            "dagster._core.remote_representation.code_location.sync_get_serialized_external_job_data_grpc",
+            wraps=sync_get_serialized_external_job_data_grpc,
+        ) as fetch_job_data_mock:
+            with get_bar_repo_code_location(instance) as code_location:
+                job = code_location.get_repository("bar_repo").get_full_job("foo")
+                job_snapshot = job.job_snapshot
+                assert fetch_job_data_mock.call_count == 1
+
+            # the snapshot is reused by reloaded code locations, since its snapshot id is unchanged
+            with get_bar_repo_code_location(instance) as code_location:
+                job = code_location.get_repository("bar_repo").get_full_job("foo")
+                assert job.job_snapshot == job_snapshot
+                assert fetch_job_data_mock.call_count == 1
+
+        # snapshots are also persisted to disk, so they can be loaded by new processes
+        job_ref_snap = next(
+            job_ref
+            for job_ref in check.not_none(
+                code_location.get_repository("bar_repo").repository_snap.job_refs
+            )
+            if job_ref.name == "foo"
+        )
+        job_data_snap = JobSnapshotCache(cache_dir=cache_dir).get(job_ref_snap)
+        assert job_data_snap
+        assert job_data_snap.job == job_snapshot
+        assert JobSnapshotCache().get(job_ref_snap) is None
+
+
+def _get_job_snaps(num_jobs: int) -> list[tuple[JobRefSnap, JobDataSnap]]:
+    job_snaps = []
+    for i in range(num_jobs):
+
+        @op(name=f"op_{i}")
+        def my_op():
+            pass
+
+        @job(name=f"job_{i}")
+        def my_job():
+            my_op()
+
+        job_snaps.append(
+            (
+                JobRefSnap.from_job_def(my_job),
+                JobDataSnap.from_job_def(my_job, include_parent_snapshot=False),
+            )
+        )
+    return job_snaps
+
+
+def test_job_snapshot_cache_memory_size_bound():
+    job_snaps = _get_job_snaps(3)
+    entry_size = len(serialize_value_to_bytes(job_snaps[0][1]))
+    cache = JobSnapshotCache(max_memory_bytes=int(entry_size * 2.5))
+    for job_ref_snap, job_data_snap in job_snaps:
+        cache.set(job_ref_snap, job_data_snap)
+
+    # the least recently used entry is evicted once the entries exceed the size limit
+    assert cache.get(job_snaps[0][0]) is None
+    assert cache.get(job_snaps[1][0])
+    assert cache.get(job_snaps[2][0])
+
+
+def test_job_snapshot_cache_serialized_size():
+    job_snaps = _get_job_snaps(3)
+    cache = JobSnapshotCache(max_memory_bytes=250)
+    with mock.patch(
+        "dagster._core.remote_representation.job_snapshot_cache.serialize_value_to_bytes"
+    ) as serialize_mock:
+        for job_ref_snap, job_data_snap in job_snaps:
+            cache.set(job_ref_snap, job_data_snap, serialized_size=100)
+
+    # snapshots are not serialized again when they are only cached in memory
+    assert serialize_mock.call_count == 0
+    assert cache.get(job_snaps[0][0]) is None
+    assert cache.get(job_snaps[1][0])
+    assert cache.get(job_snaps[2][0])
+
+
+def test_job_snapshot_cache_disk_size_bound():
+    job_snaps = _get_job_snaps(4)
+    entry_sizes = [len(serialize_value_to_bytes(job_data_snap)) for _, job_data_snap in job_snaps]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # exactly fits the last two files
+        cache = JobSnapshotCache(cache_dir=cache_dir, max_disk_bytes=sum(entry_sizes[2:]))
+        for i, (job_ref_snap, job_data_snap) in enumerate(job_snaps):
+            cache.set(job_ref_snap, job_data_snap)
+            os.utime(os.path.join(cache_dir, job_ref_snap.snapshot_id), (i, i))
+
+        # the least recently used files are removed once they exceed the size limit, but only
+        # until the remaining files fit within it
+        assert sorted(os.listdir(cache_dir)) == sorted(
+            job_ref_snap.snapshot_id for job_ref_snap, _ in job_snaps[2:]
+        )
+
+
+def test_job_snapshot_cache_write_failure(caplog):
+    ((job_ref_snap, job_data_snap),) = _get_job_snaps(1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # the cache directory can not be created, since a file exists at its path
+        cache_dir = os.path.join(tmpdir, "cache")
+        with open(cache_dir, "w"):
+            pass
+
+        cache = JobSnapshotCache(cache_dir=cache_dir)
+        cache.set(job_ref_snap, job_data_snap)
+        assert "Could not write job snapshot" in caplog.text
+        assert os.listdir(tmpdir) == ["cache"]
+
+        # the snapshot is still cached in memory
+        assert cache.get(job_ref_snap)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
 import pytest
@@ -492,3 +493,20 @@ def unpartitioned() -> None: ...
         == upstream_last.expensively_compute_asset_partitions()
     )
     assert unpartitioned_empty.compute_parent_subset(parent_key=upstream.key) == upstream_empty
+
+
+def test_queryer_per_thread() -> None:
+    @asset
+    def an_asset() -> None: ...
+
+    asset_graph_view = AssetGraphView.for_test(Definitions([an_asset]))
+    queryer = asset_graph_view.get_inner_queryer_for_back_compat()
+    assert asset_graph_view.get_inner_queryer_for_back_compat() is queryer
+
+    # the caches of the queryer are not thread-safe, so each thread gets its own queryer
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        thread_queryer = executor.submit(
+            asset_graph_view.get_inner_queryer_for_back_compat
+        ).result()
+    assert thread_queryer is not queryer
+    assert thread_queryer.evaluation_time == queryer.evaluation_time
@@ -1,3 +1,4 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
@@ -8,7 +9,11 @@
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     HourlyPartitionsDefinition,
@@ -17,7 +22,8 @@
     TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
-from dagster._core.test_utils import freeze_time
+from dagster._core.remote_representation.external_data import StaticPartitionsSnap
+from dagster._core.test_utils import environ, freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
 
@@ -218,6 +224,124 @@ def test_partitions_set_short_circuiting() -> None:
     assert (default_ps - all_ps) == DefaultPartitionsSubset.create_empty_subset()
 
 
+def test_bitmap_partitions_subset() -> None:
+    partitions_def = StaticPartitionsDefinition(
+        [str(i) for i in range(200)], use_bitmap_subset=True
+    )
+    assert type(partitions_def.empty_subset()) is BitmapPartitionsSubset
+
+    evens = partitions_def.subset_with_partition_keys([str(i) for i in range(0, 200, 2)])
+    low = partitions_def.get_subset_in_range(PartitionKeyRange("0", "99"))
+    assert isinstance(evens, BitmapPartitionsSubset)
+    assert isinstance(low, BitmapPartitionsSubset)
+    assert len(evens) == 100
+    assert len(low) == 100
+    assert "4" in evens and "5" not in evens and "foo" not in evens
+
+    assert set((evens | low).get_partition_keys()) == {str(i) for i in range(100)} | {
+        str(i) for i in range(100, 200, 2)
+    }
+    assert set((evens & low).get_partition_keys()) == {str(i) for i in range(0, 100, 2)}
+    assert set((evens - low).get_partition_keys()) == {str(i) for i in range(100, 200, 2)}
+    assert set(low.get_partition_keys_not_in_subset(partitions_def)) == {
+        str(i) for i in range(100, 200)
+    }
+    assert low.get_partition_key_ranges(partitions_def) == [PartitionKeyRange("0", "99")]
+    assert (evens - evens).is_empty
+
+    default_subset = DefaultPartitionsSubset({"1", "2", "3"})
+    assert set((low - default_subset).get_partition_keys()) == {"0"} | {
+        str(i) for i in range(4, 100)
+    }
+    assert set((default_subset | evens).get_partition_keys()) == {"1", "3"} | {
+        str(i) for i in range(0, 200, 2)
+    }
+
+    # keys outside of the partitions definition fall back to a set of keys
+    with_unknown = evens.with_partition_keys(["foo"])
+    assert isinstance(with_unknown, DefaultPartitionsSubset)
+    assert len(with_unknown) == 101
+
+    round_trip_subset = deserialize_value(serialize_value(evens.to_serializable_subset()))  # type: ignore
+    assert round_trip_subset == DefaultPartitionsSubset(set(evens.get_partition_keys()))
+
+    # a DefaultPartitionsSubset has no partitions definition, so it is never equal to a bitmap
+    # subset, in either direction, even if it has the same partition keys
+    low_keys = DefaultPartitionsSubset({str(i) for i in range(100)})
+    assert low != low_keys
+    assert low_keys != low
+    assert low != evens.to_serializable_subset()
+
+    # subsets of equal partitions definitions are equal and hash equally, while subsets of other
+    # partitions definitions are not equal
+    same_partitions_def = StaticPartitionsDefinition(
+        [str(i) for i in range(200)], use_bitmap_subset=True
+    )
+    same_low = same_partitions_def.get_subset_in_range(PartitionKeyRange("0", "99"))
+    assert low == same_low
+    assert hash(low) == hash(same_low)
+    assert same_low != low_keys
+    other_partitions_def = StaticPartitionsDefinition(
+        [str(i) for i in range(100)], use_bitmap_subset=True
+    )
+    assert low != other_partitions_def.subset_with_all_partitions()
+
+    # partitions definitions that only differ in their subset representation are not equal
+    assert partitions_def != StaticPartitionsDefinition([str(i) for i in range(200)])
+    assert hash(partitions_def) != hash(StaticPartitionsDefinition([str(i) for i in range(200)]))
+
+
+def test_bitmap_partitions_subset_serialization() -> None:
+    keys = [str(i) for i in range(50)]
+    bitmap_partitions_def = StaticPartitionsDefinition(keys, use_bitmap_subset=True)
+    default_partitions_def = StaticPartitionsDefinition(keys)
+
+    subset = bitmap_partitions_def.subset_with_partition_keys(["3", "10", "11", "12"])
+
+    # by default, subsets are stored as lists of keys, which older versions of dagster can read
+    assert subset.serialize() == DefaultPartitionsSubset({"3", "10", "11", "12"}).serialize()
+
+    with environ({"DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS": "1"}):
+        serialized = subset.serialize()
+    assert "bitmap" in json.loads(serialized)
+    assert bitmap_partitions_def.can_deserialize_subset(serialized, None, None)
+    assert bitmap_partitions_def.deserialize_subset(serialized) == subset
+
+    # subsets written by either representation can be read by the other
+    assert default_partitions_def.can_deserialize_subset(
+        serialized, None, StaticPartitionsDefinition.__name__
+    )
+    assert default_partitions_def.deserialize_subset(serialized) == DefaultPartitionsSubset(
+        {"3", "10", "11", "12"}
+    )
+    default_serialized = DefaultPartitionsSubset({"3", "10", "11", "12"}).serialize()
+    assert bitmap_partitions_def.can_deserialize_subset(default_serialized, None, None)
+    assert bitmap_partitions_def.deserialize_subset(default_serialized) == subset
+
+    assert not default_partitions_def.can_deserialize_subset(
+        serialized, None, "TimeWindowPartitionsDefinition"
+    )
+
+    # bitmaps are only valid for the partition keys they were created with
+    changed_partitions_def = StaticPartitionsDefinition([*keys, "50"], use_bitmap_subset=True)
+    assert not changed_partitions_def.can_deserialize_subset(
+        serialized, None, StaticPartitionsDefinition.__name__
+    )
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        changed_partitions_def.deserialize_subset(serialized)
+
+    snap = StaticPartitionsSnap.from_def(bitmap_partitions_def)
+    assert (
+        deserialize_value(serialize_value(snap), StaticPartitionsSnap)
+        .get_partitions_definition()
+        .partitions_subset_class
+        is BitmapPartitionsSubset
+    )
+    assert "use_bitmap_subset" not in serialize_value(
+        StaticPartitionsSnap.from_def(default_partitions_def)
+    )
+
+
 def test_multi_partition_subset_to_range_conversion():
     # Test that converting from a list of partitions keys to a subset, to a list of ranges, and back to
     # a list of partition keys for MultiPartitionsDefinitions does not lose any partitions.
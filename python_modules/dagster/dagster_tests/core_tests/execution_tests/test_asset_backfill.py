@@ -53,6 +53,7 @@
     AssetBackfillData,
     AssetBackfillIterationResult,
     AssetBackfillStatus,
+    _should_backfill_atomic_asset_graph_subset_unit,
     backfill_is_complete,
     execute_asset_backfill_iteration_inner,
     get_canceling_asset_backfill_iteration_data,
@@ -711,6 +712,75 @@ def downstream(upstream):
     assert len(instance.get_runs(RunsFilter(tags={BACKFILL_ID_TAG: backfill_id}))) == 1
 
 
+def test_only_children_of_newly_materialized_partitions_evaluated():
+    @asset(partitions_def=DailyPartitionsDefinition("2023-01-01"))
+    def upstream():
+        pass
+
+    @asset(partitions_def=DailyPartitionsDefinition("2023-01-01"), deps=[upstream])
+    def downstream():
+        pass
+
+    # assets in different code locations cannot be requested in the same run
+    assets_by_repo_name = {"repo1": [upstream], "repo2": [downstream]}
+    asset_graph = get_asset_graph(assets_by_repo_name)
+
+    instance = DagsterInstance.ephemeral()
+
+    backfill_id = "dummy_backfill_id"
+    partition_keys = ["2023-01-01", "2023-01-02", "2023-01-03", "2023-01-04"]
+    asset_backfill_data = AssetBackfillData.from_asset_partitions(
+        asset_graph=asset_graph,
+        partition_names=partition_keys,
+        asset_selection=[upstream.key, downstream.key],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=False,
+        backfill_start_timestamp=create_datetime(2023, 1, 9, 0, 0, 0).timestamp(),
+    )
+
+    asset_backfill_data = _single_backfill_iteration_create_but_do_not_submit_runs(
+        backfill_id, asset_backfill_data, asset_graph, instance, assets_by_repo_name
+    )
+    assert asset_backfill_data.requested_subset.asset_keys == {upstream.key}
+
+    do_run(
+        all_assets=[upstream],
+        asset_keys=[upstream.key],
+        partition_key="2023-01-02",
+        instance=instance,
+        tags={BACKFILL_ID_TAG: backfill_id},
+    )
+    # materializations outside of the backfill do not unblock any targeted partitions
+    do_run(
+        all_assets=[upstream],
+        asset_keys=[upstream.key],
+        partition_key="2023-01-03",
+        instance=instance,
+    )
+
+    with patch(
+        "dagster._core.execution.asset_backfill._should_backfill_atomic_asset_graph_subset_unit",
+        wraps=_should_backfill_atomic_asset_graph_subset_unit,
+    ) as should_backfill_mock:
+        asset_backfill_data = _single_backfill_iteration_create_but_do_not_submit_runs(
+            backfill_id, asset_backfill_data, asset_graph, instance, assets_by_repo_name
+        )
+
+    # only the child of the newly materialized partition is evaluated, rather than every
+    # targeted asset partition
+    assert [
+        set(call.kwargs["candidate_asset_graph_subset_unit"].iterate_asset_partitions())
+        for call in should_backfill_mock.call_args_list
+    ] == [{AssetKeyPartitionKey(downstream.key, "2023-01-02")}]
+    assert (
+        AssetKeyPartitionKey(downstream.key, "2023-01-02") in asset_backfill_data.requested_subset
+    )
+    assert (
+        AssetKeyPartitionKey(downstream.key, "2023-01-03")
+        not in asset_backfill_data.requested_subset
+    )
+
+
 def make_backfill_data(
     some_or_all: str,
     asset_graph: RemoteWorkspaceAssetGraph,
@@ -1,6 +1,9 @@
+import asyncio
 import os
 import re
 import tempfile
+import threading
+import time
 from collections.abc import Mapping
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
@@ -32,6 +35,7 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -240,6 +244,22 @@ def test_in_memory_persist_one_run():
         do_test_single_write_read(instance)
 
 
+def test_async_reads():
+    with instance_for_test() as instance:
+        result = noop_job.execute_in_process(instance=instance)
+        run_id = result.run_id
+
+        async def _read():
+            return (
+                await instance.get_run_records_async(),
+                await instance.get_records_for_run_async(run_id),
+            )
+
+        run_records, records_for_run = asyncio.run(_read())
+        assert [record.dagster_run.run_id for record in run_records] == [run_id]
+        assert records_for_run.records == instance.get_records_for_run(run_id).records
+
+
 @op
 def noop_op(_):
     pass
@@ -368,6 +388,7 @@ def test_create_run_with_asset_partitions():
 def test_get_required_daemon_types():
     from dagster._daemon.daemon import (
         BackfillDaemon,
+        EventLogRetentionDaemon,
         MonitoringDaemon,
         SchedulerDaemon,
         SensorDaemon,
@@ -413,6 +434,36 @@ def test_get_required_daemon_types():
             QueuedRunCoordinatorDaemon.daemon_type(),
         ]
 
+    # run sharded sqlite event log storage does not support event log retention
+    with instance_for_test(
+        overrides={
+            "auto_materialize": {"enabled": False, "use_sensors": False},
+            "retention": {"event_logs": {"purge_after_days": 30}},
+        }
+    ) as instance:
+        assert EventLogRetentionDaemon.daemon_type() not in instance.get_required_daemon_types()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with instance_for_test(
+            overrides={
+                "auto_materialize": {"enabled": False, "use_sensors": False},
+                "event_log_storage": {
+                    "module": "dagster._core.storage.event_log",
+                    "class": "ConsolidatedSqliteEventLogStorage",
+                    "config": {"base_dir": tmpdir},
+                },
+                "retention": {"event_logs": {"purge_after_days": 30}},
+            }
+        ) as instance:
+            assert instance.event_log_retention_days == 30
+            assert instance.get_required_daemon_types() == [
+                SensorDaemon.daemon_type(),
+                BackfillDaemon.daemon_type(),
+                SchedulerDaemon.daemon_type(),
+                QueuedRunCoordinatorDaemon.daemon_type(),
+                EventLogRetentionDaemon.daemon_type(),
+            ]
+
 
 class TestNonResumeRunLauncher(RunLauncher, ConfigurableClass):
     def __init__(self, inst_data: Optional[ConfigurableClassData] = None):
@@ -802,3 +853,173 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+@op
+def chatty_op(context):
+    for i in range(10):
+        context.log.info(f"message {i}")
+
+
+@job
+def chatty_job():
+    chatty_op()
+
+
+def test_buffered_event_writes():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "60"}):
+        with instance_for_test() as instance:
+            with patch.object(
+                instance.event_log_storage,
+                "store_buffered_events",
+                wraps=instance.event_log_storage.store_buffered_events,
+            ) as store_buffered_events:
+                result = chatty_job.execute_in_process(instance=instance)
+                assert result.success
+                assert store_buffered_events.call_count > 0
+
+            records = instance.get_records_for_run(result.run_id).records
+            messages = [record.event_log_entry.user_message for record in records]
+            assert [m for m in messages if m.startswith("message")] == [
+                f"message {i}" for i in range(10)
+            ]
+            assert records[-1].event_log_entry.dagster_event_type == "PIPELINE_SUCCESS"
+            assert instance.get_run_by_id(result.run_id).is_success  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def test_flush_event_buffer():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "60"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+
+            # events are only buffered while steps are being executed
+            instance.report_engine_event("unbuffered", run)
+            assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 1  # noqa: SLF001
+
+            handled_on_threads = []
+            instance.add_event_listener(
+                run.run_id, lambda _event: handled_on_threads.append(threading.current_thread())
+            )
+            with instance.buffered_event_writes():
+                instance.report_engine_event("buffered", run)
+                assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 1  # noqa: SLF001
+                assert not handled_on_threads
+
+                # reading events through the instance flushes the buffer on the calling thread
+                logs = instance.all_logs(run.run_id)
+                assert [log.message for log in logs] == ["unbuffered", "buffered"]
+                assert handled_on_threads == [threading.current_thread()]
+
+                instance.report_engine_event("flushed on exit", run)
+
+            assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 3  # noqa: SLF001
+
+
+def test_flush_event_buffer_max_age():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "0"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            with instance.buffered_event_writes():
+                instance.report_engine_event("aged out", run)
+                assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 1  # noqa: SLF001
+
+
+def test_flush_event_buffer_max_age_without_new_events():
+    with environ(
+        {"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "0.2"}
+    ):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            with instance.buffered_event_writes():
+                instance.report_engine_event("aged out", run)
+                assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 0  # noqa: SLF001
+
+                # the buffer is flushed in the background while the step is busy
+                start = time.time()
+                while not instance._event_storage.get_logs_for_run(run.run_id):  # noqa: SLF001
+                    assert time.time() - start < 10
+                    time.sleep(0.05)
+
+            assert not any(
+                thread.name == "event-buffer-flusher" for thread in threading.enumerate()
+            )
+
+
+def test_flush_event_buffer_error_level():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "60"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            with instance.buffered_event_writes():
+                # levels may be given by name
+                instance.handle_new_event(
+                    EventLogEntry(
+                        error_info=None,
+                        level="ERROR",
+                        user_message="failed",
+                        run_id=run.run_id,
+                        timestamp=time.time(),
+                    )
+                )
+                assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 1  # noqa: SLF001
+
+
+def test_flush_event_buffer_batch_failure():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "60"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            with patch.object(
+                instance._event_storage,  # noqa: SLF001
+                "store_buffered_events",
+                side_effect=Exception("failed batch"),
+            ):
+                with instance.buffered_event_writes():
+                    for i in range(3):
+                        instance.report_engine_event(f"message {i}", run)
+
+            # the events of the failed batch are stored one by one
+            assert [log.message for log in instance.all_logs(run.run_id)] == [
+                f"message {i}" for i in range(3)
+            ]
+
+
+def test_flush_event_buffer_batch_failure_event_error():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "60"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            store_event = instance._event_storage.store_event  # noqa: SLF001
+
+            def _fail_second_event(event):
+                if event.message == "message 1":
+                    raise Exception("failed event")
+                store_event(event)
+
+            with patch.object(
+                instance._event_storage,  # noqa: SLF001
+                "store_buffered_events",
+                side_effect=Exception("failed batch"),
+            ):
+                with patch.object(
+                    instance._event_storage,  # noqa: SLF001
+                    "store_event",
+                    side_effect=_fail_second_event,
+                ):
+                    with pytest.raises(Exception, match="failed event"):
+                        with instance.buffered_event_writes():
+                            for i in range(3):
+                                instance.report_engine_event(f"message {i}", run)
+
+            # the events of the failed batch are stored one by one, up to the failing event
+            assert [log.message for log in instance.all_logs(run.run_id)] == ["message 0"]
+
+
+def test_flush_event_buffer_direct_storage_access():
+    with environ({"DAGSTER_EVENT_BUFFER_SIZE": "50", "DAGSTER_EVENT_BUFFER_MAX_AGE_SECONDS": "60"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            with instance.buffered_event_writes():
+                instance.report_engine_event("buffered", run)
+                assert len(instance._event_storage.get_logs_for_run(run.run_id)) == 0  # noqa: SLF001
+
+                # reading from the storage directly sees the buffered events
+                logs = instance.event_log_storage.get_logs_for_run(run.run_id)
+                assert [log.message for log in logs] == ["buffered"]
@@ -1,6 +1,7 @@
+import threading
 import time
 import warnings
-from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextvars import ContextVar
 from typing import NamedTuple
 
@@ -11,6 +12,7 @@
 from dagster._core.utils import (
     InheritContextThreadPoolExecutor,
     check_dagster_package_version,
+    imap_batched,
     parse_env_var,
 )
 from dagster._utils import hash_collection, library_version_from_core_version
@@ -168,3 +170,83 @@ def sleepy_thread():
         f = None
         # now they dont
         assert executor.weak_tracked_futures_count == 0
+
+
+def test_imap_batched():
+    batches = []
+
+    def _double(batch):
+        batches.append(list(batch))
+        # complete later batches first, to check that the results are yielded in order
+        time.sleep(0.1 if batch[0] == 0 else 0)
+        return [i * 2 for i in batch]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            imap_batched(
+                executor=executor,
+                iterable=iter(range(10)),
+                func=_double,
+                batch_size=4,
+                batch_window_seconds=5,
+            )
+        )
+
+    assert results == [i * 2 for i in range(10)]
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_imap_batched_window():
+    def _slow_iterator():
+        yield 0
+        yield 1
+        time.sleep(0.5)
+        yield 2
+        raise Exception("iterator error")
+
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(Exception, match="iterator error"):
+            for result in imap_batched(
+                executor=executor,
+                iterable=_slow_iterator(),
+                func=lambda batch: [len(batch)] * len(batch),
+                batch_size=10,
+                batch_window_seconds=0.1,
+            ):
+                results.append(result)
+
+    # the first batch is submitted once its window elapses, and results are yielded before the
+    # exception from the iterator is raised
+    assert results == [2, 2, 1]
+
+
+def test_imap_batched_close():
+    num_read = 0
+
+    def _infinite_iterator():
+        nonlocal num_read
+        while True:
+            num_read += 1
+            yield num_read
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = imap_batched(
+            executor=executor,
+            iterable=_infinite_iterator(),
+            func=lambda batch: batch,
+            batch_size=2,
+            batch_window_seconds=5,
+        )
+        assert next(results) == 1
+
+        # the iterator is only read a bounded number of elements ahead of the batches
+        time.sleep(0.5)
+        num_read_ahead = num_read
+        time.sleep(0.5)
+        assert num_read == num_read_ahead
+
+        # the iterator is no longer read once the generator is closed
+        results.close()
+        time.sleep(0.5)
+        assert not any(thread.name == "imap_batched" for thread in threading.enumerate())
@@ -92,6 +92,7 @@
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
 from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sharding import DaemonShard
 from dagster._record import copy
 from dagster._time import create_datetime, get_current_datetime
 from dagster._vendored.dateutil.relativedelta import relativedelta
@@ -1078,7 +1079,9 @@ def asset_sensor_repo():
 FUTURES_TIMEOUT = 75
 
 
-def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT):
+def evaluate_sensors(
+    workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT, shard=None
+):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -1088,6 +1091,7 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
             threadpool_executor=executor,
             sensor_tick_futures=futures,
             submit_threadpool_executor=submit_executor,
+            shard=shard,
         )
     )
 
@@ -1242,6 +1246,47 @@ def test_simple_sensor(instance, workspace_context, remote_repo, executor):
         )
 
 
+def test_sharded_sensor(instance, workspace_context, remote_repo, executor):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+
+    with freeze_time(freeze_datetime):
+        sensor = remote_repo.get_sensor("simple_sensor")
+        instance.add_instigator_state(
+            InstigatorState(
+                sensor.get_remote_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+        shards = [
+            DaemonShard(instance, "SENSOR", replica_id="one"),
+            DaemonShard(instance, "SENSOR", replica_id="two"),
+        ]
+        for shard in shards:
+            shard.claim([])
+
+        # the sensor is only evaluated by the replica that it is assigned to
+        for shard in shards:
+            evaluate_sensors(workspace_context, executor, shard=shard)
+
+        ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        assert len(ticks) == 1
+        validate_tick(ticks[0], sensor, freeze_datetime, TickStatus.SKIPPED)
+
+        owner = next(shard for shard in shards if shard.claim([sensor.selector_id]))
+        other = next(shard for shard in shards if shard is not owner)
+        owner.release()
+        freeze_datetime = freeze_datetime + relativedelta(seconds=30)
+
+    # once the replica that owned the sensor releases its leases, the remaining replica evaluates it
+    with freeze_time(freeze_datetime):
+        evaluate_sensors(workspace_context, executor, shard=other)
+        wait_for_all_runs_to_start(instance)
+        assert instance.get_runs_count() == 1
+        ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+        assert len(ticks) == 2
+
+
 def test_sensor_stopped_while_submitting_runs(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
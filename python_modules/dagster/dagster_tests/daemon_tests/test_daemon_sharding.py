@@ -0,0 +1,123 @@
+import datetime
+import logging
+import time
+
+from dagster._core.test_utils import freeze_time, instance_for_test
+from dagster._daemon.sharding import DaemonShard
+from dagster._time import get_current_datetime
+
+SELECTOR_IDS = [f"selector_{i}" for i in range(50)]
+
+
+def test_shards_claim_disjoint_instigators():
+    with instance_for_test() as instance:
+        shard_one = DaemonShard(instance, "SENSOR", replica_id="one")
+        shard_two = DaemonShard(instance, "SENSOR", replica_id="two")
+
+        shard_one.claim(SELECTOR_IDS)
+        claimed_two = shard_two.claim(SELECTOR_IDS)
+        # the first replica released the instigators that were reassigned once the second joined
+        claimed_one = shard_one.claim(SELECTOR_IDS)
+        claimed_two = shard_two.claim(SELECTOR_IDS)
+
+        assert shard_one.get_replica_ids() == ["one", "two"]
+        assert claimed_one and claimed_two
+        assert not claimed_one & claimed_two
+        assert claimed_one | claimed_two == set(SELECTOR_IDS)
+
+        # shards of other daemon types are independent
+        assert DaemonShard(instance, "SCHEDULER", replica_id="three").claim(SELECTOR_IDS) == set(
+            SELECTOR_IDS
+        )
+
+
+def test_shard_rebalances_on_lease_expiry():
+    with instance_for_test() as instance:
+        freeze_datetime = get_current_datetime()
+        shard_one = DaemonShard(instance, "SENSOR", lease_duration_seconds=30, replica_id="one")
+        shard_two = DaemonShard(instance, "SENSOR", lease_duration_seconds=30, replica_id="two")
+
+        with freeze_time(freeze_datetime):
+            shard_one.claim(SELECTOR_IDS)
+            shard_two.claim(SELECTOR_IDS)
+            claimed_one = shard_one.claim(SELECTOR_IDS)
+            assert claimed_one != set(SELECTOR_IDS)
+
+        # the second replica stops renewing its leases, so its instigators are reassigned once
+        # they expire
+        with freeze_time(freeze_datetime + datetime.timedelta(seconds=20)):
+            assert shard_one.claim(SELECTOR_IDS) == claimed_one
+
+        with freeze_time(freeze_datetime + datetime.timedelta(seconds=40)):
+            assert shard_one.claim(SELECTOR_IDS) == set(SELECTOR_IDS)
+            assert shard_one.get_replica_ids() == ["one"]
+
+
+def test_shard_keeps_in_progress_instigators():
+    with instance_for_test() as instance:
+        shard_one = DaemonShard(instance, "SENSOR", replica_id="one")
+        assert shard_one.claim(SELECTOR_IDS) == set(SELECTOR_IDS)
+
+        shard_two = DaemonShard(instance, "SENSOR", replica_id="two")
+        # the first replica still holds every lease
+        assert shard_two.claim(SELECTOR_IDS) == set()
+
+        # the first replica keeps the leases of in progress instigators that were reassigned
+        in_progress = set(SELECTOR_IDS[:25])
+        claimed_one = shard_one.claim(SELECTOR_IDS, in_progress_selector_ids=in_progress)
+        claimed_two = shard_two.claim(SELECTOR_IDS)
+        assert not claimed_one & claimed_two
+        assert not claimed_two & in_progress
+        assert claimed_one | claimed_two == set(SELECTOR_IDS) - (in_progress - claimed_one)
+
+        # once they finish, their leases are handed over
+        claimed_one = shard_one.claim(SELECTOR_IDS)
+        claimed_two = shard_two.claim(SELECTOR_IDS)
+        assert claimed_one | claimed_two == set(SELECTOR_IDS)
+
+        shard_one.release()
+        assert shard_two.get_replica_ids() == ["two"]
+
+
+def test_shard_iteration_outlasts_lease():
+    with instance_for_test() as instance:
+        freeze_datetime = get_current_datetime()
+        shard_one = DaemonShard(instance, "SENSOR", lease_duration_seconds=30, replica_id="one")
+        shard_two = DaemonShard(instance, "SENSOR", lease_duration_seconds=30, replica_id="two")
+
+        with freeze_time(freeze_datetime):
+            assert shard_one.claim(SELECTOR_IDS) == set(SELECTOR_IDS)
+
+        # the heartbeat renews the leases while an iteration of the first replica is still running
+        with freeze_time(freeze_datetime + datetime.timedelta(seconds=20)):
+            shard_one.heartbeat()
+
+        with freeze_time(freeze_datetime + datetime.timedelta(seconds=40)):
+            assert shard_two.claim(SELECTOR_IDS) == set()
+            assert shard_one.renew(SELECTOR_IDS[0])
+
+        # without renewals, the leases expire mid-iteration and are taken over by the second
+        # replica, so the first replica must not evaluate its instigators any more
+        with freeze_time(freeze_datetime + datetime.timedelta(seconds=100)):
+            assert shard_two.claim(SELECTOR_IDS) == set(SELECTOR_IDS)
+            assert not shard_one.renew(SELECTOR_IDS[0])
+
+            # the heartbeat forgets the instigators whose leases were lost
+            shard_one.heartbeat()
+            assert not any(shard_one.renew(selector_id) for selector_id in SELECTOR_IDS)
+
+
+def test_shard_heartbeat_thread():
+    with instance_for_test() as instance:
+        shard_one = DaemonShard(instance, "SENSOR", lease_duration_seconds=0.6, replica_id="one")
+        shard_two = DaemonShard(instance, "SENSOR", lease_duration_seconds=0.6, replica_id="two")
+        assert shard_one.claim(SELECTOR_IDS) == set(SELECTOR_IDS)
+
+        shard_one.start_heartbeat(logging.getLogger())
+        try:
+            time.sleep(1.5)
+            assert shard_two.claim(SELECTOR_IDS) == set()
+        finally:
+            shard_one.release()
+
+        assert shard_two.claim(SELECTOR_IDS) == set(SELECTOR_IDS)
@@ -8,6 +8,7 @@
 from dagster._daemon.controller import daemon_controller_from_instance
 from dagster._daemon.daemon import SchedulerDaemon
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._serdes import serialize_value
 from dagster._utils.log import get_structlog_json_formatter
 
 
@@ -57,6 +58,22 @@ def test_run_coordinator_instance():
             assert any(isinstance(daemon, QueuedRunCoordinatorDaemon) for daemon in daemons)
 
 
+def test_run_unconfigured_daemon_type():
+    with instance_for_test() as instance:
+        result = CliRunner().invoke(
+            run_command,
+            [
+                "--instance-ref",
+                serialize_value(instance.get_ref()),
+                "--daemon-type",
+                "NOT_A_DAEMON",
+                "--empty-workspace",
+            ],
+        )
+        assert result.exit_code == 2
+        assert "Daemon type NOT_A_DAEMON is not configured on the instance" in result.output
+
+
 def test_ephemeral_instance():
     runner = CliRunner()
     with pytest.raises(Exception, match="DAGSTER_HOME is not set"):
@@ -25,7 +25,11 @@
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.context import WorkspaceRequestContext
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget, PythonFileTarget
-from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
+    QUEUED_RUN_UPDATE_STATUSES,
+    QueuedRunCoordinatorDaemon,
+    _QueuedRuns,
+)
 from dagster._record import copy
 from dagster._time import create_datetime
 from dagster._utils import file_relative_path
@@ -285,6 +289,73 @@ def test_disable_max_concurrent_runs_limit(
 
         assert len(instance.run_launcher.queue()) == 6
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(max_concurrent_runs=1),
+        ],
+    )
+    def test_queued_runs_across_iterations(self, instance, workspace_context, job_handle, daemon):
+        run_id_1, run_id_2, run_id_3, run_id_4 = [make_new_run_id() for _ in range(4)]
+        self.create_queued_run(instance, job_handle, run_id=run_id_1)
+        self.create_queued_run(instance, job_handle, run_id=run_id_2)
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1]
+
+        # runs queued after the daemon has loaded the queue are picked up in priority order, and
+        # runs that leave the queue are not launched
+        instance.report_run_canceled(instance.get_run_by_id(run_id_1))
+        instance.report_run_canceled(instance.get_run_by_id(run_id_2))
+        self.create_queued_run(instance, job_handle, run_id=run_id_3)
+        self.create_queued_run(instance, job_handle, run_id=run_id_4, tags={PRIORITY_TAG: "1"})
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1, run_id_4]
+
+        # deleted runs are dropped from the queue
+        instance.report_run_canceled(instance.get_run_by_id(run_id_4))
+        instance.delete_run(run_id_3)
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1, run_id_4]
+
+    def test_queued_runs_reloaded_when_empty(self, instance, job_handle, monkeypatch):
+        run_filters = []
+        get_run_records = instance.get_run_records
+
+        def _get_run_records(filters, *args, **kwargs):
+            run_filters.append(filters)
+            return get_run_records(filters, *args, **kwargs)
+
+        monkeypatch.setattr(instance, "get_run_records", _get_run_records)
+
+        queued_runs = _QueuedRuns(page_size=10)
+        queued_runs.refresh(instance)
+        assert run_filters[-1].statuses == [DagsterRunStatus.QUEUED]
+
+        run_id = make_new_run_id()
+        self.create_queued_run(instance, job_handle, run_id=run_id)
+        queued_runs.refresh(instance)
+        assert run_filters[-1].statuses == [DagsterRunStatus.QUEUED]
+        assert [run.run_id for run in queued_runs.runs] == [run_id]
+
+        # only the runs that were updated are read while the queue is not empty, filtered to the
+        # statuses that queued runs can reach so that the query can use the status index
+        queued_runs.refresh(instance)
+        assert run_filters[-1].updated_after is not None
+        assert run_filters[-1].statuses == QUEUED_RUN_UPDATE_STATUSES
+        assert DagsterRunStatus.NOT_STARTED not in QUEUED_RUN_UPDATE_STATUSES
+
+        instance.report_run_failed(instance.get_run_by_id(run_id))
+        queued_runs.refresh(instance)
+        assert run_filters[-1].updated_after is not None
+        assert run_filters[-1].statuses == QUEUED_RUN_UPDATE_STATUSES
+        assert len(queued_runs) == 0
+
+        queued_runs.refresh(instance)
+        assert run_filters[-1].statuses == [DagsterRunStatus.QUEUED]
+
     def test_priority(self, instance, workspace_context, job_handle, daemon):
         default_run_id, hi_pri_run_id, lo_pri_run_id = [make_new_run_id() for _ in range(3)]
         self.create_run(instance, job_handle, run_id=default_run_id, status=DagsterRunStatus.QUEUED)
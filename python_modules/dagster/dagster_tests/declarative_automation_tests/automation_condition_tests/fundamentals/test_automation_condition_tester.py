@@ -1,4 +1,5 @@
 import datetime
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -15,8 +16,12 @@
 )
 from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.definitions.asset_spec import AssetExecutionType
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
 from dagster._core.definitions.events import AssetMaterialization
 from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import instance_for_test
 
 
 @asset(
@@ -240,3 +245,70 @@ def b() -> None: ...
                 evaluation_time=evaluation_time,
             )
             assert result.total_requested == 0
+
+
+def test_parallel_evaluation_of_independent_components() -> None:
+    def _get_component_defs(prefix: str) -> list[AssetsDefinition]:
+        @asset(
+            name=f"{prefix}_root",
+            partitions_def=HourlyPartitionsDefinition("2020-01-01-00:00"),
+            automation_condition=AutomationCondition.missing(),
+        )
+        def root() -> None: ...
+
+        @asset(
+            name=f"{prefix}_downstream",
+            deps=[root],
+            partitions_def=HourlyPartitionsDefinition("2020-01-01-00:00"),
+            automation_condition=AutomationCondition.eager(),
+        )
+        def downstream() -> None: ...
+
+        @asset(
+            name=f"{prefix}_unpartitioned",
+            deps=[downstream],
+            automation_condition=AutomationCondition.eager(),
+        )
+        def unpartitioned() -> None: ...
+
+        return [root, downstream, unpartitioned]
+
+    component_defs = Definitions(
+        assets=[
+            asset_def
+            for prefix in ["a", "b", "c", "d"]
+            for asset_def in _get_component_defs(prefix)
+        ]
+    )
+    evaluation_time = datetime.datetime(2020, 1, 2)
+
+    def _evaluate(num_evaluation_workers: int):
+        with instance_for_test(
+            overrides={"auto_materialize": {"num_evaluation_workers": num_evaluation_workers}}
+        ) as instance:
+            instance.report_runless_asset_event(
+                AssetMaterialization("a_root", partition="2020-01-01-03:00")
+            )
+            instance.report_runless_asset_event(AssetMaterialization("c_unpartitioned"))
+            with mock.patch.object(
+                AutomationConditionEvaluator,
+                "prefetch",
+                autospec=True,
+                side_effect=AutomationConditionEvaluator.prefetch,
+            ) as prefetch:
+                result = evaluate_automation_conditions(
+                    defs=component_defs, instance=instance, evaluation_time=evaluation_time
+                )
+            # data is prefetched once for all groups, before fanning out to the worker threads
+            assert prefetch.call_count == 1
+            return result
+
+    serial_result = _evaluate(1)
+    parallel_result = _evaluate(4)
+
+    assert serial_result.total_requested > 0
+    assert [r.key for r in parallel_result.results] == [r.key for r in serial_result.results]
+    assert [r.true_subset.convert_to_serializable_subset() for r in parallel_result.results] == [
+        r.true_subset.convert_to_serializable_subset() for r in serial_result.results
+    ]
+    assert parallel_result.total_requested == serial_result.total_requested
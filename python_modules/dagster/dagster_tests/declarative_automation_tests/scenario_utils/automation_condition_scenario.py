@@ -94,9 +94,9 @@ async def evaluate(
                 logger=self.logger,
                 emit_backfills=False,
             )
-            evaluator.request_subsets_by_key = self._get_request_subsets_by_key(
-                evaluator.asset_graph_view
-            )  # type: ignore
+            evaluator.request_subsets_by_key.update(
+                self._get_request_subsets_by_key(evaluator.asset_graph_view)
+            )
             context = AutomationContext.create(key=asset_key, evaluator=evaluator)
 
             full_result = await asset_condition.evaluate(context)  # type: ignore
@@ -19,11 +19,16 @@
     weekly_partitioned_config,
 )
 from dagster._check import CheckError
+from dagster._core.definitions import time_window_partitions
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    _CalendarTimeWindowIndex,
+    _CompiledTimeWindowIndex,
+    _get_compiled_time_window_index,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
@@ -1266,6 +1271,268 @@ def my_daily_dst_transition_partitioned_config(_start, _end):
     )
 
 
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2021-01-01-00:00", minute_offset=15),
+        HourlyPartitionsDefinition(start_date="2021-01-01-00:00", timezone="US/Pacific"),
+        DailyPartitionsDefinition(start_date="2021-01-01", hour_offset=7, end_offset=2),
+        DailyPartitionsDefinition(start_date="2021-01-01", timezone="US/Pacific", end_offset=-3),
+        WeeklyPartitionsDefinition(start_date="2021-01-01", day_offset=3),
+        MonthlyPartitionsDefinition(start_date="2021-01-01", timezone="Europe/Berlin"),
+        # ticks that fall into the hour skipped or repeated by a DST transition
+        DailyPartitionsDefinition(
+            start_date="2021-01-01", timezone="US/Pacific", hour_offset=2, minute_offset=30
+        ),
+        DailyPartitionsDefinition(
+            start_date="2021-01-01", timezone="US/Pacific", hour_offset=1, minute_offset=30
+        ),
+        WeeklyPartitionsDefinition(
+            start_date="2021-01-01", timezone="Europe/Berlin", day_offset=0, hour_offset=2
+        ),
+        MonthlyPartitionsDefinition(
+            start_date="2021-01-01", timezone="US/Pacific", day_offset=14, hour_offset=2
+        ),
+        TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 * * * *", start="2021-03-13-00:00", fmt="%Y-%m-%d-%H:%M"
+        ),
+        TimeWindowPartitionsDefinition(
+            cron_schedule="0 9-17 * * 1-5",
+            start="2021-01-01-00:00",
+            timezone="America/New_York",
+            fmt="%Y-%m-%d-%H:%M",
+        ),
+        TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 0 * * *", start="2021-01-01-00:00", fmt="%Y-%m-%d-%H:%M"
+        ),
+        TimeWindowPartitionsDefinition(
+            cron_schedule="*/20 1 * * *", start="2021-01-01-00:00", fmt="%Y-%m-%d-%H:%M"
+        ),
+    ],
+)
+def test_time_window_index_matches_cron_iteration(partitions_def: TimeWindowPartitionsDefinition):
+    current_time = create_datetime(2021, 11, 10, 3, 15)
+    partition_keys = partitions_def.get_partition_keys(current_time)
+
+    # compute the expected keys by walking the cron schedule directly
+    expected_windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        if len(expected_windows) >= len(partition_keys) + 1:
+            break
+        expected_windows.append(window)
+    assert partition_keys == [
+        dst_safe_strftime(
+            w.start, partitions_def.timezone, partitions_def.fmt, partitions_def.cron_schedule
+        )
+        for w in expected_windows[: len(partition_keys)]
+    ]
+    assert partitions_def.get_num_partitions(current_time) == len(partition_keys)
+    assert partitions_def.get_last_partition_key(current_time) == partition_keys[-1]
+
+    assert (
+        partitions_def.get_partition_keys_between_indexes(100, 110, current_time=current_time)
+        == partition_keys[100:110]
+    )
+    sampled_keys = partition_keys[::37]
+    assert [
+        w.start.timestamp()
+        for w in partitions_def.time_windows_for_partition_keys(
+            frozenset(sampled_keys), validate=False
+        )
+    ] == [w.start.timestamp() for w in expected_windows[: len(partition_keys) : 37]]
+    for key, window in zip(sampled_keys, expected_windows[::37]):
+        assert partitions_def.time_window_for_partition_key(key).end == window.end
+        assert partitions_def.has_partition_key(key, current_time=current_time)
+
+    window = TimeWindow(expected_windows[2].start, expected_windows[8].start)
+    assert partitions_def.get_partition_keys_in_time_window(window) == partition_keys[2:8]
+    assert partitions_def.get_num_partitions_in_window(window) == 6
+
+
+def test_minute_interval_restricted_to_hours():
+    # these only tick every n minutes within a single hour of the day
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="*/15 0 * * *", start="2024-01-01-00:00", fmt="%Y-%m-%d-%H:%M"
+    )
+    current_time = create_datetime(2024, 1, 2, 3, 0)
+    assert partitions_def.get_partition_keys(current_time) == [
+        "2024-01-01-00:00",
+        "2024-01-01-00:15",
+        "2024-01-01-00:30",
+        "2024-01-01-00:45",
+        "2024-01-02-00:00",
+        "2024-01-02-00:15",
+        "2024-01-02-00:30",
+    ]
+    assert partitions_def.get_num_partitions(current_time) == 7
+    assert partitions_def.time_window_for_partition_key("2024-01-01-00:45") == time_window(
+        "2024-01-01T00:45:00", "2024-01-02T00:00:00"
+    )
+    assert partitions_def.get_last_partition_window(current_time) == time_window(
+        "2024-01-02T00:30:00", "2024-01-02T00:45:00"
+    )
+    window = time_window("2024-01-01T00:00:00", "2024-01-02T00:30:00")
+    assert partitions_def.get_partition_keys_in_time_window(window) == [
+        "2024-01-01-00:00",
+        "2024-01-01-00:15",
+        "2024-01-01-00:30",
+        "2024-01-01-00:45",
+        "2024-01-02-00:00",
+        "2024-01-02-00:15",
+    ]
+    assert partitions_def.get_num_partitions_in_window(window) == 6
+
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="*/20 1 * * *", start="2024-01-01-00:00", fmt="%Y-%m-%d-%H:%M"
+    )
+    assert partitions_def.get_partition_keys(current_time) == [
+        "2024-01-01-01:00",
+        "2024-01-01-01:20",
+        "2024-01-01-01:40",
+        "2024-01-02-01:00",
+        "2024-01-02-01:20",
+    ]
+
+
+@pytest.mark.usefixtures("clear_compiled_time_window_indexes")
+def test_time_window_index_calendar():
+    # schedules that tick once per day, week or month are indexed by their local date, without
+    # compiling their ticks, even outside of UTC
+    for partitions_def in [
+        DailyPartitionsDefinition(start_date="2021-01-01", timezone="US/Pacific"),
+        WeeklyPartitionsDefinition(start_date="2021-01-01", timezone="Europe/Berlin"),
+        MonthlyPartitionsDefinition(start_date="2021-01-01", timezone="US/Pacific"),
+    ]:
+        assert isinstance(partitions_def._time_window_index, _CalendarTimeWindowIndex)  # noqa: SLF001
+        current_time = create_datetime(2071, 1, 1)
+        num_partitions = partitions_def.get_num_partitions(current_time)
+        last_key = partitions_def.get_last_partition_key(current_time)
+        assert last_key
+        window = partitions_def.time_window_for_partition_key(last_key)
+        assert window.end.timestamp() <= current_time.timestamp()
+        assert partitions_def.get_partition_keys_between_indexes(
+            num_partitions - 1, num_partitions, current_time=current_time
+        ) == [last_key]
+    assert _get_compiled_time_window_index.cache_info().currsize == 0
+
+    # days that are not in every month are skipped in some months, so their ticks are compiled
+    partitions_def = MonthlyPartitionsDefinition(
+        start_date="2021-01-01", timezone="US/Pacific", day_offset=31
+    )
+    assert isinstance(partitions_def._time_window_index, _CompiledTimeWindowIndex)  # noqa: SLF001
+
+
+@pytest.fixture
+def clear_compiled_time_window_indexes():
+    _get_compiled_time_window_index.cache_clear()
+    yield
+    _get_compiled_time_window_index.cache_clear()
+
+
+@pytest.mark.usefixtures("clear_compiled_time_window_indexes")
+def test_time_window_index_bounded(monkeypatch):
+    monkeypatch.setattr(time_window_partitions, "MAX_COMPILED_TIME_WINDOW_TICKS", 50)
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-01-01-00:00", timezone="US/Pacific"
+    )
+    current_time = create_datetime(2021, 11, 10, 3, 15)
+
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    # ticks past the compiled table are found by iterating the cron schedule
+    assert len(partitions_def._time_window_index._timestamps) == 50  # noqa: SLF001
+    assert (
+        partition_keys
+        == HourlyPartitionsDefinition(
+            start_date="2021-01-01-00:00", timezone="US/Pacific", end_offset=1
+        ).get_partition_keys(current_time)[:-1]
+    )
+    assert partitions_def.get_num_partitions(current_time) == len(partition_keys)
+    assert partitions_def.get_last_partition_key(current_time) == partition_keys[-1]
+    assert (
+        partitions_def.get_partition_keys_between_indexes(100, 110, current_time=current_time)
+        == partition_keys[100:110]
+    )
+    window = partitions_def.time_window_for_partition_key(partition_keys[500])
+    assert partitions_def.get_partition_keys_in_time_window(window) == [partition_keys[500]]
+    assert len(partitions_def._time_window_index._timestamps) == 50  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("clear_compiled_time_window_indexes")
+@pytest.mark.parametrize("max_compiled_ticks", [50, 100_000])
+@pytest.mark.parametrize("cron_schedule", ["0 * * * *", "30 * * * *"])
+@pytest.mark.parametrize("timezone", ["Asia/Kolkata", "America/St_Johns", "Australia/Adelaide"])
+def test_time_window_index_non_whole_hour_offset(
+    monkeypatch, timezone: str, cron_schedule: str, max_compiled_ticks: int
+):
+    # in timezones whose UTC offset is not a whole number of hours, hourly cron iterators started
+    # between ticks are out of phase with ones started on a tick, so the compiled ticks, both in
+    # and past the table, have to match iterating the time windows from the start
+    monkeypatch.setattr(
+        time_window_partitions, "MAX_COMPILED_TIME_WINDOW_TICKS", max_compiled_ticks
+    )
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule,
+        start="2024-03-01-00:00",
+        timezone=timezone,
+        fmt="%Y-%m-%d-%H:%M",
+    )
+    current_time = create_datetime(2024, 3, 1, tz=timezone) + timedelta(hours=100, minutes=15)
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    assert partition_keys[:3] == ["2024-03-01-00:00", "2024-03-01-01:00", "2024-03-01-02:00"]
+
+    expected_windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        if len(expected_windows) >= len(partition_keys):
+            break
+        expected_windows.append(window)
+    assert partition_keys == [
+        dst_safe_strftime(w.start, timezone, partitions_def.fmt, cron_schedule)
+        for w in expected_windows
+    ]
+    assert len(partition_keys) == 100
+    assert partitions_def.get_num_partitions(current_time) == 100
+
+    for idx in [0, 49, 50, 75, 99]:
+        window = partitions_def.time_window_for_partition_key(partition_keys[idx])
+        assert window == expected_windows[idx]
+        assert partitions_def.get_partition_keys_in_time_window(window) == [partition_keys[idx]]
+    assert (
+        partitions_def.get_partition_keys_between_indexes(45, 55, current_time=current_time)
+        == partition_keys[45:55]
+    )
+
+
+def test_get_partition_keys_between_indexes_clipped_at_end():
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="0 * * * *",
+        start="2024-03-01-00:00",
+        end="2024-03-01-05:00",
+        timezone="Asia/Kolkata",
+        fmt="%Y-%m-%d-%H:%M",
+    )
+    current_time = create_datetime(2024, 4, 1)
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    assert partition_keys == [f"2024-03-01-0{hour}:00" for hour in range(5)]
+    # indexes past the end of the definition don't produce partitions after its end
+    assert (
+        partitions_def.get_partition_keys_between_indexes(3, 10, current_time=current_time)
+        == partition_keys[3:]
+    )
+    assert partitions_def.get_partition_keys_between_indexes(6, 10, current_time=current_time) == []
+
+
+@pytest.mark.usefixtures("clear_compiled_time_window_indexes")
+def test_time_window_index_shared():
+    # the compiled ticks are shared by definitions with the same schedule, timezone and start
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-01-01-00:00", timezone="US/Pacific"
+    )
+    offset_partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-01-01-00:00", timezone="US/Pacific", end_offset=1
+    )
+    assert partitions_def._time_window_index is offset_partitions_def._time_window_index  # noqa: SLF001
+
+
 def test_get_first_partition_window():
     assert DailyPartitionsDefinition(
         start_date="2023-01-01"
@@ -11,6 +11,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -99,6 +100,28 @@ def test_child_process_uncaught_exception():
     assert "AnError" in str(results[0].error_info.message)  # type: ignore
 
 
+def _failing_initializer():
+    raise AnError("Could not initialize")
+
+
+def test_worker_pool_initializer_error():
+    with ChildProcessWorkerPool(multiprocessing_ctx, initializer=_failing_initializer) as pool:
+        worker = pool.acquire_worker()
+        results = list(
+            filter(
+                lambda x: x and isinstance(x, ChildProcessEvent),
+                pool.execute_command(worker, DoubleAStringChildProcessCommand("aa")),
+            )
+        )
+        assert len(results) == 2
+        assert isinstance(results[0], ChildProcessStartEvent)
+        assert isinstance(results[1], ChildProcessSystemErrorEvent)
+        assert "Could not initialize" in results[1].error_info.message
+
+        # the worker is replaced rather than reused
+        assert not worker.process.is_alive()
+
+
 def test_child_process_crashy_process():
     with pytest.raises(ChildProcessCrashException) as exc:
         list(execute_child_process_command(multiprocessing_ctx, CrashyCommand()))
@@ -107,6 +107,69 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+@op
+def first_pid() -> int:
+    return os.getpid()
+
+
+@op
+def next_pid(pids) -> list[int]:
+    return [*(pids if isinstance(pids, list) else [pids]), os.getpid()]
+
+
+@job
+def pid_chain_job():
+    next_pid(next_pid(next_pid(first_pid())))
+
+
+def _worker_pool_run_config(**worker_pool_config) -> dict:
+    return {
+        "execution": {
+            "config": {"multiprocess": {"max_concurrent": 1, "worker_pool": worker_pool_config}}
+        }
+    }
+
+
+def test_worker_pool_reuses_processes():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(pid_chain_job),
+            run_config=_worker_pool_run_config(),
+            instance=instance,
+        ) as result:
+            assert result.success
+            pids = result.output_for_node("next_pid_3")
+            assert len(pids) == 4
+            assert len(set(pids)) == 1
+            assert os.getpid() not in pids
+
+        with execute_job(
+            reconstructable(pid_chain_job),
+            run_config=_worker_pool_run_config(max_steps_per_worker=2),
+            instance=instance,
+        ) as result:
+            assert result.success
+            pids = result.output_for_node("next_pid_3")
+            assert pids[0] == pids[1]
+            assert pids[2] == pids[3]
+            assert pids[1] != pids[2]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config=_worker_pool_run_config(),
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"  # pyright: ignore[reportOptionalMemberAccess]
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -1056,3 +1056,33 @@ def downstream_asset(**kwargs):
             "DagsterInstance.get_run_record_by_id": 3,  # get_run_record_by_id called when handling events for the run
         }
     )
+
+
+def test_intra_step_fan_in():
+    @multi_asset(
+        outs={
+            **{f"upstream_asset_{i}": AssetOut(code_version="abc") for i in range(50)},
+            "downstream_asset": AssetOut(code_version="abc"),
+        },
+        internal_asset_deps={
+            **{f"upstream_asset_{i}": set() for i in range(50)},
+            "downstream_asset": {AssetKey(f"upstream_asset_{i}") for i in range(50)},
+        },
+    )
+    def fan_in():
+        for i in range(50):
+            yield Output(i, output_name=f"upstream_asset_{i}")
+        yield Output(None, output_name="downstream_asset")
+
+    instance = DagsterInstance.ephemeral()
+    materialize_assets([fan_in], instance)
+
+    counter = Counter()
+    traced_counter.set(counter)
+    mats = materialize_assets([fan_in], instance)
+    # intra-step deps are refetched in a single batch for the downstream asset
+    assert traced_counter.get().counts()["DagsterInstance.get_asset_records"] == 1  # pyright: ignore[reportOptionalMemberAccess]
+    for i in range(50):
+        assert_provenance_match(
+            mats[AssetKey("downstream_asset")], mats[AssetKey(f"upstream_asset_{i}")]
+        )
@@ -1,4 +1,5 @@
 import dataclasses
+import pickle
 import re
 import string
 from collections import namedtuple
@@ -24,10 +25,13 @@
     WhitelistMap,
     _whitelist_for_serdes,
     deserialize_value,
+    deserialize_values,
     get_prefix_for_a_serialized,
     get_storage_name,
+    is_binary_serialized_value,
     pack_value,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_value,
 )
 from dagster_shared.serdes.utils import hash_str
@@ -1217,3 +1221,126 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_binary_serialization() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "red"
+        BLUE = "blue"
+
+    @_whitelist_for_serdes(test_env)
+    class Bar(NamedTuple):
+        color: Color
+        tags: frozenset[str]
+
+    @_whitelist_for_serdes(test_env, storage_name="Qux")
+    @dataclasses.dataclass
+    class Baz:
+        bars: list[Bar]
+        keyed: Mapping[Bar, int]
+        tags: AbstractSet[int]
+        nested: Mapping[str, Any]
+
+    bars = [Bar(Color.RED, frozenset(["a", "b"])), Bar(Color.BLUE, frozenset())]
+    val = Baz(
+        bars=bars * 50,
+        keyed=SerializableNonScalarKeyMapping({bars[0]: 1}),
+        tags={1, 2},
+        nested={"x": [1, 2.5, None, True, "s", {"y": bars[1]}]},
+    )
+
+    serialized = serialize_value_to_bytes(val, whitelist_map=test_env)
+    assert is_binary_serialized_value(serialized)
+    assert deserialize_value(serialized, as_type=Baz, whitelist_map=test_env) == val
+    # class and field names are only stored once
+    assert len(serialized) < len(serialize_value(val, whitelist_map=test_env)) / 2
+
+    # values in either format can be read, including json as utf-8 encoded bytes
+    json_serialized = serialize_value(val, whitelist_map=test_env)
+    assert deserialize_values(
+        [serialized, json_serialized, json_serialized.encode()], whitelist_map=test_env
+    ) == [val, val, val]
+
+
+def test_binary_serialization_field_names_bounded(monkeypatch) -> None:
+    from dagster_shared.serdes import serdes
+
+    field_names_cache = {}
+    monkeypatch.setattr(serdes, "_BINARY_FIELD_NAMES", field_names_cache)
+    monkeypatch.setattr(serdes, "_BINARY_FIELD_NAMES_MAX_SIZE", 1)
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+
+    @_whitelist_for_serdes(test_env)
+    class Bar(NamedTuple):
+        foos: list[Foo]
+
+    val = Bar([Foo("red"), Foo("blue")])
+    serialized = serialize_value_to_bytes(val, whitelist_map=test_env)
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+    # field names are cached by class, up to the maximum number of classes
+    assert field_names_cache == {"Foo": ("color",)}
+
+
+def test_binary_serialization_field_serializers() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Bar(NamedTuple):
+        color: str
+
+    class BarsSerializer(FieldSerializer):
+        def pack(
+            self, bars: Mapping[str, Bar], whitelist_map: WhitelistMap, descent_path: str
+        ) -> Sequence[Any]:
+            return [(key, pack_value(bar, whitelist_map)) for key, bar in bars.items()]
+
+        def unpack(
+            self, entries: Sequence[Sequence[Any]], whitelist_map: WhitelistMap, context
+        ) -> Any:
+            assert all(isinstance(entry, list) for entry in entries)
+            return {entry[0]: entry[1] for entry in entries}
+
+    @_whitelist_for_serdes(test_env, field_serializers={"bars": BarsSerializer})
+    class Foo(NamedTuple):
+        bars: Mapping[str, Bar]
+
+    val = Foo({"a": Bar("red")})
+    assert (
+        deserialize_value(
+            serialize_value_to_bytes(val, whitelist_map=test_env), whitelist_map=test_env
+        )
+        == val
+    )
+
+
+def test_binary_deserialization_errors() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+
+    serialized = serialize_value_to_bytes(Foo("red"), whitelist_map=test_env)
+
+    with pytest.raises(DeserializationError, match="not in the whitelist"):
+        deserialize_value(serialized, whitelist_map=WhitelistMap.create())
+
+    with pytest.raises(DeserializationError, match="Unsupported binary serdes version"):
+        deserialize_value(b"\x00dsb\x02" + serialized[5:], whitelist_map=test_env)
+
+    # values may not reference arbitrary globals
+    malicious = b"\x00dsb\x01" + pickle.dumps(print, protocol=5)
+    with pytest.raises(DeserializationError, match="builtins.print"):
+        deserialize_value(malicious, whitelist_map=test_env)
+
+    # including globals of the serdes module other than the unpacking hooks
+    malicious = b"\x00dsb\x01" + pickle.dumps(serialize_value_to_bytes, protocol=5)
+    with pytest.raises(DeserializationError, match="serialize_value_to_bytes"):
+        deserialize_value(malicious, whitelist_map=test_env)
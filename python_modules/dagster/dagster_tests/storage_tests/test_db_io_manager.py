@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import MagicMock
 
 import pytest
@@ -10,8 +11,10 @@
     DbClient,
     DbIOManager,
     DbTypeHandler,
+    TableFilter,
     TablePartitionDimension,
     TableSlice,
+    get_table_filters_where_clause,
 )
 from dagster._core.types.dagster_type import resolve_dagster_type
 from dagster._time import create_datetime
@@ -152,6 +155,72 @@ def test_asset_out_columns():
     )
 
 
+def test_asset_in_filters():
+    handler = IntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient,
+        get_select_statement=MagicMock(return_value=""),
+        connect=connect_mock,
+        get_table_name=mock_table_name,
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    output_context = build_output_context(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        definition_metadata={"filters": [("apple", "=", 1)]},
+    )
+    manager.handle_output(output_context, 5)
+    input_context = MagicMock(
+        asset_key=asset_key,
+        upstream_output=output_context,
+        resource_config=resource_config,
+        dagster_type=resolve_dagster_type(int),
+        has_asset_partitions=False,
+        definition_metadata={
+            "columns": ["apple", "banana"],
+            "filters": [("apple", ">", 1), TableFilter("banana", "IN", ["a", "b"])],
+        },
+    )
+    assert manager.load_input(input_context) == 7
+
+    # filters on the output do not apply to the rows that are stored
+    assert handler.handle_output_calls[0][1].filters is None
+
+    assert len(handler.handle_input_calls) == 1
+    assert handler.handle_input_calls[0][1] == TableSlice(
+        database="database_abc",
+        schema="schema1",
+        table="table1",
+        columns=["apple", "banana"],
+        partition_dimensions=[],
+        filters=[TableFilter("apple", ">", 1), TableFilter("banana", "in", ("a", "b"))],
+    )
+
+    input_context.definition_metadata = {"filters": [("apple", "like", "a%")]}
+    with pytest.raises(CheckError, match="operator"):
+        manager.load_input(input_context)
+
+
+def test_table_filters_where_clause():
+    assert (
+        get_table_filters_where_clause(
+            [
+                TableFilter("price", ">=", 1.5),
+                TableFilter("color", "in", ["red", "gree'n"]),
+                TableFilter("eaten_at", "is null"),
+            ],
+            "%Y-%m-%d %H:%M:%S",
+        )
+        == "price >= 1.5 AND\ncolor in ('red', 'gree''n') AND\neaten_at is null"
+    )
+
+    for value in [float("nan"), float("inf"), float("-inf"), Decimal("NaN"), Decimal("Infinity")]:
+        with pytest.raises(CheckError, match="non-finite"):
+            get_table_filters_where_clause([TableFilter("price", "<", value)], "%Y-%m-%d")
+
+
 def test_asset_out_partitioned():
     handler = IntHandler()
     connect_mock = MagicMock()
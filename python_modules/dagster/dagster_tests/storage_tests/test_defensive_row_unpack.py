@@ -6,7 +6,7 @@
 from dagster._core.storage.runs.sql_run_storage import (
     defensively_unpack_execution_plan_snapshot_query,
 )
-from dagster._serdes import serialize_value
+from dagster._serdes import serialize_value, serialize_value_to_bytes
 
 
 def test_defensive_job_not_a_string():
@@ -99,3 +99,11 @@ def noop_job():
     )
 
     assert mock_logger.warning.call_count == 0
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(
+            mock_logger, [zlib.compress(serialize_value_to_bytes(noop_job_snapshot))]
+        )
+        == noop_job_snapshot
+    )
+
+    assert mock_logger.warning.call_count == 0
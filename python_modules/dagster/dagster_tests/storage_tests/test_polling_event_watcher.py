@@ -3,11 +3,17 @@
 from collections.abc import Mapping
 from contextlib import contextmanager
 from typing import Any, Callable, Optional
+from unittest import mock
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
@@ -62,6 +68,40 @@ def dispose(self) -> None:
             self._watcher = None
 
 
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite-backed event log storage that uses SqlPollingMultiRunEventWatcher, which
+    requires storage ids that increase across all runs, for watching runs.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._watcher: Optional[SqlPollingMultiRunEventWatcher] = None
+
+    def watch(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ):
+        if self._watcher is None:
+            self._watcher = SqlPollingMultiRunEventWatcher(self)
+
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ):
+        if self._watcher:
+            self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self) -> None:
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+
+
 RUN_ID = make_new_run_id()
 
 
@@ -147,3 +187,149 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    attempts = 50
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_multi_run_watcher():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        run_ids = [make_new_run_id() for _ in range(20)]
+        watched = {run_id: [] for run_id in run_ids}
+        watched_after_cursor = []
+
+        def _watch_fn(run_id):
+            return lambda event, _cursor: watched[run_id].append(int(event.message))
+
+        for run_id in run_ids:
+            storage.store_event(create_event(0, run_id))
+
+        with mock.patch.object(
+            storage, "get_records_for_run", wraps=storage.get_records_for_run
+        ) as get_records_for_run_mock:
+            # events written before the callback was added are delivered to each callback
+            for run_id in run_ids:
+                storage.watch(run_id, None, _watch_fn(run_id))
+            _wait_for(lambda: all(len(watched[run_id]) == 1 for run_id in run_ids))
+
+            cursor = storage.get_records_for_run(run_ids[0]).cursor
+            storage.watch(
+                run_ids[0], cursor, lambda event, _cursor: watched_after_cursor.append(event)
+            )
+
+            for count in range(1, 4):
+                for run_id in run_ids:
+                    storage.store_event(create_event(count, run_id))
+            _wait_for(lambda: all(len(watched[run_id]) == 4 for run_id in run_ids))
+
+            # runs are only queried individually when they are first watched, all other events
+            # are delivered by polling the event log of all runs
+            assert get_records_for_run_mock.call_count == len(run_ids) + 2
+
+        for run_id in run_ids:
+            assert watched[run_id] == [0, 1, 2, 3]
+        assert [int(event.message) for event in watched_after_cursor] == [1, 2, 3]
+
+        storage.dispose()
+
+
+@contextmanager
+def _hide_storage_ids(storage, hidden_storage_ids):
+    """Simulates writes that have not been committed yet by hiding their storage ids from the
+    queries of the multi-run watcher.
+    """
+    get_storage_ids = storage.get_storage_ids
+    get_logs_for_runs_by_log_id = storage.get_logs_for_runs_by_log_id
+
+    def _get_storage_ids(*args, **kwargs):
+        return [
+            storage_id
+            for storage_id in get_storage_ids(*args, **kwargs)
+            if storage_id not in hidden_storage_ids
+        ]
+
+    def _get_logs_for_runs_by_log_id(*args, **kwargs):
+        return {
+            storage_id: event
+            for storage_id, event in get_logs_for_runs_by_log_id(*args, **kwargs).items()
+            if storage_id not in hidden_storage_ids
+        }
+
+    with (
+        mock.patch.object(storage, "get_storage_ids", _get_storage_ids),
+        mock.patch.object(storage, "get_logs_for_runs_by_log_id", _get_logs_for_runs_by_log_id),
+    ):
+        yield
+
+
+def test_multi_run_watcher_out_of_order_commit():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        watched = []
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(int(event.message)))
+        _wait_for(lambda: storage._watcher is not None and storage._watcher.has_run_id(RUN_ID))  # noqa: SLF001
+
+        hidden_storage_ids = set()
+        with _hide_storage_ids(storage, hidden_storage_ids):
+            hidden_storage_ids.add((storage.get_maximum_record_id() or 0) + 1)
+            storage.store_event(create_event(1))
+            storage.store_event(create_event(2))
+            _wait_for(lambda: watched == [2])
+            assert watched == [2]
+
+            # the event is delivered once it becomes visible, without delivering the later event
+            # again
+            hidden_storage_ids.clear()
+            storage.store_event(create_event(3))
+            _wait_for(lambda: len(watched) == 3)
+            assert watched == [2, 1, 3]
+
+        storage.dispose()
+
+
+def test_multi_run_watcher_storage_id_gap():
+    with (
+        tempfile.TemporaryDirectory() as tmpdir_path,
+        mock.patch.dict("os.environ", {"DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE": "2"}),
+    ):
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        watched = []
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(int(event.message)))
+        _wait_for(lambda: storage._watcher is not None and storage._watcher.has_run_id(RUN_ID))  # noqa: SLF001
+
+        # a write that is never committed does not hold back the events after it, even when they
+        # are read in several batches
+        with _hide_storage_ids(storage, {(storage.get_maximum_record_id() or 0) + 1}):
+            for count in range(10):
+                storage.store_event(create_event(count))
+            _wait_for(lambda: len(watched) == 9)
+            assert watched == list(range(1, 10))
+
+        storage.dispose()
+
+
+def test_multi_run_watcher_only_reads_watched_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        unwatched_run_id = make_new_run_id()
+        watched = []
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(int(event.message)))
+        _wait_for(lambda: storage._watcher is not None and storage._watcher.has_run_id(RUN_ID))  # noqa: SLF001
+
+        with mock.patch.object(
+            storage, "get_logs_for_runs_by_log_id", wraps=storage.get_logs_for_runs_by_log_id
+        ) as get_logs_mock:
+            for count in range(3):
+                storage.store_event(create_event(count, unwatched_run_id))
+                storage.store_event(create_event(count))
+            _wait_for(lambda: len(watched) == 3)
+
+        assert watched == [0, 1, 2]
+        for call in get_logs_mock.call_args_list:
+            assert list(call.args[0]) == [RUN_ID]
+        storage.dispose()
@@ -1,13 +1,18 @@
 import os
 import tempfile
+import zlib
 from contextlib import contextmanager
 
 import pytest
 from dagster import DagsterInstance
+from dagster._core.definitions import GraphDefinition
 from dagster._core.storage.legacy_storage import LegacyRunStorage
 from dagster._core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster._core.storage.runs.schema import SnapshotsTable
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
 from dagster._core.test_utils import instance_for_test
+from dagster._serdes import is_binary_serialized_value, serialize_pp
 
 from dagster_tests.storage_tests.utils.run_storage import TestRunStorage
 
@@ -130,3 +135,32 @@ def run_storage(self, instance):
 
     def test_storage_telemetry(self, storage):
         pass
+
+
+@pytest.mark.parametrize("binary_serialization", [False, True])
+def test_snapshot_serialization_format(binary_serialization: bool):
+    job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+    job_snapshot = job_def.get_job_snapshot()
+
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+        with instance_for_test(
+            temp_dir=tmpdir_path,
+            overrides={"snapshots": {"binary_serialization": binary_serialization}},
+        ) as instance:
+            assert instance.binary_snapshot_serialization_enabled == binary_serialization
+            storage = instance.run_storage
+            assert isinstance(storage, SqliteRunStorage)
+            assert storage.add_job_snapshot(job_snapshot) == job_snapshot.snapshot_id
+
+            with storage.connect() as conn:
+                snapshot_body = conn.execute(
+                    db_select([SnapshotsTable.c.snapshot_body]).where(
+                        SnapshotsTable.c.snapshot_id == job_snapshot.snapshot_id
+                    )
+                ).scalar()
+            # snapshots are written as JSON unless the instance opts into the binary format
+            snapshot_bytes = zlib.decompress(snapshot_body)
+            assert is_binary_serialized_value(snapshot_bytes) == binary_serialization
+
+            fetched_job_snapshot = storage.get_job_snapshot(job_snapshot.snapshot_id)
+            assert serialize_pp(fetched_job_snapshot) == serialize_pp(job_snapshot)
@@ -0,0 +1,159 @@
+import errno
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from unittest import mock
+
+import pytest
+from dagster import (
+    SharedMemoryIOManager,
+    build_init_resource_context,
+    build_output_context,
+    execute_job,
+    job,
+    multiprocess_executor,
+    op,
+    reconstructable,
+)
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.storage import shared_memory_io_manager
+from dagster._core.storage.dagster_run import DagsterRunStatus
+from dagster._core.storage.shared_memory_io_manager import (
+    RUN_DIRECTORY_PREFIX,
+    PickledObjectSharedMemoryIOManager,
+    ensure_private_directory,
+    read_shared_memory_file,
+    remove_finished_run_directories,
+    write_shared_memory_file,
+)
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+
+
+class OutOfBandArray:
+    """Minimal stand-in for an array type that exposes its data via pickle protocol 5."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        return OutOfBandArray, (pickle.PickleBuffer(self.data),)
+
+
+def test_round_trip_out_of_band_buffers() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "value")
+        value = {
+            "small": [1, 2, 3],
+            "arrays": [OutOfBandArray(bytearray(b"abc" * 1000)), OutOfBandArray(bytearray(7))],
+        }
+        write_shared_memory_file(path, value)
+        loaded = read_shared_memory_file(path)
+
+        assert loaded["small"] == [1, 2, 3]  # pyright: ignore[reportIndexIssue]
+        first, second = loaded["arrays"]  # pyright: ignore[reportIndexIssue]
+
+        # buffers are views onto the mapped file rather than copies
+        assert isinstance(first.data, memoryview)
+        assert bytes(first.data) == b"abc" * 1000
+        assert bytes(second.data) == bytes(7)
+
+        # the mapping is copy-on-write, so loaded values can be modified without changing the file
+        first.data[0] = ord("z")
+        reloaded = read_shared_memory_file(path)
+        assert bytes(reloaded["arrays"][0].data[:3]) == b"abc"  # pyright: ignore[reportIndexIssue]
+
+
+@op
+def make_array():
+    return OutOfBandArray(bytearray(b"x" * 100_000))
+
+
+@op
+def array_length(array) -> int:
+    assert isinstance(array.data, memoryview)
+    assert len(array.data) == 100_000
+    return len(array.data)
+
+
+@job(
+    executor_def=multiprocess_executor,
+    resource_defs={"io_manager": SharedMemoryIOManager.configure_at_launch()},
+)
+def shared_memory_job():
+    array_length(make_array())
+
+
+def test_shared_memory_io_manager_multiprocess() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir, instance_for_test() as instance:
+        os.makedirs(os.path.join(tmpdir, f"{RUN_DIRECTORY_PREFIX}other"))
+        with execute_job(
+            reconstructable(shared_memory_job),
+            instance=instance,
+            run_config={"resources": {"io_manager": {"config": {"base_dir": tmpdir}}}},
+        ) as result:
+            assert result.success
+
+        # the storage of the run is removed once it has finished, and other runs are left untouched
+        assert os.listdir(tmpdir) == [f"{RUN_DIRECTORY_PREFIX}other"]
+
+
+def test_remove_finished_run_directories() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir, instance_for_test() as instance:
+        finished_run = create_run_for_test(instance, status=DagsterRunStatus.FAILURE)
+        started_run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+        current_run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+        for run_id in [finished_run.run_id, started_run.run_id, current_run.run_id, "unknown"]:
+            os.makedirs(os.path.join(tmpdir, f"{RUN_DIRECTORY_PREFIX}{run_id}"))
+
+        # the current run has no execution plan, so whether its steps have finished is unknown
+        removed_run_ids = remove_finished_run_directories(tmpdir, instance, current_run)
+        assert removed_run_ids == [finished_run.run_id]
+        assert sorted(os.listdir(tmpdir)) == sorted(
+            f"{RUN_DIRECTORY_PREFIX}{run_id}"
+            for run_id in [started_run.run_id, current_run.run_id, "unknown"]
+        )
+
+        missing_dir = os.path.join(tmpdir, "missing")
+        assert remove_finished_run_directories(missing_dir, instance, current_run) == []
+
+
+def test_out_of_space() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        io_manager = PickledObjectSharedMemoryIOManager(base_dir=tmpdir)
+        context = build_output_context(step_key="my_step", name="result", run_id="my_run")
+        with mock.patch.object(
+            shared_memory_io_manager.os,
+            "replace",
+            side_effect=OSError(errno.ENOSPC, "No space left on device"),
+        ):
+            with pytest.raises(DagsterInvariantViolationError, match="Ran out of space"):
+                io_manager.handle_output(context, [1, 2, 3])
+
+        # the partially written file is removed
+        assert os.listdir(os.path.join(tmpdir, f"{RUN_DIRECTORY_PREFIX}my_run", "my_step")) == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="file ownership is not checked on windows")
+def test_private_storage() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = os.path.join(tmpdir, "storage")
+        ensure_private_directory(base_dir)
+        assert stat.S_IMODE(os.stat(base_dir).st_mode) & 0o077 == 0
+
+        path = os.path.join(base_dir, "value")
+        write_shared_memory_file(path, [1, 2, 3])
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert read_shared_memory_file(path) == [1, 2, 3]
+
+        # values are unpickled, so storage that other users can write to is never loaded
+        os.chmod(path, 0o666)
+        with pytest.raises(DagsterInvariantViolationError, match="Refusing"):
+            read_shared_memory_file(path)
+
+        os.chmod(base_dir, 0o777)
+        with pytest.raises(DagsterInvariantViolationError, match="Refusing"):
+            SharedMemoryIOManager(base_dir=base_dir).create_io_manager(
+                build_init_resource_context()
+            )
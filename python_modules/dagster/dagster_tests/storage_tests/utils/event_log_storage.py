@@ -1052,6 +1052,31 @@ def test_delete_sql_backed_event_log(self, test_run_id, storage):
 
         assert storage.get_logs_for_run(result.run_id) == []
 
+    def test_purge_run_events(self, storage):
+        if not storage.supports_event_log_retention:
+            pytest.skip("storage does not support event log retention")
+
+        old_events, old_result = _synthesize_events(lambda: one_asset_op())
+        for event in old_events:
+            storage.store_event(event)
+
+        before = time.time()
+
+        new_events, new_result = _synthesize_events(lambda: one_asset_op())
+        for event in new_events:
+            storage.store_event(event)
+
+        storage.purge_run_events(before)
+
+        old_out_events = storage.get_logs_for_run(old_result.run_id)
+        assert _event_types(old_out_events) == [
+            event.dagster_event_type
+            for event in old_events
+            if event.dagster_event and event.dagster_event.asset_key
+        ]
+        assert DagsterEventType.ASSET_MATERIALIZATION in _event_types(old_out_events)
+        assert _event_types(storage.get_logs_for_run(new_result.run_id)) == _event_types(new_events)
+
     def test_get_logs_for_run_of_type(self, test_run_id, storage):
         events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
 
@@ -1561,6 +1586,28 @@ def my_asset():
                 planned_event.event_specific_data.partition for planned_event in planned_events
             } == {"a", "b"}
 
+    def test_store_buffered_events(self, storage, test_run_id):
+        with instance_for_test() as created_instance:
+            events, _ = _synthesize_events(
+                two_asset_ops, run_id=test_run_id, instance=created_instance
+            )
+
+        storage.store_buffered_events(events)
+
+        stored_events = storage.get_logs_for_run(test_run_id)
+        assert [event.message for event in stored_events] == [event.message for event in events]
+
+        asset_keys = [AssetKey("asset_1"), AssetKey("asset_2"), AssetKey(["path", "to", "asset_3"])]
+        for asset_key in asset_keys:
+            records = storage.fetch_materializations(asset_key, limit=10).records
+            assert len(records) == 1
+
+        asset_records = storage.get_asset_records(asset_keys)
+        assert {record.asset_entry.asset_key for record in asset_records} == set(asset_keys)
+        for record in asset_records:
+            assert record.asset_entry.last_materialization_record
+            assert record.asset_entry.last_run_id == test_run_id
+
     def test_asset_materialization_range(self, storage, test_run_id):
         partitions_def = StaticPartitionsDefinition(["a", "b"])
 
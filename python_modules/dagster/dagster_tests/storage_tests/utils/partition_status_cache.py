@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -204,6 +205,51 @@ def asset1():
             for partition in ["b", "c"]
         )
 
+    def test_cached_status_applies_deltas(self, instance):
+        partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        asset_job.execute_in_process(instance=instance, partition_key="a")
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset1.key, partitions_def
+        )
+        assert cached_status
+
+        # with no new events, the stored value is returned without fetching partitions
+        traced_counter.set(Counter())
+        with mock.patch.object(
+            StaticPartitionsDefinition, "deserialize_subset", side_effect=Exception("unexpected")
+        ):
+            assert (
+                get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+                == cached_status
+            )
+        counts = traced_counter.get().counts()  # pyright: ignore[reportOptionalMemberAccess]
+        assert not counts.get("DagsterInstance.get_materialized_partitions")
+
+        # new materializations only touch the materialized subset
+        asset_job.execute_in_process(instance=instance, partition_key="b")
+        updated_status = get_and_update_asset_status_cache_value(
+            instance, asset1.key, partitions_def
+        )
+        assert updated_status
+        assert updated_status.latest_storage_id > cached_status.latest_storage_id
+        assert (
+            updated_status.serialized_failed_partition_subset
+            == cached_status.serialized_failed_partition_subset
+        )
+        assert set(
+            updated_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"a", "b"}
+
     def test_multipartition_get_cached_partition_status(self, instance):
         partitions_def = MultiPartitionsDefinition(
             {
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import tempfile
 import time
@@ -20,6 +21,7 @@
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 from dagster._core.instance import DagsterInstance, InstanceType
 from dagster._core.launcher.sync_in_memory_run_launcher import SyncInMemoryRunLauncher
+from dagster._core.loader import LoadingContextForTest
 from dagster._core.remote_representation import (
     ManagedGrpcPythonEnvCodeLocationOrigin,
     RemoteRepositoryOrigin,
@@ -1716,6 +1718,38 @@ def test_backfill_id_filtering(self, storage: RunStorage):
         )
         assert backfills_for_id[0].backfill_id == backfill.backfill_id
 
+    def test_backfill_loader(self, storage: RunStorage):
+        if not self.supports_backfill_id_filtering_queries():
+            pytest.skip("storage does not support filtering backfills by backfill id")
+        origin = self.fake_partition_set_origin("fake_partition_set")
+        for backfill_id in ["backfill_1", "backfill_2"]:
+            storage.add_backfill(
+                PartitionBackfill(
+                    backfill_id,
+                    partition_set_origin=origin,
+                    status=BulkActionStatus.REQUESTED,
+                    partition_names=["a", "b", "c"],
+                    from_failure=False,
+                    tags={},
+                    backfill_timestamp=time.time(),
+                )
+            )
+
+        with instance_for_storage(storage) as instance:
+            loading_context = LoadingContextForTest(instance)
+            backfills = PartitionBackfill.blocking_get_many(
+                loading_context, ["backfill_2", "missing", "backfill_1"]
+            )
+            assert [backfill.backfill_id for backfill in backfills] == ["backfill_2", "backfill_1"]
+            assert PartitionBackfill.blocking_get(loading_context, "missing") is None
+
+            async def _gen_backfills():
+                return await PartitionBackfill.gen_many(loading_context, ["backfill_1", "missing"])
+
+            backfill, missing = asyncio.run(_gen_backfills())
+            assert backfill and backfill.backfill_id == "backfill_1"
+            assert missing is None
+
     def test_secondary_index(self, storage):
         self._skip_in_memory(storage)
 
@@ -145,7 +145,7 @@ class LoadableThing(NamedTuple("_LoadableThing", [("key", str), ("val", int)]),
     def _blocking_batch_load(
         cls, keys: Iterable[str], context: mock.MagicMock
     ) -> list["LoadableThing"]:
-        context.query(keys)
+        context.instance.query(keys)
         return [LoadableThing(key, random.randint(0, 100000)) for key in keys]
 
 
@@ -196,3 +196,42 @@ def test_sync_loadable_by() -> None:
     d2 = LoadableThing.blocking_get(context, "d")
     assert d1 == d2
     assert context.instance.query.call_count == 2
+
+
+def test_blocking_prefetch() -> None:
+    async def _test() -> None:
+        context = BasicLoadingContext()
+
+        LoadableThing.blocking_prefetch(context, ["a", "b", "c"])
+        context.instance.query.assert_called_once_with(["a", "b", "c"])
+
+        # both the blocking and non-blocking loaders are served from the prefetched values
+        a1 = LoadableThing.blocking_get(context, "a")
+        a2, b2 = await LoadableThing.gen_many(context, ["a", "b"])
+        assert a1 is a2
+        assert b2 is LoadableThing.blocking_get(context, "b")
+        assert context.instance.query.call_count == 1
+
+    asyncio.run(_test())
+
+
+def test_prime_loaders_from() -> None:
+    prefetch_context = BasicLoadingContext()
+    LoadableThing.blocking_get_many(prefetch_context, ["a", "b", "c"])
+    prefetch_context.instance.query.assert_called_once_with(["a", "b", "c"])
+
+    async def _test() -> None:
+        context = BasicLoadingContext()
+        context.prime_loaders_from(prefetch_context.loaders)
+
+        # both the blocking and non-blocking loaders are served from the prefetched values
+        a1 = LoadableThing.blocking_get(context, "a")
+        a2, b2 = await LoadableThing.gen_many(context, ["a", "b"])
+        assert a1 is a2
+        assert b2 is LoadableThing.blocking_get(prefetch_context, "b")
+        context.instance.query.assert_not_called()
+
+        await LoadableThing.gen(context, "d")
+        context.instance.query.assert_called_once_with(["d"])
+
+    asyncio.run(_test())
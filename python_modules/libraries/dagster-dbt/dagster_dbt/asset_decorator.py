@@ -71,7 +71,7 @@ def dbt_assets(
         required_resource_keys (Optional[Set[str]]): Set of required resource handles.
         project (Optional[DbtProject]): A DbtProject instance which provides a pointer to the dbt
             project location and manifest. Not required, but needed to attach code references from
-            model code to Dagster assets.
+            model code to Dagster assets, and to cache the asset specs built from the manifest.
         retry_policy (Optional[RetryPolicy]): The retry policy for the op that computes the asset.
         pool (Optional[str]): A string that identifies the concurrency pool that governs the dbt
             assets' execution.
@@ -32,7 +32,7 @@ def build_dbt_asset_specs(
             to exclude. Defaults to "".
         project (Optional[DbtProject]): A DbtProject instance which provides a pointer to the dbt
             project location and manifest. Not required, but needed to attach code references from
-            model code to Dagster assets.
+            model code to Dagster assets, and to cache the asset specs built from the manifest.
 
     Returns:
         Sequence[AssetSpec]: A list of asset specs.
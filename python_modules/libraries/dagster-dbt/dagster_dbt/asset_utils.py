@@ -35,13 +35,10 @@
 )
 from dagster._core.types.dagster_type import Nothing
 
+from dagster_dbt.dbt_asset_spec_cache import read_cached_specs, write_cached_specs
+from dagster_dbt.dbt_manifest_index import DbtManifestIndex, get_manifest_index
 from dagster_dbt.metadata_set import DbtMetadataSet
-from dagster_dbt.utils import (
-    ASSET_RESOURCE_TYPES,
-    dagster_name_fn,
-    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
-    select_unique_ids_from_manifest,
-)
+from dagster_dbt.utils import ASSET_RESOURCE_TYPES, dagster_name_fn
 
 if TYPE_CHECKING:
     from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator, DbtManifestWrapper
@@ -570,20 +567,19 @@ def default_asset_check_fn(
     if not dagster_dbt_translator.settings.enable_asset_checks:
         return None
 
+    manifest_index = get_manifest_index(manifest)
     test_resource_props = dbt_nodes[test_unique_id]
-    parent_unique_ids: set[str] = set(manifest["parent_map"].get(test_unique_id, []))
+    parent_unique_ids: set[str] = set(manifest_index.get_parent_unique_ids(test_unique_id))
 
-    asset_check_key = get_asset_check_key_for_test(
-        manifest=manifest,
-        dagster_dbt_translator=dagster_dbt_translator,
-        test_unique_id=test_unique_id,
+    asset_check_key = manifest_index.get_asset_check_key_for_test(
+        dagster_dbt_translator, test_unique_id
     )
 
     if not (asset_check_key and asset_check_key.asset_key == asset_key):
         return None
 
     additional_deps = {
-        dagster_dbt_translator.get_asset_key(dbt_nodes[parent_id])
+        manifest_index.get_asset_key(dagster_dbt_translator, parent_id)
         for parent_id in parent_unique_ids
     }
     additional_deps.discard(asset_key)
@@ -761,7 +757,9 @@ def get_asset_spec(
     # add integration-specific metadata to the spec
     spec = spec.merge_attributes(
         metadata={
-            DAGSTER_DBT_MANIFEST_METADATA_KEY: DbtManifestWrapper(manifest=manifest),
+            DAGSTER_DBT_MANIFEST_METADATA_KEY: DbtManifestWrapper(
+                manifest=manifest, manifest_index=get_manifest_index(manifest)
+            ),
             DAGSTER_DBT_TRANSLATOR_METADATA_KEY: translator,
             DAGSTER_DBT_UNIQUE_ID_METADATA_KEY: resource_props["unique_id"],
         }
@@ -792,13 +790,95 @@ def build_dbt_specs(
     io_manager_key: Optional[str],
     project: Optional["DbtProject"],
 ) -> tuple[Sequence[AssetSpec], Sequence[AssetCheckSpec]]:
-    dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(manifest)
-    group_props = {group["name"]: group for group in manifest.get("groups", {}).values()}
+    from dagster_dbt.dagster_dbt_translator import DbtManifestWrapper
 
-    selected_unique_ids = select_unique_ids_from_manifest(
-        select=select, exclude=exclude, manifest_json=manifest
+    manifest_index = get_manifest_index(
+        manifest, cache_dir=project.manifest_path.parent if project else None
     )
 
+    cached_specs = None
+    if translator.settings.enable_asset_spec_cache:
+        if not project:
+            raise DagsterInvalidDefinitionError(
+                "enable_asset_spec_cache requires a DbtProject to be supplied"
+                " to the @dbt_assets decorator."
+            )
+
+        cached_specs = read_cached_specs(manifest_index, translator, select, exclude, project)
+
+    if cached_specs:
+        specs, check_specs = cached_specs
+
+        # add back the integration-specific metadata, which is not cached
+        manifest_wrapper = DbtManifestWrapper(manifest=manifest, manifest_index=manifest_index)
+        specs = [
+            spec.merge_attributes(
+                metadata={
+                    DAGSTER_DBT_MANIFEST_METADATA_KEY: manifest_wrapper,
+                    DAGSTER_DBT_TRANSLATOR_METADATA_KEY: translator,
+                }
+            )
+            for spec in specs
+        ]
+    else:
+        specs, check_specs = _build_dbt_specs(
+            translator=translator,
+            manifest_index=manifest_index,
+            select=select,
+            exclude=exclude,
+            project=project,
+        )
+
+        if translator.settings.enable_asset_spec_cache and project:
+            write_cached_specs(
+                manifest_index,
+                translator,
+                select,
+                exclude,
+                project,
+                specs=[
+                    spec.replace_attributes(
+                        metadata={
+                            key: value
+                            for key, value in spec.metadata.items()
+                            if key
+                            not in (
+                                DAGSTER_DBT_MANIFEST_METADATA_KEY,
+                                DAGSTER_DBT_TRANSLATOR_METADATA_KEY,
+                            )
+                        }
+                    )
+                    for spec in specs
+                ],
+                check_specs=check_specs,
+            )
+
+    # add the io manager key and set the dagster type to Nothing
+    if io_manager_key is not None:
+        specs = [
+            spec.with_io_manager_key(io_manager_key).merge_attributes(
+                metadata={SYSTEM_METADATA_KEY_DAGSTER_TYPE: Nothing}
+            )
+            for spec in specs
+        ]
+
+    return specs, check_specs
+
+
+def _build_dbt_specs(
+    *,
+    translator: "DagsterDbtTranslator",
+    manifest_index: DbtManifestIndex,
+    select: str,
+    exclude: str,
+    project: Optional["DbtProject"],
+) -> tuple[list[AssetSpec], list[AssetCheckSpec]]:
+    manifest = manifest_index.manifest
+    dbt_nodes = manifest_index.dbt_nodes
+    group_props = {group["name"]: group for group in manifest.get("groups", {}).values()}
+
+    selected_unique_ids = manifest_index.select_unique_ids(select=select, exclude=exclude)
+
     specs: list[AssetSpec] = []
     check_specs: list[AssetCheckSpec] = []
     key_by_unique_id: dict[str, AssetKey] = {}
@@ -813,16 +893,10 @@ def build_dbt_specs(
         # get the spec for the given node
         spec = get_asset_spec(translator, manifest, dbt_nodes, group_props, project, resource_props)
         key_by_unique_id[unique_id] = spec.key
-
-        # add the io manager key and set the dagster type to Nothing
-        if io_manager_key is not None:
-            spec = spec.with_io_manager_key(io_manager_key)
-            spec = spec.merge_attributes(metadata={SYSTEM_METADATA_KEY_DAGSTER_TYPE: Nothing})
-
         specs.append(spec)
 
         # add check specs associated with the asset
-        for child_unique_id in manifest["child_map"][unique_id]:
+        for child_unique_id in manifest_index.get_child_unique_ids(unique_id):
             if not child_unique_id.startswith("test"):
                 continue
 
@@ -836,7 +910,7 @@ def build_dbt_specs(
         # assets. note that this step may need to change once the translator is updated
         # to no longer rely on `get_asset_key` as a standalone method
         for upstream_id in get_upstream_unique_ids(dbt_nodes, resource_props):
-            key_by_unique_id[upstream_id] = translator.get_asset_key(dbt_nodes[upstream_id])
+            key_by_unique_id[upstream_id] = manifest_index.get_asset_key(translator, upstream_id)
 
     _validate_asset_keys(translator, dbt_nodes, key_by_unique_id)
     return specs, check_specs
@@ -889,60 +963,6 @@ def get_asset_check_key_for_test(
     dagster_dbt_translator: "DagsterDbtTranslator",
     test_unique_id: str,
 ) -> Optional[AssetCheckKey]:
-    if not test_unique_id.startswith("test"):
-        return None
-
-    test_resource_props = manifest["nodes"][test_unique_id]
-    upstream_unique_ids: AbstractSet[str] = set(test_resource_props["depends_on"]["nodes"])
-
-    # If the test is generic, it will have an attached node that we can use.
-    attached_node_unique_id = test_resource_props.get("attached_node")
-
-    # If the test is singular, infer the attached node from the upstream nodes.
-    if len(upstream_unique_ids) == 1:
-        [attached_node_unique_id] = upstream_unique_ids
-
-    # If the test is singular, but has multiple dependencies, infer the attached node from
-    # from the dbt meta.
-    attached_node_ref = (
-        (
-            test_resource_props.get("config", {}).get("meta", {})
-            or test_resource_props.get("meta", {})
-        )
-        .get("dagster", {})
-        .get("ref", {})
-    )
-
-    # Attempt to find the attached node from the ref.
-    if attached_node_ref:
-        ref_name, ref_package, ref_version = (
-            attached_node_ref["name"],
-            attached_node_ref.get("package"),
-            attached_node_ref.get("version"),
-        )
-
-        project_name = manifest["metadata"]["project_name"]
-        if not ref_package:
-            ref_package = project_name
-
-        unique_id_by_ref: Mapping[tuple[str, str, Optional[str]], str] = {
-            (
-                dbt_resource_props["name"],
-                dbt_resource_props["package_name"],
-                dbt_resource_props.get("version"),
-            ): unique_id
-            for unique_id, dbt_resource_props in manifest["nodes"].items()
-        }
-
-        attached_node_unique_id = unique_id_by_ref.get((ref_name, ref_package, ref_version))
-
-    if not attached_node_unique_id:
-        return None
-
-    return AssetCheckKey(
-        name=test_resource_props["name"],
-        asset_key=dagster_dbt_translator.get_asset_key(
-            manifest["nodes"].get(attached_node_unique_id)
-            or manifest["sources"].get(attached_node_unique_id)
-        ),
+    return get_manifest_index(manifest).get_asset_check_key_for_test(
+        dagster_dbt_translator, test_unique_id
     )
@@ -1,4 +1,4 @@
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast
 
@@ -14,7 +14,11 @@
 from dagster._core.definitions.asset_check_evaluation import AssetCheckEvaluation
 from dagster._core.definitions.metadata import TableMetadataSet, TextMetadataValue
 from dagster._core.errors import DagsterInvalidPropertyError
-from dagster._core.utils import exhaust_iterator_and_yield_results_with_exception, imap
+from dagster._core.utils import (
+    exhaust_iterator_and_yield_results_with_exception,
+    imap,
+    imap_batched,
+)
 from typing_extensions import TypeVar
 
 from dagster_dbt.asset_utils import default_metadata_from_dbt_resource_props
@@ -35,6 +39,10 @@
 # will be able to see the inner type of the iterator, rather than just `DbtEventIterator`.
 T = TypeVar("T", bound=DbtDagsterEventType)
 
+# The default time to wait for a batch of built dbt models to fill up before fetching their
+# metadata, when metadata is fetched in batches.
+DEFAULT_METADATA_BATCH_WINDOW_SECONDS = 1.0
+
 
 def _get_dbt_resource_props_from_event(
     invocation: "DbtCliInvocation", event: DbtDagsterEventType
@@ -63,79 +71,135 @@ def _fetch_column_metadata(
     dbt_resource_props = _get_dbt_resource_props_from_event(invocation, event)
 
     with adapter.connection_named(f"column_metadata_{dbt_resource_props['unique_id']}"):
+        return _build_column_metadata(invocation, dbt_resource_props, with_column_lineage)
+
+
+def _fetch_column_metadata_batch(
+    invocation: "DbtCliInvocation",
+    events: Sequence[DbtDagsterEventType],
+    with_column_lineage: bool,
+) -> Sequence[Optional[dict[str, Any]]]:
+    """Threaded task which fetches column schema and lineage metadata for a batch of dbt models,
+    using a single connection for the batch rather than one connection per model.
+    """
+    adapter = check.not_none(invocation.adapter)
+
+    dbt_resource_props_list = [
+        _get_dbt_resource_props_from_event(invocation, event) for event in events
+    ]
+
+    with adapter.connection_named(
+        f"column_metadata_batch_{dbt_resource_props_list[0]['unique_id']}"
+    ):
+        return [
+            _build_column_metadata(invocation, dbt_resource_props, with_column_lineage)
+            for dbt_resource_props in dbt_resource_props_list
+        ]
+
+
+def _build_column_metadata(
+    invocation: "DbtCliInvocation",
+    dbt_resource_props: dict[str, Any],
+    with_column_lineage: bool,
+) -> Optional[dict[str, Any]]:
+    """Fetches the column schema and lineage metadata for a dbt model, using the adapter's open
+    connection.
+    """
+    adapter = check.not_none(invocation.adapter)
+
+    try:
+        cols = invocation._get_columns_from_dbt_resource_props(  # noqa: SLF001
+            adapter=adapter, dbt_resource_props=dbt_resource_props
+        ).columns
+    except Exception as e:
+        logger.warning(
+            "An error occurred while fetching column schema metadata for the dbt resource"
+            f" `{dbt_resource_props['original_file_path']}`."
+            " Column metadata will not be included in the event.\n\n"
+            f"Exception: {e}",
+            exc_info=True,
+        )
+        return {}
+
+    schema_metadata = {}
+    try:
+        column_schema_data = {col.name: {"data_type": col.data_type} for col in cols}
+        col_data = {"columns": column_schema_data}
+        schema_metadata = default_metadata_from_dbt_resource_props(col_data)
+    except Exception as e:
+        logger.warning(
+            "An error occurred while building column schema metadata from data"
+            f" `{col_data}` for the dbt resource"
+            f" `{dbt_resource_props['original_file_path']}`."
+            " Column schema metadata will not be included in the event.\n\n"
+            f"Exception: {e}",
+            exc_info=True,
+        )
+
+    lineage_metadata = {}
+    if with_column_lineage:
         try:
-            cols = invocation._get_columns_from_dbt_resource_props(  # noqa: SLF001
-                adapter=adapter, dbt_resource_props=dbt_resource_props
-            ).columns
-        except Exception as e:
-            logger.warning(
-                "An error occurred while fetching column schema metadata for the dbt resource"
-                f" `{dbt_resource_props['original_file_path']}`."
-                " Column metadata will not be included in the event.\n\n"
-                f"Exception: {e}",
-                exc_info=True,
+            parents = {}
+            parent_unique_ids = invocation.manifest["parent_map"].get(
+                dbt_resource_props["unique_id"], []
+            )
+            for parent_unique_id in parent_unique_ids:
+                dbt_parent_resource_props = invocation.manifest["nodes"].get(
+                    parent_unique_id
+                ) or invocation.manifest["sources"].get(parent_unique_id)
+
+                parent_name, parent_columns = invocation._get_columns_from_dbt_resource_props(  # noqa: SLF001
+                    adapter=adapter, dbt_resource_props=dbt_parent_resource_props
+                )
+
+                parents[parent_name] = {
+                    col.name: {"data_type": col.data_type} for col in parent_columns
+                }
+
+            lineage_metadata = _build_column_lineage_metadata(
+                event_history_metadata=EventHistoryMetadata(
+                    columns=column_schema_data,
+                    parents=parents,
+                ),
+                dbt_resource_props=dbt_resource_props,
+                manifest=invocation.manifest,
+                dagster_dbt_translator=invocation.dagster_dbt_translator,
+                target_path=invocation.target_path,
             )
-            return {}
 
-        schema_metadata = {}
-        try:
-            column_schema_data = {col.name: {"data_type": col.data_type} for col in cols}
-            col_data = {"columns": column_schema_data}
-            schema_metadata = default_metadata_from_dbt_resource_props(col_data)
         except Exception as e:
             logger.warning(
-                "An error occurred while building column schema metadata from data"
-                f" `{col_data}` for the dbt resource"
+                "An error occurred while building column lineage metadata for the dbt resource"
                 f" `{dbt_resource_props['original_file_path']}`."
-                " Column schema metadata will not be included in the event.\n\n"
+                " Lineage metadata will not be included in the event.\n\n"
                 f"Exception: {e}",
                 exc_info=True,
             )
 
-        lineage_metadata = {}
-        if with_column_lineage:
-            try:
-                parents = {}
-                parent_unique_ids = invocation.manifest["parent_map"].get(
-                    dbt_resource_props["unique_id"], []
-                )
-                for parent_unique_id in parent_unique_ids:
-                    dbt_parent_resource_props = invocation.manifest["nodes"].get(
-                        parent_unique_id
-                    ) or invocation.manifest["sources"].get(parent_unique_id)
+    return {
+        **schema_metadata,
+        **lineage_metadata,
+    }
 
-                    parent_name, parent_columns = invocation._get_columns_from_dbt_resource_props(  # noqa: SLF001
-                        adapter=adapter, dbt_resource_props=dbt_parent_resource_props
-                    )
 
-                    parents[parent_name] = {
-                        col.name: {"data_type": col.data_type} for col in parent_columns
-                    }
-
-                lineage_metadata = _build_column_lineage_metadata(
-                    event_history_metadata=EventHistoryMetadata(
-                        columns=column_schema_data,
-                        parents=parents,
-                    ),
-                    dbt_resource_props=dbt_resource_props,
-                    manifest=invocation.manifest,
-                    dagster_dbt_translator=invocation.dagster_dbt_translator,
-                    target_path=invocation.target_path,
-                )
+def _get_row_count_relation_name(
+    invocation: "DbtCliInvocation",
+    event: DbtDagsterEventType,
+) -> Optional[str]:
+    """Returns the relation to count the rows of for an event, if any."""
+    if not isinstance(event, (AssetMaterialization, Output)):
+        return None
 
-            except Exception as e:
-                logger.warning(
-                    "An error occurred while building column lineage metadata for the dbt resource"
-                    f" `{dbt_resource_props['original_file_path']}`."
-                    " Lineage metadata will not be included in the event.\n\n"
-                    f"Exception: {e}",
-                    exc_info=True,
-                )
+    dbt_resource_props = _get_dbt_resource_props_from_event(invocation, event)
+    is_view = dbt_resource_props["config"]["materialized"] == "view"
+
+    # Avoid counting rows for views, since they may include complex SQL queries
+    # that are costly to execute. We can revisit this in the future if there is
+    # a demand for it.
+    if is_view:
+        return None
 
-        return {
-            **schema_metadata,
-            **lineage_metadata,
-        }
+    return dbt_resource_props["relation_name"]
 
 
 def _fetch_row_count_metadata(
@@ -145,23 +209,14 @@ def _fetch_row_count_metadata(
     """Threaded task which fetches row counts for materialized dbt models in a dbt run
     once they are built, and attaches the row count as metadata to the event.
     """
-    if not isinstance(event, (AssetMaterialization, Output)):
+    relation_name = _get_row_count_relation_name(invocation, event)
+    if not relation_name:
         return None
 
     adapter = check.not_none(invocation.adapter)
 
-    dbt_resource_props = _get_dbt_resource_props_from_event(invocation, event)
-    is_view = dbt_resource_props["config"]["materialized"] == "view"
-
-    # Avoid counting rows for views, since they may include complex SQL queries
-    # that are costly to execute. We can revisit this in the future if there is
-    # a demand for it.
-    if is_view:
-        return None
-
-    unique_id = dbt_resource_props["unique_id"]
+    unique_id = _get_dbt_resource_props_from_event(invocation, event)["unique_id"]
     logger.debug("Fetching row count for %s", unique_id)
-    relation_name = dbt_resource_props["relation_name"]
 
     try:
         with adapter.connection_named(f"row_count_{unique_id}"):
@@ -189,6 +244,56 @@ def _fetch_row_count_metadata(
         return None
 
 
+def _fetch_row_count_metadata_batch(
+    invocation: "DbtCliInvocation",
+    events: Sequence[DbtDagsterEventType],
+) -> Sequence[Optional[dict[str, Any]]]:
+    """Threaded task which fetches row counts for a batch of materialized dbt models with a
+    single query, rather than one query per model.
+
+    If the batched query fails, e.g. because one of the relations cannot be queried, the row
+    counts are fetched for each model individually.
+    """
+    relation_names_by_index = {
+        i: relation_name
+        for i, event in enumerate(events)
+        if (relation_name := _get_row_count_relation_name(invocation, event))
+    }
+    if not relation_names_by_index:
+        return [None] * len(events)
+
+    adapter = check.not_none(invocation.adapter)
+
+    logger.debug("Fetching row counts for a batch of %s dbt models", len(relation_names_by_index))
+    # some adapters do not output the column names, so we select the index of each relation in
+    # the batch alongside its row count, and index the results by position
+    query = "\nUNION ALL\n".join(
+        f"SELECT {i} AS batch_index, count(*) AS row_count FROM {relation_name}"
+        for i, relation_name in relation_names_by_index.items()
+    )
+
+    try:
+        first_unique_id = _get_dbt_resource_props_from_event(
+            invocation, events[next(iter(relation_names_by_index))]
+        )["unique_id"]
+        with adapter.connection_named(f"row_count_batch_{first_unique_id}"):
+            query_result = adapter.execute(query, fetch=True)
+        row_counts_by_index = {int(row[0]): row[1] for row in query_result[1]}
+    except Exception as e:
+        logger.warning(
+            f"An error occurred while fetching row counts for a batch of"
+            f" {len(relation_names_by_index)} dbt models. Row counts will be fetched for each"
+            " model individually.\n\n"
+            f"Exception: {e}"
+        )
+        return [_fetch_row_count_metadata(invocation, event) for event in events]
+
+    return [
+        {**TableMetadataSet(row_count=row_counts_by_index[i])} if i in row_counts_by_index else None
+        for i in range(len(events))
+    ]
+
+
 class DbtEventIterator(Iterator[T]):
     """A wrapper around an iterator of dbt events which contains additional methods for
     post-processing the events, such as fetching row counts for materialized tables.
@@ -211,22 +316,44 @@ def __iter__(self) -> "DbtEventIterator[T]":
     @public
     def fetch_row_counts(
         self,
+        *,
+        batch_size: Optional[int] = None,
+        batch_window_seconds: float = DEFAULT_METADATA_BATCH_WINDOW_SECONDS,
+        max_concurrency: Optional[int] = None,
     ) -> "DbtEventIterator[Union[Output, AssetMaterialization, AssetCheckResult, AssetObservation, AssetCheckEvaluation]]":
         """Functionality which will fetch row counts for materialized dbt
         models in a dbt run once they are built. Note that row counts will not be fetched
         for views, since this requires running the view's SQL query which may be costly.
 
+        Args:
+            batch_size (Optional[int]): If set, the row counts of up to this many built models are
+                fetched with a single query, rather than one query per model.
+            batch_window_seconds (float): When batching, the maximum time to wait for a batch to
+                fill up before its row counts are fetched. Defaults to 1 second.
+            max_concurrency (Optional[int]): The maximum number of queries to run concurrently.
+                Defaults to the ``postprocessing_threadpool_num_threads`` of the dbt invocation.
+
         Returns:
             Iterator[Union[Output, AssetMaterialization, AssetObservation, AssetCheckResult]]:
                 A set of corresponding Dagster events for dbt models, with row counts attached,
                 yielded in the order they are emitted by dbt.
         """
-        return self._attach_metadata(_fetch_row_count_metadata)
+        return self._attach_metadata(
+            _fetch_row_count_metadata,
+            batch_fn=_fetch_row_count_metadata_batch,
+            batch_size=batch_size,
+            batch_window_seconds=batch_window_seconds,
+            max_concurrency=max_concurrency,
+        )
 
     @public
     def fetch_column_metadata(
         self,
         with_column_lineage: bool = True,
+        *,
+        batch_size: Optional[int] = None,
+        batch_window_seconds: float = DEFAULT_METADATA_BATCH_WINDOW_SECONDS,
+        max_concurrency: Optional[int] = None,
     ) -> "DbtEventIterator[Union[Output, AssetMaterialization, AssetCheckResult, AssetObservation, AssetCheckEvaluation]]":
         """Functionality which will fetch column schema metadata for dbt models in a run
         once they're built. It will also fetch schema information for upstream models and generate
@@ -234,6 +361,13 @@ def fetch_column_metadata(
 
         Args:
             generate_column_lineage (bool): Whether to generate column lineage metadata using sqlglot.
+            batch_size (Optional[int]): If set, the column metadata of up to this many built models
+                is fetched over a single connection, rather than one connection per model.
+            batch_window_seconds (float): When batching, the maximum time to wait for a batch to
+                fill up before its column metadata is fetched. Defaults to 1 second.
+            max_concurrency (Optional[int]): The maximum number of connections to fetch column
+                metadata over concurrently. Defaults to the ``postprocessing_threadpool_num_threads``
+                of the dbt invocation.
 
         Returns:
             Iterator[Union[Output, AssetMaterialization, AssetObservation, AssetCheckResult]]:
@@ -243,11 +377,29 @@ def fetch_column_metadata(
         fetch_metadata = lambda invocation, event: _fetch_column_metadata(
             invocation, event, with_column_lineage
         )
-        return self._attach_metadata(fetch_metadata)
+        fetch_metadata_batch = lambda invocation, events: _fetch_column_metadata_batch(
+            invocation, events, with_column_lineage
+        )
+        return self._attach_metadata(
+            fetch_metadata,
+            batch_fn=fetch_metadata_batch,
+            batch_size=batch_size,
+            batch_window_seconds=batch_window_seconds,
+            max_concurrency=max_concurrency,
+        )
 
     def _attach_metadata(
         self,
         fn: Callable[["DbtCliInvocation", DbtDagsterEventType], Optional[dict[str, Any]]],
+        batch_fn: Optional[
+            Callable[
+                ["DbtCliInvocation", Sequence[DbtDagsterEventType]],
+                Sequence[Optional[dict[str, Any]]],
+            ]
+        ] = None,
+        batch_size: Optional[int] = None,
+        batch_window_seconds: float = DEFAULT_METADATA_BATCH_WINDOW_SECONDS,
+        max_concurrency: Optional[int] = None,
     ) -> "DbtEventIterator[DbtDagsterEventType]":
         """Runs a threaded task to attach metadata to each event in the iterator.
 
@@ -255,20 +407,42 @@ def _attach_metadata(
             fn (Callable[[DbtCliInvocation, DbtDagsterEventType], Optional[Dict[str, Any]]]):
                 A function which takes a DbtCliInvocation and a DbtDagsterEventType and returns
                 a dictionary of metadata to attach to the event.
+            batch_fn (Optional[Callable[[DbtCliInvocation, Sequence[DbtDagsterEventType]], Sequence[Optional[Dict[str, Any]]]]]):
+                A function which takes a DbtCliInvocation and a batch of DbtDagsterEventTypes and
+                returns a dictionary of metadata to attach to each event of the batch. Used in
+                place of `fn` if `batch_size` is set.
+            batch_size (Optional[int]): The maximum number of events to pass to `batch_fn`.
+            batch_window_seconds (float): The maximum time to wait for a batch to fill up.
+            max_concurrency (Optional[int]): The maximum number of threads to run the task in.
 
         Returns:
              Iterator[Union[Output, AssetMaterialization, AssetObservation, AssetCheckResult]]:
                 A set of corresponding Dagster events for dbt models, with any metadata output
                 by the function attached, yielded in the order they are emitted by dbt.
         """
+        check.opt_int_param(batch_size, "batch_size")
+        check.numeric_param(batch_window_seconds, "batch_window_seconds")
+        check.opt_int_param(max_concurrency, "max_concurrency")
+        check.invariant(
+            batch_size is None or batch_fn is not None,
+            "batch_fn must be provided to attach metadata in batches",
+        )
 
-        def _map_fn(event: DbtDagsterEventType) -> DbtDagsterEventType:
-            result = fn(self._dbt_cli_invocation, event)
+        def _with_metadata(
+            event: DbtDagsterEventType, result: Optional[dict[str, Any]]
+        ) -> DbtDagsterEventType:
             if result is None:
                 return event
 
             return event.with_metadata({**event.metadata, **result})
 
+        def _map_fn(event: DbtDagsterEventType) -> DbtDagsterEventType:
+            return _with_metadata(event, fn(self._dbt_cli_invocation, event))
+
+        def _batch_map_fn(events: Sequence[DbtDagsterEventType]) -> Sequence[DbtDagsterEventType]:
+            results = check.not_none(batch_fn)(self._dbt_cli_invocation, events)
+            return [_with_metadata(event, result) for event, result in zip(events, results)]
+
         # If the adapter is DuckDB, we need to wait for the dbt CLI process to complete
         # so that the DuckDB lock is released. This is because DuckDB does not allow for
         # opening multiple connections to the same database when a write connection, such
@@ -295,14 +469,26 @@ def _threadpool_wrap_map_fn() -> (
             ]
         ):
             with ThreadPoolExecutor(
-                max_workers=self._dbt_cli_invocation.postprocessing_threadpool_num_threads,
+                max_workers=max_concurrency
+                or self._dbt_cli_invocation.postprocessing_threadpool_num_threads,
                 thread_name_prefix=f"dbt_attach_metadata_{fn.__name__}",
             ) as executor:
-                yield from imap(
-                    executor=executor,
-                    iterable=event_stream,
-                    func=_map_fn,
-                )
+                if batch_size:
+                    # Group the events into batches, so that the metadata of the models in a
+                    # batch can be fetched with fewer queries and connections.
+                    yield from imap_batched(
+                        executor=executor,
+                        iterable=event_stream,
+                        func=_batch_map_fn,
+                        batch_size=batch_size,
+                        batch_window_seconds=batch_window_seconds,
+                    )
+                else:
+                    yield from imap(
+                        executor=executor,
+                        iterable=event_stream,
+                        func=_map_fn,
+                    )
 
         return DbtEventIterator(
             _threadpool_wrap_map_fn(),
@@ -1,5 +1,5 @@
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from dagster import (
@@ -24,6 +24,7 @@
     default_metadata_from_dbt_resource_props,
     default_owners_from_dbt_resource_props,
 )
+from dagster_dbt.dbt_manifest_index import DbtManifestIndex
 
 
 @dataclass(frozen=True)
@@ -39,12 +40,18 @@ class DagsterDbtTranslatorSettings:
             Defaults to False.
         enable_dbt_selection_by_name (bool): Whether to enable selecting dbt resources by name,
             rather than fully qualified name. Defaults to False.
+        enable_asset_spec_cache (bool): Whether to cache the asset specs built from the dbt
+            manifest in the target directory of the dbt project, so that they are not rebuilt
+            while the manifest, the selection and the translator are unchanged. Requires a
+            DbtProject, and that the attributes of the translator are primitive values, or lists,
+            mappings or dataclasses of them. Defaults to False.
     """
 
     enable_asset_checks: bool = True
     enable_duplicate_source_asset_keys: bool = False
     enable_code_references: bool = False
     enable_dbt_selection_by_name: bool = False
+    enable_asset_spec_cache: bool = False
 
 
 class DagsterDbtTranslator:
@@ -560,6 +567,8 @@ def get_partitions_def(self, dbt_resource_props: Mapping[str, Any]) -> Optional[
 @dataclass
 class DbtManifestWrapper:
     manifest: Mapping[str, Any]
+    # Keeps the index of the manifest alive for as long as the definitions built from it.
+    manifest_index: Optional[DbtManifestIndex] = field(default=None, compare=False, repr=False)
 
 
 def validate_translator(dagster_dbt_translator: DagsterDbtTranslator) -> DagsterDbtTranslator:
@@ -0,0 +1,287 @@
+import dataclasses
+import hashlib
+import inspect
+import os
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+
+from dagster import (
+    AssetCheckSpec,
+    AssetDep,
+    AssetKey,
+    AssetSpec,
+    AutomationCondition,
+    FreshnessPolicy,
+    PartitionMapping,
+    get_dagster_logger,
+)
+from dagster._core.remote_representation.external_data import PartitionsSnap
+from dagster._record import record
+from dagster._serdes import deserialize_value, serialize_value, whitelist_for_serdes
+from dagster.version import __version__ as dagster_version
+
+from dagster_dbt.dbt_manifest_index import DbtManifestIndex
+from dagster_dbt.version import __version__ as dagster_dbt_version
+
+if TYPE_CHECKING:
+    from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
+    from dagster_dbt.dbt_project import DbtProject
+
+logger = get_dagster_logger()
+
+
+@whitelist_for_serdes
+@record
+class DbtCachedAssetDep:
+    asset_key: AssetKey
+    partition_mapping: Optional[PartitionMapping]
+
+
+@whitelist_for_serdes
+@record
+class DbtCachedAssetSpec:
+    """The attributes of an AssetSpec built for a dbt resource, in a serializable form."""
+
+    key: AssetKey
+    deps: Sequence[DbtCachedAssetDep]
+    description: Optional[str]
+    metadata: Mapping[str, Any]
+    skippable: bool
+    group_name: Optional[str]
+    code_version: Optional[str]
+    automation_condition: Optional[AutomationCondition]
+    freshness_policy: Optional[FreshnessPolicy]
+    owners: Sequence[str]
+    tags: Mapping[str, str]
+    partitions: Optional[PartitionsSnap]
+
+    @staticmethod
+    def from_asset_spec(spec: AssetSpec) -> "DbtCachedAssetSpec":
+        return DbtCachedAssetSpec(
+            key=spec.key,
+            deps=[
+                DbtCachedAssetDep(asset_key=dep.asset_key, partition_mapping=dep.partition_mapping)
+                for dep in spec.deps
+            ],
+            description=spec.description,
+            metadata=spec.metadata,
+            skippable=spec.skippable,
+            group_name=spec.group_name,
+            code_version=spec.code_version,
+            automation_condition=spec.automation_condition,
+            freshness_policy=spec.freshness_policy,
+            owners=spec.owners,
+            tags=spec.tags,
+            partitions=PartitionsSnap.from_def(spec.partitions_def)
+            if spec.partitions_def
+            else None,
+        )
+
+    def to_asset_spec(self) -> AssetSpec:
+        return AssetSpec(
+            key=self.key,
+            deps=[
+                AssetDep(asset=dep.asset_key, partition_mapping=dep.partition_mapping)
+                for dep in self.deps
+            ],
+            description=self.description,
+            metadata=self.metadata,
+            skippable=self.skippable,
+            group_name=self.group_name,
+            code_version=self.code_version,
+            automation_condition=self.automation_condition,
+            freshness_policy=self.freshness_policy,
+            owners=self.owners,
+            # kinds are stored as tags
+            tags=self.tags,
+            partitions_def=self.partitions.get_partitions_definition() if self.partitions else None,
+        )
+
+
+@whitelist_for_serdes
+@record
+class DbtCachedAssetCheckSpec:
+    """The attributes of an AssetCheckSpec built for a dbt test, in a serializable form."""
+
+    name: str
+    asset_key: AssetKey
+    description: Optional[str]
+    additional_deps: Sequence[AssetKey]
+    metadata: Mapping[str, Any]
+
+    @staticmethod
+    def from_asset_check_spec(check_spec: AssetCheckSpec) -> "DbtCachedAssetCheckSpec":
+        return DbtCachedAssetCheckSpec(
+            name=check_spec.name,
+            asset_key=check_spec.asset_key,
+            description=check_spec.description,
+            additional_deps=[dep.asset_key for dep in check_spec.additional_deps],
+            metadata=check_spec.metadata,
+        )
+
+    def to_asset_check_spec(self) -> AssetCheckSpec:
+        return AssetCheckSpec(
+            name=self.name,
+            asset=self.asset_key,
+            description=self.description,
+            additional_deps=self.additional_deps,
+            metadata=self.metadata,
+        )
+
+
+@whitelist_for_serdes
+@record
+class DbtCachedSpecs:
+    specs: Sequence[DbtCachedAssetSpec]
+    check_specs: Sequence[DbtCachedAssetCheckSpec]
+
+
+def _get_stable_state(value: Any) -> Any:
+    """Returns a representation of the state of a translator that is the same in every process,
+    or raises a TypeError if the state holds a value with no such representation, e.g. an object
+    whose repr includes its memory address.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, Enum):
+        return f"{type(value).__module__}.{type(value).__qualname__}.{value.name}"
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__class__": f"{type(value).__module__}.{type(value).__qualname__}",
+            **{
+                field.name: _get_stable_state(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+            },
+        }
+
+    if isinstance(value, (list, tuple)):
+        return [_get_stable_state(item) for item in value]
+
+    if isinstance(value, (set, frozenset)):
+        return sorted(_get_stable_state(item) for item in value)
+
+    if isinstance(value, Mapping) and all(isinstance(key, str) for key in value):
+        return {key: _get_stable_state(item) for key, item in sorted(value.items())}
+
+    raise TypeError(f"{type(value).__name__} values have no stable representation")
+
+
+def _get_cached_specs_name(
+    translator: "DagsterDbtTranslator",
+    select: str,
+    exclude: str,
+    project: "DbtProject",
+) -> Optional[str]:
+    from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
+
+    # The implementation and the state of the translator are part of the cache key, so that
+    # changing how the specs are translated from dbt resources invalidates the cached specs.
+    try:
+        translator_sources = [
+            inspect.getsource(translator_cls)
+            for translator_cls in type(translator).__mro__
+            if issubclass(translator_cls, DagsterDbtTranslator)
+            and translator_cls is not DagsterDbtTranslator
+        ]
+    except (OSError, TypeError):
+        logger.warning(
+            f"Could not read the source of {type(translator).__name__} to cache the dbt asset specs"
+            " that it translates. The asset specs will not be cached."
+        )
+        return None
+
+    # Only state that is represented identically in every process can be part of the cache key,
+    # otherwise the cached specs would never be read by another process.
+    try:
+        translator_state = _get_stable_state(getattr(translator, "__dict__", {}))
+    except TypeError as e:
+        logger.warning(
+            f"Could not cache the dbt asset specs translated by {type(translator).__name__}, as its"
+            f" state cannot be used as a cache key: {e}. Only primitive values, and lists,"
+            " mappings and dataclasses of them, are supported. The asset specs will not be cached."
+        )
+        return None
+
+    cache_key = hashlib.sha1(
+        serialize_value(
+            {
+                "dagster_version": dagster_version,
+                "dagster_dbt_version": dagster_dbt_version,
+                "translator_cls": f"{type(translator).__module__}.{type(translator).__qualname__}",
+                "translator_sources": translator_sources,
+                "translator_state": translator_state,
+                "select": select,
+                "exclude": exclude,
+                "project_dir": os.fspath(project.project_dir.resolve()),
+            }
+        ).encode()
+    ).hexdigest()
+    return f"specs_{cache_key}.json"
+
+
+def read_cached_specs(
+    manifest_index: DbtManifestIndex,
+    translator: "DagsterDbtTranslator",
+    select: str,
+    exclude: str,
+    project: "DbtProject",
+) -> Optional[tuple[Sequence[AssetSpec], Sequence[AssetCheckSpec]]]:
+    """Reads the asset specs and asset check specs previously built for a dbt selection, if the
+    manifest, selection and translator have not changed since they were cached.
+    """
+    name = _get_cached_specs_name(translator, select, exclude, project)
+    data = manifest_index.read_cache_file(name) if name else None
+    if data is None:
+        return None
+
+    # The cache is best effort, so any cached specs that cannot be loaded are rebuilt.
+    try:
+        cached_specs = deserialize_value(data.decode(), DbtCachedSpecs)
+        return (
+            [cached_spec.to_asset_spec() for cached_spec in cached_specs.specs],
+            [
+                cached_check_spec.to_asset_check_spec()
+                for cached_check_spec in cached_specs.check_specs
+            ],
+        )
+    except Exception as e:
+        logger.warning(f"Could not load the cached dbt asset specs, they will be rebuilt: {e}")
+        return None
+
+
+def write_cached_specs(
+    manifest_index: DbtManifestIndex,
+    translator: "DagsterDbtTranslator",
+    select: str,
+    exclude: str,
+    project: "DbtProject",
+    specs: Sequence[AssetSpec],
+    check_specs: Sequence[AssetCheckSpec],
+) -> None:
+    """Caches the asset specs and asset check specs built for a dbt selection alongside the
+    manifest.
+    """
+    name = _get_cached_specs_name(translator, select, exclude, project)
+    if not name:
+        return
+
+    # Specs with attributes that cannot be serialized, e.g. custom partitions definitions or
+    # metadata values, are not cached.
+    try:
+        data = serialize_value(
+            DbtCachedSpecs(
+                specs=[DbtCachedAssetSpec.from_asset_spec(spec) for spec in specs],
+                check_specs=[
+                    DbtCachedAssetCheckSpec.from_asset_check_spec(check_spec)
+                    for check_spec in check_specs
+                ],
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Could not cache the dbt asset specs, they will be rebuilt on load: {e}")
+        return
+
+    manifest_index.write_cache_file(name, data.encode())
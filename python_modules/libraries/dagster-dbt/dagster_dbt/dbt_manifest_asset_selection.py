@@ -10,14 +10,11 @@
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._record import record
 
-from dagster_dbt.asset_utils import get_asset_check_key_for_test, is_non_asset_node
+from dagster_dbt.asset_utils import is_non_asset_node
 from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
 from dagster_dbt.dbt_manifest import DbtManifestParam, validate_manifest
-from dagster_dbt.utils import (
-    ASSET_RESOURCE_TYPES,
-    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
-    select_unique_ids_from_manifest,
-)
+from dagster_dbt.dbt_manifest_index import get_manifest_index
+from dagster_dbt.utils import ASSET_RESOURCE_TYPES
 
 
 @record
@@ -91,19 +88,15 @@ def build(
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool = False
     ) -> AbstractSet[AssetKey]:
-        dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(self.manifest)
+        manifest_index = get_manifest_index(self.manifest)
+        dbt_nodes = manifest_index.dbt_nodes
 
         keys = set()
-        for unique_id in select_unique_ids_from_manifest(
-            select=self.select,
-            exclude=self.exclude,
-            manifest_json=self.manifest,
-        ):
+        for unique_id in manifest_index.select_unique_ids(select=self.select, exclude=self.exclude):
             dbt_resource_props = dbt_nodes[unique_id]
             is_dbt_asset = dbt_resource_props["resource_type"] in ASSET_RESOURCE_TYPES
             if is_dbt_asset and not is_non_asset_node(dbt_resource_props):
-                asset_key = self.dagster_dbt_translator.get_asset_key(dbt_resource_props)
-                keys.add(asset_key)
+                keys.add(manifest_index.get_asset_key(self.dagster_dbt_translator, unique_id))
 
         return keys
 
@@ -113,14 +106,12 @@ def resolve_checks_inner(
         if not self.dagster_dbt_translator.settings.enable_asset_checks:
             return set()
 
+        manifest_index = get_manifest_index(self.manifest)
+
         keys = set()
-        for unique_id in select_unique_ids_from_manifest(
-            select=self.select,
-            exclude=self.exclude,
-            manifest_json=self.manifest,
-        ):
-            asset_check_key = get_asset_check_key_for_test(
-                self.manifest, self.dagster_dbt_translator, test_unique_id=unique_id
+        for unique_id in manifest_index.select_unique_ids(select=self.select, exclude=self.exclude):
+            asset_check_key = manifest_index.get_asset_check_key_for_test(
+                self.dagster_dbt_translator, unique_id
             )
 
             if asset_check_key:
@@ -0,0 +1,319 @@
+import hashlib
+import os
+import shutil
+import threading
+import weakref
+from collections.abc import Mapping, Sequence
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, AbstractSet, Any, Optional  # noqa: UP035
+
+import orjson
+from dagster import (
+    AssetCheckKey,
+    AssetKey,
+    _check as check,
+)
+
+from dagster_dbt.utils import build_dbt_selection_graph, select_unique_ids_from_dbt_graph
+
+if TYPE_CHECKING:
+    from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
+
+DAGSTER_DBT_MANIFEST_INDEX_CACHE_DIR = "dagster_dbt_manifest_index"
+
+
+class DbtManifestIndex:
+    """An index over a dbt manifest, built once per manifest and shared by the selection, asset key
+    and asset check key lookups over that manifest.
+
+    The unique ids selected by a dbt selection string are cached in memory and, if a cache directory
+    is set, on disk keyed by the hash of the manifest. This allows the selections of a project to be
+    resolved without hydrating the manifest into a dbt graph when the manifest has not changed.
+
+    The index is kept alive by the objects built from its manifest, such as the
+    ``DbtManifestWrapper`` attached to dbt asset specs, and is released along with them.
+    """
+
+    def __init__(self, manifest: Mapping[str, Any], cache_dir: Optional[Path] = None):
+        self._manifest = manifest
+        self._cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._dbt_selection_graph: Optional[tuple[Any, Any]] = None
+        self._selected_unique_ids: dict[tuple[str, str], AbstractSet[str]] = {}
+        # Translators are weakly referenced, so that caching their asset keys does not keep them
+        # alive for as long as the manifest.
+        self._asset_keys_by_translator: weakref.WeakKeyDictionary[
+            DagsterDbtTranslator, dict[str, AssetKey]
+        ] = weakref.WeakKeyDictionary()
+        self._attached_unique_ids_by_test_unique_id: dict[str, Optional[str]] = {}
+
+    @property
+    def manifest(self) -> Mapping[str, Any]:
+        return self._manifest
+
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        return self._cache_dir
+
+    def set_cache_dir(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @cached_property
+    def manifest_hash(self) -> str:
+        return hashlib.sha1(orjson.dumps(self._manifest)).hexdigest()
+
+    @cached_property
+    def dbt_nodes(self) -> Mapping[str, Mapping[str, Any]]:
+        """A mapping of a dbt node's unique id to the node's dictionary representation in the
+        manifest.
+        """
+        manifest = self._manifest
+        # The mapping is shared by every lookup over this manifest, so it is read-only.
+        return MappingProxyType(
+            {
+                **manifest["nodes"],
+                **manifest["sources"],
+                **manifest["exposures"],
+                **manifest["metrics"],
+                **manifest.get("semantic_models", {}),
+                **manifest.get("saved_queries", {}),
+                **manifest.get("unit_tests", {}),
+            }
+        )
+
+    @cached_property
+    def unique_id_by_ref(self) -> Mapping[tuple[str, str, Optional[str]], str]:
+        return {
+            (
+                dbt_resource_props["name"],
+                dbt_resource_props["package_name"],
+                dbt_resource_props.get("version"),
+            ): unique_id
+            for unique_id, dbt_resource_props in self._manifest["nodes"].items()
+        }
+
+    def get_parent_unique_ids(self, unique_id: str) -> Sequence[str]:
+        return self._manifest["parent_map"].get(unique_id, [])
+
+    def get_child_unique_ids(self, unique_id: str) -> Sequence[str]:
+        return self._manifest["child_map"].get(unique_id, [])
+
+    def get_asset_key(self, translator: "DagsterDbtTranslator", unique_id: str) -> AssetKey:
+        """Returns the asset key of a dbt node, as computed by the given translator."""
+        with self._lock:
+            try:
+                asset_keys = self._asset_keys_by_translator.setdefault(translator, {})
+            except TypeError:
+                # Translators that are not hashable, e.g. dataclasses, are not cached.
+                return translator.get_asset_key(self.dbt_nodes[unique_id])
+
+            if unique_id not in asset_keys:
+                asset_keys[unique_id] = translator.get_asset_key(self.dbt_nodes[unique_id])
+
+            return asset_keys[unique_id]
+
+    def get_attached_unique_id_for_test(self, test_unique_id: str) -> Optional[str]:
+        """Returns the unique id of the dbt node that a dbt test is attached to, if any."""
+        with self._lock:
+            if test_unique_id not in self._attached_unique_ids_by_test_unique_id:
+                self._attached_unique_ids_by_test_unique_id[test_unique_id] = (
+                    self._get_attached_unique_id_for_test(test_unique_id)
+                )
+
+            return self._attached_unique_ids_by_test_unique_id[test_unique_id]
+
+    def _get_attached_unique_id_for_test(self, test_unique_id: str) -> Optional[str]:
+        test_resource_props = self._manifest["nodes"][test_unique_id]
+        upstream_unique_ids: AbstractSet[str] = set(test_resource_props["depends_on"]["nodes"])
+
+        # If the test is generic, it will have an attached node that we can use.
+        attached_node_unique_id = test_resource_props.get("attached_node")
+
+        # If the test is singular, infer the attached node from the upstream nodes.
+        if len(upstream_unique_ids) == 1:
+            [attached_node_unique_id] = upstream_unique_ids
+
+        # If the test is singular, but has multiple dependencies, infer the attached node from
+        # from the dbt meta.
+        attached_node_ref = (
+            (
+                test_resource_props.get("config", {}).get("meta", {})
+                or test_resource_props.get("meta", {})
+            )
+            .get("dagster", {})
+            .get("ref", {})
+        )
+
+        # Attempt to find the attached node from the ref.
+        if attached_node_ref:
+            ref_name, ref_package, ref_version = (
+                attached_node_ref["name"],
+                attached_node_ref.get("package"),
+                attached_node_ref.get("version"),
+            )
+
+            project_name = self._manifest["metadata"]["project_name"]
+            if not ref_package:
+                ref_package = project_name
+
+            attached_node_unique_id = self.unique_id_by_ref.get(
+                (ref_name, ref_package, ref_version)
+            )
+
+        return attached_node_unique_id
+
+    def get_asset_check_key_for_test(
+        self, translator: "DagsterDbtTranslator", test_unique_id: str
+    ) -> Optional[AssetCheckKey]:
+        if not test_unique_id.startswith("test"):
+            return None
+
+        attached_node_unique_id = self.get_attached_unique_id_for_test(test_unique_id)
+        if not attached_node_unique_id:
+            return None
+
+        return AssetCheckKey(
+            name=self._manifest["nodes"][test_unique_id]["name"],
+            asset_key=self.get_asset_key(translator, attached_node_unique_id),
+        )
+
+    def select_unique_ids(self, select: str, exclude: str) -> AbstractSet[str]:
+        """Applies a dbt selection string to the manifest, returning the selected unique ids."""
+        with self._lock:
+            selection = (select, exclude or "")
+            if selection not in self._selected_unique_ids:
+                selected_unique_ids = self._read_cached_selection(*selection)
+                if selected_unique_ids is None:
+                    selected_unique_ids = frozenset(
+                        select_unique_ids_from_dbt_graph(
+                            *selection, *self._get_dbt_selection_graph()
+                        )
+                    )
+                    self._write_cached_selection(*selection, selected_unique_ids)
+
+                self._selected_unique_ids[selection] = selected_unique_ids
+
+            return self._selected_unique_ids[selection]
+
+    def _get_dbt_selection_graph(self) -> tuple[Any, Any]:
+        if self._dbt_selection_graph is None:
+            self._dbt_selection_graph = build_dbt_selection_graph(self._manifest)
+
+        return self._dbt_selection_graph
+
+    def _get_cached_selection_name(self, select: str, exclude: str) -> str:
+        from dbt.version import __version__ as dbt_version
+
+        selection_hash = hashlib.sha1(
+            orjson.dumps({"select": select, "exclude": exclude, "dbt_version": dbt_version})
+        ).hexdigest()
+        return f"selection_{selection_hash}.json"
+
+    def _read_cached_selection(self, select: str, exclude: str) -> Optional[AbstractSet[str]]:
+        if not self._cache_dir:
+            return None
+
+        data = self.read_cache_file(self._get_cached_selection_name(select, exclude))
+        if data is None:
+            return None
+
+        try:
+            return frozenset(orjson.loads(data)["unique_ids"])
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def _write_cached_selection(
+        self, select: str, exclude: str, selected_unique_ids: AbstractSet[str]
+    ) -> None:
+        if not self._cache_dir:
+            return
+
+        self.write_cache_file(
+            self._get_cached_selection_name(select, exclude),
+            orjson.dumps(
+                {"select": select, "exclude": exclude, "unique_ids": sorted(selected_unique_ids)}
+            ),
+        )
+
+    def _get_cache_file_path(self, name: str) -> Optional[Path]:
+        if not self._cache_dir:
+            return None
+
+        return self._cache_dir.joinpath(
+            DAGSTER_DBT_MANIFEST_INDEX_CACHE_DIR, self.manifest_hash, name
+        )
+
+    def read_cache_file(self, name: str) -> Optional[bytes]:
+        """Reads a file cached for this version of the manifest, if it exists."""
+        cache_file_path = self._get_cache_file_path(name)
+        if not cache_file_path:
+            return None
+
+        try:
+            return cache_file_path.read_bytes()
+        except OSError:
+            return None
+
+    def write_cache_file(self, name: str, data: bytes) -> None:
+        """Writes a file to the cache of this version of the manifest. Files cached for other
+        versions of the manifest are removed.
+        """
+        cache_file_path = self._get_cache_file_path(name)
+        if not cache_file_path:
+            return
+
+        # The cache is best effort, e.g. the target directory may be read-only when deployed.
+        try:
+            manifest_cache_dir = cache_file_path.parent
+            if not manifest_cache_dir.exists():
+                # Files cached for previous versions of the manifest can no longer be used.
+                for stale_cache_dir in manifest_cache_dir.parent.glob("*"):
+                    shutil.rmtree(stale_cache_dir, ignore_errors=True)
+                manifest_cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first so that concurrent readers never see a partial file.
+            tmp_path = cache_file_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_file_path)
+        except OSError:
+            pass
+
+
+_manifest_indexes_lock = threading.Lock()
+# Indexes are looked up by the identity of their manifest, but are only referenced weakly here, so
+# that an index and its manifest are released once nothing built from the manifest refers to them.
+# An index holds a reference to its manifest, so the identity of a manifest cannot be reused while
+# its index is alive.
+_manifest_indexes: "weakref.WeakValueDictionary[int, DbtManifestIndex]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_manifest_index(
+    manifest: Mapping[str, Any], cache_dir: Optional[Path] = None
+) -> DbtManifestIndex:
+    """Returns the index of a dbt manifest, building it if this manifest has not been indexed.
+
+    Indexes are looked up by the identity of the manifest, so a manifest must not be mutated once
+    it has been used to build definitions. An index is only cached for as long as it is referenced,
+    e.g. by the definitions built from the manifest.
+
+    Args:
+        manifest (Mapping[str, Any]): The dbt manifest blob.
+        cache_dir (Optional[Path]): The directory to cache the selections of the manifest in,
+            typically the target directory of the dbt project.
+    """
+    check.mapping_param(manifest, "manifest")
+    check.opt_inst_param(cache_dir, "cache_dir", Path)
+
+    with _manifest_indexes_lock:
+        index = _manifest_indexes.get(id(manifest))
+        if index is None or index.manifest is not manifest:
+            index = DbtManifestIndex(manifest, cache_dir=cache_dir)
+            _manifest_indexes[id(manifest)] = index
+        elif cache_dir and not index.cache_dir:
+            index.set_cache_dir(cache_dir)
+
+        return index
@@ -22,11 +22,22 @@ def select_unique_ids_from_manifest(
     exclude: str,
     manifest_json: Mapping[str, Any],
 ) -> AbstractSet[str]:
-    """Method to apply a selection string to an existing manifest.json file."""
-    import dbt.graph.cli as graph_cli
+    """Method to apply a selection string to an existing manifest.json file.
+
+    The dbt graph that the selection is applied to is built once per manifest, and the selected
+    unique ids are cached for each selection.
+    """
+    from dagster_dbt.dbt_manifest_index import get_manifest_index
+
+    return get_manifest_index(manifest_json).select_unique_ids(select=select, exclude=exclude)
+
+
+def build_dbt_selection_graph(manifest_json: Mapping[str, Any]) -> tuple[Any, Any]:
+    """Hydrates a manifest.json file into the dbt manifest and graph that selection strings are
+    applied to.
+    """
     import dbt.graph.selector as graph_selector
     from dbt.contracts.graph.manifest import Manifest
-    from dbt.graph.selector_spec import IndirectSelection, SelectionSpec
     from dbt.version import __version__ as dbt_version
     from networkx import DiGraph
 
@@ -99,6 +110,20 @@ def __getattr__(self, item):
 
     graph = graph_selector.Graph(DiGraph(incoming_graph_data=child_map))
 
+    return manifest, graph
+
+
+def select_unique_ids_from_dbt_graph(
+    select: str,
+    exclude: str,
+    manifest: Any,
+    graph: Any,
+) -> AbstractSet[str]:
+    """Applies a selection string to a dbt manifest and graph built by `build_dbt_selection_graph`."""
+    import dbt.graph.cli as graph_cli
+    import dbt.graph.selector as graph_selector
+    from dbt.graph.selector_spec import IndirectSelection, SelectionSpec
+
     # create a parsed selection from the select string
     _set_flag_attrs(
         {
@@ -122,15 +147,9 @@ def get_dbt_resource_props_by_dbt_unique_id_from_manifest(
     manifest: Mapping[str, Any],
 ) -> Mapping[str, Mapping[str, Any]]:
     """A mapping of a dbt node's unique id to the node's dictionary representation in the manifest."""
-    return {
-        **manifest["nodes"],
-        **manifest["sources"],
-        **manifest["exposures"],
-        **manifest["metrics"],
-        **manifest.get("semantic_models", {}),
-        **manifest.get("saved_queries", {}),
-        **manifest.get("unit_tests", {}),
-    }
+    from dagster_dbt.dbt_manifest_index import get_manifest_index
+
+    return get_manifest_index(manifest).dbt_nodes
 
 
 def _set_flag_attrs(kvs: dict[str, Any]):
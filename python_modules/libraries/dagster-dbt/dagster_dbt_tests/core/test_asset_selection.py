@@ -1,5 +1,7 @@
 import copy
+import gc
 import os
+import weakref
 from pathlib import Path
 from typing import Any, Optional, cast
 from unittest import mock
@@ -11,7 +13,10 @@
 from dagster._record import replace
 from dagster_dbt import build_dbt_asset_selection
 from dagster_dbt.asset_decorator import dbt_assets
+from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
 from dagster_dbt.dbt_manifest_asset_selection import DbtManifestAssetSelection
+from dagster_dbt.dbt_manifest_index import DAGSTER_DBT_MANIFEST_INDEX_CACHE_DIR, get_manifest_index
+from dagster_dbt.utils import get_dbt_resource_props_by_dbt_unique_id_from_manifest
 
 
 @pytest.mark.parametrize(
@@ -247,6 +252,81 @@ def my_dbt_assets(): ...
         assert selected_asset_keys == expected_asset_keys
 
 
+def test_dbt_asset_selection_index(
+    test_jaffle_shop_manifest: dict[str, Any], tmp_path: Path
+) -> None:
+    manifest = copy.deepcopy(test_jaffle_shop_manifest)
+
+    @dbt_assets(manifest=manifest)
+    def my_dbt_assets(): ...
+
+    asset_graph = AssetGraph.from_assets([my_dbt_assets])
+    expected_asset_keys = build_dbt_asset_selection(
+        [my_dbt_assets], dbt_select="raw_customers+"
+    ).resolve(all_assets=asset_graph)
+
+    # the dbt graph is built once per manifest, and selections are cached
+    with mock.patch("dagster_dbt.dbt_manifest_index.build_dbt_selection_graph") as mock_build:
+        assert (
+            build_dbt_asset_selection([my_dbt_assets], dbt_select="raw_customers+").resolve(
+                all_assets=asset_graph
+            )
+            == expected_asset_keys
+        )
+        mock_build.assert_not_called()
+
+    manifest_index = get_manifest_index(manifest, cache_dir=tmp_path)
+    selected_unique_ids = manifest_index.select_unique_ids(select="stg_orders+", exclude="")
+    assert list(
+        tmp_path.joinpath(DAGSTER_DBT_MANIFEST_INDEX_CACHE_DIR, manifest_index.manifest_hash).glob(
+            "*.json"
+        )
+    )
+
+    # the selections of an unchanged manifest are read from disk
+    with mock.patch("dagster_dbt.dbt_manifest_index.build_dbt_selection_graph") as mock_build:
+        manifest_index = get_manifest_index(copy.deepcopy(manifest), cache_dir=tmp_path)
+        assert (
+            manifest_index.select_unique_ids(select="stg_orders+", exclude="")
+            == selected_unique_ids
+        )
+        mock_build.assert_not_called()
+
+
+def test_dbt_manifest_index_is_not_retained(test_jaffle_shop_manifest: dict[str, Any]) -> None:
+    manifest = copy.deepcopy(test_jaffle_shop_manifest)
+
+    @dbt_assets(manifest=manifest)
+    def my_dbt_assets(): ...
+
+    # the index is kept alive by the definitions built from the manifest
+    manifest_index = get_manifest_index(manifest)
+    manifest_index_ref = weakref.ref(manifest_index)
+    del manifest_index
+    gc.collect()
+    assert get_manifest_index(manifest) is manifest_index_ref()
+
+    # the resource props shared by the lookups over the manifest are read-only
+    dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(manifest)
+    with pytest.raises(TypeError):
+        dbt_nodes["model.jaffle_shop.new_model"] = {}  # type: ignore
+
+    # the asset keys cached for a translator do not keep the translator alive
+    translator = DagsterDbtTranslator()
+    translator_ref = weakref.ref(translator)
+    assert get_manifest_index(manifest).get_asset_key(
+        translator, "model.jaffle_shop.customers"
+    ) == AssetKey(["customers"])
+    del translator
+    gc.collect()
+    assert translator_ref() is None
+
+    # the index is released along with the definitions
+    del my_dbt_assets, dbt_nodes
+    gc.collect()
+    assert manifest_index_ref() is None
+
+
 def test_dbt_asset_selection_equality(
     test_jaffle_shop_manifest_path: Path, test_jaffle_shop_manifest: dict[str, Any]
 ) -> None:
@@ -1,8 +1,39 @@
-from typing import Any
+import copy
+import multiprocessing
+import shutil
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional
+from unittest import mock
 
-from dagster import Definitions
+from dagster import AssetKey, Definitions
 from dagster._core.definitions.external_asset import external_assets_from_specs
+from dagster_dbt import DbtProject
 from dagster_dbt.asset_specs import build_dbt_asset_specs
+from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator, DagsterDbtTranslatorSettings
+
+from dagster_dbt_tests.dbt_projects import test_jaffle_shop_path
+
+
+class PrefixedDagsterDbtTranslator(DagsterDbtTranslator):
+    def __init__(self, prefix: str, settings: Optional[DagsterDbtTranslatorSettings] = None):
+        super().__init__(settings=settings)
+        self._prefix = prefix
+
+    def get_asset_key(self, dbt_resource_props: Mapping[str, Any]) -> AssetKey:
+        return super().get_asset_key(dbt_resource_props).with_prefix(self._prefix)
+
+
+def _build_dbt_asset_specs_with_cache(manifest: Mapping[str, Any], project_dir: Path) -> int:
+    return len(
+        build_dbt_asset_specs(
+            manifest=manifest,
+            dagster_dbt_translator=PrefixedDagsterDbtTranslator(
+                "prefix", settings=DagsterDbtTranslatorSettings(enable_asset_spec_cache=True)
+            ),
+            project=DbtProject(project_dir),
+        )
+    )
 
 
 def test_build_dbt_asset_specs_as_external_assets(
@@ -17,3 +48,80 @@ def test_build_dbt_asset_specs_as_external_assets(
             )
         ]
     )
+
+
+def test_build_dbt_asset_specs_cache(
+    test_jaffle_shop_manifest: dict[str, Any], tmp_path: Path
+) -> None:
+    project_dir = tmp_path.joinpath("jaffle_shop")
+    shutil.copytree(
+        test_jaffle_shop_path,
+        project_dir,
+        ignore=shutil.ignore_patterns("target", "dbt_packages", "logs"),
+    )
+    project = DbtProject(project_dir)
+    manifest = copy.deepcopy(test_jaffle_shop_manifest)
+    dagster_dbt_translator = DagsterDbtTranslator(
+        settings=DagsterDbtTranslatorSettings(enable_asset_spec_cache=True)
+    )
+
+    specs = build_dbt_asset_specs(
+        manifest=manifest, dagster_dbt_translator=dagster_dbt_translator, project=project
+    )
+    assert list(project_dir.joinpath("target").rglob("specs_*.json"))
+
+    # the cached specs are loaded without translating the dbt resources
+    with mock.patch("dagster_dbt.asset_utils.get_asset_spec") as mock_get_asset_spec:
+        cached_specs = build_dbt_asset_specs(
+            manifest=manifest, dagster_dbt_translator=dagster_dbt_translator, project=project
+        )
+        mock_get_asset_spec.assert_not_called()
+
+    assert sorted(cached_specs, key=lambda spec: spec.key.to_user_string()) == sorted(
+        specs, key=lambda spec: spec.key.to_user_string()
+    )
+
+
+def test_build_dbt_asset_specs_cache_across_processes(
+    test_jaffle_shop_manifest: dict[str, Any], tmp_path: Path
+) -> None:
+    project_dir = tmp_path.joinpath("jaffle_shop")
+    shutil.copytree(
+        test_jaffle_shop_path,
+        project_dir,
+        ignore=shutil.ignore_patterns("target", "dbt_packages", "logs"),
+    )
+    manifest = copy.deepcopy(test_jaffle_shop_manifest)
+
+    # the specs are cached by a fresh interpreter, rather than a fork of this one
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        num_specs = pool.apply(_build_dbt_asset_specs_with_cache, (manifest, project_dir))
+    assert list(project_dir.joinpath("target").rglob("specs_*.json"))
+
+    # the specs cached by the other process are loaded without translating the dbt resources
+    with mock.patch("dagster_dbt.asset_utils.get_asset_spec") as mock_get_asset_spec:
+        assert _build_dbt_asset_specs_with_cache(manifest, project_dir) == num_specs
+        mock_get_asset_spec.assert_not_called()
+
+
+def test_build_dbt_asset_specs_cache_unstable_translator_state(
+    test_jaffle_shop_manifest: dict[str, Any], tmp_path: Path
+) -> None:
+    project_dir = tmp_path.joinpath("jaffle_shop")
+    shutil.copytree(
+        test_jaffle_shop_path,
+        project_dir,
+        ignore=shutil.ignore_patterns("target", "dbt_packages", "logs"),
+    )
+    dagster_dbt_translator = DagsterDbtTranslator(
+        settings=DagsterDbtTranslatorSettings(enable_asset_spec_cache=True)
+    )
+    # the repr of an arbitrary object includes its memory address, so it cannot be a cache key
+    dagster_dbt_translator.client = object()  # type: ignore
+
+    assert build_dbt_asset_specs(
+        manifest=copy.deepcopy(test_jaffle_shop_manifest),
+        dagster_dbt_translator=dagster_dbt_translator,
+        project=DbtProject(project_dir),
+    )
+    assert not list(project_dir.joinpath("target").rglob("specs_*.json"))
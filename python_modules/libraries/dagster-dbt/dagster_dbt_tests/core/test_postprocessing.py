@@ -138,6 +138,37 @@ def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
     ), str(metadata_by_asset_key)
 
 
+def test_row_count_batched(
+    test_jaffle_shop_manifest_standalone_duckdb_dbfile: dict[str, Any],
+) -> None:
+    @dbt_assets(manifest=test_jaffle_shop_manifest_standalone_duckdb_dbfile)
+    def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
+        yield from (
+            dbt.cli(["build"], context=context)
+            .stream()
+            .fetch_row_counts(batch_size=3, batch_window_seconds=0.1, max_concurrency=2)
+        )
+
+    result = materialize(
+        [my_dbt_assets],
+        resources={"dbt": DbtCliResource(project_dir=os.fspath(test_jaffle_shop_path))},
+    )
+
+    assert result.success
+
+    metadata_by_asset_key = {
+        check.not_none(event.asset_key): event.materialization.metadata
+        for event in result.get_asset_materialization_events()
+    }
+
+    # Validate that the row counts fetched in batches are attached to the right models
+    for asset_key, metadata in metadata_by_asset_key.items():
+        if "stg" in asset_key.path[-1]:
+            assert "dagster/row_count" not in metadata
+        else:
+            assert metadata["dagster/row_count"].value > 0
+
+
 def test_insights_err_not_snowflake_or_bq(
     test_jaffle_shop_manifest_standalone_duckdb_dbfile: dict[str, Any],
     caplog: pytest.LogCaptureFixture,
@@ -1,3 +1,4 @@
+import operator
 from abc import abstractmethod
 from collections.abc import Iterable, Sequence
 from typing import Any, Generic, Optional, TypeVar, Union, cast
@@ -7,7 +8,12 @@
 import pyarrow.dataset as ds
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
 from dagster._core.definitions.time_window_partitions import TimeWindow
-from dagster._core.storage.db_io_manager import DbTypeHandler, TablePartitionDimension, TableSlice
+from dagster._core.storage.db_io_manager import (
+    DbTypeHandler,
+    TableFilter,
+    TablePartitionDimension,
+    TableSlice,
+)
 from deltalake import DeltaTable, WriterProperties, write_deltalake
 from deltalake.schema import (
     Field as DeltaField,
@@ -224,6 +230,40 @@ def _field_from_schema(field_name: str, schema: Schema) -> Optional[DeltaField]:
     return None
 
 
+_TABLE_FILTER_COMPARISONS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def table_filters_to_expression(filters: Sequence[TableFilter]) -> ds.Expression:
+    expressions = []
+    for table_filter in filters:
+        # as with partition expressions, only column names are supported
+        field = ds.field(table_filter.column)
+        if table_filter.operator == "is null":
+            expressions.append(field.is_null())
+        elif table_filter.operator == "is not null":
+            expressions.append(field.is_valid())
+        elif table_filter.operator == "in":
+            expressions.append(field.isin(list(table_filter.value)))
+        elif table_filter.operator == "not in":
+            expressions.append(~field.isin(list(table_filter.value)))
+        else:
+            expressions.append(
+                _TABLE_FILTER_COMPARISONS[table_filter.operator](field, table_filter.value)
+            )
+
+    expression = expressions[0]
+    for other in expressions[1:]:
+        expression = expression & other
+    return expression
+
+
 def _get_partition_stats(dt: DeltaTable, partition_filters=None):
     files = pa.array(dt.files(partition_filters=partition_filters))
     files_table = pa.Table.from_arrays([files], names=["path"])
@@ -251,6 +291,10 @@ def _table_reader(table_slice: TableSlice, connection: TableConnection) -> ds.Da
         if partition_filters is not None:
             partition_expr = filters_to_expression([partition_filters])
 
+    if table_slice.filters:
+        filters_expr = table_filters_to_expression(table_slice.filters)
+        partition_expr = filters_expr if partition_expr is None else partition_expr & filters_expr
+
     dataset = table.to_pyarrow_dataset()
     if partition_expr is not None:
         dataset = dataset.filter(partition_expr)
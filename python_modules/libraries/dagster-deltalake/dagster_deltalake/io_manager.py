@@ -15,6 +15,7 @@
     DbTypeHandler,
     TablePartitionDimension,
     TableSlice,
+    get_table_filters_where_clause,
 )
 from pydantic import Field
 
@@ -117,6 +118,19 @@ def my_table_a(my_table: pd.DataFrame):
             # my_table will just contain the data from column "a"
             ...
 
+    To only load the rows of a table that match some filters, add the metadata "filters" to the In or
+    AssetIn. Each filter is a ``(column, operator, value)`` tuple, and the filters are applied by the
+    query that loads the table. Only column names are supported.
+
+    .. code-block:: python
+
+        @asset(
+            ins={"my_table": AssetIn("my_table", metadata={"filters": [("a", ">", 0)]})}
+        )
+        def my_table_positive(my_table: pd.DataFrame):
+            # my_table will just contain the rows where column "a" is positive
+            ...
+
     """
 
     root_uri: str = Field(description="Storage location where Delta tables are stored.")
@@ -198,11 +212,19 @@ def get_select_statement(table_slice: TableSlice) -> str:
         # the operation being executed.
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
 
+        where_clauses = []
         if table_slice.partition_dimensions and len(table_slice.partition_dimensions) > 0:
-            query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table} WHERE\n"
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+            where_clauses.append(_partition_where_clause(table_slice.partition_dimensions))
+        if table_slice.filters:
+            where_clauses.append(
+                get_table_filters_where_clause(table_slice.filters, DELTA_DATETIME_FORMAT)
+            )
+
+        query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"
+        if where_clauses:
+            return query + " WHERE\n" + " AND\n".join(where_clauses)
         else:
-            return f"""SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"""
+            return query
 
     @staticmethod
     @contextmanager
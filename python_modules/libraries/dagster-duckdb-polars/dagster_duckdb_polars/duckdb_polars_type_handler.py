@@ -1,15 +1,24 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Optional
 
 import polars as pl
-from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
-from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
-from dagster_duckdb.io_manager import DuckDbClient, DuckDBIOManager, build_duckdb_io_manager
+import pyarrow as pa
+from dagster import MetadataValue, OutputContext, TableColumn, TableSchema
+from dagster._core.definitions.metadata import RawMetadataValue
+from dagster._core.storage.db_io_manager import DbTypeHandler
+from dagster_duckdb.io_manager import (
+    DuckDBBaseArrowTypeHandler,
+    DuckDBIOManager,
+    build_duckdb_io_manager,
+)
 
 
-class DuckDBPolarsTypeHandler(DbTypeHandler[pl.DataFrame]):
+class DuckDBPolarsTypeHandler(DuckDBBaseArrowTypeHandler[pl.DataFrame]):
     """Stores and loads Polars DataFrames in DuckDB.
 
+    DataFrames are stored and loaded as Arrow data, which DuckDB scans and produces without
+    copying it into an intermediate format.
+
     To use this type handler, return it from the ``type_handlers` method of an I/O manager that inherits from ``DuckDBIOManager``.
 
     Example:
@@ -36,47 +45,26 @@ def my_table() -> pl.DataFrame:  # the name of the asset will be the table name
 
     """
 
-    def handle_output(
-        self, context: OutputContext, table_slice: TableSlice, obj: pl.DataFrame, connection
-    ):
-        """Stores the polars DataFrame in duckdb."""
-        obj_arrow = obj.to_arrow()  # noqa: F841  # need obj_arrow symbol to exist for duckdb query
-        connection.execute(f"create schema if not exists {table_slice.schema};")
-        connection.execute(
-            f"create table if not exists {table_slice.schema}.{table_slice.table} as select * from"
-            " obj_arrow;"
-        )
-        if not connection.fetchall():
-            # table was not created, therefore already exists. Insert the data
-            connection.execute(
-                f"insert into {table_slice.schema}.{table_slice.table} select * from obj_arrow"
-            )
-
-        context.add_output_metadata(
-            {
-                "row_count": obj.shape[0],
-                "dataframe_columns": MetadataValue.table_schema(
-                    TableSchema(
-                        columns=[
-                            TableColumn(name=name, type=str(dtype))
-                            for name, dtype in zip(obj.columns, obj.dtypes)
-                        ]
-                    )
-                ),
-            }
-        )
-
-    def load_input(
-        self, context: InputContext, table_slice: TableSlice, connection
-    ) -> pl.DataFrame:
-        """Loads the input as a Polars DataFrame."""
-        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
-            return pl.DataFrame()
-        select_statement = connection.execute(
-            DuckDbClient.get_select_statement(table_slice=table_slice)
-        )
-        duckdb_to_arrow = select_statement.arrow()
-        return pl.DataFrame(duckdb_to_arrow)
+    def to_arrow(self, obj: pl.DataFrame) -> pa.Table:
+        return obj.to_arrow()
+
+    def from_arrow(self, reader: pa.RecordBatchReader, target_type: type) -> pl.DataFrame:
+        return pl.DataFrame(reader.read_all())
+
+    def get_output_metadata(
+        self, context: OutputContext, obj: pl.DataFrame
+    ) -> Mapping[str, RawMetadataValue]:
+        return {
+            "row_count": obj.shape[0],
+            "dataframe_columns": MetadataValue.table_schema(
+                TableSchema(
+                    columns=[
+                        TableColumn(name=name, type=str(dtype))
+                        for name, dtype in zip(obj.columns, obj.dtypes)
+                    ]
+                )
+            ),
+        }
 
     @property
     def supported_types(self):
@@ -7,4 +7,13 @@
 from dagster_duckdb.resource import DuckDBResource as DuckDBResource
 from dagster_duckdb.version import __version__
 
+try:
+    # provided by dagster-duckdb[pyarrow]
+    from dagster_duckdb.pyarrow_type_handler import (
+        DuckDBPyArrowIOManager as DuckDBPyArrowIOManager,
+        DuckDBPyArrowTypeHandler as DuckDBPyArrowTypeHandler,
+    )
+except ImportError:
+    pass
+
 DagsterLibraryRegistry.register("dagster-duckdb", __version__)
@@ -1,11 +1,13 @@
+import uuid
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
-from typing import Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, cast
 
 import duckdb
-from dagster import IOManagerDefinition, OutputContext, io_manager
+from dagster import InputContext, IOManagerDefinition, OutputContext, io_manager
 from dagster._config.pythonic_config import ConfigurableIOManagerFactory
+from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.definitions.time_window_partitions import TimeWindow
 from dagster._core.storage.db_io_manager import (
     DbClient,
@@ -13,14 +15,20 @@
     DbTypeHandler,
     TablePartitionDimension,
     TableSlice,
+    get_table_filters_where_clause,
 )
 from dagster._core.storage.io_manager import dagster_maintained_io_manager
 from dagster._utils.backoff import backoff
 from packaging.version import Version
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 DUCKDB_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+T = TypeVar("T")
+
 
 def build_duckdb_io_manager(
     type_handlers: Sequence[DbTypeHandler], default_load_type: Optional[type] = None
@@ -211,6 +219,19 @@ def my_table_a(my_table: pd.DataFrame):
             # my_table will just contain the data from column "a"
             ...
 
+    To only load the rows of a table that match some filters, add the metadata "filters" to the In or
+    AssetIn. Each filter is a ``(column, operator, value)`` tuple, and the filters are applied by the
+    query that loads the table.
+
+    .. code-block:: python
+
+        @asset(
+            ins={"my_table": AssetIn("my_table", metadata={"filters": [("a", ">", 0)]})}
+        )
+        def my_table_positive(my_table: pd.DataFrame):
+            # my_table will just contain the rows where column "a" is positive
+            ...
+
     Set DuckDB configuration options using the connection_config field. See
     https://duckdb.org/docs/sql/configuration.html for all available settings.
 
@@ -236,6 +257,8 @@ def my_table_a(my_table: pd.DataFrame):
         default=None, alias="schema", description="Name of the schema to use."
     )  # schema is a reserved word for pydantic
 
+    _arrow_type_handlers: list["DuckDBBaseArrowTypeHandler"] = PrivateAttr(default_factory=list)
+
     @staticmethod
     @abstractmethod
     def type_handlers() -> Sequence[DbTypeHandler]: ...
@@ -245,11 +268,26 @@ def default_load_type() -> Optional[type]:
         return None
 
     def create_io_manager(self, context) -> DbIOManager:
+        return self._create_db_io_manager(self.type_handlers())
+
+    def teardown_after_execution(self, context) -> None:
+        # Inputs streamed by a type handler may hold their own connection to the database, which is
+        # closed once the I/O manager is torn down.
+        arrow_type_handlers, self._arrow_type_handlers = self._arrow_type_handlers, []
+        for type_handler in arrow_type_handlers:
+            type_handler.close()
+
+    def _create_db_io_manager(self, type_handlers: Sequence[DbTypeHandler]) -> DbIOManager:
+        self._arrow_type_handlers.extend(
+            type_handler
+            for type_handler in type_handlers
+            if isinstance(type_handler, DuckDBBaseArrowTypeHandler)
+        )
         return DbIOManager(
             db_client=DuckDbClient(),
             database=self.database,
             schema=self.schema_,
-            type_handlers=self.type_handlers(),
+            type_handlers=type_handlers,
             default_load_type=self.default_load_type(),
             io_manager_name="DuckDBIOManager",
         )
@@ -272,11 +310,19 @@ def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connec
     def get_select_statement(table_slice: TableSlice) -> str:
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
 
+        where_clauses = []
         if table_slice.partition_dimensions and len(table_slice.partition_dimensions) > 0:
-            query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table} WHERE\n"
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+            where_clauses.append(_partition_where_clause(table_slice.partition_dimensions))
+        if table_slice.filters:
+            where_clauses.append(
+                get_table_filters_where_clause(table_slice.filters, DUCKDB_DATETIME_FORMAT)
+            )
+
+        query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"
+        if where_clauses:
+            return query + " WHERE\n" + " AND\n".join(where_clauses)
         else:
-            return f"""SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"""
+            return query
 
     @staticmethod
     @contextmanager
@@ -307,6 +353,84 @@ def connect(context, _):
         conn.close()
 
 
+class DuckDBBaseArrowTypeHandler(DbTypeHandler[T], Generic[T]):
+    """Base class for type handlers which store and load objects in DuckDB as Arrow data.
+
+    Outputs are converted to an Arrow table or record batch reader, which DuckDB scans in place
+    rather than copying it into an intermediate Python object. Inputs are fetched from DuckDB as a
+    stream of Arrow record batches, which subclasses convert to the loaded type.
+
+    Subclasses implement ``to_arrow`` and ``from_arrow`` to convert between the types they handle
+    and Arrow data.
+    """
+
+    @abstractmethod
+    def to_arrow(self, obj: T) -> Union["pa.Table", "pa.RecordBatchReader"]:
+        """Converts an output to the Arrow data that is stored in DuckDB."""
+
+    @abstractmethod
+    def from_arrow(self, reader: "pa.RecordBatchReader", target_type: type) -> T:
+        """Converts the record batches loaded from DuckDB to the type of an input."""
+
+    def get_output_metadata(self, context: OutputContext, obj: T) -> Mapping[str, RawMetadataValue]:
+        """Returns the metadata to attach to an output once it has been stored."""
+        return {}
+
+    def close(self) -> None:
+        """Releases anything still held by the inputs this handler loaded, such as connections
+        for streamed inputs that were not read to the end. Called when the I/O manager is torn
+        down.
+        """
+
+    def handle_output(
+        self, context: OutputContext, table_slice: TableSlice, obj: T, connection
+    ) -> Mapping[str, RawMetadataValue]:
+        """Stores the output in DuckDB as Arrow data."""
+        # Register the Arrow data as a view, which DuckDB scans without copying it. A record batch
+        # reader can only be scanned once, so check if the table exists rather than relying on
+        # "create table if not exists".
+        view_name = f"dagster_arrow_{uuid.uuid4().hex}"
+        connection.register(view_name, self.to_arrow(obj))
+        try:
+            if _table_exists(table_slice, connection):
+                connection.execute(
+                    f"insert into {table_slice.schema}.{table_slice.table} select * from {view_name}"
+                )
+            else:
+                connection.execute(
+                    f"create table {table_slice.schema}.{table_slice.table} as select * from"
+                    f" {view_name}"
+                )
+        finally:
+            connection.unregister(view_name)
+
+        return self.get_output_metadata(context, obj)
+
+    def load_input(self, context: InputContext, table_slice: TableSlice, connection) -> T:
+        """Loads the input from DuckDB as a stream of Arrow record batches."""
+        target_type = context.dagster_type.typing_type
+        if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
+            import pyarrow as pa
+
+            return self.from_arrow(
+                pa.RecordBatchReader.from_batches(pa.schema([]), []), target_type
+            )
+
+        reader = connection.execute(
+            DuckDbClient.get_select_statement(table_slice)
+        ).fetch_record_batch()
+        return self.from_arrow(reader, target_type)
+
+
+def _table_exists(table_slice: TableSlice, connection) -> bool:
+    result = connection.execute(
+        "select count(*) from information_schema.tables where table_catalog = current_database()"
+        " and lower(table_schema) = lower(?) and lower(table_name) = lower(?)",
+        [table_slice.schema, table_slice.table],
+    ).fetchone()
+    return result[0] > 0
+
+
 def _get_cleanup_statement(table_slice: TableSlice) -> str:
     """Returns a SQL statement that deletes data in the given table to make way for the output data
     being written.
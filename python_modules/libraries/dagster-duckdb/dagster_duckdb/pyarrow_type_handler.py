@@ -0,0 +1,183 @@
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import ExitStack
+from typing import Optional, Union
+
+import pyarrow as pa
+from dagster import InputContext, OutputContext, TableColumn, TableSchema
+from dagster._core.definitions.metadata import RawMetadataValue, TableMetadataSet
+from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
+
+from dagster_duckdb.io_manager import DuckDBBaseArrowTypeHandler, DuckDbClient, DuckDBIOManager
+
+ArrowTypes = Union[pa.Table, pa.RecordBatchReader]
+
+
+class DuckDBPyArrowTypeHandler(DuckDBBaseArrowTypeHandler[ArrowTypes]):
+    """Stores and loads PyArrow Tables and RecordBatchReaders in DuckDB.
+
+    Inputs annotated as a ``pyarrow.RecordBatchReader`` are streamed from DuckDB one record batch at
+    a time, so that tables and partitions which do not fit in memory can be processed
+    incrementally. The record batches are read over a separate connection to the database, which
+    is closed once all of the record batches have been read, or otherwise when the I/O manager is
+    torn down.
+
+    To use this type handler, return it from the ``type_handlers`` method of an I/O manager that inherits from ``DuckDBIOManager``.
+
+    Example:
+        .. code-block:: python
+
+            from dagster_duckdb import DuckDBIOManager, DuckDBPyArrowTypeHandler
+
+            class MyDuckDBIOManager(DuckDBIOManager):
+                @staticmethod
+                def type_handlers() -> Sequence[DbTypeHandler]:
+                    return [DuckDBPyArrowTypeHandler()]
+
+            @asset(
+                key_prefix=["my_schema"]  # will be used as the schema in duckdb
+            )
+            def my_table() -> pa.Table:  # the name of the asset will be the table name
+                ...
+
+            @asset
+            def my_table_summary(my_table: pa.RecordBatchReader) -> pa.Table:
+                # my_table is streamed from duckdb
+                for batch in my_table:
+                    ...
+
+            defs = Definitions(
+                assets=[my_table, my_table_summary],
+                resources={"io_manager": MyDuckDBIOManager(database="my_db.duckdb")}
+            )
+
+    """
+
+    def __init__(self):
+        # the connections of the inputs streamed by this handler, which are closed by the I/O
+        # manager if they have not been read to the end
+        self._stream_exit_stack = ExitStack()
+
+    def to_arrow(self, obj: ArrowTypes) -> ArrowTypes:
+        return obj
+
+    def from_arrow(self, reader: pa.RecordBatchReader, target_type: type) -> ArrowTypes:
+        if target_type == pa.RecordBatchReader:
+            return reader
+        return reader.read_all()
+
+    def get_output_metadata(
+        self, context: OutputContext, obj: ArrowTypes
+    ) -> Mapping[str, RawMetadataValue]:
+        # the number of rows of a record batch reader is only known once it has been read
+        row_count = obj.num_rows if isinstance(obj, pa.Table) else None
+        return {
+            # output object may be a slice/partition, so we output different metadata keys based on
+            # whether this output represents an entire table or just a slice/partition
+            **(
+                TableMetadataSet(partition_row_count=row_count)
+                if context.has_partition_key
+                else TableMetadataSet(row_count=row_count)
+            ),
+            **TableMetadataSet(
+                column_schema=TableSchema(
+                    columns=[
+                        TableColumn(name=field.name, type=str(field.type)) for field in obj.schema
+                    ]
+                )
+            ),
+        }
+
+    def load_input(self, context: InputContext, table_slice: TableSlice, connection) -> ArrowTypes:
+        """Loads the input as a PyArrow Table, or streams it as a PyArrow RecordBatchReader."""
+        if context.dagster_type.typing_type != pa.RecordBatchReader or (
+            table_slice.partition_dimensions and len(context.asset_partition_keys) == 0
+        ):
+            return super().load_input(context, table_slice, connection)
+
+        # The I/O manager closes its connection once the input is loaded, before the record batches
+        # are read, so they are streamed over a separate connection to the database.
+        exit_stack = ExitStack()
+        stream_connection = exit_stack.enter_context(DuckDbClient.connect(context, table_slice))
+        try:
+            reader = stream_connection.execute(
+                DuckDbClient.get_select_statement(table_slice)
+            ).fetch_record_batch()
+        except Exception:
+            exit_stack.close()
+            raise
+
+        self._stream_exit_stack.push(exit_stack)
+        return pa.RecordBatchReader.from_batches(
+            reader.schema, _read_batches_and_close(reader, exit_stack)
+        )
+
+    def close(self) -> None:
+        self._stream_exit_stack.close()
+
+    @property
+    def supported_types(self) -> Sequence[type[object]]:
+        return [pa.Table, pa.RecordBatchReader]
+
+
+def _read_batches_and_close(
+    reader: pa.RecordBatchReader, exit_stack: ExitStack
+) -> Iterator[pa.RecordBatch]:
+    with exit_stack:
+        yield from reader
+
+
+class DuckDBPyArrowIOManager(DuckDBIOManager):
+    """An I/O manager definition that reads inputs from and writes PyArrow Tables and
+    RecordBatchReaders to DuckDB. When using the DuckDBPyArrowIOManager, any inputs and outputs
+    without type annotations will be loaded as PyArrow Tables.
+
+    Returns:
+        IOManagerDefinition
+
+    Examples:
+        .. code-block:: python
+
+            from dagster_duckdb import DuckDBPyArrowIOManager
+
+            @asset(
+                key_prefix=["my_schema"]  # will be used as the schema in DuckDB
+            )
+            def my_table() -> pa.Table:  # the name of the asset will be the table name
+                ...
+
+            defs = Definitions(
+                assets=[my_table],
+                resources={"io_manager": DuckDBPyArrowIOManager(database="my_db.duckdb")}
+            )
+
+    Inputs annotated as a ``pyarrow.RecordBatchReader`` are streamed from DuckDB one record batch
+    at a time, rather than being loaded into memory as a whole.
+
+    .. code-block:: python
+
+        @asset(
+            partitions_def=DailyPartitionsDefinition(start_date="2024-01-01"),
+            metadata={"partition_expr": "date"},
+        )
+        def my_daily_table() -> pa.Table:
+            ...
+
+        @asset
+        def my_daily_table_totals(my_daily_table: pa.RecordBatchReader) -> pa.Table:
+            # every partition of my_daily_table is streamed from duckdb
+            for batch in my_daily_table:
+                ...
+
+    """
+
+    @classmethod
+    def _is_dagster_maintained(cls) -> bool:
+        return True
+
+    @staticmethod
+    def type_handlers() -> Sequence[DbTypeHandler]:
+        return [DuckDBPyArrowTypeHandler()]
+
+    @staticmethod
+    def default_load_type() -> Optional[type]:
+        return pa.Table
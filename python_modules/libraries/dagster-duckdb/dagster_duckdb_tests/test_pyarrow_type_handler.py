@@ -0,0 +1,140 @@
+import os
+from contextlib import contextmanager
+from unittest import mock
+
+import duckdb
+import pyarrow as pa
+import pytest
+from dagster import AssetExecutionContext, AssetIn, StaticPartitionsDefinition, asset, materialize
+from dagster_duckdb import DuckDBPyArrowIOManager
+from dagster_duckdb.io_manager import DuckDbClient
+
+
+@pytest.fixture
+def io_manager(tmp_path):
+    return DuckDBPyArrowIOManager(database=os.path.join(tmp_path, "unit_test.duckdb"))
+
+
+@asset(key_prefix=["my_schema"])
+def b_table() -> pa.Table:
+    return pa.table({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+
+@asset(key_prefix=["my_schema"])
+def b_plus_one(b_table: pa.Table) -> pa.Table:
+    return pa.table({"a": [a + 1 for a in b_table["a"].to_pylist()]})
+
+
+@asset(key_prefix=["my_schema"], ins={"b_table": AssetIn("b_table", metadata={"columns": ["b"]})})
+def b_batches(b_table: pa.RecordBatchReader) -> pa.RecordBatchReader:
+    assert isinstance(b_table, pa.RecordBatchReader)
+    return b_table
+
+
+def test_duckdb_pyarrow_io_manager_with_assets(tmp_path, io_manager):
+    # materialize asset twice to ensure that tables get properly deleted
+    for _ in range(2):
+        res = materialize([b_table, b_plus_one, b_batches], resources={"io_manager": io_manager})
+        assert res.success
+
+        materializations = {
+            event.asset_key.path[-1]: event.materialization.metadata
+            for event in res.get_asset_materialization_events()
+        }
+        assert materializations["b_table"]["dagster/row_count"].value == 3
+        # the number of rows of a record batch reader is not known until it has been stored
+        assert "dagster/row_count" not in materializations["b_batches"]
+
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+        assert duckdb_conn.execute("SELECT a FROM my_schema.b_plus_one").fetchall() == [
+            (2,),
+            (3,),
+            (4,),
+        ]
+        # the record batch reader loaded from one table was streamed into another
+        assert duckdb_conn.execute("SELECT * FROM my_schema.b_batches").fetchall() == [
+            (4,),
+            (5,),
+            (6,),
+        ]
+        duckdb_conn.close()
+
+
+@asset(
+    partitions_def=StaticPartitionsDefinition(["red", "yellow", "blue"]),
+    key_prefix=["my_schema"],
+    metadata={"partition_expr": "color"},
+)
+def static_partitioned(context: AssetExecutionContext) -> pa.Table:
+    return pa.table({"color": [context.partition_key] * 3, "b": [4, 5, 6]})
+
+
+@asset(key_prefix=["my_schema"])
+def static_partitioned_row_count(static_partitioned: pa.RecordBatchReader) -> pa.Table:
+    row_count = sum(batch.num_rows for batch in static_partitioned)
+    return pa.table({"row_count": [row_count]})
+
+
+def test_stream_partitioned_asset(tmp_path, io_manager):
+    for partition_key in ["red", "yellow", "blue"]:
+        assert materialize(
+            [static_partitioned],
+            partition_key=partition_key,
+            resources={"io_manager": io_manager},
+        ).success
+
+    res = materialize(
+        [static_partitioned, static_partitioned_row_count],
+        selection=[static_partitioned_row_count],
+        resources={"io_manager": io_manager},
+    )
+    assert res.success
+
+    duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+    assert duckdb_conn.execute(
+        "SELECT row_count FROM my_schema.static_partitioned_row_count"
+    ).fetchall() == [(9,)]
+    duckdb_conn.close()
+
+
+def test_stream_closed_on_teardown(io_manager):
+    readers = []
+
+    @asset(key_prefix=["my_schema"])
+    def b_first_batch(b_table: pa.RecordBatchReader) -> pa.Table:
+        # only the first record batch is read, and the reader outlives the step
+        readers.append(b_table)
+        return pa.Table.from_batches([b_table.read_next_batch()])
+
+    connections = []
+    connect = DuckDbClient.connect
+
+    @contextmanager
+    def _record_connection(context, table_slice):
+        with connect(context, table_slice) as connection:
+            connections.append(connection)
+            yield connection
+
+    with mock.patch.object(DuckDbClient, "connect", staticmethod(_record_connection)):
+        assert materialize([b_table, b_first_batch], resources={"io_manager": io_manager}).success
+
+    # the connection of the stream that was not read to the end is closed with the I/O manager
+    assert readers
+    assert connections
+    for connection in connections:
+        with pytest.raises(duckdb.ConnectionException):
+            connection.execute("SELECT 1")
+
+
+def test_create_io_manager_override(tmp_path):
+    created = []
+
+    class MyDuckDBPyArrowIOManager(DuckDBPyArrowIOManager):
+        def create_io_manager(self, context):
+            io_manager = super().create_io_manager(context)
+            created.append(io_manager)
+            return io_manager
+
+    io_manager = MyDuckDBPyArrowIOManager(database=os.path.join(tmp_path, "unit_test.duckdb"))
+    assert materialize([b_table, b_plus_one], resources={"io_manager": io_manager}).success
+    assert created
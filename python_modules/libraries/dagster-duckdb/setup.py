@@ -39,6 +39,7 @@ def get_version() -> str:
         "pandas": [
             "pandas",
         ],
+        "pyarrow": ["pyarrow"],
         "pyspark": ["pyspark>=3"],
     },
     zip_safe=False,
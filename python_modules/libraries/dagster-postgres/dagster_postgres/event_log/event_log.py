@@ -1,6 +1,10 @@
+import logging
+import os
+import threading
+from collections import defaultdict
 from collections.abc import Iterator, Mapping, Sequence
-from contextlib import contextmanager
-from typing import Any, ContextManager, Optional, cast  # noqa: UP035
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Optional, Union, cast  # noqa: UP035
 
 import dagster._check as check
 import sqlalchemy as db
@@ -21,7 +25,8 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingMultiRunEventWatcher
+from dagster._core.storage.event_log.sql_event_log import RUN_EVENT_PURGE_BATCH_SIZE
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -34,6 +39,16 @@
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
+from dagster_postgres.event_log.event_watcher import CHANNEL_NAME, PostgresEventWatcher
+from dagster_postgres.event_log.partitioning import (
+    DEFAULT_RUN_EVENTS_PARTITION,
+    count_default_run_events,
+    create_partitioned_event_logs_table,
+    delete_default_run_events,
+    drop_run_events_partitions,
+    ensure_run_events_partitions,
+    is_event_logs_table_partitioned,
+)
 from dagster_postgres.utils import (
     create_pg_connection,
     pg_alembic_config,
@@ -43,7 +58,9 @@
     set_pg_statement_timeout,
 )
 
-CHANNEL_NAME = "run_events"
+
+def _use_notify_event_watcher() -> bool:
+    return os.getenv("DAGSTER_POSTGRES_EVENT_WATCHER_USE_NOTIFY", "1") != "0"
 
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
@@ -80,20 +97,27 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        event_log_partition_size: Optional[int] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self._event_log_partition_size = check.opt_int_param(
+            event_log_partition_size, "event_log_partition_size"
+        )
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
-        self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_watcher: Optional[
+            Union[PostgresEventWatcher, SqlPollingMultiRunEventWatcher]
+        ] = None
 
         self._secondary_index_cache = {}
+        self._batch_connection = threading.local()
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -104,14 +128,44 @@ def __init__(
                 self.reindex_events()
                 self.reindex_assets()
 
+        self._has_partitioned_event_logs = self._init_partitions()
+
         super().__init__()
 
     def _init_db(self) -> None:
         with self._connect() as conn:
             with conn.begin():
-                SqlEventLogStorageMetadata.create_all(conn)
+                if self._event_log_partition_size:
+                    create_partitioned_event_logs_table(conn, self._event_log_partition_size)
+                    SqlEventLogStorageMetadata.create_all(
+                        conn,
+                        tables=[
+                            table
+                            for table in SqlEventLogStorageMetadata.sorted_tables
+                            if table is not SqlEventLogStorageTable
+                        ],
+                    )
+                else:
+                    SqlEventLogStorageMetadata.create_all(conn)
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
 
+    def _init_partitions(self) -> bool:
+        if not self._event_log_partition_size:
+            return False
+
+        with self._connect() as conn:
+            if not is_event_logs_table_partitioned(conn):
+                logging.warning(
+                    "event_log_partition_size is set, but the existing event_logs table is not"
+                    " partitioned. Event log retention will delete rows instead of dropping"
+                    " partitions."
+                )
+                return False
+
+        # partitions for upcoming events are created by the event log retention daemon, rather
+        # than by every process that initializes the storage
+        return True
+
     def optimize_for_webserver(
         self, statement_timeout: int, pool_recycle: int, max_overflow: int
     ) -> None:
@@ -136,6 +190,8 @@ def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+            if self._has_partitioned_event_logs:
+                ensure_run_events_partitions(conn, check.not_none(self._event_log_partition_size))
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -153,11 +209,14 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            event_log_partition_size=config_value.get("event_log_partition_size"),
         )
 
     @staticmethod
     def create_clean_storage(
-        conn_string: str, should_autocreate_tables: bool = True
+        conn_string: str,
+        should_autocreate_tables: bool = True,
+        event_log_partition_size: Optional[int] = None,
     ) -> "PostgresEventLogStorage":
         engine = create_engine(
             conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
@@ -167,7 +226,11 @@ def create_clean_storage(
         finally:
             engine.dispose()
 
-        return PostgresEventLogStorage(conn_string, should_autocreate_tables)
+        return PostgresEventLogStorage(
+            conn_string,
+            should_autocreate_tables,
+            event_log_partition_size=event_log_partition_size,
+        )
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a run.
@@ -187,7 +250,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # consumed by PostgresEventWatcher to push new events to watchers of this run
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -219,18 +282,103 @@ def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
             f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
         )
 
+        self._store_events(events)
+
+    def store_buffered_events(self, events: Sequence[EventLogEntry]) -> None:
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        self._store_events(events)
+
+    def _store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store events of any type with a single multi-row insert, preserving their order.
+
+        Asset index and asset event tag updates for the events are also coalesced, so that the
+        number of round trips is independent of the number of events. The events and all of their
+        index updates are written in a single transaction, so if an error is raised none of the
+        events have been stored and they can safely be retried event by event.
+        """
+        if not events:
+            return
+
         insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
+        with self._batch_transaction() as conn:
             result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
             event_ids = [cast(int, row[0]) for row in result.fetchall()]
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+            if any(event_id is None for event_id in event_ids):
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
 
-        if any(event_id is None for event_id in event_ids):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+            asset_events = []
+            asset_event_ids = []
+            for entry, event_id in zip(events, event_ids):
+                if not entry.is_dagster_event:
+                    continue
+                if entry.dagster_event_type in ASSET_EVENTS and entry.dagster_event.asset_key:  # type: ignore
+                    asset_events.append(entry)
+                    asset_event_ids.append(event_id)
+                if entry.dagster_event_type in ASSET_CHECK_EVENTS:
+                    self.store_asset_check_event(entry, event_id)
+
+            if asset_events:
+                self._store_asset_event_batch(asset_events, asset_event_ids)
+                self.store_asset_event_tags(asset_events, asset_event_ids)
+
+            # notifications are only delivered once the transaction commits, once per run with the
+            # last event id, which is all PostgresEventWatcher needs
+            last_event_id_by_run_id = {
+                event.run_id: event_id for event, event_id in zip(events, event_ids)
+            }
+            for run_id, event_id in last_event_id_by_run_id.items():
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(event_id)},
+                )
 
-        self.store_asset_event_tags(events, event_ids)
+    @contextmanager
+    def _batch_transaction(self) -> Iterator[Connection]:
+        # Index writes made while the batch is being stored (e.g. by `store_asset_check_event`) go
+        # through `index_connection`, which joins this transaction on the current thread.
+        with self._connect() as conn:
+            conn = conn.execution_options(isolation_level="READ COMMITTED")  # noqa: PLW2901
+            with conn.begin():
+                self._batch_connection.conn = conn
+                try:
+                    yield conn
+                finally:
+                    self._batch_connection.conn = None
+
+    def _store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        # Applying the asset entry values of each event in order is equivalent to applying the
+        # merged values per asset key, since every update overwrites a fixed set of columns. Keys
+        # that update the same set of columns are then upserted with a single statement.
+        has_asset_key_index_cols = self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        values_by_asset_key: dict[str, dict[str, Any]] = {}
+        for entry, event_id in zip(events, event_ids):
+            asset_key_str = entry.get_dagster_event().asset_key.to_string()  # type: ignore
+            values_by_asset_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(entry, event_id, has_asset_key_index_cols)
+            )
+
+        rows_by_columns: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+        for asset_key_str, values in values_by_asset_key.items():
+            rows_by_columns[tuple(sorted(values.keys()))].append(
+                dict(asset_key=asset_key_str, **values)
+            )
+
+        with self.index_connection() as conn:
+            for columns, rows in rows_by_columns.items():
+                query = db_dialects.postgresql.insert(AssetKeyTable).values(rows)
+                if columns:
+                    query = query.on_conflict_do_update(
+                        index_elements=[AssetKeyTable.c.asset_key],
+                        set_={column: query.excluded[column] for column in columns},
+                    )
+                else:
+                    query = query.on_conflict_do_nothing()
+                conn.execute(query)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -304,6 +452,40 @@ def add_dynamic_partitions(
                 .on_conflict_do_nothing(),
             )
 
+    @property
+    def requires_event_log_maintenance(self) -> bool:
+        return self._has_partitioned_event_logs
+
+    def maintain_event_log(self) -> None:
+        if not self._has_partitioned_event_logs:
+            return
+
+        with self._connect() as conn:
+            ensure_run_events_partitions(conn, check.not_none(self._event_log_partition_size))
+            num_default_events = count_default_run_events(conn)
+
+        if num_default_events:
+            logging.warning(
+                f"{num_default_events} events are stored in {DEFAULT_RUN_EVENTS_PARTITION}, since"
+                " no partition covered their ids when they were stored. Event log retention"
+                " deletes them row by row rather than dropping them with a partition. Increase"
+                " event_log_partition_size if this happens regularly."
+            )
+
+    def purge_run_events(self, before: float) -> None:
+        if not self._has_partitioned_event_logs:
+            super().purge_run_events(before)
+            return
+
+        # drop whole partitions of run events instead of deleting rows. Only the default
+        # partition, which is never dropped, is deleted from.
+        with self._connect() as conn:
+            drop_run_events_partitions(conn, before)
+        max_purged_id = self._get_max_event_id_before(before)
+        if max_purged_id is not None:
+            with self._connect() as conn:
+                delete_default_run_events(conn, max_purged_id, RUN_EVENT_PURGE_BATCH_SIZE)
+
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
@@ -311,6 +493,9 @@ def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connect
         return self._connect()
 
     def index_connection(self) -> ContextManager[Connection]:
+        batch_connection = getattr(self._batch_connection, "conn", None)
+        if batch_connection is not None:
+            return nullcontext(batch_connection)
         return self._connect()
 
     @contextmanager
@@ -346,10 +531,21 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = self._create_event_watcher()
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
+    def _create_event_watcher(self) -> Union[PostgresEventWatcher, SqlPollingMultiRunEventWatcher]:
+        if _use_notify_event_watcher():
+            try:
+                return PostgresEventWatcher(self)
+            except Exception:
+                logging.getLogger("dagster").warning(
+                    "Unable to LISTEN for event log notifications, falling back to polling.",
+                    exc_info=True,
+                )
+        return SqlPollingMultiRunEventWatcher(self)
+
     def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
         with self._engine.connect() as conn:
             cursor_res = conn.execute(
@@ -0,0 +1,267 @@
+import logging
+import os
+import select
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+import dagster._check as check
+import psycopg2.extensions
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import CallbackAfterCursor
+from dagster._core.storage.sql import create_engine
+from sqlalchemy import pool as db_pool
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from dagster_postgres.event_log.event_log import PostgresEventLogStorage
+
+CHANNEL_NAME = "run_events"
+
+# How long the watcher thread blocks waiting for notifications before checking for new or removed
+# watches
+NOTIFY_WAIT_PERIOD = 0.250  # 250ms
+
+# Watched runs are re-queried on this cadence even if no notification has been received, to pick up
+# events written by processes that do not send notifications
+FALLBACK_POLL_PERIOD = 16.0  # 16s
+
+# How long to wait before trying to re-establish a dropped LISTEN connection
+RECONNECT_PERIOD = 5.0  # 5s
+
+# While the LISTEN connection is down, watched runs are polled with an exponential backoff, starting
+# at NOTIFY_WAIT_PERIOD and doubling after every poll up to this period
+MAX_DISCONNECTED_POLL_PERIOD = 4.0  # 4s
+
+
+def parse_notify_payload(payload: str) -> Optional[tuple[str, int]]:
+    """Parse a `run_events` notification payload of the form `{run_id}_{storage_id}`."""
+    run_id, _, storage_id = payload.rpartition("_")
+    if not run_id or not storage_id.isdigit():
+        return None
+    return run_id, int(storage_id)
+
+
+class PostgresEventWatcher:
+    """Event log watcher that uses Postgres LISTEN/NOTIFY to push new events to all watched runs.
+
+    A single background thread holds one dedicated connection that listens on the `run_events`
+    channel, which `PostgresEventLogStorage` notifies whenever it writes events. When a notification
+    arrives for a watched run_id, the thread fetches the new records for that run once and fans them
+    out to every callback registered for it. Watched runs are also re-queried every
+    FALLBACK_POLL_PERIOD, and with an exponential backoff while the LISTEN connection is down, so
+    that missed notifications only delay delivery rather than dropping events.
+
+    LOCKING INFO:
+        ORDER: _lock
+        INVARIANTS: _lock protects _callbacks_by_run_id, _cursor_by_run_id and _dirty_run_ids
+    """
+
+    def __init__(self, event_log_storage: "PostgresEventLogStorage"):
+        from dagster_postgres.event_log.event_log import PostgresEventLogStorage
+
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", PostgresEventLogStorage
+        )
+        self._lock = threading.Lock()
+        self._callbacks_by_run_id: MutableMapping[str, list[CallbackAfterCursor]] = {}
+        self._cursor_by_run_id: MutableMapping[str, Optional[str]] = {}
+        self._dirty_run_ids: set[str] = set()
+        self._disposed = False
+        self._should_thread_exit = threading.Event()
+
+        # Connect eagerly so that callers can fall back to polling if LISTEN is not available
+        self._listen_engine = create_engine(
+            event_log_storage.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+        )
+        self._listen_conn = self._listen()
+
+        self._thread = threading.Thread(target=self._run, name="postgres-event-watch", daemon=True)
+        self._thread.start()
+
+    def _listen(self):
+        conn = self._listen_engine.raw_connection()
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            cursor = conn.cursor()
+            cursor.execute(f"LISTEN {CHANNEL_NAME};")
+            cursor.close()
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._callbacks_by_run_id
+
+    def watch_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        check.invariant(not self._disposed, "Attempted to watch_run after close")
+
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                self._callbacks_by_run_id[run_id] = []
+                self._cursor_by_run_id[run_id] = cursor
+            self._callbacks_by_run_id[run_id].append(CallbackAfterCursor(cursor, callback))
+            # fetch any events written since the cursor on the next iteration of the thread
+            self._dirty_run_ids.add(run_id)
+
+    def unwatch_run(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                return
+            self._callbacks_by_run_id[run_id] = [
+                callback_with_cursor
+                for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                if callback_with_cursor.callback != handler
+            ]
+            if not self._callbacks_by_run_id[run_id]:
+                del self._callbacks_by_run_id[run_id]
+                del self._cursor_by_run_id[run_id]
+                self._dirty_run_ids.discard(run_id)
+
+    def close(self) -> None:
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            self._thread.join()
+            with self._lock:
+                self._callbacks_by_run_id = {}
+                self._cursor_by_run_id = {}
+                self._dirty_run_ids = set()
+            self._listen_engine.dispose()
+
+    def _run(self) -> None:
+        last_poll_time = time.monotonic()
+        last_connect_attempt_time = last_poll_time
+        last_disconnected_poll_time = last_poll_time
+        disconnected_poll_period = NOTIFY_WAIT_PERIOD
+        while not self._should_thread_exit.is_set():
+            if self._listen_conn is None:
+                # Without a LISTEN connection we cannot rely on notifications, so poll all watched
+                # runs, backing off for as long as the connection stays down
+                self._should_thread_exit.wait(NOTIFY_WAIT_PERIOD)
+                if time.monotonic() - last_disconnected_poll_time >= disconnected_poll_period:
+                    last_disconnected_poll_time = time.monotonic()
+                    disconnected_poll_period = min(
+                        disconnected_poll_period * 2, MAX_DISCONNECTED_POLL_PERIOD
+                    )
+                    self._mark_all_dirty()
+                if time.monotonic() - last_connect_attempt_time >= RECONNECT_PERIOD:
+                    last_connect_attempt_time = time.monotonic()
+                    self._reconnect()
+            else:
+                last_disconnected_poll_time = time.monotonic()
+                disconnected_poll_period = NOTIFY_WAIT_PERIOD
+                self._wait_for_notifications()
+
+            if time.monotonic() - last_poll_time >= FALLBACK_POLL_PERIOD:
+                last_poll_time = time.monotonic()
+                self._mark_all_dirty()
+
+            try:
+                self._fetch_and_dispatch()
+            except Exception:
+                logging.exception("Exception while fetching events for watched runs.")
+
+        self._close_listen_conn()
+
+    def _wait_for_notifications(self) -> None:
+        conn = check.not_none(self._listen_conn)
+        try:
+            readable, _, _ = select.select([conn], [], [], NOTIFY_WAIT_PERIOD)
+            if not readable:
+                return
+            conn.poll()
+            notifies = list(conn.notifies)
+            conn.notifies.clear()
+        except Exception:
+            logging.exception(
+                "Lost LISTEN connection for event log watch, falling back to polling."
+            )
+            self._close_listen_conn()
+            return
+
+        with self._lock:
+            for notify in notifies:
+                parsed = parse_notify_payload(notify.payload)
+                if parsed and parsed[0] in self._callbacks_by_run_id:
+                    self._dirty_run_ids.add(parsed[0])
+
+    def _reconnect(self) -> None:
+        try:
+            self._listen_conn = self._listen()
+        except Exception:
+            self._listen_conn = None
+            return
+        # events may have been written while we were disconnected
+        self._mark_all_dirty()
+
+    def _close_listen_conn(self) -> None:
+        if self._listen_conn is not None:
+            try:
+                self._listen_conn.close()
+            except Exception:
+                pass
+            self._listen_conn = None
+
+    def _mark_all_dirty(self) -> None:
+        with self._lock:
+            self._dirty_run_ids.update(self._callbacks_by_run_id.keys())
+
+    def _fetch_and_dispatch(self) -> None:
+        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
+        with self._lock:
+            dirty_run_ids = [
+                run_id for run_id in self._dirty_run_ids if run_id in self._callbacks_by_run_id
+            ]
+            self._dirty_run_ids = set()
+
+        for run_id in dirty_run_ids:
+            has_more = True
+            while has_more:
+                with self._lock:
+                    if run_id not in self._cursor_by_run_id:
+                        break
+                    cursor = self._cursor_by_run_id[run_id]
+
+                conn = self._event_log_storage.get_records_for_run(
+                    run_id, cursor=cursor, limit=chunk_limit
+                )
+                has_more = conn.has_more
+
+                with self._lock:
+                    if run_id not in self._cursor_by_run_id:
+                        break
+                    self._cursor_by_run_id[run_id] = conn.cursor
+                    callbacks = list(self._callbacks_by_run_id[run_id])
+
+                for event_record in conn.records:
+                    for callback_with_cursor in callbacks:
+                        if (
+                            callback_with_cursor.cursor is None
+                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                            < event_record.storage_id
+                        ):
+                            callback_with_cursor.callback(
+                                event_record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                            )
@@ -0,0 +1,241 @@
+"""Partitioned schema for the postgres event_logs table.
+
+The table is list partitioned on whether each row has an asset key:
+
+    event_logs
+      event_logs_assets            asset events, which are kept indefinitely
+      event_logs_runs              all other events, range partitioned by id
+        event_logs_runs_<start>_<end>
+        event_logs_runs_default
+
+Since only asset events are indexed by asset key, queries by asset key are pruned to the assets
+partition, and queries for the events of a run which are bounded by a cursor are pruned to the
+range partitions after that cursor. Retention drops whole range partitions of run events instead of
+deleting rows, which avoids bloating the table and its indexes.
+
+Range partitions are created ahead of the id sequence when the table is created or upgraded, and
+then periodically by the event log retention daemon, far enough ahead to cover the events stored
+between its iterations. Events that are stored before a partition covering their id exists land in
+the default partition, which is never dropped, so retention deletes its rows instead and the daemon
+warns when it is not empty.
+"""
+
+import re
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+import sqlalchemy as db
+from dagster._core.storage.event_log import SqlEventLogStorageTable
+from dagster._core.storage.sqlalchemy_compat import db_select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+EVENT_LOGS_TABLE = "event_logs"
+ASSET_EVENTS_PARTITION = "event_logs_assets"
+RUN_EVENTS_PARTITION = "event_logs_runs"
+DEFAULT_RUN_EVENTS_PARTITION = "event_logs_runs_default"
+RUN_EVENTS_PARTITIONS_AHEAD = 10
+
+_RUN_EVENTS_RANGE_PARTITION_PATTERN = re.compile(rf"^{RUN_EVENTS_PARTITION}_(\d+)_(\d+)$")
+
+# serializes partition maintenance across processes sharing the same database
+_PARTITION_MAINTENANCE_LOCK_ID = 0x646167737465720
+
+
+class RunEventsPartition(NamedTuple):
+    name: str
+    start_id: int
+    end_id: int
+
+
+@contextmanager
+def _partition_maintenance_lock(conn: Connection) -> Iterator[None]:
+    # storage connections are in autocommit mode, so a session level lock is used rather than a
+    # transaction level one
+    conn.execute(
+        db.text("SELECT pg_advisory_lock(:lock_id)"), {"lock_id": _PARTITION_MAINTENANCE_LOCK_ID}
+    )
+    try:
+        yield
+    finally:
+        conn.execute(
+            db.text("SELECT pg_advisory_unlock(:lock_id)"),
+            {"lock_id": _PARTITION_MAINTENANCE_LOCK_ID},
+        )
+
+
+def _get_last_event_id(conn: Connection) -> Optional[int]:
+    sequence_name = conn.execute(
+        db.text("SELECT pg_get_serial_sequence(:table_name, 'id')"),
+        {"table_name": EVENT_LOGS_TABLE},
+    ).scalar()
+    return conn.execute(db.text(f"SELECT last_value FROM {sequence_name}")).scalar()
+
+
+def _get_max_id(conn: Connection, table_name: str) -> Optional[int]:
+    table = db.table(table_name, db.column("id"))
+    return conn.execute(db_select([db.func.max(table.c.id)])).scalar()
+
+
+def _get_latest_timestamp(conn: Connection, table_name: str) -> Optional[datetime]:
+    table = db.table(table_name, db.column("id"), db.column("timestamp"))
+    return conn.execute(
+        db_select([table.c.timestamp]).order_by(table.c.id.desc()).limit(1)
+    ).scalar()
+
+
+def is_event_logs_table_partitioned(conn: Connection) -> bool:
+    return bool(
+        conn.execute(
+            db.text(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table_name)"
+            ),
+            {"table_name": EVENT_LOGS_TABLE},
+        ).scalar()
+    )
+
+
+def create_partitioned_event_logs_table(conn: Connection, partition_size: int) -> None:
+    """Creates the event_logs table with a partitioned schema, along with its indexes."""
+    dialect = postgresql.dialect()
+    # postgres requires the partition key of a table to be part of any primary key, so the id
+    # column is only indexed. Ids are still unique, since they are assigned by the same sequence.
+    columns = ",\n    ".join(
+        str(CreateColumn(column).compile(dialect=dialect)).strip()
+        for column in SqlEventLogStorageTable.columns
+    )
+    conn.execute(
+        db.text(
+            f"CREATE TABLE {EVENT_LOGS_TABLE} (\n    {columns}\n)"
+            " PARTITION BY LIST ((asset_key IS NOT NULL))"
+        )
+    )
+    conn.execute(
+        db.text(
+            f"CREATE TABLE {ASSET_EVENTS_PARTITION} PARTITION OF {EVENT_LOGS_TABLE}"
+            " FOR VALUES IN (true)"
+        )
+    )
+    conn.execute(
+        db.text(
+            f"CREATE TABLE {RUN_EVENTS_PARTITION} PARTITION OF {EVENT_LOGS_TABLE}"
+            " FOR VALUES IN (false) PARTITION BY RANGE (id)"
+        )
+    )
+    conn.execute(
+        db.text(
+            f"CREATE TABLE {DEFAULT_RUN_EVENTS_PARTITION} PARTITION OF {RUN_EVENTS_PARTITION}"
+            " DEFAULT"
+        )
+    )
+    conn.execute(db.text(f"CREATE INDEX idx_event_logs_id ON {EVENT_LOGS_TABLE} (id)"))
+    for index in SqlEventLogStorageTable.indexes:
+        index.create(conn)
+
+    ensure_run_events_partitions(conn, partition_size)
+
+
+def get_run_events_partitions(conn: Connection) -> Sequence[RunEventsPartition]:
+    """Returns the range partitions of run events, ordered by the ids that they cover."""
+    rows = conn.execute(
+        db.text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+            " WHERE i.inhparent = to_regclass(:table_name)"
+        ),
+        {"table_name": RUN_EVENTS_PARTITION},
+    ).fetchall()
+
+    partitions = []
+    for (name,) in rows:
+        match = _RUN_EVENTS_RANGE_PARTITION_PATTERN.match(name)
+        if match:
+            partitions.append(
+                RunEventsPartition(name, start_id=int(match.group(1)), end_id=int(match.group(2)))
+            )
+    return sorted(partitions, key=lambda partition: partition.start_id)
+
+
+def ensure_run_events_partitions(conn: Connection, partition_size: int) -> Sequence[str]:
+    """Creates range partitions of run events so that the ids of the next
+    RUN_EVENTS_PARTITIONS_AHEAD partitions worth of events are covered. Returns the names of the
+    created partitions.
+    """
+    with _partition_maintenance_lock(conn):
+        partitions = get_run_events_partitions(conn)
+        last_id = _get_last_event_id(conn)
+        # a new partition can't cover ids of events that were already stored in the default
+        # partition, so partitions always start after them
+        max_default_id = _get_max_id(conn, DEFAULT_RUN_EVENTS_PARTITION)
+
+        start_id = partitions[-1].end_id if partitions else 0
+        if max_default_id is not None and max_default_id >= start_id:
+            start_id = (max_default_id // partition_size + 1) * partition_size
+        target_id = (last_id or 0) + partition_size * RUN_EVENTS_PARTITIONS_AHEAD
+
+        created = []
+        while start_id <= target_id:
+            end_id = start_id + partition_size
+            name = f"{RUN_EVENTS_PARTITION}_{start_id}_{end_id}"
+            conn.execute(
+                db.text(
+                    f"CREATE TABLE {name} PARTITION OF {RUN_EVENTS_PARTITION}"
+                    f" FOR VALUES FROM ({start_id}) TO ({end_id})"
+                )
+            )
+            created.append(name)
+            start_id = end_id
+
+    return created
+
+
+def count_default_run_events(conn: Connection) -> int:
+    """Returns the number of events in the default partition of run events."""
+    table = db.table(DEFAULT_RUN_EVENTS_PARTITION, db.column("id"))
+    return conn.execute(db_select([db.func.count()]).select_from(table)).scalar() or 0
+
+
+def delete_default_run_events(conn: Connection, max_id: int, batch_size: int) -> None:
+    """Deletes the events in the default partition of run events with ids up to max_id, in batches
+    so that each statement only holds locks on a bounded number of rows.
+    """
+    table = db.table(DEFAULT_RUN_EVENTS_PARTITION, db.column("id"))
+    while True:
+        event_ids = [
+            row[0]
+            for row in conn.execute(
+                db_select([table.c.id])
+                .where(table.c.id <= max_id)
+                .order_by(table.c.id.asc())
+                .limit(batch_size)
+            ).fetchall()
+        ]
+        if not event_ids:
+            return
+        conn.execute(table.delete().where(table.c.id.in_(event_ids)))
+
+
+def drop_run_events_partitions(conn: Connection, before: float) -> Sequence[str]:
+    """Drops the range partitions of run events which only contain events stored before the given
+    timestamp. Returns the names of the dropped partitions.
+    """
+    before_datetime = datetime.fromtimestamp(before, timezone.utc).replace(tzinfo=None)
+    dropped = []
+    with _partition_maintenance_lock(conn):
+        last_id = _get_last_event_id(conn)
+        for partition in get_run_events_partitions(conn):
+            # never drop partitions that may still receive new events
+            if last_id is None or partition.end_id > last_id:
+                break
+
+            latest_timestamp = _get_latest_timestamp(conn, partition.name)
+            if latest_timestamp is not None and latest_timestamp >= before_datetime:
+                # partitions cover increasing ids, so later partitions only contain newer events
+                break
+
+            conn.execute(db.text(f"DROP TABLE {partition.name}"))
+            dropped.append(partition.name)
+
+    return dropped
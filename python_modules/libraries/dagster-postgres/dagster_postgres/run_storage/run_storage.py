@@ -1,4 +1,3 @@
-import zlib
 from collections.abc import Mapping
 from typing import ContextManager, Optional  # noqa: UP035
 
@@ -229,7 +228,7 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 db_dialects.postgresql.insert(SnapshotsTable)
                 .values(
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                    snapshot_body=self._serialize_snapshot_body(snapshot_obj),
                     snapshot_type=snapshot_type.value,
                 )
                 .on_conflict_do_nothing()
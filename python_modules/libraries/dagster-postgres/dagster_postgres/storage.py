@@ -39,6 +39,7 @@ def __init__(
         postgres_url,
         should_autocreate_tables=True,
         inst_data: Optional[ConfigurableClassData] = None,
+        event_log_partition_size: Optional[int] = None,
     ):
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
@@ -46,7 +47,11 @@ def __init__(
         )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._run_storage = PostgresRunStorage(postgres_url, should_autocreate_tables)
-        self._event_log_storage = PostgresEventLogStorage(postgres_url, should_autocreate_tables)
+        self._event_log_storage = PostgresEventLogStorage(
+            postgres_url,
+            should_autocreate_tables,
+            event_log_partition_size=event_log_partition_size,
+        )
         self._schedule_storage = PostgresScheduleStorage(postgres_url, should_autocreate_tables)
         super().__init__()
 
@@ -66,6 +71,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            event_log_partition_size=config_value.get("event_log_partition_size"),
         )
 
     @property
@@ -4,19 +4,46 @@
 
 import objgraph
 import pytest
+import sqlalchemy as db
 import yaml
+from dagster._core.events import DagsterEventType
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingMultiRunEventWatcher
 from dagster._core.test_utils import ensure_dagster_tests_import, instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_watcher import (
+    FALLBACK_POLL_PERIOD,
+    PostgresEventWatcher,
+    parse_notify_payload,
+)
+from dagster_postgres.event_log.partitioning import (
+    ASSET_EVENTS_PARTITION,
+    DEFAULT_RUN_EVENTS_PARTITION,
+    RUN_EVENTS_PARTITIONS_AHEAD,
+    count_default_run_events,
+    drop_run_events_partitions,
+    get_run_events_partitions,
+    is_event_logs_table_partitioned,
+)
 
 ensure_dagster_tests_import()
 from dagster_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
+    _event_types,
+    _synthesize_events,
     create_test_event_log_record,
+    one_asset_op,
 )
 
 
+def test_parse_notify_payload():
+    run_id = make_new_run_id()
+    assert parse_notify_payload(f"{run_id}_123") == (run_id, 123)
+    assert parse_notify_payload("not_a_payload") is None
+    assert parse_notify_payload("123") is None
+
+
 @contextmanager
 def _clean_storage(conn_string):
     storage = PostgresEventLogStorage.create_clean_storage(conn_string)
@@ -103,11 +130,45 @@ def watch_two(event, _cursor):
 
             assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
             assert [int(evt.message) for evt in watched_2] == [4, 5]
-            assert len(objgraph.by_type("SqlPollingEventWatcher")) == 1
+            assert len(objgraph.by_type("PostgresEventWatcher")) == 1
 
-        # ensure we clean up poller on exit
+        # ensure we clean up watcher on exit
         gc.collect()
-        assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
+        assert len(objgraph.by_type("PostgresEventWatcher")) == 0
+
+    def test_event_log_storage_watch_notify_latency(self, conn_string):
+        with _clean_storage(conn_string) as storage:
+            run_id = make_new_run_id()
+            watched = []
+            storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+            time.sleep(0.5)
+
+            # events should be pushed well before the first fallback poll
+            start = time.time()
+            storage.store_event(create_test_event_log_record("1", run_id=run_id))
+            storage.store_buffered_events(
+                [create_test_event_log_record(str(i), run_id=run_id) for i in range(2, 5)]
+            )
+            while len(watched) < 4 and time.time() - start < FALLBACK_POLL_PERIOD / 2:
+                time.sleep(0.05)
+
+            assert [int(evt.message) for evt in watched] == [1, 2, 3, 4]
+            assert isinstance(storage._event_watcher, PostgresEventWatcher)  # noqa: SLF001
+
+    def test_event_log_storage_watch_polling_fallback(self, conn_string, monkeypatch):
+        monkeypatch.setenv("DAGSTER_POSTGRES_EVENT_WATCHER_USE_NOTIFY", "0")
+        with _clean_storage(conn_string) as storage:
+            run_id = make_new_run_id()
+            watched = []
+            storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+            assert isinstance(storage._event_watcher, SqlPollingMultiRunEventWatcher)  # noqa: SLF001
+
+            storage.store_event(create_test_event_log_record("1", run_id=run_id))
+            attempts = 10
+            while len(watched) < 1 and attempts > 0:
+                time.sleep(0.5)
+                attempts -= 1
+            assert len(watched) == 1
 
     def test_load_from_config(self, hostname):
         url_cfg = f"""
@@ -137,3 +198,140 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage  # noqa: SLF001
 
                 assert from_url.postgres_url == from_explicit.postgres_url  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class TestPartitionedPostgresEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(name="instance", scope="function")
+    def instance(self, conn_string):
+        PostgresEventLogStorage.create_clean_storage(conn_string, event_log_partition_size=100)
+
+        with instance_for_test(
+            overrides={
+                "storage": {
+                    "postgres": {"postgres_url": conn_string, "event_log_partition_size": 100}
+                }
+            }
+        ) as instance:
+            yield instance
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self, instance):
+        event_log_storage = instance.event_log_storage
+        assert isinstance(event_log_storage, PostgresEventLogStorage)
+        yield event_log_storage
+
+    def test_create_partitioned_event_logs_table(self, storage):
+        with storage.index_connection() as conn:
+            assert is_event_logs_table_partitioned(conn)
+            partitions = get_run_events_partitions(conn)
+
+        # partitions are created ahead of the first events
+        assert [(partition.start_id, partition.end_id) for partition in partitions] == [
+            (start_id, start_id + 100)
+            for start_id in range(0, 100 * (RUN_EVENTS_PARTITIONS_AHEAD + 1), 100)
+        ]
+
+        events, result = _synthesize_events(lambda: one_asset_op())
+        for event in events:
+            storage.store_event(event)
+
+        # asset events are stored in the assets partition, and other events in the range partitions
+        with storage.index_connection() as conn:
+            num_asset_events = conn.execute(
+                db.text(f"SELECT COUNT(*) FROM {ASSET_EVENTS_PARTITION}")
+            ).scalar()
+            num_first_partition_events = conn.execute(
+                db.text(f"SELECT COUNT(*) FROM {partitions[0].name}")
+            ).scalar()
+            num_default_events = conn.execute(
+                db.text(f"SELECT COUNT(*) FROM {DEFAULT_RUN_EVENTS_PARTITION}")
+            ).scalar()
+        assert num_asset_events == len(
+            [event for event in events if event.dagster_event and event.dagster_event.asset_key]
+        )
+        assert num_first_partition_events == len(events) - num_asset_events
+        assert num_default_events == 0
+        assert _event_types(storage.get_logs_for_run(result.run_id)) == _event_types(events)
+
+    def test_drop_run_events_partitions(self, storage):
+        run_id = make_new_run_id()
+        while (storage.get_maximum_record_id() or 0) < 150:
+            storage.store_event(create_test_event_log_record("old", run_id=run_id))
+
+        with storage.index_connection() as conn:
+            # partitions with events stored after the cutoff are kept
+            assert drop_run_events_partitions(conn, time.time() - 3600) == []
+
+            # the partition that is still receiving events is kept, even if all of its events are
+            # older than the cutoff
+            assert drop_run_events_partitions(conn, time.time() + 3600) == ["event_logs_runs_0_100"]
+            partition_names = [partition.name for partition in get_run_events_partitions(conn)]
+        assert partition_names[0] == "event_logs_runs_100_200"
+
+        records = storage.get_records_for_run(run_id).records
+        assert min(record.storage_id for record in records) >= 100
+
+    def test_maintain_event_log(self, storage):
+        assert storage.requires_event_log_maintenance
+
+        # partitions are only created ahead by maintenance, not when the storage is initialized
+        with storage.index_connection() as conn:
+            partitions = get_run_events_partitions(conn)
+            for partition in partitions[1:]:
+                conn.execute(db.text(f"DROP TABLE {partition.name}"))
+
+        # events that are not covered by a partition are stored in the default partition
+        run_id = make_new_run_id()
+        while (storage.get_maximum_record_id() or 0) < 110:
+            storage.store_event(create_test_event_log_record("uncovered", run_id=run_id))
+        with storage.index_connection() as conn:
+            assert count_default_run_events(conn) == 11
+
+        storage.maintain_event_log()
+        with storage.index_connection() as conn:
+            partition_names = [partition.name for partition in get_run_events_partitions(conn)]
+            assert count_default_run_events(conn) == 11
+        # new partitions start after the events in the default partition
+        assert partition_names[0] == partitions[0].name
+        assert partition_names[1] == "event_logs_runs_200_300"
+
+        # retention deletes the events of the default partition
+        storage.purge_run_events(time.time())
+        with storage.index_connection() as conn:
+            assert count_default_run_events(conn) == 0
+
+    def test_purge_run_events(self, storage):
+        with storage.index_connection() as conn:
+            assert is_event_logs_table_partitioned(conn)
+
+        old_events, old_result = _synthesize_events(lambda: one_asset_op())
+        for event in old_events:
+            storage.store_event(event)
+        # fill the first partition with events that are older than the cutoff
+        while storage.get_maximum_record_id() < 100:
+            storage.store_event(create_test_event_log_record("old", run_id=old_result.run_id))
+
+        before = time.time()
+
+        new_events, new_result = _synthesize_events(lambda: one_asset_op())
+        for event in new_events:
+            storage.store_event(event)
+
+        storage.purge_run_events(before)
+
+        with storage.index_connection() as conn:
+            partition_names = [partition.name for partition in get_run_events_partitions(conn)]
+        assert "event_logs_runs_0_100" not in partition_names
+        assert "event_logs_runs_100_200" in partition_names
+
+        # only the asset events of the dropped partition are kept
+        old_records = storage.get_records_for_run(old_result.run_id).records
+        assert all(
+            record.storage_id >= 100 or record.asset_key is not None for record in old_records
+        )
+        assert DagsterEventType.ASSET_MATERIALIZATION in _event_types(
+            [record.event_log_entry for record in old_records]
+        )
+        assert _event_types(storage.get_logs_for_run(new_result.run_id)) == _event_types(new_events)
@@ -11,10 +11,19 @@
 
 * This isn't meant to replace pickle in the conditions that pickle is reasonable to use
   (in memory, not human readable, etc) just handle the json case effectively.
+
+Values can also be serialized to a compact binary format with `serialize_value_to_bytes`, which
+uses pickle's opcode stream as an encoding of the same whitelisted structure rather than pickling
+arbitrary objects: unpickling is restricted to builtin containers and scalars, and the only globals
+that may be referenced are the hooks that construct whitelisted objects. `deserialize_value`
+accepts both formats.
 """
 
 import collections.abc
 import dataclasses
+import io
+import pickle
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import is_dataclass
@@ -934,8 +943,9 @@ def _transform_for_serialization(
             for key, value in cast(dict, val).items()
         }
     if tval is SerializableNonScalarKeyMapping:
-        return {
-            "__mapping_items__": [
+        return _pack_marker(
+            "__mapping_items__",
+            [
                 [
                     _transform_for_serialization(
                         k,
@@ -951,8 +961,9 @@ def _transform_for_serialization(
                     ),
                 ]
                 for k, v in cast(dict, val).items()
-            ]
-        }
+            ],
+            object_handler,
+        )
 
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -962,7 +973,9 @@ def _transform_for_serialization(
                 f" {klass_name}.\nDescent path: {descent_path}",
             )
         enum_serializer = whitelist_map.enum_serializers[klass_name]
-        return {"__enum__": enum_serializer.pack(val, whitelist_map, descent_path)}
+        return _pack_marker(
+            "__enum__", enum_serializer.pack(val, whitelist_map, descent_path), object_handler
+        )
     if (
         (isinstance(val, tuple) and hasattr(val, "_fields"))
         or isinstance(val, BaseModel)
@@ -981,8 +994,9 @@ def _transform_for_serialization(
         )
     if isinstance(val, set):
         set_path = descent_path + "{}"
-        return {
-            "__set__": [
+        return _pack_marker(
+            "__set__",
+            [
                 _transform_for_serialization(
                     item,
                     whitelist_map,
@@ -990,12 +1004,14 @@ def _transform_for_serialization(
                     set_path,
                 )
                 for item in sorted(list(val), key=str)
-            ]
-        }
+            ],
+            object_handler,
+        )
     if isinstance(val, frozenset):
         frz_set_path = descent_path + "{}"
-        return {
-            "__frozenset__": [
+        return _pack_marker(
+            "__frozenset__",
+            [
                 _transform_for_serialization(
                     item,
                     whitelist_map,
@@ -1003,8 +1019,9 @@ def _transform_for_serialization(
                     frz_set_path,
                 )
                 for item in sorted(list(val), key=str)
-            ]
-        }
+            ],
+            object_handler,
+        )
 
     # custom string subclasses
     if isinstance(val, str):
@@ -1035,6 +1052,20 @@ def _transform_for_serialization(
     raise SerializationError(f"Unhandled value type {tval}")
 
 
+def _pack_marker(
+    key: str,
+    value: JsonSerializableValue,
+    object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+) -> JsonSerializableValue:
+    # enums, sets and non-scalar key mappings are represented by dicts with a single marker key
+    if object_handler is _pack_binary_object:
+        if key == "__enum__":
+            # interned so that the pickle memo stores each member once per value
+            value = sys.intern(cast(str, value))
+        return _BinaryCall(_UnpackBinaryMarker, (key, value))  # type: ignore
+    return {key: value}
+
+
 def _pack_object(
     obj: SerializableObject, whitelist_map: WhitelistMap, descent_path: str
 ) -> Mapping[str, JsonSerializableValue]:
@@ -1088,6 +1119,195 @@ def _wrap_object(
     return _LazySerializationWrapper(obj, whitelist_map, descent_path)
 
 
+###################################################################################################
+# Binary serialization
+###################################################################################################
+
+# Binary values start with a null byte, which can never start a JSON document, followed by a
+# format identifier and version.
+BINARY_SERDES_HEADER: Final = b"\x00dsb"
+BINARY_SERDES_VERSION: Final = 1
+_BINARY_SERDES_PREFIX = BINARY_SERDES_HEADER + bytes([BINARY_SERDES_VERSION])
+_BINARY_PICKLE_PROTOCOL = 5
+
+# Objects of the same class are usually packed with the same fields. Interning the tuple of field
+# names means that the pickle memo stores it once per value, so repeated objects only reference it.
+# One tuple is kept per class name, and the number of classes is capped, so that values with
+# unexpected class names can not grow the cache without bound.
+_BINARY_FIELD_NAMES: dict[str, tuple[str, ...]] = {}
+_BINARY_FIELD_NAMES_MAX_SIZE: Final = 4096
+
+
+def _intern_field_names(storage_name: str, field_names: tuple[str, ...]) -> tuple[str, ...]:
+    interned = _BINARY_FIELD_NAMES.get(storage_name)
+    if interned == field_names:
+        return interned
+    if interned is not None or len(_BINARY_FIELD_NAMES) < _BINARY_FIELD_NAMES_MAX_SIZE:
+        _BINARY_FIELD_NAMES[storage_name] = field_names
+    return field_names
+
+
+class _BinaryHook:
+    """Stands in for one of the binary unpacking hooks. Hooks are pickled as references to their
+    class, which _BinaryUnpickler.find_class resolves to the corresponding unpacking method, so they
+    are never instantiated.
+    """
+
+
+class _UnpackBinaryObject(_BinaryHook):
+    pass
+
+
+class _UnpackBinaryMarker(_BinaryHook):
+    pass
+
+
+class _BinaryCall:
+    """A call to one of the binary unpacking hooks, made when the value is deserialized."""
+
+    __slots__ = ("args", "hook")
+
+    def __init__(self, hook: type[_BinaryHook], args: tuple[Any, ...]):
+        self.hook = hook
+        self.args = args
+
+
+def _pack_binary_object(
+    obj: SerializableObject, whitelist_map: WhitelistMap, descent_path: str
+) -> "_BinaryCall":
+    # the object_handler for _transform_for_serialization to produce values for serialize_value_to_bytes
+    klass_name = obj.__class__.__name__
+    serializer = whitelist_map.object_serializers[klass_name]
+    items = serializer.pack_items(obj, whitelist_map, _pack_binary_object, descent_path)
+    _, storage_name = next(items)  # __class__
+    # custom field serializers pack their values to the JSON representation
+    custom_storage_keys = (
+        {serializer.storage_field_names.get(key, key) for key in serializer.field_serializers}
+        if serializer.field_serializers
+        else None
+    )
+    packed_items = list(items)
+    field_names = _intern_field_names(storage_name, tuple([key for key, _ in packed_items]))
+    if custom_storage_keys:
+        values = [
+            _binary_from_json_packed(value) if key in custom_storage_keys else value
+            for key, value in packed_items
+        ]
+    else:
+        values = [value for _, value in packed_items]
+    return _BinaryCall(_UnpackBinaryObject, (storage_name, field_names, *values))
+
+
+def _binary_from_json_packed(val: JsonSerializableValue) -> Any:
+    # sequences are written as lists, as they would be in JSON
+    if isinstance(val, (list, tuple)):
+        return [_binary_from_json_packed(item) for item in val]
+    if isinstance(val, dict):
+        items = {key: _binary_from_json_packed(value) for key, value in val.items()}
+        if "__class__" in items:
+            storage_name = items.pop("__class__")
+            field_names = _intern_field_names(storage_name, tuple(items.keys()))
+            return _BinaryCall(_UnpackBinaryObject, (storage_name, field_names, *items.values()))
+        if len(items) == 1:
+            key = next(iter(items))
+            if key in ("__enum__", "__set__", "__frozenset__", "__mapping_items__"):
+                return _BinaryCall(_UnpackBinaryMarker, (key, items[key]))
+        return items
+    return val
+
+
+class _BinaryPickler(pickle.Pickler):
+    def reducer_override(self, obj: Any) -> Any:
+        if type(obj) is _BinaryCall:
+            return obj.hook, obj.args
+        # custom string subclasses are stored as plain strings, as they would be in JSON
+        if isinstance(obj, str):
+            return str, (str(obj),)
+        return NotImplemented
+
+
+class _BinaryUnpickler(pickle.Unpickler):
+    def __init__(self, data: bytes, whitelist_map: WhitelistMap, context: UnpackContext):
+        super().__init__(io.BytesIO(data))
+        self._whitelist_map = whitelist_map
+        self._context = context
+
+    def find_class(self, module_name: str, global_name: str) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if module_name == __name__:
+            if global_name == _UnpackBinaryObject.__name__:
+                return self._unpack_object
+            if global_name == _UnpackBinaryMarker.__name__:
+                return self._unpack_marker
+        elif module_name == "builtins" and global_name == "str":
+            return str
+        raise DeserializationError(
+            f"Binary serialized value references {module_name}.{global_name}, which is not"
+            " permitted."
+        )
+
+    def _unpack_object(
+        self, storage_name: str, field_names: tuple[str, ...], *values: UnpackedValue
+    ) -> UnpackedValue:
+        deserializer = self._whitelist_map.object_deserializers.get(storage_name)
+        if deserializer is None:
+            val: dict[str, Any] = {"__class__": storage_name}
+            val.update(zip(field_names, values))
+            return _unpack_object(val, self._whitelist_map, self._context)
+        return deserializer.unpack(
+            dict(zip(field_names, values)), self._whitelist_map, self._context
+        )
+
+    def _unpack_marker(self, key: str, value: UnpackedValue) -> UnpackedValue:
+        return _unpack_object({key: value}, self._whitelist_map, self._context)
+
+    def persistent_load(self, pid: Any) -> Any:
+        raise DeserializationError("Binary serialized value contains a persistent id.")
+
+
+def serialize_value_to_bytes(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object to the compact binary serdes format.
+
+    The binary format encodes the same structure as `serialize_value`, but is smaller. Field names
+    and enum members are stored once per value, rather than once per object. Use
+    `deserialize_value` to read values in either format, which allows storage that contains JSON
+    serialized values to switch to the binary format without migrating existing values.
+    """
+    serializable_value = _transform_for_serialization(
+        val,
+        whitelist_map=whitelist_map,
+        object_handler=_pack_binary_object,
+        descent_path=_root(val),
+    )
+    buffer = io.BytesIO()
+    buffer.write(_BINARY_SERDES_PREFIX)
+    _BinaryPickler(buffer, protocol=_BINARY_PICKLE_PROTOCOL).dump(serializable_value)
+    return buffer.getvalue()
+
+
+def is_binary_serialized_value(val: Union[str, bytes]) -> bool:
+    """Whether the value was serialized with `serialize_value_to_bytes`."""
+    return isinstance(val, bytes) and val.startswith(BINARY_SERDES_HEADER)
+
+
+def _load_binary_value(
+    val: bytes, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    version = val[len(BINARY_SERDES_HEADER)] if len(val) > len(BINARY_SERDES_HEADER) else None
+    if version != BINARY_SERDES_VERSION:
+        raise DeserializationError(
+            f"Unsupported binary serdes version {version}, expected {BINARY_SERDES_VERSION}."
+        )
+    try:
+        return _BinaryUnpickler(
+            val[len(_BINARY_SERDES_PREFIX) :], whitelist_map=whitelist_map, context=context
+        ).load()
+    except (pickle.UnpicklingError, EOFError) as e:
+        raise DeserializationError(f"Could not read binary serialized value: {e}") from e
+
+
 ###################################################################################################
 # Deserialize / Unpack
 ###################################################################################################
@@ -1098,7 +1318,7 @@ def _wrap_object(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: tuple[type[T_PackableValue], type[U_PackableValue]],
     whitelist_map: WhitelistMap = ...,
 ) -> Union[T_PackableValue, U_PackableValue]: ...
@@ -1106,7 +1326,7 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> T_PackableValue: ...
@@ -1114,34 +1334,35 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> PackableValue: ...
 
 
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Optional[
         Union[type[T_PackableValue], tuple[type[T_PackableValue], type[U_PackableValue]]]
     ] = None,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
 ) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
-    """Deserialize a json encoded string to a Python object.
+    """Deserialize a json encoded string, or a value serialized with `serialize_value_to_bytes`,
+    to a Python object.
 
     Two steps:
 
     - Parse the input string as JSON with an object_hook for custom types.
     - Optionally, check that the resulting object is of the expected type.
     """
-    check.str_param(val, "val")
+    check.inst_param(val, "val", (str, bytes))
 
     return deserialize_values([val], as_type, whitelist_map)[0]
 
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> Sequence[T_PackableValue]: ...
@@ -1149,7 +1370,7 @@ def deserialize_values(
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> Sequence[PackableValue]: ...
@@ -1157,7 +1378,7 @@ def deserialize_values(
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Optional[
         Union[type[T_PackableValue], tuple[type[T_PackableValue], type[U_PackableValue]]]
     ],
@@ -1166,7 +1387,7 @@ def deserialize_values(
 
 
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Optional[
         Union[type[T_PackableValue], tuple[type[T_PackableValue], type[U_PackableValue]]]
     ] = None,
@@ -1180,10 +1401,18 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            if is_binary_serialized_value(val):
+                unpacked_value = _load_binary_value(
+                    cast(bytes, val), whitelist_map=whitelist_map, context=context
+                )
+            else:
+                # JSON serialized values may also be passed as utf-8 encoded bytes
+                unpacked_value = seven.json.loads(
+                    val,
+                    object_hook=partial(
+                        _unpack_object, whitelist_map=whitelist_map, context=context
+                    ),
+                )
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
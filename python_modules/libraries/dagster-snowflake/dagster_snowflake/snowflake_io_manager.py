@@ -12,6 +12,7 @@
     DbTypeHandler,
     TablePartitionDimension,
     TableSlice,
+    get_table_filters_where_clause,
 )
 from dagster._core.storage.io_manager import dagster_maintained_io_manager
 from pydantic import Field
@@ -226,6 +227,19 @@ def my_table_a(my_table: pd.DataFrame) -> pd.DataFrame:
                 # my_table will just contain the data from column "a"
                 ...
 
+        To only load the rows of a table that match some filters, add the metadata ``filters`` to the In or
+        AssetIn. Each filter is a ``(column, operator, value)`` tuple, and the filters are applied by the
+        query that loads the table.
+
+        .. code-block:: python
+
+            @asset(
+                ins={"my_table": AssetIn("my_table", metadata={"filters": [("a", ">", 0)]})}
+            )
+            def my_table_positive(my_table: pd.DataFrame):
+                # my_table will just contain the rows where column "a" is positive
+                ...
+
     """
 
     database: str = Field(description="Name of the database to use.")
@@ -386,14 +400,24 @@ def delete_table_slice(context: OutputContext, table_slice: TableSlice, connecti
     @staticmethod
     def get_select_statement(table_slice: TableSlice) -> str:
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
+
+        where_clauses = []
         if table_slice.partition_dimensions and len(table_slice.partition_dimensions) > 0:
-            query = (
-                f"SELECT {col_str} FROM"
-                f" {table_slice.database}.{table_slice.schema}.{table_slice.table} WHERE\n"
+            where_clauses.append(_partition_where_clause(table_slice.partition_dimensions))
+        if table_slice.filters:
+            where_clauses.append(
+                get_table_filters_where_clause(
+                    table_slice.filters, SNOWFLAKE_DATETIME_FORMAT, backslash_escapes=True
+                )
             )
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+
+        query = (
+            f"SELECT {col_str} FROM {table_slice.database}.{table_slice.schema}.{table_slice.table}"
+        )
+        if where_clauses:
+            return query + " WHERE\n" + " AND\n".join(where_clauses)
         else:
-            return f"""SELECT {col_str} FROM {table_slice.database}.{table_slice.schema}.{table_slice.table}"""
+            return query
 
 
 def _get_cleanup_statement(table_slice: TableSlice) -> str:
@@ -4,7 +4,12 @@
 from dagster import TimeWindow
 from dagster._core.definitions import materialize
 from dagster._core.definitions.decorators import asset
-from dagster._core.storage.db_io_manager import DbTypeHandler, TablePartitionDimension, TableSlice
+from dagster._core.storage.db_io_manager import (
+    DbTypeHandler,
+    TableFilter,
+    TablePartitionDimension,
+    TableSlice,
+)
 from dagster_snowflake.snowflake_io_manager import (
     SnowflakeDbClient,
     SnowflakeIOManager,
@@ -114,6 +119,31 @@ def test_get_select_statement_multiple_static_partitions():
     )
 
 
+def test_get_select_statement_filters():
+    assert (
+        SnowflakeDbClient.get_select_statement(
+            TableSlice(
+                database="database_abc",
+                schema="schema1",
+                table="table1",
+                partition_dimensions=[
+                    TablePartitionDimension(partition_expr="my_fruit_col", partitions=["apple"])
+                ],
+                columns=["apple", "banana"],
+                filters=[
+                    TableFilter("price", ">=", 1.5),
+                    TableFilter("color", "in", ["red", "gree'n"]),
+                    TableFilter("picked_at", "<", datetime(2020, 1, 2)),
+                    TableFilter("eaten_at", "is null"),
+                ],
+            )
+        )
+        == "SELECT apple, banana FROM database_abc.schema1.table1 WHERE\nmy_fruit_col in ('apple')"
+        " AND\nprice >= 1.5 AND\ncolor in ('red', 'gree\\'n') AND\npicked_at < '2020-01-02"
+        " 00:00:00' AND\neaten_at is null"
+    )
+
+
 def test_get_select_statement_multi_partitioned():
     assert (
         SnowflakeDbClient.get_select_statement(